@@ -1,9 +1,13 @@
 import asyncio
+import json
+import time
+from collections.abc import AsyncIterator, Awaitable, Callable
 
 import httpx
 
 from app.core.config import settings
 from app.core.logging import get_logger
+from app.infra.queue.job_queue import JobEvent, JobQueue
 
 logger = get_logger(__name__)
 
@@ -51,3 +55,60 @@ async def send_callback_with_retry(
 
     logger.error("콜백 전송 최종 실패", max_retries=max_retries)
     return False
+
+
+async def deliver_callback(url: str, payload: dict, job_id: str) -> bool:
+    """작업 큐 워커용 콜백 전송, 성공 여부 반환"""
+    async with httpx.AsyncClient(timeout=settings.callback_timeout) as client:
+        return await send_callback_with_retry(client, url, payload, job_id)
+
+
+TERMINAL_JOB_EVENTS = frozenset({"delivered", "dead"})
+SSE_HEARTBEAT_INTERVAL = 15.0
+
+
+def format_sse_event(event: str, data: dict, event_id: int | None = None) -> str:
+    """SSE 메시지 한 건 생성"""
+    payload = json.dumps(data, ensure_ascii=False)
+    prefix = f"id: {event_id}\n" if event_id is not None else ""
+    return f"{prefix}event: {event}\ndata: {payload}\n\n"
+
+
+def _format_sse(event: JobEvent) -> str:
+    """진행 이벤트를 SSE 메시지로 변환"""
+    return format_sse_event(
+        event.event,
+        {"event": event.event, "data": event.data, "timestamp": event.created_at},
+        event_id=event.id,
+    )
+
+
+async def stream_job_events(
+    queue: JobQueue,
+    job_id: str,
+    after_id: int,
+    is_disconnected: Callable[[], Awaitable[bool]],
+) -> AsyncIterator[str]:
+    """작업 진행 이벤트를 SSE로 스트리밍
+
+    큐 SQLite를 폴링하므로 다른 워커 프로세스가 실행 중인 작업도 중계한다
+    콜백 전달 완료(delivered/dead) 이벤트를 보내거나 클라이언트 연결이 끊기면 종료한다
+    """
+    last_sent = time.monotonic()
+    while True:
+        events = await queue.alist_events(job_id, after_id)
+        for event in events:
+            after_id = event.id
+            yield _format_sse(event)
+            if event.event in TERMINAL_JOB_EVENTS:
+                return
+        if events:
+            last_sent = time.monotonic()
+            continue
+
+        if await is_disconnected() or await queue.aget(job_id) is None:
+            return
+        if time.monotonic() - last_sent >= SSE_HEARTBEAT_INTERVAL:
+            yield ": keep-alive\n\n"
+            last_sent = time.monotonic()
+        await asyncio.sleep(settings.job_events_poll_interval)
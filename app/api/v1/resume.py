@@ -1,11 +1,10 @@
-import asyncio
 import uuid
-from asyncio import Semaphore, create_task
 
-import httpx
-from fastapi import APIRouter
+from fastapi import APIRouter, Header, Request
+from fastapi.responses import StreamingResponse
+from langgraph.checkpoint.base import BaseCheckpointSaver
 
-from app.api.utils import send_callback_with_retry
+from app.api.utils import stream_job_events
 from app.api.v1.schemas import GenerateRequest, GenerateResponse, MockGenerateRequest
 from app.api.v1.schemas.callback import (
     CallbackErrorData,
@@ -15,60 +14,73 @@ from app.api.v1.schemas.callback import (
     CallbackSuccessPayload,
 )
 from app.core.config import settings
-from app.core.context import github_mock_var, set_job_id
-from app.core.exceptions import ErrorCode
+from app.core.context import github_mock_var
+from app.core.exceptions import ErrorCode, JobNotFoundError
 from app.core.logging import get_logger
 from app.domain.resume.agent import run_resume_agent
 from app.domain.resume.schemas import ResumeData, ResumeRequest
+from app.domain.resume.workflow_utils import discard_checkpoint
+from app.infra.queue.job_queue import get_job_queue
+from app.infra.queue.worker import JobHandler
 
 router = APIRouter(prefix="/resume", tags=["v1"])
 logger = get_logger(__name__)
 
-MAX_CONCURRENT_JOBS = 10
-_job_semaphore = Semaphore(MAX_CONCURRENT_JOBS)
-_background_tasks: set[asyncio.Task] = set()
-_tasks_lock = asyncio.Lock()
+GENERATE_JOB_KIND = "resume_generate"
 
 
-async def _remove_task(task: asyncio.Task) -> None:
-    async with _tasks_lock:
-        _background_tasks.discard(task)
+async def _run_generate_job(
+    job_id: str, payload: dict, checkpointer: BaseCheckpointSaver | None = None
+) -> dict:
+    """큐 워커에서 에이전트를 실행하고 콜백 페이로드 반환
+
+    thread_id를 job_id로 지정하여 재시작 후 다시 실행되면 마지막 완료 노드부터 이어서 실행한다
+    타임아웃 등 예외는 그대로 전파하여 작업 큐가 백오프 후 재시도하게 한다
+    """
+    github_mock_var.set(bool(payload.get("mock")))
+    request = ResumeRequest(**payload["request"])
+    resume_data, error_message = await run_resume_agent(
+        request=request,
+        session_id=job_id,
+        thread_id=job_id,
+        checkpointer=checkpointer,
+    )
+    return _build_callback_payload(job_id, resume_data, error_message)
 
 
-async def _send_callback(
-    callback_url: str,
-    payload: dict,
-    job_id: str,
-) -> None:
-    """콜백 전송 - 실패 시 로그만 남김"""
-    try:
-        async with httpx.AsyncClient(timeout=settings.callback_timeout) as client:
-            await send_callback_with_retry(client, callback_url, payload, job_id)
-    except Exception as cb_err:
-        logger.error("콜백 전송 실패", error=str(cb_err), exc_info=True)
+async def _generate_job_exhausted(
+    job_id: str, payload: dict, checkpointer: BaseCheckpointSaver | None = None
+) -> dict:
+    """재시도 한도를 넘긴 작업의 체크포인트를 지우고 실패 콜백 페이로드 반환"""
+    await discard_checkpoint(checkpointer, job_id)
+    return _build_callback_payload(job_id, None, "알 수 없는 오류가 발생했습니다")
 
 
-async def _run_agent_and_callback(
-    job_id: str,
-    request: ResumeRequest,
-    callback_url: str,
-) -> None:
-    """에이전트 실행 후 콜백 전송"""
-    set_job_id(job_id)
-    async with _job_semaphore:
-        logger.info("작업 시작", concurrent_limit=MAX_CONCURRENT_JOBS)
-        try:
-            resume_data, error_message = await run_resume_agent(
-                request=request,
-                session_id=job_id,
-            )
-            payload = _build_callback_payload(job_id, resume_data, error_message)
-        except Exception as e:
-            logger.error("작업 처리 실패", error=str(e), exc_info=True)
-            payload = _build_callback_payload(job_id, None, "알 수 없는 오류가 발생했습니다")
-
-        logger.info("콜백 전송 시작")
-        await _send_callback(callback_url, payload, job_id)
+def create_generate_job_handler(checkpointer: BaseCheckpointSaver | None = None) -> JobHandler:
+    """이력서 생성 작업 핸들러 생성"""
+
+    async def run(job_id: str, payload: dict) -> dict:
+        return await _run_generate_job(job_id, payload, checkpointer)
+
+    async def on_exhausted(job_id: str, payload: dict) -> dict:
+        return await _generate_job_exhausted(job_id, payload, checkpointer)
+
+    return JobHandler(run=run, on_exhausted=on_exhausted)
+
+
+async def _enqueue_generate_job(
+    request: ResumeRequest, callback_url: str, mock: bool = False
+) -> str:
+    """이력서 생성 작업을 큐에 등록하고 job_id 반환"""
+    job_id = str(uuid.uuid4())
+    await get_job_queue().aenqueue(
+        job_id,
+        GENERATE_JOB_KIND,
+        {"request": request.model_dump(), "mock": mock},
+        callback_url,
+    )
+    logger.info("이력서 생성 작업 등록", job_id=job_id)
+    return job_id
 
 
 def _build_callback_payload(
@@ -108,7 +120,6 @@ async def generate_resume(
     body: GenerateRequest,
 ) -> GenerateResponse:
     """이력서 생성 요청"""
-    job_id = str(uuid.uuid4())
     callback_url = settings.generate_callback_url
 
     resume_request = ResumeRequest(
@@ -119,11 +130,7 @@ async def generate_resume(
         callback_url=callback_url,
     )
 
-    task = create_task(_run_agent_and_callback(job_id, resume_request, callback_url))
-    async with _tasks_lock:
-        _background_tasks.add(task)
-    task.add_done_callback(lambda t: create_task(_remove_task(t)))
-
+    job_id = await _enqueue_generate_job(resume_request, callback_url)
     return GenerateResponse(job_id=job_id)
 
 
@@ -132,12 +139,8 @@ async def generate_resume_mock(
     body: MockGenerateRequest,
 ) -> GenerateResponse:
     """GitHub API 없이 모의 데이터로 이력서 생성"""
-
-    job_id = str(uuid.uuid4())
     callback_url = settings.generate_callback_url
 
-    github_mock_var.set(True)
-
     resume_request = ResumeRequest(
         repo_urls=body.repo_urls,
         position=body.position,
@@ -146,14 +149,25 @@ async def generate_resume_mock(
         callback_url=callback_url,
     )
 
-    task = create_task(_run_agent_and_callback(job_id, resume_request, callback_url))
-    async with _tasks_lock:
-        _background_tasks.add(task)
-    task.add_done_callback(lambda t: create_task(_remove_task(t)))
-
+    job_id = await _enqueue_generate_job(resume_request, callback_url, mock=True)
     return GenerateResponse(job_id=job_id)
 
 
-def get_background_tasks() -> set[asyncio.Task]:
-    """진행 중인 백그라운드 태스크 스냅샷 반환"""
-    return set(_background_tasks)
+@router.get("/{job_id}/events", summary="이력서 생성 진행 이벤트 스트림")
+async def stream_resume_events(
+    job_id: str,
+    request: Request,
+    last_event_id: str | None = Header(default=None),
+) -> StreamingResponse:
+    """이력서 생성 작업의 진행 이벤트를 SSE로 전송, Last-Event-ID 이후 이벤트부터 이어서 전송"""
+    queue = get_job_queue()
+    job = await queue.aget(job_id)
+    if job is None or job.kind != GENERATE_JOB_KIND:
+        raise JobNotFoundError(detail=job_id)
+
+    after_id = int(last_event_id) if last_event_id and last_event_id.isdigit() else 0
+    return StreamingResponse(
+        stream_job_events(queue, job_id, after_id, request.is_disconnected),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
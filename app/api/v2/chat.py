@@ -1,15 +1,26 @@
+import asyncio
+import functools
+import time
+from collections.abc import AsyncIterator, Awaitable, Callable
+
 from fastapi import APIRouter, Request
+from fastapi.responses import StreamingResponse
+from langgraph.checkpoint.base import BaseCheckpointSaver
+from prometheus_client import Histogram
 
+from app.api.utils import format_sse_event
 from app.api.v2.schemas.chat import (
     ChatErrorResponse,
     ChatRequest,
     ChatResponse,
+    ChatStreamResult,
 )
 from app.core.exceptions import ErrorCode
 from app.core.logging import get_logger
 from app.domain.interview.chat_agent import run_chat_agent
 from app.domain.interview.chat_schemas import MAX_FOLLOW_UP_TURNS
 from app.domain.interview.store import QuestionContext, interview_context_store
+from app.infra.llm.limiter import PRIORITY_INTERACTIVE, llm_priority
 
 router = APIRouter(prefix="/interview", tags=["v2"])
 logger = get_logger(__name__)
@@ -18,6 +29,14 @@ SKIP_PATTERNS = ["모르겠", "잘 모르", "패스", "모릅니다", "생각이
 SELF_PRESENTATION_PATTERNS = ["자기소개", "장단점", "강점과 약점"]
 SOLO_PROJECT_PATTERNS = ["혼자 진행", "혼자 했", "개인 프로젝트", "팀원이 없", "팀원은 없"]
 
+CHAT_FIRST_TOKEN_SECONDS = Histogram(
+    "chat_stream_first_token_seconds",
+    "면접 채팅 스트리밍 요청부터 첫 메시지 토큰 전송까지 걸린 시간",
+    buckets=(0.1, 0.25, 0.5, 1, 2, 5, 10, 30),
+)
+
+_pending_turns: set[asyncio.Task] = set()
+
 
 def _filter_follow_up(follow_up, body, question_ctx, turn_count):
     """꼬리질문 필터링 — 성의없는 답변, 자기소개, 솔로 프로젝트, 최대 횟수"""
@@ -51,100 +70,73 @@ def _filter_follow_up(follow_up, body, question_ctx, turn_count):
     return follow_up
 
 
-@router.post(
-    "/chat",
-    response_model=ChatResponse,
-    summary="면접 채팅",
-)
-async def chat_interview(
-    request: Request,
-    body: ChatRequest,
-) -> ChatResponse:
-    """면접 질문에 대한 실시간 채팅 응답
+def _failed(message: str) -> ChatStreamResult:
+    """채팅 실패 응답 생성"""
+    return ChatStreamResult(
+        status="failed",
+        error=ChatErrorResponse(code=ErrorCode.CHAT_GENERATE_ERROR, message=message),
+    )
 
-    같은 aiSessionId + questionId로 반복 호출하면 이전 대화를 이어갑니다
-    """
+
+async def _run_turn(
+    body: ChatRequest,
+    checkpointer: BaseCheckpointSaver | None,
+    on_message_delta: Callable[[str], None] | None = None,
+) -> ChatStreamResult:
+    """채팅 한 턴 실행 — 세션 조회, 에이전트 호출, 꼬리질문 필터링과 컨텍스트 저장"""
     thread_id = f"chat-{body.ai_session_id}-{body.question_id}"
     logger.info(
         "채팅 요청",
         ai_session_id=body.ai_session_id,
         question_id=body.question_id,
         thread_id=thread_id,
+        streaming=on_message_delta is not None,
     )
 
     contexts = interview_context_store.get(body.ai_session_id)
     if not contexts:
-        return ChatResponse(
-            status="failed",
-            error=ChatErrorResponse(
-                code=ErrorCode.CHAT_GENERATE_ERROR,
-                message="면접 세션이 만료되었습니다",
-            ),
-        )
+        return _failed("면접 세션이 만료되었습니다")
 
     question_ctx = contexts.get(body.question_id)
     if not question_ctx:
-        return ChatResponse(
-            status="failed",
-            error=ChatErrorResponse(
-                code=ErrorCode.CHAT_GENERATE_ERROR,
-                message="해당 질문을 찾을 수 없습니다",
-            ),
-        )
+        return _failed("해당 질문을 찾을 수 없습니다")
 
     meta = interview_context_store.get_session_meta(body.ai_session_id)
     if not meta:
-        return ChatResponse(
-            status="failed",
-            error=ChatErrorResponse(
-                code=ErrorCode.CHAT_GENERATE_ERROR,
-                message="면접 세션 메타데이터가 만료되었습니다",
-            ),
-        )
-
-    checkpointer = getattr(request.app.state, "checkpointer", None)
+        return _failed("면접 세션 메타데이터가 만료되었습니다")
 
     try:
-        chat_result, error_message, turn_count = await run_chat_agent(
-            resume_json=meta.resume_json,
-            position=meta.position,
-            interview_type=meta.interview_type,
-            question_text=question_ctx.question_text,
-            question_intent=question_ctx.intent,
-            related_project=question_ctx.related_project,
-            answer=body.answer,
-            session_id=body.ai_session_id,
-            thread_id=thread_id,
-            checkpointer=checkpointer,
-        )
+        with llm_priority(PRIORITY_INTERACTIVE):
+            chat_result, error_message, turn_count = await run_chat_agent(
+                resume_json=meta.resume_json,
+                position=meta.position,
+                interview_type=meta.interview_type,
+                question_text=question_ctx.question_text,
+                question_intent=question_ctx.intent,
+                related_project=question_ctx.related_project,
+                answer=body.answer,
+                session_id=body.ai_session_id,
+                thread_id=thread_id,
+                checkpointer=checkpointer,
+                on_message_delta=on_message_delta,
+            )
     except Exception:
         logger.error("채팅 응답 예외 발생", exc_info=True)
-        return ChatResponse(
-            status="failed",
-            error=ChatErrorResponse(
-                code=ErrorCode.CHAT_GENERATE_ERROR,
-                message="채팅 응답 생성 중 오류가 발생했습니다",
-            ),
-        )
+        return _failed("채팅 응답 생성 중 오류가 발생했습니다")
 
     if error_message or not chat_result:
         logger.error("채팅 응답 실패", error=error_message)
-        return ChatResponse(
-            status="failed",
-            error=ChatErrorResponse(
-                code=ErrorCode.CHAT_GENERATE_ERROR,
-                message=error_message or "채팅 응답 생성에 실패했습니다",
-            ),
-        )
+        return _failed(error_message or "채팅 응답 생성에 실패했습니다")
 
     follow_up = _filter_follow_up(chat_result.follow_up_question, body, question_ctx, turn_count)
+    follow_up_intent = chat_result.follow_up_intent if follow_up else None
 
-    if follow_up and chat_result.follow_up_intent:
+    if follow_up and follow_up_intent:
         fu_qid = f"{body.question_id}-fu{turn_count}"
         fu_ctx = QuestionContext(
             question_id=fu_qid,
             question_text=follow_up,
-            intent=chat_result.follow_up_intent,
+            intent=follow_up_intent,
             related_project=question_ctx.related_project,
             dimension=question_ctx.dimension,
             category=question_ctx.category,
@@ -153,13 +145,80 @@ async def chat_interview(
         logger.info(
             "꼬리질문 컨텍스트 저장",
             fu_qid=fu_qid,
-            intent=chat_result.follow_up_intent,
+            intent=follow_up_intent,
         )
 
     logger.info("채팅 응답 성공", turn_count=turn_count)
-    return ChatResponse(
+    return ChatStreamResult(
         status="success",
         message=chat_result.message,
         follow_up_question=follow_up,
+        follow_up_intent=follow_up_intent,
         turn_number=turn_count,
     )
+
+
+async def _stream_turn(
+    run_turn: Callable[[Callable[[str], None]], Awaitable[ChatStreamResult]],
+) -> AsyncIterator[str]:
+    """채팅 턴을 백그라운드 태스크로 실행하며 메시지 토큰을 SSE로 중계
+
+    클라이언트 연결이 끊겨도 태스크는 끝까지 실행되어 체크포인트와 꼬리질문 컨텍스트가 저장된다
+    """
+    deltas: asyncio.Queue[str | None] = asyncio.Queue()
+    started = time.monotonic()
+
+    async def run() -> ChatStreamResult:
+        try:
+            return await run_turn(deltas.put_nowait)
+        finally:
+            deltas.put_nowait(None)
+
+    task = asyncio.create_task(run())
+    _pending_turns.add(task)
+    task.add_done_callback(_pending_turns.discard)
+
+    first_token = True
+    while (delta := await deltas.get()) is not None:
+        if first_token:
+            CHAT_FIRST_TOKEN_SECONDS.observe(time.monotonic() - started)
+            first_token = False
+        yield format_sse_event("message_delta", {"delta": delta})
+
+    result = await task
+    yield format_sse_event("done", result.model_dump(mode="json", by_alias=True))
+
+
+@router.post(
+    "/chat",
+    response_model=ChatResponse,
+    summary="면접 채팅",
+)
+async def chat_interview(
+    request: Request,
+    body: ChatRequest,
+) -> ChatResponse:
+    """면접 질문에 대한 실시간 채팅 응답
+
+    같은 aiSessionId + questionId로 반복 호출하면 이전 대화를 이어갑니다
+    """
+    checkpointer = getattr(request.app.state, "checkpointer", None)
+    return await _run_turn(body, checkpointer)
+
+
+@router.post("/chat/stream", summary="면접 채팅 스트리밍")
+async def chat_interview_stream(
+    request: Request,
+    body: ChatRequest,
+) -> StreamingResponse:
+    """면접관 메시지를 토큰 단위 SSE로 전송하는 면접 채팅
+
+    message_delta 이벤트로 메시지 토큰을 보내고, 마지막 done 이벤트로
+    꼬리질문과 의도를 포함한 최종 응답(/chat 응답 형식)을 보냅니다
+    """
+    checkpointer = getattr(request.app.state, "checkpointer", None)
+    return StreamingResponse(
+        _stream_turn(functools.partial(_run_turn, body, checkpointer)),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
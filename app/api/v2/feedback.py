@@ -20,12 +20,12 @@ from app.domain.interview.feedback_agent import (
 )
 from app.domain.interview.store import interview_context_store
 from app.infra.llm.base import get_langfuse_parent_handler
+from app.infra.llm.limiter import PRIORITY_BATCH, llm_priority
 from app.infra.tavily.client import search_company_talent
 
 router = APIRouter(prefix="/interview", tags=["v2"])
 logger = get_logger(__name__)
 
-MAX_CONCURRENT_FEEDBACK = 10
 FEEDBACK_GATHER_TIMEOUT = settings.feedback_gather_timeout
 TAVILY_SEARCH_TIMEOUT = 10
 
@@ -200,7 +200,16 @@ def _find_context(contexts: dict | None, turn_no: int, question: str):
 async def end_interview(
     body: InterviewEndRequest,
 ) -> InterviewEndResponse:
-    """면접 종료 시 개별 + 종합 피드백을 한 번에 생성"""
+    """면접 종료 시 개별 + 종합 피드백을 한 번에 생성
+
+    피드백 LLM 호출은 batch 우선순위로 실행되어 면접 채팅 호출보다 뒤에 슬롯을 배정받는다
+    """
+    with llm_priority(PRIORITY_BATCH):
+        return await _end_interview(body)
+
+
+async def _end_interview(body: InterviewEndRequest) -> InterviewEndResponse:
+    """개별 피드백 병렬 생성, 기업 인재상 검색, 종합 피드백 생성"""
     interview_type = body.interview_type
 
     logger.info(
@@ -223,28 +232,26 @@ async def end_interview(
 
     contexts = interview_context_store.get(body.ai_session_id)
 
-    semaphore = asyncio.Semaphore(MAX_CONCURRENT_FEEDBACK)
     langfuse_parent = get_langfuse_parent_handler(
         "individual-feedbacks",
         session_id=body.ai_session_id,
     )
     parent_callbacks = [langfuse_parent] if langfuse_parent else None
 
-    async def run_feedback_with_semaphore(m):
+    async def run_feedback(m):
         ctx = _find_context(contexts, m.turn_no, m.question)
-        async with semaphore:
-            return await run_feedback_agent(
-                position=body.position,
-                interview_type=interview_type,
-                question_text=m.question,
-                question_intent=ctx.intent if ctx else "",
-                related_project=ctx.related_project if ctx else None,
-                answer=m.answer,
-                session_id=body.ai_session_id,
-                callbacks=parent_callbacks,
-            )
+        return await run_feedback_agent(
+            position=body.position,
+            interview_type=interview_type,
+            question_text=m.question,
+            question_intent=ctx.intent if ctx else "",
+            related_project=ctx.related_project if ctx else None,
+            answer=m.answer,
+            session_id=body.ai_session_id,
+            callbacks=parent_callbacks,
+        )
 
-    individual_tasks = [run_feedback_with_semaphore(m) for m in body.messages]
+    individual_tasks = [run_feedback(m) for m in body.messages]
 
     talent_search_task = asyncio.create_task(search_company_talent(body.company))
 
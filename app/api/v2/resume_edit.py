@@ -1,11 +1,8 @@
-import asyncio
 import uuid
-from asyncio import create_task
 
-import httpx
 from fastapi import APIRouter
+from langgraph.checkpoint.base import BaseCheckpointSaver
 
-from app.api.utils import send_callback_with_retry
 from app.api.v2.schemas.resume_edit import (
     EditCallbackContentData,
     EditCallbackErrorData,
@@ -17,21 +14,17 @@ from app.api.v2.schemas.resume_edit import (
 )
 from app.api.v2.utils import build_resume_json
 from app.core.config import settings
-from app.core.context import set_job_id
 from app.core.exceptions import ErrorCode
 from app.core.logging import get_logger
 from app.domain.resume.edit_agent import run_edit_agent
+from app.domain.resume.workflow_utils import discard_checkpoint
+from app.infra.queue.job_queue import get_job_queue
+from app.infra.queue.worker import JobHandler
 
 router = APIRouter(prefix="/resume", tags=["v2"])
 logger = get_logger(__name__)
 
-_background_tasks: set[asyncio.Task] = set()
-_tasks_lock = asyncio.Lock()
-
-
-async def _remove_task(task: asyncio.Task) -> None:
-    async with _tasks_lock:
-        _background_tasks.discard(task)
+EDIT_JOB_KIND = "resume_edit"
 
 
 def _build_callback_url(job_id: str) -> str:
@@ -74,36 +67,41 @@ def _build_callback_payload(
     return payload.model_dump(by_alias=True)
 
 
-async def _run_edit_and_callback(
-    job_id: str,
-    resume_json: str,
-    message: str,
-) -> None:
-    """수정 에이전트 실행 후 콜백 전송"""
-    set_job_id(job_id)
-    callback_url = _build_callback_url(job_id)
-
-    try:
-        edited_resume, error_message, error_code = await run_edit_agent(
-            resume_json=resume_json,
-            message=message,
-            session_id=job_id,
-        )
+async def _run_edit_job(
+    job_id: str, payload: dict, checkpointer: BaseCheckpointSaver | None = None
+) -> dict:
+    """큐 워커에서 수정 에이전트를 실행하고 콜백 페이로드 반환
+
+    타임아웃 등 예외는 그대로 전파하여 작업 큐가 백오프 후 재시도하게 한다
+    """
+    edited_resume, error_message, error_code = await run_edit_agent(
+        resume_json=payload["resume_json"],
+        message=payload["message"],
+        session_id=job_id,
+        thread_id=job_id,
+        checkpointer=checkpointer,
+    )
+    return _build_callback_payload(job_id, edited_resume, error_message, error_code)
+
 
-        payload = _build_callback_payload(job_id, edited_resume, error_message, error_code)
-        logger.info("콜백 전송 시작", callback_url=callback_url)
+async def _edit_job_exhausted(
+    job_id: str, payload: dict, checkpointer: BaseCheckpointSaver | None = None
+) -> dict:
+    """재시도 한도를 넘긴 작업의 체크포인트를 지우고 실패 콜백 페이로드 반환"""
+    await discard_checkpoint(checkpointer, job_id)
+    return _build_callback_payload(job_id, None, "알 수 없는 오류가 발생했습니다")
+
+
+def create_edit_job_handler(checkpointer: BaseCheckpointSaver | None = None) -> JobHandler:
+    """이력서 수정 작업 핸들러 생성"""
+
+    async def run(job_id: str, payload: dict) -> dict:
+        return await _run_edit_job(job_id, payload, checkpointer)
 
-        async with httpx.AsyncClient(timeout=settings.callback_timeout) as client:
-            await send_callback_with_retry(client, callback_url, payload, job_id)
+    async def on_exhausted(job_id: str, payload: dict) -> dict:
+        return await _edit_job_exhausted(job_id, payload, checkpointer)
 
-    except Exception as e:
-        logger.error("이력서 수정 작업 실패", error=str(e), exc_info=True)
-        try:
-            payload = _build_callback_payload(job_id, None, "알 수 없는 오류가 발생했습니다")
-            async with httpx.AsyncClient(timeout=settings.callback_timeout) as client:
-                await send_callback_with_retry(client, callback_url, payload, job_id)
-        except Exception as cb_err:
-            logger.error("실패 콜백 전송도 실패", error=str(cb_err), exc_info=True)
+    return JobHandler(run=run, on_exhausted=on_exhausted)
 
 
 @router.post("/edit", response_model=EditResponse, summary="이력서 수정")
@@ -120,14 +118,11 @@ async def edit_resume(
 
     resume_json = build_resume_json(body.content)
 
-    task = create_task(_run_edit_and_callback(job_id, resume_json, body.request_message))
-    async with _tasks_lock:
-        _background_tasks.add(task)
-    task.add_done_callback(lambda t: create_task(_remove_task(t)))
+    await get_job_queue().aenqueue(
+        job_id,
+        EDIT_JOB_KIND,
+        {"resume_json": resume_json, "message": body.request_message},
+        _build_callback_url(job_id),
+    )
 
     return EditResponse(job_id=job_id)
-
-
-def get_background_tasks() -> set[asyncio.Task]:
-    """진행 중인 백그라운드 태스크 스냅샷 반환"""
-    return set(_background_tasks)
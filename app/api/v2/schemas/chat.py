@@ -30,3 +30,9 @@ class ChatResponse(BaseModel):
     follow_up_question: str | None = Field(default=None, alias="followUpQuestion")
     turn_number: int | None = Field(default=None, alias="turnNumber")
     error: ChatErrorResponse | None = None
+
+
+class ChatStreamResult(ChatResponse):
+    """면접 채팅 스트리밍의 마지막 done 이벤트 - 구조화 필드 포함"""
+
+    follow_up_intent: str | None = Field(default=None, alias="followUpIntent")
@@ -12,6 +12,8 @@ class Settings(BaseSettings):
     vllm_base_url: str = ""
     vllm_model: str = ""
     vllm_timeout: float = 600.0
+    # vLLM 동시 요청 수 초기값 (적응형 동시성 제한의 시작점)
+    vllm_max_concurrent_requests: int = 4
 
     # Gemini 평가용 설정
     gemini_api_key: str = ""
@@ -27,11 +29,143 @@ class Settings(BaseSettings):
     # Timeout 설정
     github_timeout: float = 60.0
     callback_timeout: float = 120.0
+    # 작업 실행 1회 마감 시간, 타임아웃된 작업은 큐 재시도 시 마지막 완료 노드부터 이어서 실행
     workflow_timeout: float = 600.0
+    # 이력서 생성 방식: batch(전체 프로젝트 1회 호출) | per_project(프로젝트별 병렬 호출)
+    resume_generation_mode: str = "batch"
+    # 이력서 평가 방식: resume(전체 1회 평가) | per_project(프로젝트별 평가, 실패 프로젝트만 재생성)
+    resume_evaluation_mode: str = "resume"
+    # plan→generate 실행 방식: staged(모든 plan 완료 후 생성) | pipelined(프로젝트별 plan 직후 생성)
+    resume_pipeline_mode: str = "staged"
+    # LLM 평가 전 코드 기반 형식 검증 (위반 시 평가 없이 재생성)
+    resume_format_validation_enabled: bool = True
 
     # 동시 요청 제한
     github_max_concurrent_requests: int = 15
 
+    # GitHub rate limit 스케줄러 설정
+    github_rate_limit_reserve: int = 50
+    github_rate_limit_pace_threshold: int = 200
+    github_rate_limit_max_wait: float = 30.0
+    # 예산을 보관할 최대 토큰 수, 초과 시 가장 오래 쓰지 않은 토큰부터 제거
+    github_rate_limit_max_tokens: int = 1000
+
+    # GitHub 요청 재시도 설정
+    github_retry_max_attempts: int = 3
+    github_retry_base_delay: float = 0.5
+    github_retry_max_delay: float = 8.0
+    github_retry_max_total_wait: float = 30.0
+
+    # GitHub 조건부 요청 캐시 설정
+    github_cache_enabled: bool = True
+    github_cache_path: str = "data/github_cache.db"
+    github_cache_max_entries: int = 5000
+
+    # GitHub GraphQL 배치 조회 설정
+    github_graphql_batch_max_repos: int = 5
+    github_graphql_batch_max_nodes: int = 700
+
+    # GitHub PR 상세 조회 설정
+    github_pull_detail_batch_size: int = 50
+    github_pull_detail_cache_size: int = 2000
+
+    # GitHub 파일 일괄 조회 청크 설정
+    github_files_batch_max_aliases: int = 20
+    github_files_batch_max_bytes: int = 512_000
+    github_files_batch_unknown_size: int = 16_000
+
+    # GitHub blob SHA 캐시 설정 (경로가 비어 있으면 메모리만 사용)
+    github_blob_cache_max_entries: int = 2000
+    github_blob_cache_path: str = ""
+
+    # GitHub 부분 클론 수집 설정
+    # off: API만 사용, auto: 레포 크기가 임계값 이상이면 클론, always: 항상 클론
+    github_clone_mode: str = "off"
+    github_clone_min_size_kb: int = 50_000
+    github_clone_base_url: str = "https://github.com"
+    github_clone_dir: str = "data/clones"
+    github_clone_depth: int = 200
+    github_clone_max_repos: int = 10
+    github_clone_ttl: float = 600.0
+
+    # GitHub 신원 조회 메모이제이션 TTL (초)
+    github_identity_ttl: float = 60.0
+
+    # 레포 스냅샷 저장소 설정 (HEAD oid 기준 증분 수집)
+    resume_snapshot_enabled: bool = True
+    resume_snapshot_path: str = "data/resume_snapshots.db"
+    resume_snapshot_max_entries: int = 1000
+    resume_snapshot_max_age: float = 604800.0
+
+    # LangGraph 노드 캐시 설정 (워커 간 공유 SQLite, 최대 개수 초과 시 LRU 제거)
+    # ":memory:"로 지정하면 프로세스 내부에서만 유지
+    workflow_cache_path: str = "data/workflow_cache.db"
+    workflow_cache_max_entries: int = 500
+    workflow_cache_ttl: int = 3600
+
+    # LLM 응답 캐시 (호출 지점별 opt-in, 워커 간 공유 SQLite)
+    llm_response_cache_enabled: bool = True
+    llm_response_cache_path: str = "data/llm_response_cache.db"
+    llm_response_cache_max_entries: int = 2000
+    llm_response_cache_ttl: float = 86400.0
+
+    # LLM 백엔드별 적응형 동시성 제한 (AIMD)
+    # 지연이 임계값 이내면 한도를 조금씩 늘리고
+    # 429/5xx/타임아웃이나 임계값 초과 지연이 관측되면 backoff 배로 줄임
+    # 감소 후 cooldown 동안은 추가 감소하지 않음
+    # 지연 임계값을 비워 두면 각 백엔드 타임아웃(vllm_timeout/gemini_timeout)의 90%를 사용
+    # 대기 요청은 (대기 시작 시각 + 우선순위 × priority_aging) 순으로 배정하여
+    # 낮은 우선순위도 priority_aging초 대기할 때마다 한 단계씩 앞선 것으로 취급 (batch 기아 방지)
+    llm_limiter_enabled: bool = True
+    llm_limiter_backoff: float = 0.5
+    llm_limiter_cooldown: float = 5.0
+    llm_limiter_priority_aging: float = 10.0
+    llm_generator_min_concurrency: int = 2
+    llm_generator_max_concurrency: int = 16
+    llm_generator_latency_threshold: float | None = None
+    llm_evaluator_initial_concurrency: int = 8
+    llm_evaluator_min_concurrency: int = 2
+    llm_evaluator_max_concurrency: int = 32
+    llm_evaluator_latency_threshold: float | None = None
+
+    # LLM 헤지 요청 (호출 지점별 opt-in)
+    # 프롬프트별 최근 window개 지연의 percentile을 넘기면 같은 요청을 한 번 더 보냄
+    # min_samples개가 쌓이기 전에는 헤지하지 않고, 추가 요청은 전체의 budget_ratio 이내로 제한
+    llm_hedge_enabled: bool = False
+    llm_hedge_percentile: float = 0.95
+    llm_hedge_min_samples: int = 20
+    llm_hedge_window: int = 200
+    llm_hedge_budget_ratio: float = 0.05
+    llm_hedge_budget_burst: float = 5.0
+
+    # 작업 큐 설정 (SQLite 영속 큐, 재시작 시 미완료 작업 복구)
+    # 임대 만료 시간 동안 하트비트가 없으면 다른 워커가 작업을 다시 가져감
+    job_queue_path: str = "data/jobs.db"
+    job_worker_concurrency: int = 10
+    job_visibility_timeout: float = 300.0
+    job_max_attempts: int = 3
+    job_callback_max_deliveries: int = 5
+    job_callback_redelivery_delay: float = 30.0
+    # 실행 중 예외가 난 작업의 재시도 기본 지연 (시도마다 2배)
+    job_retry_delay: float = 10.0
+    job_queue_retention: float = 86400.0
+    # 요청 페이로드(GitHub 토큰 포함) 암호화 키 재료, 비어 있으면 AI_CALLBACK_SECRET 사용
+    # 워커 프로세스끼리 같아야 하고, 바꾸면 대기 중인 작업은 복호화하지 못해 dead 처리됨
+    job_queue_payload_secret: str = ""
+    # 진행 이벤트: SSE 폴링 간격, 중간 콜백 URL (비어 있으면 중간 콜백 미전송)
+    job_events_poll_interval: float = 0.5
+    job_progress_callback_url: str = ""
+
+    # GitHub 작성자 커밋 서버 측 필터 설정
+    # 활성화 시 history(author: {id})로 본인 커밋만 페이지네이션 조회
+    # 계정에 연결되지 않은 이메일로 작성한 커밋은 제외됨
+    github_author_history_enabled: bool = False
+    github_author_history_target: int = 30
+    github_author_history_max_pages: int = 5
+    # 유저네임 → 노드 ID 캐시 (유저네임 변경/재사용 대비 TTL, 최대 개수 초과 시 LRU 제거)
+    github_user_node_id_cache_size: int = 1000
+    github_user_node_id_cache_ttl: float = 86400.0
+
     # Callback 재시도 설정
     callback_max_retries: int = 3
     callback_retry_base_delay: float = 1.0
@@ -45,6 +45,7 @@ class ErrorCode(str, Enum):
     STT_API_ERROR = "STT_API_ERROR"
     S3_DOWNLOAD_ERROR = "S3_DOWNLOAD_ERROR"
     INVALID_AUDIO_FORMAT = "INVALID_AUDIO_FORMAT"
+    JOB_NOT_FOUND = "JOB_NOT_FOUND"
 
 
 class CustomException(Exception):
@@ -176,3 +177,13 @@ def register_exception_handlers(app: FastAPI) -> None:
                 "request_id": get_request_id(),
             },
         )
+
+
+class JobNotFoundError(CustomException):
+    def __init__(self, detail: str | None = None):
+        super().__init__(
+            status_code=404,
+            error_code=ErrorCode.JOB_NOT_FOUND,
+            message="작업을 찾을 수 없습니다",
+            detail=detail,
+        )
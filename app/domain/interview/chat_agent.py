@@ -1,4 +1,6 @@
 import asyncio
+from collections.abc import Callable
+from typing import Any
 
 from langgraph.checkpoint.base import BaseCheckpointSaver
 from langgraph.graph.state import CompiledStateGraph
@@ -23,6 +25,7 @@ async def _run_single_call(
     related_project: str | None,
     answer: str,
     session_id: str | None,
+    on_message_delta: Callable[[str], None] | None = None,
 ) -> tuple[ChatOutput | None, str | None, int]:
     """폴백용 단일 LLM 호출 - 체크포인터 없을 때 사용
 
@@ -40,6 +43,7 @@ async def _run_single_call(
                 related_project=related_project,
                 answer=answer,
                 session_id=session_id,
+                on_message_delta=on_message_delta,
             ),
             timeout=settings.workflow_timeout,
         )
@@ -57,6 +61,27 @@ async def _run_single_call(
         return None, "채팅 응답 생성에 실패했습니다", 0
 
 
+async def _run_workflow(
+    workflow: CompiledStateGraph,
+    workflow_input: ChatState | Command,
+    config: dict[str, Any],
+    on_message_delta: Callable[[str], None] | None,
+) -> dict[str, Any]:
+    """워크플로우를 실행하고 체크포인트에 기록된 최종 상태 반환
+
+    on_message_delta가 있으면 custom 스트림으로 받은 면접관 메시지 토큰을 전달한다
+    """
+    if on_message_delta is None:
+        return await workflow.ainvoke(workflow_input, config=config)
+
+    async for chunk in workflow.astream(workflow_input, config=config, stream_mode="custom"):
+        delta = chunk.get("message_delta") if isinstance(chunk, dict) else None
+        if delta:
+            on_message_delta(delta)
+    snapshot = await workflow.aget_state(config)
+    return snapshot.values
+
+
 async def run_chat_agent(
     resume_json: str,
     position: str,
@@ -68,11 +93,13 @@ async def run_chat_agent(
     session_id: str | None = None,
     thread_id: str | None = None,
     checkpointer: BaseCheckpointSaver | None = None,
+    on_message_delta: Callable[[str], None] | None = None,
 ) -> tuple[ChatOutput | None, str | None, int]:
     """면접 채팅 에이전트 실행
 
     체크포인터가 있으면 멀티턴 워크플로우를 사용하고,
     없으면 기존 단일 LLM 호출로 폴백합니다
+    on_message_delta를 지정하면 면접관 메시지 토큰을 생성되는 대로 전달합니다
 
     Returns:
         chat_result, error_message, turn_count 튜플
@@ -95,6 +122,7 @@ async def run_chat_agent(
             related_project=related_project,
             answer=answer,
             session_id=session_id,
+            on_message_delta=on_message_delta,
         )
 
     try:
@@ -104,7 +132,10 @@ async def run_chat_agent(
         workflow = _chat_workflow
         langfuse_handler = get_langfuse_handler()
         config = {
-            "configurable": {"thread_id": thread_id},
+            "configurable": {
+                "thread_id": thread_id,
+                "stream_message": on_message_delta is not None,
+            },
             "callbacks": [langfuse_handler] if langfuse_handler else [],
             "metadata": {
                 "langfuse_session_id": session_id,
@@ -117,17 +148,11 @@ async def run_chat_agent(
 
         if is_interrupted:
             logger.info("기존 대화 이어서 진행", thread_id=thread_id)
-            result_state = await asyncio.wait_for(
-                workflow.ainvoke(
-                    Command(resume=answer),
-                    config=config,
-                ),
-                timeout=settings.workflow_timeout,
-            )
+            workflow_input: ChatState | Command = Command(resume=answer)
         else:
             logger.info("새 대화 시작", thread_id=thread_id)
             human_message: ChatMessage = {"role": "human", "content": answer}
-            initial_state: ChatState = {
+            workflow_input = {
                 "resume_json": resume_json,
                 "position": position,
                 "interview_type": interview_type,
@@ -142,10 +167,11 @@ async def run_chat_agent(
                 "last_follow_up": None,
                 "last_follow_up_intent": None,
             }
-            result_state = await asyncio.wait_for(
-                workflow.ainvoke(initial_state, config=config),
-                timeout=settings.workflow_timeout,
-            )
+
+        result_state = await asyncio.wait_for(
+            _run_workflow(workflow, workflow_input, config, on_message_delta),
+            timeout=settings.workflow_timeout,
+        )
 
         error_message = result_state.get("error_message")
         if error_message:
@@ -3,10 +3,15 @@
 interrupt + Command 패턴으로 사용자 입력을 기다리며 대화를 이어갑니다
 체크포인터가 각 턴의 상태를 저장하므로 같은 thread_id로 호출하면
 이전 대화를 기억합니다
+configurable의 stream_message가 켜져 있으면 면접관 메시지 토큰을
+custom 스트림 이벤트({"message_delta": ...})로 내보냅니다
 """
 
+from collections.abc import Callable
+
 from langchain_core.runnables import RunnableConfig
 from langgraph.checkpoint.base import BaseCheckpointSaver
+from langgraph.config import get_stream_writer
 from langgraph.graph import END, StateGraph
 from langgraph.graph.state import CompiledStateGraph
 from langgraph.types import Command, interrupt
@@ -37,12 +42,21 @@ def _format_conversation_history(messages: list[ChatMessage]) -> str:
     return "\n".join(lines)
 
 
+def _message_delta_writer() -> Callable[[str], None]:
+    """면접관 메시지 토큰을 custom 스트림 이벤트로 내보내는 함수"""
+    writer = get_stream_writer()
+    return lambda delta: writer({"message_delta": delta})
+
+
 async def respond_node(state: ChatState, config: RunnableConfig) -> ChatState:
     """LLM을 호출하여 면접관 응답을 생성하는 노드"""
     messages = state.get("messages", [])
     turn_count = state.get("turn_count", 0)
     session_id = state.get("session_id")
     callbacks = config.get("callbacks", [])
+    on_message_delta = (
+        _message_delta_writer() if config.get("configurable", {}).get("stream_message") else None
+    )
 
     logger.info("respond_node 시작", turn_count=turn_count)
 
@@ -58,6 +72,7 @@ async def respond_node(state: ChatState, config: RunnableConfig) -> ChatState:
                 answer=messages[-1]["content"] if messages else "",
                 session_id=session_id,
                 callbacks=callbacks,
+                on_message_delta=on_message_delta,
             )
         else:
             conversation_history = _format_conversation_history(messages[:-1])
@@ -73,6 +88,7 @@ async def respond_node(state: ChatState, config: RunnableConfig) -> ChatState:
                 conversation_history=conversation_history,
                 session_id=session_id,
                 callbacks=callbacks,
+                on_message_delta=on_message_delta,
             )
 
         ai_message: ChatMessage = {"role": "ai", "content": result.message}
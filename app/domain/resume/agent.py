@@ -1,66 +1,95 @@
 import asyncio
 
+from langgraph.checkpoint.base import BaseCheckpointSaver
+from langgraph.graph.state import CompiledStateGraph
+
 from app.core.config import settings
 from app.core.logging import get_logger
 from app.domain.resume.schemas import ResumeData, ResumeRequest, ResumeState
 from app.domain.resume.workflow import create_resume_workflow
+from app.domain.resume.workflow_utils import ainvoke_resumable, clear_checkpoint
 from app.infra.llm.client import get_langfuse_handler
 
 logger = get_logger(__name__)
 
 _resume_workflow = create_resume_workflow()
+_checkpointed_workflow: CompiledStateGraph | None = None
+
+
+def _get_workflow(checkpointer: BaseCheckpointSaver | None) -> CompiledStateGraph:
+    """체크포인터 유무에 맞는 컴파일된 워크플로우 반환"""
+    global _checkpointed_workflow
+    if checkpointer is None:
+        return _resume_workflow
+    if _checkpointed_workflow is None or _checkpointed_workflow.checkpointer is not checkpointer:
+        _checkpointed_workflow = create_resume_workflow(checkpointer=checkpointer)
+    return _checkpointed_workflow
 
 
 async def run_resume_agent(
     request: ResumeRequest,
     session_id: str | None = None,
+    thread_id: str | None = None,
+    checkpointer: BaseCheckpointSaver | None = None,
 ) -> tuple[ResumeData | None, str | None]:
     """에이전트 기반 이력서 생성 워크플로우
 
+    체크포인터와 thread_id가 있으면 노드마다 상태를 저장하고,
+    같은 thread_id로 다시 호출하면 마지막으로 완료된 노드 다음부터 이어서 실행합니다
+
     Args:
         request: 이력서 생성 요청
         session_id: Langfuse 세션 ID
+        thread_id: 체크포인트 스레드 ID (작업 ID)
+        checkpointer: LangGraph 체크포인터
 
     Returns:
         resume_data, error_message 튜플
+
+    Raises:
+        TimeoutError: 워크플로우 타임아웃, 체크포인트를 남겨 작업 큐 재시도 시 이어서 실행
+        Exception: 그 밖의 재시도 가능한 실패, 체크포인트를 남김
     """
     logger.info(
         "에이전트 시작",
         repos=len(request.repo_urls),
         position=request.position,
         session_id=session_id,
+        thread_id=thread_id,
     )
 
-    try:
-        initial_state: ResumeState = {
-            "request": request,
-            "session_id": session_id,
-        }
+    workflow = _get_workflow(checkpointer)
+    langfuse_handler = get_langfuse_handler()
+    config = {"callbacks": [langfuse_handler]} if langfuse_handler else {}
+    if thread_id:
+        config["configurable"] = {"thread_id": thread_id}
 
-        langfuse_handler = get_langfuse_handler()
-        config = {"callbacks": [langfuse_handler]} if langfuse_handler else {}
+    initial_state: ResumeState = {
+        "request": request,
+        "session_id": session_id,
+    }
 
-        final_state = await asyncio.wait_for(
-            _resume_workflow.ainvoke(initial_state, config=config),
-            timeout=settings.workflow_timeout,
+    try:
+        final_state = await ainvoke_resumable(
+            workflow, initial_state, config, timeout=settings.workflow_timeout
         )
+    except asyncio.TimeoutError:
+        logger.error("워크플로우 타임아웃, 재시도 대기", timeout=settings.workflow_timeout)
+        raise
+    except Exception as e:
+        logger.error("에이전트 실패, 재시도 대기", error=str(e), exc_info=True)
+        raise
 
-        if final_state.get("error_code"):
-            error_msg = final_state.get("error_message", "알 수 없는 오류")
-            logger.error("워크플로우 실패", error_code=final_state.get("error_code"))
-            return None, error_msg
-
-        resume_data = final_state.get("resume_data")
-        if not resume_data:
-            return None, "이력서 생성 실패"
+    await clear_checkpoint(workflow, config)
 
-        logger.info("에이전트 완료", projects=len(resume_data.projects))
-        return resume_data, None
+    if final_state.get("error_code"):
+        error_msg = final_state.get("error_message", "알 수 없는 오류")
+        logger.error("워크플로우 실패", error_code=final_state.get("error_code"))
+        return None, error_msg
 
-    except asyncio.TimeoutError:
-        logger.error("워크플로우 타임아웃", timeout=settings.workflow_timeout)
-        return None, f"워크플로우 타임아웃: {settings.workflow_timeout}초 초과"
+    resume_data = final_state.get("resume_data")
+    if not resume_data:
+        return None, "이력서 생성 실패"
 
-    except Exception as e:
-        logger.error("에이전트 실패", error=str(e), exc_info=True)
-        return None, "알 수 없는 오류가 발생했습니다"
+    logger.info("에이전트 완료", projects=len(resume_data.projects))
+    return resume_data, None
@@ -1,66 +1,91 @@
 import asyncio
 
+from langgraph.checkpoint.base import BaseCheckpointSaver
+from langgraph.graph.state import CompiledStateGraph
+
 from app.core.config import settings
 from app.core.exceptions import ErrorCode
 from app.core.logging import get_logger
 from app.domain.resume.edit_workflow import create_edit_workflow
 from app.domain.resume.schemas.edit import EditResumeOutput, EditState
+from app.domain.resume.workflow_utils import ainvoke_resumable, clear_checkpoint
 from app.infra.llm.client import get_langfuse_handler
 
 logger = get_logger(__name__)
 
 _edit_workflow = create_edit_workflow()
+_checkpointed_workflow: CompiledStateGraph | None = None
+
+
+def _get_workflow(checkpointer: BaseCheckpointSaver | None) -> CompiledStateGraph:
+    """체크포인터 유무에 맞는 컴파일된 워크플로우 반환"""
+    global _checkpointed_workflow
+    if checkpointer is None:
+        return _edit_workflow
+    if _checkpointed_workflow is None or _checkpointed_workflow.checkpointer is not checkpointer:
+        _checkpointed_workflow = create_edit_workflow(checkpointer=checkpointer)
+    return _checkpointed_workflow
 
 
 async def run_edit_agent(
     resume_json: str,
     message: str,
     session_id: str | None = None,
+    thread_id: str | None = None,
+    checkpointer: BaseCheckpointSaver | None = None,
 ) -> tuple[EditResumeOutput | None, str | None, ErrorCode | None]:
     """이력서 수정 워크플로우 실행
 
+    체크포인터와 thread_id가 있으면 같은 thread_id로 다시 호출할 때
+    마지막으로 완료된 노드 다음부터 이어서 실행합니다
+
     Returns:
         edited_resume, error_message, error_code 튜플
+
+    Raises:
+        TimeoutError: 워크플로우 타임아웃, 체크포인트를 남겨 작업 큐 재시도 시 이어서 실행
+        Exception: 그 밖의 재시도 가능한 실패, 체크포인트를 남김
     """
-    logger.info("수정 에이전트 시작", session_id=session_id)
+    logger.info("수정 에이전트 시작", session_id=session_id, thread_id=thread_id)
+
+    workflow = _get_workflow(checkpointer)
+    langfuse_handler = get_langfuse_handler()
+    config = {"callbacks": [langfuse_handler]} if langfuse_handler else {}
+    if thread_id:
+        config["configurable"] = {"thread_id": thread_id}
+
+    initial_state: EditState = {
+        "resume_json": resume_json,
+        "message": message,
+        "session_id": session_id,
+        "retry_count": 0,
+    }
 
     try:
-        initial_state: EditState = {
-            "resume_json": resume_json,
-            "message": message,
-            "session_id": session_id,
-            "retry_count": 0,
-        }
-
-        langfuse_handler = get_langfuse_handler()
-        config = {"callbacks": [langfuse_handler]} if langfuse_handler else {}
-
-        final_state = await asyncio.wait_for(
-            _edit_workflow.ainvoke(initial_state, config=config),
-            timeout=settings.workflow_timeout,
+        final_state = await ainvoke_resumable(
+            workflow, initial_state, config, timeout=settings.workflow_timeout
         )
+    except asyncio.TimeoutError:
+        logger.error("수정 워크플로우 타임아웃, 재시도 대기", timeout=settings.workflow_timeout)
+        raise
+    except Exception as e:
+        logger.error("수정 에이전트 실패, 재시도 대기", error=str(e), exc_info=True)
+        raise
 
-        if final_state.get("error_code"):
-            error_msg = final_state.get("error_message", "알 수 없는 오류")
-            error_code = final_state.get("error_code")
-            if error_code == ErrorCode.EDIT_OUT_OF_SCOPE:
-                logger.info("범위 밖 요청 거절", error_code=error_code)
-            else:
-                logger.error("수정 워크플로우 실패", error_code=error_code)
-            return None, error_msg, error_code
-
-        edited_resume = final_state.get("edited_resume")
-        if not edited_resume:
-            return None, "이력서 수정 실패", ErrorCode.EDIT_FAILED
+    await clear_checkpoint(workflow, config)
 
-        logger.info("수정 에이전트 완료", projects=len(edited_resume.projects))
-        return edited_resume, None, None
+    if final_state.get("error_code"):
+        error_msg = final_state.get("error_message", "알 수 없는 오류")
+        error_code = final_state.get("error_code")
+        if error_code == ErrorCode.EDIT_OUT_OF_SCOPE:
+            logger.info("범위 밖 요청 거절", error_code=error_code)
+        else:
+            logger.error("수정 워크플로우 실패", error_code=error_code)
+        return None, error_msg, error_code
 
-    except asyncio.TimeoutError:
-        logger.error("수정 워크플로우 타임아웃", timeout=settings.workflow_timeout)
-        timeout_msg = f"워크플로우 타임아웃: {settings.workflow_timeout}초 초과"
-        return None, timeout_msg, ErrorCode.EDIT_FAILED
+    edited_resume = final_state.get("edited_resume")
+    if not edited_resume:
+        return None, "이력서 수정 실패", ErrorCode.EDIT_FAILED
 
-    except Exception as e:
-        logger.error("수정 에이전트 실패", error=str(e), exc_info=True)
-        return None, "알 수 없는 오류가 발생했습니다", ErrorCode.EDIT_FAILED
+    logger.info("수정 에이전트 완료", projects=len(edited_resume.projects))
+    return edited_resume, None, None
@@ -1,6 +1,7 @@
 import json
 
 import httpx
+from langgraph.checkpoint.base import BaseCheckpointSaver
 from langgraph.graph import END, StateGraph
 from langgraph.graph.state import CompiledStateGraph
 
@@ -339,11 +340,19 @@ def _should_continue_after_plan(state: EditState) -> str:
     return "end" if state.get("error_code") else "edit"
 
 
-def create_edit_workflow() -> CompiledStateGraph:
+def create_edit_workflow(
+    checkpointer: BaseCheckpointSaver | None = None,
+) -> CompiledStateGraph:
     """이력서 수정 워크플로우 생성
 
     워크플로우: classify → [plan → edit | reject] → evaluate → retry/END
+
+    checkpointer가 있으면 노드 완료마다 상태를 저장하여 중단된 작업을 이어서 실행할 수 있습니다
+    LangGraph Studio에서 dict를 전달하는 경우 None으로 폴백합니다
     """
+    if checkpointer is not None and not isinstance(checkpointer, BaseCheckpointSaver):
+        checkpointer = None
+
     workflow = StateGraph(EditState)
 
     workflow.add_node("classify", classify_node)
@@ -389,4 +398,4 @@ def create_edit_workflow() -> CompiledStateGraph:
         },
     )
 
-    return workflow.compile()
+    return workflow.compile(checkpointer=checkpointer)
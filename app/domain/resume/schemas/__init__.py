@@ -2,6 +2,8 @@ from app.domain.resume.schemas.base import (
     EvaluationOutput,
     ProjectInfo,
     ProjectInfoDict,
+    ProjectPipelineResult,
+    ProjectPipelineState,
     ResumeData,
     ResumeRequest,
     ResumeState,
@@ -27,6 +29,8 @@ __all__ = [
     "ResumeRequest",
     "ProjectInfo",
     "ProjectInfoDict",
+    "ProjectPipelineState",
+    "ProjectPipelineResult",
     "ResumeData",
     "EvaluationOutput",
     "ResumeState",
@@ -1,4 +1,4 @@
-from typing import Literal, TypedDict
+from typing import Annotated, Literal, TypedDict
 
 from pydantic import AliasChoices, BaseModel, Field, field_validator
 
@@ -68,6 +68,40 @@ class EvaluationOutput(BaseModel):
     feedback: str
 
 
+class ProjectPipelineState(TypedDict):
+    """프로젝트별 plan→generate→evaluate 파이프라인 입력"""
+
+    request: ResumeRequest
+    session_id: str | None
+    index: int
+    project: ProjectInfoDict
+    repo_context: RepoContext | None
+
+
+class ProjectPipelineResult(TypedDict, total=False):
+    """프로젝트별 파이프라인 결과
+
+    verdict는 파이프라인 안에서 평가한 경우에만 pass/fail, 평가하지 않았으면 None
+    """
+
+    index: int
+    plan: ProjectPlan
+    project: ProjectInfo | None
+    verdict: str | None
+    feedback: str
+    format_violations: list[dict]
+    error_code: str
+    error_message: str
+
+
+def merge_project_results(
+    left: dict[str, ProjectPipelineResult] | None,
+    right: dict[str, ProjectPipelineResult] | None,
+) -> dict[str, ProjectPipelineResult]:
+    """프로젝트 파이프라인 결과 병합 - 같은 키는 덮어써서 전체 상태를 다시 반환해도 중복되지 않음"""
+    return {**(left or {}), **(right or {})}
+
+
 class ResumeState(TypedDict, total=False):
     """LangGraph 워크플로우 상태"""
 
@@ -83,4 +117,8 @@ class ResumeState(TypedDict, total=False):
     error_message: str
     evaluation: str
     evaluation_feedback: str
+    project_verdicts: dict[str, str]
+    project_feedback: dict[str, str]
+    format_violations: list[dict]
+    project_results: Annotated[dict[str, ProjectPipelineResult], merge_project_results]
     retry_count: int
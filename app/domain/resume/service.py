@@ -3,6 +3,7 @@ import re
 
 import httpx
 
+from app.core.config import settings
 from app.core.context import github_mock_var
 from app.core.logging import get_logger
 from app.domain.resume.constants import (
@@ -14,12 +15,19 @@ from app.domain.resume.constants import (
 )
 from app.domain.resume.parsers import DEPENDENCY_FILE_NAMES, parse_dependency_file
 from app.domain.resume.schemas import ProjectInfoDict, RepoContext, ResumeRequest, UserStats
+from app.domain.resume.snapshot_store import ProjectSnapshot, get_snapshot_store
+from app.infra.github.blob_cache import BlobCache, get_blob_cache
 from app.infra.github.client import (
     get_authenticated_user,
     get_files_content,
+    get_head_commit,
+    get_project_history_since,
     get_project_info,
     get_repo_context,
+    get_repo_tree_entries,
+    get_repos_batch_graphql,
     get_user_stats,
+    head_commit_from_node,
     parse_repo_url,
 )
 
@@ -27,13 +35,14 @@ __all__ = [
     "collect_project_info",
     "collect_repo_contexts",
     "collect_user_stats",
+    "prefetch_repositories",
     "filter_tech_stack_by_position",
     "validate_position_match",
 ]
 
 logger = get_logger(__name__)
 
-GITHUB_API_SEMAPHORE_LIMIT = 5
+SNAPSHOT_HISTORY_LIMIT = 50
 
 MEANINGFUL_EXTENSIONS = frozenset(
     [
@@ -226,80 +235,247 @@ def _filter_and_sort_dependencies(deps: list[str]) -> list[str]:
     return sorted_deps
 
 
+async def _resolve_head_commit(
+    repo_url: str, token: str | None, prefetched: dict | None
+) -> dict | None:
+    """스냅샷 비교용 HEAD 커밋 조회, 배치 결과가 있으면 추가 요청 없이 사용"""
+    if prefetched is not None:
+        return head_commit_from_node(prefetched)
+    try:
+        return await get_head_commit(repo_url, token)
+    except Exception as e:
+        logger.warning(
+            "HEAD 커밋 조회 실패, 스냅샷 미사용", repo_url=repo_url, error=type(e).__name__
+        )
+        return None
+
+
+def _merge_recent(recent: list, previous: list, key, limit: int) -> list:
+    """새 항목을 앞에 두고 키 중복을 제거해 최대 limit개 반환"""
+    seen = set()
+    merged = []
+    for item in [*recent, *previous]:
+        item_key = key(item)
+        if item_key in seen:
+            continue
+        seen.add(item_key)
+        merged.append(item)
+    return merged[:limit]
+
+
+async def _fetch_incremental_project_info(
+    repo_url: str,
+    token: str | None,
+    username: str | None,
+    author_name: str | None,
+    snapshot: ProjectSnapshot,
+) -> dict:
+    """스냅샷 커서 이후의 커밋과 PR만 조회해 스냅샷 이력과 병합"""
+    file_entries, recent = await asyncio.gather(
+        get_repo_tree_entries(repo_url, token),
+        get_project_history_since(
+            repo_url, snapshot.cursor, token, author=username, author_name=author_name
+        ),
+    )
+    logger.info(
+        "프로젝트 스냅샷 증분 병합",
+        repo_url=repo_url,
+        new_commits=len(recent["commits"]),
+        new_prs=len(recent["pulls"]),
+    )
+    return {
+        "file_tree": [entry["path"] for entry in file_entries],
+        "file_entries": file_entries,
+        "commits": _merge_recent(
+            recent["commits"], snapshot.commits, lambda c: c.sha, SNAPSHOT_HISTORY_LIMIT
+        ),
+        "pulls": _merge_recent(
+            recent["pulls"], snapshot.pulls, lambda p: p.number, SNAPSHOT_HISTORY_LIMIT
+        ),
+    }
+
+
+async def _build_project_info(
+    repo_url: str, repo_name: str, project_info: dict, token: str | None
+) -> ProjectInfoDict | None:
+    """수집한 트리와 이력으로 ProjectInfoDict 구성, 빈 레포면 None"""
+    file_tree = project_info["file_tree"]
+    commits = _filter_noise_commits(project_info["commits"])
+    pulls = project_info["pulls"]
+
+    if _is_empty_repository(file_tree):
+        logger.info("빈 레포지토리 스킵", repo=repo_name)
+        return None
+
+    dependencies = await _parse_dependencies(
+        repo_url, file_tree, token, project_info.get("file_entries")
+    )
+    messages = _format_messages(commits, pulls)
+
+    logger.info(
+        "프로젝트 정보 수집 완료",
+        repo=repo_name,
+        files=len(file_tree),
+        deps=len(dependencies),
+        messages=len(messages),
+    )
+
+    return {
+        "repo_name": repo_name,
+        "repo_url": repo_url,
+        "file_tree": _summarize_file_tree(file_tree),
+        "dependencies": dependencies,
+        "messages": messages,
+    }
+
+
 async def _collect_single_project(
     repo_url: str,
     token: str | None,
     username: str | None,
     author_name: str | None,
-    semaphore: asyncio.Semaphore,
+    prefetched: dict | None = None,
 ) -> ProjectInfoDict | None:
     """단일 레포지토리의 프로젝트 정보 수집
 
+    스냅샷 저장소가 활성화되어 있으면 HEAD oid가 같을 때 스냅샷을 그대로 반환하고,
+    달라졌으면 배치 결과가 없는 경우에 한해 커서 이후 이력만 조회해 병합
+
     Args:
         repo_url: GitHub 레포지토리 URL
         token: GitHub OAuth 토큰
         username: 인증된 사용자명
         author_name: 인증된 사용자 실명
-        semaphore: GitHub API 동시 요청 제한 세마포어
+        prefetched: 배치 쿼리로 미리 조회한 repository 노드
 
     Returns:
         프로젝트 정보 딕셔너리, 수집 실패 또는 빈 레포이면 None
     """
     _, repo_name = parse_repo_url(repo_url)
 
-    async with semaphore:
-        try:
+    try:
+        store = get_snapshot_store()
+        head = await _resolve_head_commit(repo_url, token, prefetched) if store else None
+        snapshot = await store.aget_project(repo_url, username) if head else None
+
+        if snapshot is not None and snapshot.head_oid == head["oid"]:
+            logger.info("프로젝트 스냅샷 적중", repo=repo_name, head=head["oid"][:7])
+            return snapshot.project_info
+
+        if snapshot is not None and snapshot.cursor and prefetched is None:
+            project_info = await _fetch_incremental_project_info(
+                repo_url, token, username, author_name, snapshot
+            )
+        else:
             project_info = await get_project_info(
                 repo_url,
                 token,
                 author=username,
                 author_name=author_name,
-            )
-            file_tree = project_info["file_tree"]
-            commits = _filter_noise_commits(project_info["commits"])
-            pulls = project_info["pulls"]
-
-            if _is_empty_repository(file_tree):
-                logger.info("빈 레포지토리 스킵", repo=repo_name)
-                return None
-
-            dependencies = await _parse_dependencies(repo_url, file_tree, token)
-            messages = _format_messages(commits, pulls)
-
-            logger.info(
-                "프로젝트 정보 수집 완료",
-                repo=repo_name,
-                files=len(file_tree),
-                deps=len(dependencies),
-                messages=len(messages),
+                prefetched=prefetched,
             )
 
-            return {
-                "repo_name": repo_name,
-                "repo_url": repo_url,
-                "file_tree": _summarize_file_tree(file_tree),
-                "dependencies": dependencies,
-                "messages": messages,
-            }
-
-        except httpx.HTTPStatusError as e:
-            logger.error(
-                "프로젝트 정보 수집 실패 - HTTP 오류",
-                repo=repo_name,
-                status=e.response.status_code,
+        result = await _build_project_info(repo_url, repo_name, project_info, token)
+        if result is not None and head is not None:
+            await store.aput_project(
+                repo_url,
+                username,
+                ProjectSnapshot(
+                    head_oid=head["oid"],
+                    cursor=head.get("committed_date"),
+                    project_info=result,
+                    commits=project_info["commits"],
+                    pulls=project_info["pulls"],
+                ),
             )
-            return None
+        return result
+
+    except httpx.HTTPStatusError as e:
+        logger.error(
+            "프로젝트 정보 수집 실패 - HTTP 오류",
+            repo=repo_name,
+            status=e.response.status_code,
+        )
+        return None
+
+    except Exception as e:
+        logger.error("프로젝트 정보 수집 실패", repo=repo_name, error=str(e), exc_info=True)
+        return None
+
+
+def _successful_batch_node(batch: dict[str, dict | Exception] | None, repo_url: str) -> dict | None:
+    """배치 결과에서 성공한 repository 노드만 반환, 실패하면 None으로 개별 조회 폴백"""
+    if not batch:
+        return None
+    node = batch.get(repo_url)
+    return None if isinstance(node, Exception) else node
+
+
+async def _snapshot_served_urls(urls: list[str], token: str) -> set[str]:
+    """배치 조회에서 뺄 레포 - 스냅샷이 있고 HEAD가 같거나 커서 이후 증분 병합이 가능한 레포
+
+    스냅샷이 있는 레포만 조건부 요청으로 HEAD oid를 먼저 확인한다
+    """
+    store = get_snapshot_store()
+    if store is None:
+        return set()
+    username, _ = await get_authenticated_user(token)
+
+    async def served(repo_url: str) -> bool:
+        snapshot = await store.aget_project(repo_url, username)
+        if snapshot is None:
+            return False
+        if snapshot.cursor:
+            return True
+        head = await _resolve_head_commit(repo_url, token, None)
+        return head is not None and head["oid"] == snapshot.head_oid
+
+    results = await asyncio.gather(*(served(url) for url in urls))
+    return {url for url, is_served in zip(urls, results, strict=True) if is_served}
+
+
+async def prefetch_repositories(request: ResumeRequest) -> dict[str, dict | Exception]:
+    """모든 레포의 컨텍스트와 프로젝트 이력을 GraphQL 배치로 미리 조회
+
+    스냅샷으로 처리할 수 있는 레포는 배치에서 빼고, 수집 단계에서 HEAD oid 비교 후
+    스냅샷을 그대로 쓰거나 커서 이후 이력만 조회한다
 
-        except Exception as e:
-            logger.error("프로젝트 정보 수집 실패", repo=repo_name, error=str(e), exc_info=True)
-            return None
+    Args:
+        request: 이력서 생성 요청
+
+    Returns:
+        레포 URL별 repository 노드 또는 예외, 토큰이 없거나 배치 전체가 실패하면 빈 딕셔너리
+    """
+    if github_mock_var.get() or not request.github_token:
+        return {}
+
+    unique_urls = list(dict.fromkeys(request.repo_urls))
+    try:
+        served = await _snapshot_served_urls(unique_urls, request.github_token)
+        urls = [url for url in unique_urls if url not in served]
+        if served:
+            logger.info("스냅샷 레포 배치 제외", snapshot=len(served), batch=len(urls))
+        if not urls:
+            return {}
+        # 작성자 필터 모드에서는 커밋을 레포별 페이지네이션으로 따로 조회
+        commits_count = 0 if settings.github_author_history_enabled else 50
+        return await get_repos_batch_graphql(
+            urls, request.github_token, commits_count=commits_count
+        )
+    except Exception as e:
+        logger.warning("GraphQL 배치 사전 조회 실패, 레포별 조회로 폴백", error=type(e).__name__)
+        return {}
 
 
-async def collect_project_info(request: ResumeRequest) -> list[ProjectInfoDict]:
+async def collect_project_info(
+    request: ResumeRequest,
+    batch: dict[str, dict | Exception] | None = None,
+) -> list[ProjectInfoDict]:
     """파일 목록 + 의존성 파일 기반으로 프로젝트 정보 수집
 
     Args:
         request: 이력서 생성 요청
+        batch: prefetch_repositories 결과, 실패한 레포는 개별 조회로 폴백
 
     Returns:
         유효한 프로젝트 정보 리스트
@@ -321,9 +497,14 @@ async def collect_project_info(request: ResumeRequest) -> list[ProjectInfoDict]:
         if username:
             logger.info("인증된 사용자로 필터링", username=username, name=author_name)
 
-    semaphore = asyncio.Semaphore(GITHUB_API_SEMAPHORE_LIMIT)
     tasks = [
-        _collect_single_project(repo_url, request.github_token, username, author_name, semaphore)
+        _collect_single_project(
+            repo_url,
+            request.github_token,
+            username,
+            author_name,
+            _successful_batch_node(batch, repo_url),
+        )
         for repo_url in unique_urls
     ]
     gathered = await asyncio.gather(*tasks)
@@ -384,13 +565,67 @@ def _summarize_file_tree(file_tree: list[str]) -> list[str]:
     return summary
 
 
-async def _parse_dependencies(repo_url: str, file_tree: list[str], token: str | None) -> list[str]:
+async def _parse_cached_blob(blob_cache: BlobCache, file_path: str, sha: str | None) -> dict | None:
+    """blob 캐시에서 파싱 결과 조회, 원문만 있으면 파싱 후 저장, 없으면 None"""
+    if not sha:
+        return None
+    filename = file_path.split("/")[-1]
+    parsed = await blob_cache.aget_parsed(sha, filename)
+    if parsed is None:
+        content = await blob_cache.aget_content(sha)
+        if content is not None:
+            parsed = parse_dependency_file(filename, content)
+            await blob_cache.aput_parsed(sha, filename, parsed)
+    return parsed
+
+
+async def _fetch_dependency_files(
+    repo_url: str,
+    paths: list[str],
+    token: str | None,
+    entries: dict[str, dict],
+    blob_cache: BlobCache,
+) -> list[dict]:
+    """의존성 파일을 GitHub에서 조회해 파싱하고 blob SHA가 있으면 캐시에 저장"""
+    file_sizes = {
+        path: entries[path]["size"]
+        for path in paths
+        if entries.get(path, {}).get("size") is not None
+    }
+    contents = await get_files_content(repo_url, paths, token, file_sizes)
+
+    parsed_files = []
+    for file_path, content in contents.items():
+        if not content:
+            continue
+
+        filename = file_path.split("/")[-1]
+        parsed = parse_dependency_file(filename, content)
+        parsed_files.append(parsed)
+
+        sha = entries.get(file_path, {}).get("sha")
+        if sha:
+            await blob_cache.aput_content(sha, content)
+            await blob_cache.aput_parsed(sha, filename, parsed)
+    return parsed_files
+
+
+async def _parse_dependencies(
+    repo_url: str,
+    file_tree: list[str],
+    token: str | None,
+    file_entries: list[dict] | None = None,
+) -> list[str]:
     """파일 트리에서 의존성 파일을 찾아 파싱
 
+    트리 항목에 blob SHA가 있으면 blob 캐시에서 파싱 결과나 원문을 먼저 찾고,
+    캐시에 없는 파일만 GitHub에서 조회한다
+
     Args:
         repo_url: GitHub 레포지토리 URL
         file_tree: 파일 경로 리스트
         token: GitHub 토큰
+        file_entries: get_repo_tree_entries 결과, 파일별 크기와 blob SHA
 
     Returns:
         의존성 패키지 리스트
@@ -404,19 +639,36 @@ async def _parse_dependencies(repo_url: str, file_tree: list[str], token: str |
     if not dependency_paths:
         return []
 
-    contents = await get_files_content(repo_url, dependency_paths, token)
+    entries = {entry["path"]: entry for entry in file_entries or []}
+    blob_cache = get_blob_cache()
 
-    all_deps = []
-    for file_path, content in contents.items():
-        if not content:
-            continue
+    parsed_files: list[dict] = []
+    paths_to_fetch = []
+    for file_path in dependency_paths:
+        parsed = await _parse_cached_blob(
+            blob_cache, file_path, entries.get(file_path, {}).get("sha")
+        )
+        if parsed is not None:
+            parsed_files.append(parsed)
+        else:
+            paths_to_fetch.append(file_path)
+
+    if paths_to_fetch:
+        parsed_files.extend(
+            await _fetch_dependency_files(repo_url, paths_to_fetch, token, entries, blob_cache)
+        )
 
-        filename = file_path.split("/")[-1]
-        parsed = parse_dependency_file(filename, content)
-        deps = parsed.get("dependencies", [])
-        dev_deps = parsed.get("devDependencies", [])
-        all_deps.extend(deps)
-        all_deps.extend(dev_deps)
+    logger.debug(
+        "의존성 파일 조회",
+        total=len(dependency_paths),
+        cached=len(dependency_paths) - len(paths_to_fetch),
+        fetched=len(paths_to_fetch),
+    )
+
+    all_deps = []
+    for parsed in parsed_files:
+        all_deps.extend(parsed.get("dependencies", []))
+        all_deps.extend(parsed.get("devDependencies", []))
 
     unique_deps = list(set(all_deps))
     filtered_deps = _filter_and_sort_dependencies(unique_deps)
@@ -454,46 +706,60 @@ def _format_messages(commits: list, pulls: list) -> list[str]:
 async def _collect_single_context(
     repo_url: str,
     token: str | None,
-    semaphore: asyncio.Semaphore,
+    prefetched: dict | None = None,
 ) -> tuple[str, RepoContext]:
     """단일 레포지토리의 컨텍스트 정보 수집
 
     Args:
         repo_url: GitHub 레포지토리 URL
         token: GitHub OAuth 토큰
-        semaphore: GitHub API 동시 요청 제한 세마포어
+        prefetched: 배치 쿼리로 미리 조회한 repository 노드
 
     Returns:
         레포 이름과 RepoContext 튜플
     """
     _, repo_name = parse_repo_url(repo_url)
 
-    async with semaphore:
-        try:
-            context = await get_repo_context(repo_url, token)
-            return repo_name, RepoContext(
-                name=repo_name,
-                languages=context["languages"],
-                description=context["description"],
-                topics=context["topics"],
-                readme_summary=context["readme"],
-            )
-        except Exception as e:
-            logger.warning("컨텍스트 수집 실패", repo=repo_name, error=str(e))
-            return repo_name, RepoContext(
-                name=repo_name,
-                languages={},
-                description=None,
-                topics=[],
-                readme_summary=None,
-            )
+    try:
+        store = get_snapshot_store()
+        head = await _resolve_head_commit(repo_url, token, prefetched) if store else None
+        if head is not None and prefetched is None:
+            cached = await store.aget_context(repo_url, head["oid"])
+            if cached is not None:
+                logger.info("컨텍스트 스냅샷 적중", repo=repo_name, head=head["oid"][:7])
+                return repo_name, cached
+
+        context = await get_repo_context(repo_url, token, prefetched)
+        repo_context = RepoContext(
+            name=repo_name,
+            languages=context["languages"],
+            description=context["description"],
+            topics=context["topics"],
+            readme_summary=context["readme"],
+        )
+        if head is not None:
+            await store.aput_context(repo_url, head["oid"], repo_context)
+        return repo_name, repo_context
+    except Exception as e:
+        logger.warning("컨텍스트 수집 실패", repo=repo_name, error=str(e))
+        return repo_name, RepoContext(
+            name=repo_name,
+            languages={},
+            description=None,
+            topics=[],
+            readme_summary=None,
+        )
 
 
-async def collect_repo_contexts(request: ResumeRequest) -> dict[str, RepoContext]:
+async def collect_repo_contexts(
+    request: ResumeRequest,
+    batch: dict[str, dict | Exception] | None = None,
+) -> dict[str, RepoContext]:
     """각 레포지토리의 컨텍스트 정보 수집
 
     Args:
         request: 이력서 생성 요청
+        batch: prefetch_repositories 결과, 실패한 레포는 개별 조회로 폴백
 
     Returns:
         레포 이름을 키로 하는 RepoContext 딕셔너리
@@ -508,9 +774,10 @@ async def collect_repo_contexts(request: ResumeRequest) -> dict[str, RepoContext
         }
 
     unique_urls = list(dict.fromkeys(request.repo_urls))
-    semaphore = asyncio.Semaphore(GITHUB_API_SEMAPHORE_LIMIT)
     tasks = [
-        _collect_single_context(repo_url, request.github_token, semaphore)
+        _collect_single_context(
+            repo_url, request.github_token, _successful_batch_node(batch, repo_url)
+        )
         for repo_url in unique_urls
     ]
     results = await asyncio.gather(*tasks)
@@ -0,0 +1,219 @@
+"""레포별 수집 결과 스냅샷 저장소
+
+기본 브랜치 HEAD 커밋 oid와 함께 가공된 ProjectInfoDict와 RepoContext를 SQLite에 저장
+다음 작업에서 HEAD oid가 같으면 스냅샷을 그대로 쓰고, 다르면 저장된 커서(HEAD 커밋 시각)
+이후의 커밋과 PR만 조회해 병합한다. 오래된 스냅샷은 보관 기간과 최대 개수 기준으로 삭제
+SQLite 접근은 비동기 메서드에서 스레드로 실행하고, 만료/초과분 정리는 저장 prune_interval회마다 한다
+"""
+
+import asyncio
+import json
+import os
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+
+from app.core.config import settings
+from app.core.logging import get_logger
+from app.domain.resume.schemas import CommitInfo, PRInfoExtended, ProjectInfoDict, RepoContext
+
+logger = get_logger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS repo_snapshots (
+    snapshot_key TEXT PRIMARY KEY,
+    head_oid TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    accessed_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_repo_snapshots_accessed_at
+    ON repo_snapshots (accessed_at);
+"""
+
+
+@dataclass
+class ProjectSnapshot:
+    """레포 프로젝트 정보 스냅샷 - 증분 병합을 위해 원본 커밋과 PR도 보관"""
+
+    head_oid: str
+    cursor: str | None
+    project_info: ProjectInfoDict
+    commits: list[CommitInfo]
+    pulls: list[PRInfoExtended]
+
+
+class RepoSnapshotStore:
+    """HEAD oid 기준 레포 스냅샷 SQLite 저장소"""
+
+    def __init__(
+        self,
+        path: str,
+        max_entries: int = 1000,
+        max_age_seconds: float = 604800,
+        prune_interval: int = 50,
+    ):
+        self._path = path
+        self._max_entries = max_entries
+        self._max_age = max_age_seconds
+        self._prune_interval = max(1, prune_interval)
+        self._puts_since_prune = 0
+        self._conn: sqlite3.Connection | None = None
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _project_key(repo_url: str, username: str | None) -> str:
+        return f"project|{repo_url}|{(username or '').lower()}"
+
+    @staticmethod
+    def _context_key(repo_url: str) -> str:
+        return f"context|{repo_url}"
+
+    def _connect(self) -> sqlite3.Connection:
+        """SQLite 연결 지연 초기화"""
+        if self._conn is None:
+            directory = os.path.dirname(self._path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            self._conn = sqlite3.connect(self._path, check_same_thread=False)
+            self._conn.executescript(_SCHEMA)
+        return self._conn
+
+    def _get(self, key: str) -> tuple[str, dict] | None:
+        """보관 기간 내 스냅샷의 oid와 payload 조회"""
+        with self._lock:
+            conn = self._connect()
+            row = conn.execute(
+                "SELECT head_oid, payload, created_at FROM repo_snapshots WHERE snapshot_key = ?",
+                (key,),
+            ).fetchone()
+            if row is None:
+                return None
+            head_oid, payload, created_at = row
+            if time.time() - created_at > self._max_age:
+                conn.execute("DELETE FROM repo_snapshots WHERE snapshot_key = ?", (key,))
+                conn.commit()
+                return None
+            conn.execute(
+                "UPDATE repo_snapshots SET accessed_at = ? WHERE snapshot_key = ?",
+                (time.time(), key),
+            )
+            conn.commit()
+        return head_oid, json.loads(payload)
+
+    def _put(self, key: str, head_oid: str, payload: dict) -> None:
+        """스냅샷 저장, prune_interval회마다 만료 항목과 최대 개수 초과분 제거"""
+        now = time.time()
+        data = json.dumps(payload, ensure_ascii=False)
+        with self._lock:
+            conn = self._connect()
+            conn.execute(
+                "INSERT OR REPLACE INTO repo_snapshots "
+                "(snapshot_key, head_oid, payload, created_at, accessed_at) VALUES (?, ?, ?, ?, ?)",
+                (key, head_oid, data, now, now),
+            )
+            self._puts_since_prune += 1
+            if self._puts_since_prune >= self._prune_interval:
+                self._puts_since_prune = 0
+                self._prune(conn, now)
+            conn.commit()
+
+    def _prune(self, conn: sqlite3.Connection, now: float) -> None:
+        conn.execute(
+            "DELETE FROM repo_snapshots WHERE created_at < ?",
+            (now - self._max_age,),
+        )
+        (count,) = conn.execute("SELECT COUNT(*) FROM repo_snapshots").fetchone()
+        overflow = count - self._max_entries
+        if overflow > 0:
+            conn.execute(
+                "DELETE FROM repo_snapshots WHERE snapshot_key IN ("
+                "SELECT snapshot_key FROM repo_snapshots ORDER BY accessed_at LIMIT ?)",
+                (overflow,),
+            )
+
+    def get_project(self, repo_url: str, username: str | None) -> ProjectSnapshot | None:
+        """사용자별 프로젝트 스냅샷 조회"""
+        row = self._get(self._project_key(repo_url, username))
+        if row is None:
+            return None
+        head_oid, payload = row
+        return ProjectSnapshot(
+            head_oid=head_oid,
+            cursor=payload.get("cursor"),
+            project_info=payload["project_info"],
+            commits=[CommitInfo(**commit) for commit in payload["commits"]],
+            pulls=[PRInfoExtended(**pr) for pr in payload["pulls"]],
+        )
+
+    def put_project(self, repo_url: str, username: str | None, snapshot: ProjectSnapshot) -> None:
+        """사용자별 프로젝트 스냅샷 저장"""
+        payload = {
+            "cursor": snapshot.cursor,
+            "project_info": snapshot.project_info,
+            "commits": [commit.model_dump() for commit in snapshot.commits],
+            "pulls": [pr.model_dump() for pr in snapshot.pulls],
+        }
+        self._put(self._project_key(repo_url, username), snapshot.head_oid, payload)
+
+    def get_context(self, repo_url: str, head_oid: str) -> RepoContext | None:
+        """HEAD oid가 일치하는 레포 컨텍스트 스냅샷 조회"""
+        row = self._get(self._context_key(repo_url))
+        if row is None or row[0] != head_oid:
+            return None
+        return RepoContext(**row[1])
+
+    def put_context(self, repo_url: str, head_oid: str, context: RepoContext) -> None:
+        """레포 컨텍스트 스냅샷 저장"""
+        self._put(self._context_key(repo_url), head_oid, context.model_dump())
+
+    async def aget_project(self, repo_url: str, username: str | None) -> ProjectSnapshot | None:
+        """사용자별 프로젝트 스냅샷 비동기 조회"""
+        return await asyncio.to_thread(self.get_project, repo_url, username)
+
+    async def aput_project(
+        self, repo_url: str, username: str | None, snapshot: ProjectSnapshot
+    ) -> None:
+        """사용자별 프로젝트 스냅샷 비동기 저장"""
+        await asyncio.to_thread(self.put_project, repo_url, username, snapshot)
+
+    async def aget_context(self, repo_url: str, head_oid: str) -> RepoContext | None:
+        """레포 컨텍스트 스냅샷 비동기 조회"""
+        return await asyncio.to_thread(self.get_context, repo_url, head_oid)
+
+    async def aput_context(self, repo_url: str, head_oid: str, context: RepoContext) -> None:
+        """레포 컨텍스트 스냅샷 비동기 저장"""
+        await asyncio.to_thread(self.put_context, repo_url, head_oid, context)
+
+    def close(self) -> None:
+        """SQLite 연결 종료"""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+_snapshot_store: RepoSnapshotStore | None = None
+
+
+def get_snapshot_store() -> RepoSnapshotStore | None:
+    """스냅샷 저장소 지연 초기화 싱글턴, 비활성화 시 None"""
+    global _snapshot_store
+    if not settings.resume_snapshot_enabled:
+        return None
+    if _snapshot_store is None:
+        _snapshot_store = RepoSnapshotStore(
+            settings.resume_snapshot_path,
+            max_entries=settings.resume_snapshot_max_entries,
+            max_age_seconds=settings.resume_snapshot_max_age,
+        )
+    return _snapshot_store
+
+
+def close_snapshot_store() -> None:
+    """스냅샷 저장소 종료"""
+    global _snapshot_store
+    if _snapshot_store is not None:
+        _snapshot_store.close()
+        _snapshot_store = None
@@ -1,12 +1,18 @@
 import asyncio
+import hashlib
+import json
+import time
 from typing import Literal
 
 import httpx
-from langgraph.cache.memory import InMemoryCache
+from langgraph.checkpoint.base import BaseCheckpointSaver
 from langgraph.graph import END, StateGraph
 from langgraph.graph.state import CompiledStateGraph
-from langgraph.types import CachePolicy
+from langgraph.types import CachePolicy, Send
+from prometheus_client import Counter
 
+from app.core.config import settings
+from app.core.context import github_mock_var
 from app.core.exceptions import ErrorCode, PositionMismatchError
 from app.core.logging import get_logger
 from app.domain.resume.error_handler import (
@@ -16,7 +22,12 @@ from app.domain.resume.error_handler import (
     handle_http_error,
 )
 from app.domain.resume.schemas import (
+    ProjectInfo,
     ProjectInfoDict,
+    ProjectPipelineResult,
+    ProjectPipelineState,
+    RepoContext,
+    ResumeData,
     ResumeState,
 )
 from app.domain.resume.schemas.plan import BulletPlan, ProjectPlan
@@ -25,26 +36,73 @@ from app.domain.resume.service import (
     collect_repo_contexts,
     collect_user_stats,
     filter_tech_stack_by_position,
+    prefetch_repositories,
     validate_position_match,
 )
+from app.domain.resume.task_graph import TaskGraph
+from app.domain.resume.validators import format_violations_as_feedback, validate_resume_format
 from app.domain.resume.workflow_utils import evaluate_with_fallback, has_error, make_should_retry
+from app.infra.cache.node_cache import get_node_cache
+from app.infra.github.cache import token_fingerprint
 from app.infra.github.client import get_authenticated_username, parse_repo_url
-from app.infra.llm.client import evaluate_resume, generate_resume, plan_resume
+from app.infra.llm.client import (
+    evaluate_resume,
+    generate_project_resume,
+    generate_resume,
+    plan_resume,
+)
+from app.infra.queue.progress import emit_progress
 
 logger = get_logger(__name__)
 
+MAX_GENERATE_RETRIES = 2
+
+FORMAT_VALIDATION_TOTAL = Counter(
+    "resume_format_validation_total",
+    "평가 전 형식 검증 결과 (passed: 평가로 진행, rejected: 평가 없이 재생성/종료)",
+    ["outcome"],
+)
+EVALUATOR_CALLS_SAVED = Counter(
+    "resume_evaluator_calls_saved_total",
+    "형식 검증 실패로 생략한 LLM 평가 호출 수",
+)
+
 
 async def _fetch_github_data(request) -> tuple[list, dict, object]:
-    """GitHub 데이터 병렬 수집 — 프로젝트 정보, 레포 컨텍스트, 사용자 통계 반환"""
-    project_info, repo_contexts = await asyncio.gather(
-        collect_project_info(request),
-        collect_repo_contexts(request),
-    )
-    username = await get_authenticated_username(request.github_token)
-    if not username:
-        username, _ = parse_repo_url(request.repo_urls[0])
-    user_stats = await collect_user_stats(username, request.github_token)
-    return project_info, repo_contexts, user_stats
+    """GitHub 데이터 수집 — 프로젝트 정보, 레포 컨텍스트, 사용자 통계 반환
+
+    신원 조회와 배치 사전 조회를 동시에 시작하고, 사용자 통계는 신원만,
+    프로젝트 정보와 레포 컨텍스트는 배치 결과만 기다리도록 의존 관계대로 실행
+    프로젝트 정보 내부의 신원 조회는 single-flight 메모로 공유됨
+    """
+
+    async def identity() -> str:
+        username = await get_authenticated_username(request.github_token)
+        if not username:
+            username, _ = parse_repo_url(request.repo_urls[0])
+        return username
+
+    async def batch() -> dict:
+        return await prefetch_repositories(request)
+
+    async def project_info(batch: dict) -> list:
+        return await collect_project_info(request, batch)
+
+    async def repo_contexts(batch: dict) -> dict:
+        return await collect_repo_contexts(request, batch)
+
+    async def user_stats(identity: str) -> object:
+        return await collect_user_stats(identity, request.github_token)
+
+    graph = TaskGraph("collect_data")
+    graph.add("identity", identity)
+    graph.add("batch", batch)
+    graph.add("project_info", project_info, deps=("batch",))
+    graph.add("repo_contexts", repo_contexts, deps=("batch",))
+    graph.add("user_stats", user_stats, deps=("identity",))
+
+    results = await graph.run()
+    return results["project_info"], results["repo_contexts"], results["user_stats"]
 
 
 def _filter_matched_projects(project_info: list, position: str) -> list:
@@ -67,10 +125,28 @@ def _filter_matched_projects(project_info: list, position: str) -> list:
     return matched
 
 
+def collect_data_cache_key(state: ResumeState) -> str:
+    """collect_data 캐시 키: 레포 URL, 포지션, 토큰 지문만 반영
+
+    세션 ID, 작업 ID, 회사명 등 수집 결과와 무관한 필드는 제외해 재시도와 재생성이 캐시를 공유한다
+    토큰 원문 대신 지문을 사용하여 캐시 저장소에 토큰이 남지 않도록 한다
+    """
+    request = state["request"]
+    payload = {
+        "repo_urls": [url.rstrip("/").lower() for url in request.repo_urls],
+        "position": request.position,
+        "identity": token_fingerprint(request.github_token),
+        "mock": github_mock_var.get(),
+    }
+    return hashlib.sha256(json.dumps(payload, sort_keys=True).encode()).hexdigest()
+
+
 async def collect_data_node(state: ResumeState) -> ResumeState:
     """데이터 수집 노드: 프로젝트 정보, 레포 컨텍스트, 사용자 통계 수집"""
     request = state["request"]
     logger.info("collect_data_node 시작", repos=len(request.repo_urls), position=request.position)
+    emit_progress("collect_data_started", repos=len(request.repo_urls))
+    started = time.monotonic()
 
     try:
         project_info, repo_contexts, user_stats = await _fetch_github_data(request)
@@ -95,8 +171,13 @@ async def collect_data_node(state: ResumeState) -> ResumeState:
                 "모든 프로젝트에서 포지션에 맞는 기술 스택을 찾지 못했습니다",
             )
 
+        emit_progress(
+            "collect_data_finished",
+            projects=len(matched_projects),
+            skipped=len(project_info) - len(matched_projects),
+            elapsed_s=round(time.monotonic() - started, 3),
+        )
         return {
-            **state,
             "project_info": matched_projects,
             "repo_contexts": repo_contexts,
             "user_stats": user_stats,
@@ -121,6 +202,45 @@ async def collect_data_node(state: ResumeState) -> ResumeState:
         )
 
 
+async def _plan_project(
+    project: ProjectInfoDict,
+    repo_context: RepoContext | None,
+    position: str,
+    session_id: str | None,
+) -> ProjectPlan:
+    """프로젝트 1개의 불릿 작성 계획 생성, 실패하면 커밋 메시지 기반 폴백 plan 반환"""
+    context_dict = None
+    if repo_context:
+        context_dict = {
+            "languages": repo_context.languages,
+            "description": repo_context.description,
+            "readme_summary": repo_context.readme_summary,
+        }
+
+    repo_name = project.get("repo_name", "unknown")
+    started = time.monotonic()
+    fallback = False
+    try:
+        plan = await plan_resume(
+            project_info=project,
+            position=position,
+            repo_context=context_dict,
+            session_id=session_id,
+        )
+    except Exception as e:
+        logger.warning("plan 실패, 폴백 생성", repo=repo_name, error=str(e))
+        plan = _create_fallback_plan(project)
+        fallback = True
+
+    emit_progress(
+        "plan_finished",
+        project=repo_name,
+        fallback=fallback,
+        elapsed_s=round(time.monotonic() - started, 3),
+    )
+    return plan
+
+
 async def plan_node(state: ResumeState) -> ResumeState:
     """Plan 노드: Gemini가 프로젝트별로 병렬 분석하여 불릿 작성 계획 생성"""
     project_info = state.get("project_info", [])
@@ -130,42 +250,20 @@ async def plan_node(state: ResumeState) -> ResumeState:
 
     logger.info("plan_node 시작", projects=len(project_info))
 
-    async def _plan_single_project(project: ProjectInfoDict) -> ProjectPlan:
-        repo_name = project.get("repo_name", "")
-        repo_context = repo_contexts.get(repo_name)
-        context_dict = None
-        if repo_context:
-            context_dict = {
-                "languages": repo_context.languages,
-                "description": repo_context.description,
-                "readme_summary": repo_context.readme_summary,
-            }
-
-        return await plan_resume(
-            project_info=project,
-            position=request.position,
-            repo_context=context_dict,
-            session_id=session_id,
+    plans = await asyncio.gather(
+        *(
+            _plan_project(
+                p, repo_contexts.get(p.get("repo_name", "")), request.position, session_id
+            )
+            for p in project_info
         )
-
-    tasks = [_plan_single_project(p) for p in project_info]
-    results = await asyncio.gather(*tasks, return_exceptions=True)
-
-    plans = []
-    for i, result in enumerate(results):
-        if isinstance(result, Exception):
-            repo_name = project_info[i].get("repo_name", "unknown")
-            logger.warning("plan 실패, 폴백 생성", repo=repo_name, error=str(result))
-            fallback = _create_fallback_plan(project_info[i])
-            plans.append(fallback)
-        else:
-            plans.append(result)
+    )
 
     logger.info("plan_node 완료", plans=len(plans))
 
     return {
         **state,
-        "project_plans": plans,
+        "project_plans": list(plans),
     }
 
 
@@ -231,6 +329,116 @@ def _format_plans_for_generator(plans: list[ProjectPlan]) -> str:
     return "\n\n".join(sections)
 
 
+async def _generate_per_project(
+    project_info: list[ProjectInfoDict],
+    project_plans: list[ProjectPlan],
+    position: str,
+    session_id: str | None,
+    feedback: str,
+    previous_resume: ResumeData | None,
+    project_feedback: dict[str, str] | None = None,
+) -> ResumeData:
+    """프로젝트별로 병렬 생성한 뒤 입력 순서대로 ResumeData 조립
+
+    실패한 프로젝트는 재시도 중이면 이전 결과를 유지하고, 아니면 제외한다
+    project_feedback이 있으면 피드백을 받은 프로젝트만 다시 생성하고 통과한 프로젝트는 그대로 둔다
+
+    Raises:
+        Exception: 모든 프로젝트 생성이 실패한 경우 첫 번째 예외
+    """
+    plans: list[ProjectPlan | None] = (
+        list(project_plans)
+        if len(project_plans) == len(project_info)
+        else [None] * len(project_info)
+    )
+    previous_by_url = {p.repo_url: p for p in previous_resume.projects} if previous_resume else {}
+
+    async def _generate_single(project: ProjectInfoDict, plan: ProjectPlan | None) -> ProjectInfo:
+        repo_url = project.get("repo_url", "")
+        previous = previous_by_url.get(repo_url)
+        if (
+            project_feedback is not None
+            and previous is not None
+            and repo_url not in project_feedback
+        ):
+            return previous
+        project_specific = (project_feedback or {}).get(repo_url, feedback)
+        is_retry = bool(project_specific and previous)
+        return await generate_project_resume(
+            project=project,
+            position=position,
+            generation_plan=_format_plans_for_generator([plan]) if plan else "",
+            session_id=session_id,
+            feedback=project_specific if is_retry else "",
+            previous_project_json=previous.model_dump_json() if is_retry else "",
+        )
+
+    results = await asyncio.gather(
+        *(
+            _generate_single(project, plan)
+            for project, plan in zip(project_info, plans, strict=True)
+        ),
+        return_exceptions=True,
+    )
+
+    projects: list[ProjectInfo] = []
+    errors: list[Exception] = []
+    for project, result in zip(project_info, results, strict=True):
+        if not isinstance(result, Exception):
+            projects.append(result)
+            continue
+        errors.append(result)
+        previous = previous_by_url.get(project.get("repo_url", ""))
+        logger.warning(
+            "프로젝트 생성 실패",
+            repo=project.get("repo_name", "unknown"),
+            error=str(result),
+            kept_previous=previous is not None,
+        )
+        if previous is not None:
+            projects.append(previous)
+
+    if not projects:
+        raise errors[0]
+    return ResumeData(projects=projects)
+
+
+_GENERATION_ERRORS = (
+    httpx.ConnectError,
+    httpx.TimeoutException,
+    httpx.HTTPStatusError,
+    PositionMismatchError,
+    ValueError,
+    KeyError,
+    TypeError,
+)
+
+
+def _generation_error_state(e: Exception, state: dict, node_name: str) -> dict:
+    """이력서 생성 예외를 에러 코드가 담긴 상태로 변환"""
+    if isinstance(e, (httpx.ConnectError, httpx.TimeoutException)):
+        return handle_connection_error(e, state, node_name, ErrorCode.LLM_API_ERROR)
+
+    if isinstance(e, httpx.HTTPStatusError):
+        return handle_http_error(e, state, node_name, ErrorCode.LLM_API_ERROR, "LLM API 오류")
+
+    if isinstance(e, PositionMismatchError):
+        logger.warning(f"{node_name} 포지션 불일치", error=str(e))
+        return create_error_state(state, ErrorCode.POSITION_MISMATCH, e.detail or e.message)
+
+    if isinstance(e, ValueError):
+        logger.error(f"{node_name} 생성 오류", error=str(e))
+        return create_error_state(
+            state,
+            ErrorCode.GENERATE_VALIDATION_ERROR,
+            f"이력서 생성 검증 오류: {e}",
+        )
+
+    return handle_data_error(
+        e, state, node_name, ErrorCode.GENERATE_PARSE_ERROR, "이력서 생성 중 데이터 오류"
+    )
+
+
 async def generate_node(state: ResumeState) -> ResumeState:
     """이력서 생성 노드: Plan 기반으로 이력서 JSON 생성"""
     logger.info("generate_node 시작")
@@ -260,16 +468,33 @@ async def generate_node(state: ResumeState) -> ResumeState:
 
     if is_retry:
         logger.info("generate_node 재시도", retry_count=retry_count)
+        emit_progress("retry", retry_count=retry_count + 1)
+
+    emit_progress("generate_started", projects=len(project_info))
+    started = time.monotonic()
+
+    project_feedback = state.get("project_feedback") if is_retry else None
 
     try:
-        resume_data = await generate_resume(
-            project_info=project_info,
-            position=request.position,
-            session_id=session_id,
-            generation_plans=generation_plans,
-            feedback=feedback,
-            previous_resume_json=previous_resume_json,
-        )
+        if settings.resume_generation_mode == "per_project" or project_feedback:
+            resume_data = await _generate_per_project(
+                project_info=project_info,
+                project_plans=project_plans,
+                position=request.position,
+                session_id=session_id,
+                feedback=feedback,
+                previous_resume=previous_resume if is_retry else None,
+                project_feedback=project_feedback,
+            )
+        else:
+            resume_data = await generate_resume(
+                project_info=project_info,
+                position=request.position,
+                session_id=session_id,
+                generation_plans=generation_plans,
+                feedback=feedback,
+                previous_resume_json=previous_resume_json,
+            )
 
         for project in resume_data.projects:
             project.tech_stack = filter_tech_stack_by_position(
@@ -278,6 +503,11 @@ async def generate_node(state: ResumeState) -> ResumeState:
             )
 
         logger.info("generate_node 완료", projects=len(resume_data.projects))
+        emit_progress(
+            "generate_finished",
+            projects=len(resume_data.projects),
+            elapsed_s=round(time.monotonic() - started, 3),
+        )
 
         return {
             **state,
@@ -285,47 +515,122 @@ async def generate_node(state: ResumeState) -> ResumeState:
             "retry_count": retry_count + 1 if is_retry else retry_count,
         }
 
-    except (httpx.ConnectError, httpx.TimeoutException) as e:
-        return handle_connection_error(
-            e,
-            state,
-            "generate_node",
-            ErrorCode.LLM_API_ERROR,
-        )
+    except _GENERATION_ERRORS as e:
+        return _generation_error_state(e, state, "generate_node")
 
-    except httpx.HTTPStatusError as e:
-        return handle_http_error(
-            e,
-            state,
-            "generate_node",
-            ErrorCode.LLM_API_ERROR,
-            "LLM API 오류",
-        )
 
-    except PositionMismatchError as e:
-        logger.warning("generate_node 포지션 불일치", error=str(e))
-        return create_error_state(
-            state,
-            ErrorCode.POSITION_MISMATCH,
-            e.detail or e.message,
-        )
+async def validate_node(state: ResumeState) -> ResumeState:
+    """형식 검증 노드: 코드 규칙 위반이 있으면 LLM 평가 없이 위반 사항을 피드백으로 저장
 
-    except ValueError as e:
-        logger.error("generate_node 생성 오류", error=str(e))
-        return create_error_state(
-            state,
-            ErrorCode.GENERATE_VALIDATION_ERROR,
-            f"이력서 생성 검증 오류: {e}",
-        )
+    프로젝트별 평가 모드에서는 위반한 프로젝트만 project_feedback에 담아 해당 프로젝트만 재생성
+    """
+    resume_data = state.get("resume_data")
+    if not resume_data or not settings.resume_format_validation_enabled:
+        return {"format_violations": []}
+
+    violations = validate_resume_format(resume_data, state["request"].position)
+    if not violations:
+        FORMAT_VALIDATION_TOTAL.labels(outcome="passed").inc()
+        return {"format_violations": []}
+
+    FORMAT_VALIDATION_TOTAL.labels(outcome="rejected").inc()
+    update: ResumeState = {
+        "format_violations": violations,
+        "evaluation": "fail",
+        "evaluation_feedback": format_violations_as_feedback(violations),
+    }
 
-    except (KeyError, TypeError) as e:
-        return handle_data_error(
-            e,
-            state,
-            "generate_node",
-            ErrorCode.GENERATE_PARSE_ERROR,
-            "이력서 생성 중 데이터 오류",
+    if settings.resume_evaluation_mode == "per_project":
+        verdicts = dict(state.get("project_verdicts") or {})
+        url_by_name = {p.name: p.repo_url for p in resume_data.projects}
+        project_feedback: dict[str, str] = {}
+        for project_name, repo_url in url_by_name.items():
+            project_violations = [v for v in violations if v["project"] == project_name]
+            if project_violations:
+                project_feedback[repo_url] = format_violations_as_feedback(project_violations)
+                verdicts[repo_url] = "fail"
+        update["project_feedback"] = project_feedback
+        update["project_verdicts"] = verdicts
+        # 위반하지 않은 미평가 프로젝트는 다음 라운드로 평가가 미뤄질 뿐이므로 절감에서 제외
+        saved = len(project_feedback)
+    else:
+        saved = 1
+
+    EVALUATOR_CALLS_SAVED.inc(saved)
+    logger.info("형식 검증 실패, 평가 생략", violations=len(violations), saved_calls=saved)
+    emit_progress("validate_rejected", violations=len(violations))
+    return update
+
+
+async def _evaluate_project(
+    project: ProjectInfo,
+    position: str,
+    evidence: ProjectInfoDict | None,
+    repo_contexts: dict,
+    session_id: str | None,
+    node_name: str,
+) -> dict:
+    """프로젝트 1개를 단독으로 평가하여 evaluation, evaluation_feedback 반환"""
+    return await evaluate_with_fallback(
+        {},
+        lambda: evaluate_resume(
+            resume_data=ResumeData(projects=[project]),
+            position=position,
+            project_info=[evidence] if evidence else [],
+            repo_contexts=repo_contexts,
+            session_id=session_id,
+        ),
+        node_name=f"{node_name}:{project.name}",
+    )
+
+
+async def _evaluate_per_project(
+    resume_data: ResumeData,
+    position: str,
+    project_info: list[ProjectInfoDict],
+    repo_contexts: dict,
+    session_id: str | None,
+    state: ResumeState,
+) -> dict:
+    """프로젝트별 병렬 평가: 이미 통과한 프로젝트는 다시 평가하지 않음
+
+    프로젝트마다 pass/fail 판정과 피드백을 저장하고, 하나라도 fail이면 전체 평가는 fail
+    """
+    verdicts = dict(state.get("project_verdicts") or {})
+    info_by_url = {p.get("repo_url"): p for p in project_info}
+    pending = [p for p in resume_data.projects if verdicts.get(p.repo_url) != "pass"]
+
+    results = await asyncio.gather(
+        *(
+            _evaluate_project(
+                p, position, info_by_url.get(p.repo_url), repo_contexts, session_id, "evaluate_node"
+            )
+            for p in pending
         )
+    )
+
+    project_feedback: dict[str, str] = {}
+    for project, result in zip(pending, results, strict=True):
+        verdicts[project.repo_url] = result["evaluation"]
+        if result["evaluation"] == "fail":
+            project_feedback[project.repo_url] = result["evaluation_feedback"]
+
+    logger.info(
+        "프로젝트별 평가 완료",
+        evaluated=len(pending),
+        frozen=len(resume_data.projects) - len(pending),
+        failed=len(project_feedback),
+    )
+
+    names = {p.repo_url: p.name for p in resume_data.projects}
+    return {
+        "project_verdicts": verdicts,
+        "project_feedback": project_feedback,
+        "evaluation": "fail" if project_feedback else "pass",
+        "evaluation_feedback": "\n".join(
+            f"[{names[url]}] {feedback}" for url, feedback in project_feedback.items()
+        ),
+    }
 
 
 async def evaluate_node(state: ResumeState) -> ResumeState:
@@ -340,23 +645,174 @@ async def evaluate_node(state: ResumeState) -> ResumeState:
     project_info = state.get("project_info", [])
 
     repo_contexts = state.get("repo_contexts", {})
+    started = time.monotonic()
 
-    return await evaluate_with_fallback(
-        state,
-        lambda: evaluate_resume(
-            resume_data=resume_data,
-            position=request.position,
-            project_info=project_info,
-            repo_contexts=repo_contexts,
-            session_id=session_id,
-        ),
-        node_name="evaluate_node",
+    if settings.resume_evaluation_mode == "per_project":
+        result = await _evaluate_per_project(
+            resume_data, request.position, project_info, repo_contexts, session_id, state
+        )
+    else:
+        result = await evaluate_with_fallback(
+            state,
+            lambda: evaluate_resume(
+                resume_data=resume_data,
+                position=request.position,
+                project_info=project_info,
+                repo_contexts=repo_contexts,
+                session_id=session_id,
+            ),
+            node_name="evaluate_node",
+        )
+
+    emit_progress(
+        "evaluate_finished",
+        verdict=result.get("evaluation"),
+        failed_projects=len(result.get("project_feedback") or {}),
+        elapsed_s=round(time.monotonic() - started, 3),
     )
+    return result
+
+
+async def project_pipeline_node(state: ProjectPipelineState) -> ResumeState:
+    """프로젝트 파이프라인 노드: plan이 준비되는 즉시 생성하고, 프로젝트별 평가 모드면 바로 평가
+
+    프로젝트마다 Send로 분기되므로 가장 느린 plan을 기다리지 않고,
+    완료된 프로젝트 결과는 체크포인트와 그래프 스트림에 프로젝트 단위로 기록된다
+    """
+    project = state["project"]
+    repo_name = project.get("repo_name", "")
+    repo_context = state.get("repo_context")
+    position = state["request"].position
+    session_id = state.get("session_id")
+
+    plan = await _plan_project(project, repo_context, position, session_id)
+    result: ProjectPipelineResult = {
+        "index": state["index"],
+        "plan": plan,
+        "project": None,
+        "verdict": None,
+        "feedback": "",
+        "format_violations": [],
+    }
+    key = project.get("repo_url", "") or repo_name
+
+    try:
+        generated = await generate_project_resume(
+            project=project,
+            position=position,
+            generation_plan=_format_plans_for_generator([plan]),
+            session_id=session_id,
+            feedback="",
+            previous_project_json="",
+        )
+    except _GENERATION_ERRORS as e:
+        error = _generation_error_state(e, {}, "project_pipeline_node")
+        emit_progress("project_failed", project=repo_name, error_code=error["error_code"])
+        return {"project_results": {key: {**result, **error}}}
+
+    generated.tech_stack = filter_tech_stack_by_position(generated.tech_stack, position)
+    result["project"] = generated
+
+    if settings.resume_evaluation_mode == "per_project":
+        violations = (
+            validate_resume_format(ResumeData(projects=[generated]), position)
+            if settings.resume_format_validation_enabled
+            else []
+        )
+        if violations:
+            FORMAT_VALIDATION_TOTAL.labels(outcome="rejected").inc()
+            EVALUATOR_CALLS_SAVED.inc()
+            result["verdict"] = "fail"
+            result["feedback"] = format_violations_as_feedback(violations)
+            result["format_violations"] = violations
+        else:
+            if settings.resume_format_validation_enabled:
+                FORMAT_VALIDATION_TOTAL.labels(outcome="passed").inc()
+            evaluation = await _evaluate_project(
+                generated,
+                position,
+                project,
+                {repo_name: repo_context} if repo_context else {},
+                session_id,
+                "project_pipeline_node",
+            )
+            result["verdict"] = evaluation["evaluation"]
+            result["feedback"] = evaluation["evaluation_feedback"]
 
+    logger.info("프로젝트 파이프라인 완료", repo=repo_name, verdict=result["verdict"])
+    emit_progress("project_finished", project=repo_name, verdict=result["verdict"])
+    return {"project_results": {key: result}}
 
-def should_continue(state: ResumeState) -> Literal["plan", "end"]:
-    """에러 상태 확인: 에러 있으면 종료, 없으면 plan 노드로"""
-    return "end" if has_error(state, "should_continue") else "plan"
+
+async def assemble_node(state: ResumeState) -> ResumeState:
+    """파이프라인 결과 조립 노드: 프로젝트별 결과를 입력 순서대로 plan, 이력서, 평가 상태로 합침
+
+    생성에 실패한 프로젝트는 제외하고, 모든 프로젝트가 실패하면 첫 번째 실패의 에러 상태를 반환
+    """
+    results = sorted((state.get("project_results") or {}).values(), key=lambda r: r["index"])
+    succeeded = [r for r in results if r.get("project") is not None]
+
+    if not succeeded:
+        failed = results[0] if results else {}
+        logger.error("assemble_node: 모든 프로젝트 생성 실패")
+        return create_error_state(
+            state,
+            failed.get("error_code", ErrorCode.GENERATE_ERROR),
+            failed.get("error_message", "프로젝트 정보가 없습니다"),
+        )
+
+    update: ResumeState = {
+        "project_plans": [r["plan"] for r in results],
+        "resume_data": ResumeData(projects=[r["project"] for r in succeeded]),
+        "format_violations": [v for r in succeeded for v in r.get("format_violations", [])],
+    }
+
+    if settings.resume_evaluation_mode == "per_project":
+        project_feedback = {
+            r["project"].repo_url: r["feedback"] for r in succeeded if r["verdict"] == "fail"
+        }
+        update["project_verdicts"] = {r["project"].repo_url: r["verdict"] for r in succeeded}
+        update["project_feedback"] = project_feedback
+        update["evaluation"] = "fail" if project_feedback else "pass"
+        update["evaluation_feedback"] = "\n".join(
+            f"[{r['project'].name}] {r['feedback']}" for r in succeeded if r["verdict"] == "fail"
+        )
+
+    logger.info(
+        "assemble_node 완료",
+        projects=len(succeeded),
+        failed=len(results) - len(succeeded),
+        evaluation=update.get("evaluation"),
+    )
+    return update
+
+
+def should_continue(state: ResumeState) -> Literal["plan", "end"] | list[Send]:
+    """에러 상태 확인: 에러 있으면 종료, 없으면 plan 노드로
+
+    pipelined 모드에서는 프로젝트마다 project_pipeline 노드로 분기한다
+    """
+    if has_error(state, "should_continue"):
+        return "end"
+
+    project_info = state.get("project_info") or []
+    if settings.resume_pipeline_mode != "pipelined" or not project_info:
+        return "plan"
+
+    repo_contexts = state.get("repo_contexts") or {}
+    return [
+        Send(
+            "project_pipeline",
+            {
+                "request": state["request"],
+                "session_id": state.get("session_id"),
+                "index": i,
+                "project": project,
+                "repo_context": repo_contexts.get(project.get("repo_name", "")),
+            },
+        )
+        for i, project in enumerate(project_info)
+    ]
 
 
 def _should_continue_after_plan(state: ResumeState) -> Literal["generate", "end"]:
@@ -364,22 +820,59 @@ def _should_continue_after_plan(state: ResumeState) -> Literal["generate", "end"
     return "end" if has_error(state, "_should_continue_after_plan") else "generate"
 
 
-_node_cache = InMemoryCache()
+def _should_continue_after_generate(state: ResumeState) -> Literal["validate", "end"]:
+    """generate 후 에러 확인: 에러 있으면 종료, 없으면 validate로"""
+    return "end" if has_error(state, "_should_continue_after_generate") else "validate"
+
+
+def _route_after_assemble(state: ResumeState) -> Literal["validate", "generate", "end"]:
+    """조립 후 분기: 파이프라인에서 이미 평가했으면 실패 프로젝트만 재생성, 아니면 validate로"""
+    if has_error(state, "_route_after_assemble"):
+        return "end"
+
+    if settings.resume_evaluation_mode != "per_project":
+        return "validate"
+
+    return "generate" if state.get("evaluation") == "fail" else "end"
 
 
-def _should_continue_after_generate(state: ResumeState) -> Literal["evaluate", "end"]:
-    """generate 후 에러 확인: 에러 있으면 종료, 없으면 evaluate로"""
-    return "end" if has_error(state, "_should_continue_after_generate") else "evaluate"
+def _route_after_validate(state: ResumeState) -> Literal["evaluate", "generate", "end"]:
+    """형식 검증 후 분기: 통과하면 evaluate, 위반이면 재생성, 재시도 한도 도달 시 종료
 
+    재시도 한도에 도달한 뒤에는 평가 결과가 출력에 영향을 주지 않으므로 평가 호출도 생략
+    """
+    if not state.get("format_violations"):
+        return "evaluate"
+
+    if state.get("retry_count", 0) >= MAX_GENERATE_RETRIES:
+        logger.warning("형식 검증 위반 상태로 최대 재시도 도달, 종료")
+        return "end"
+
+    return "generate"
+
+
+def create_resume_workflow(
+    checkpointer: BaseCheckpointSaver | None = None,
+) -> CompiledStateGraph:
+    """이력서 생성 워크플로우 생성 - Plan-Generate-Evaluate Reflection 패턴
+
+    checkpointer가 있으면 노드 완료마다 상태를 저장하여 중단된 작업을 이어서 실행할 수 있습니다
+    LangGraph Studio에서 dict를 전달하는 경우 None으로 폴백합니다
+    """
+    if checkpointer is not None and not isinstance(checkpointer, BaseCheckpointSaver):
+        checkpointer = None
 
-def create_resume_workflow() -> CompiledStateGraph:
-    """이력서 생성 워크플로우 생성 - Plan-Generate-Evaluate Reflection 패턴"""
     workflow = StateGraph(ResumeState)
 
-    collect_data_cache_policy = CachePolicy(ttl=3600)
+    collect_data_cache_policy = CachePolicy(
+        key_func=collect_data_cache_key, ttl=settings.workflow_cache_ttl
+    )
     workflow.add_node("collect_data", collect_data_node, cache_policy=collect_data_cache_policy)
     workflow.add_node("plan", plan_node)
+    workflow.add_node("project_pipeline", project_pipeline_node)
+    workflow.add_node("assemble", assemble_node)
     workflow.add_node("generate", generate_node)
+    workflow.add_node("validate", validate_node)
     workflow.add_node("evaluate", evaluate_node)
 
     workflow.set_entry_point("collect_data")
@@ -389,6 +882,18 @@ def create_resume_workflow() -> CompiledStateGraph:
         should_continue,
         {
             "plan": "plan",
+            "project_pipeline": "project_pipeline",
+            "end": END,
+        },
+    )
+
+    workflow.add_edge("project_pipeline", "assemble")
+    workflow.add_conditional_edges(
+        "assemble",
+        _route_after_assemble,
+        {
+            "validate": "validate",
+            "generate": "generate",
             "end": END,
         },
     )
@@ -405,13 +910,25 @@ def create_resume_workflow() -> CompiledStateGraph:
     workflow.add_conditional_edges(
         "generate",
         _should_continue_after_generate,
+        {
+            "validate": "validate",
+            "end": END,
+        },
+    )
+
+    workflow.add_conditional_edges(
+        "validate",
+        _route_after_validate,
         {
             "evaluate": "evaluate",
+            "generate": "generate",
             "end": END,
         },
     )
 
-    _should_retry_generate = make_should_retry(max_retries=2, retry_node="generate")
+    _should_retry_generate = make_should_retry(
+        max_retries=MAX_GENERATE_RETRIES, retry_node="generate"
+    )
     workflow.add_conditional_edges(
         "evaluate",
         _should_retry_generate,
@@ -421,4 +938,4 @@ def create_resume_workflow() -> CompiledStateGraph:
         },
     )
 
-    return workflow.compile(cache=_node_cache)
+    return workflow.compile(checkpointer=checkpointer, cache=get_node_cache())
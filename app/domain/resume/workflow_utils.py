@@ -1,8 +1,11 @@
+import asyncio
 import time
 from collections.abc import Awaitable, Callable
 from typing import Any
 
 import httpx
+from langgraph.checkpoint.base import BaseCheckpointSaver
+from langgraph.graph.state import CompiledStateGraph
 
 from app.core.logging import get_logger
 
@@ -116,3 +119,64 @@ async def evaluate_with_fallback(
         "evaluation": "pass",
         "evaluation_feedback": "",
     }
+
+
+async def _ainvoke_from_checkpoint(
+    workflow: CompiledStateGraph,
+    initial_state: dict[str, Any],
+    config: dict[str, Any],
+) -> dict[str, Any]:
+    """중단된 실행은 이어서, 끝난 실행은 최종 상태 반환, 없으면 처음부터 실행"""
+    thread_id = config["configurable"]["thread_id"]
+    snapshot = await workflow.aget_state(config)
+    if snapshot.next:
+        logger.info("체크포인트에서 워크플로우 재개", thread_id=thread_id, next=list(snapshot.next))
+        return await workflow.ainvoke(None, config=config)
+    if snapshot.values:
+        logger.info("완료된 체크포인트 재사용", thread_id=thread_id)
+        return snapshot.values
+    return await workflow.ainvoke(initial_state, config=config)
+
+
+async def ainvoke_resumable(
+    workflow: CompiledStateGraph,
+    initial_state: dict[str, Any],
+    config: dict[str, Any],
+    timeout: float,
+) -> dict[str, Any]:
+    """체크포인트 기반 재개를 지원하는 워크플로우 실행
+
+    체크포인터와 thread_id가 있으면 마지막으로 완료된 노드 다음부터 실행한다
+    진행 중인 LLM 호출을 버리지 않도록 실행 중에는 재시작하지 않고 timeout 전체를 한 번에 쓴다
+    타임아웃이나 예외가 나도 체크포인트는 남으므로, 큐 재시도나 프로세스 재시작 후
+    같은 thread_id로 다시 호출하면 완료된 노드를 건너뛴다
+
+    Raises:
+        TimeoutError: timeout 안에 끝나지 않은 경우
+    """
+    thread_id = config.get("configurable", {}).get("thread_id")
+    if workflow.checkpointer is None or not thread_id:
+        return await asyncio.wait_for(
+            workflow.ainvoke(initial_state, config=config), timeout=timeout
+        )
+    return await asyncio.wait_for(
+        _ainvoke_from_checkpoint(workflow, initial_state, config), timeout=timeout
+    )
+
+
+async def clear_checkpoint(workflow: CompiledStateGraph, config: dict[str, Any]) -> None:
+    """종료된 실행의 체크포인트 삭제 - 요청에 포함된 토큰이 남지 않도록 함"""
+    thread_id = config.get("configurable", {}).get("thread_id")
+    await discard_checkpoint(workflow.checkpointer, thread_id)
+
+
+async def discard_checkpoint(
+    checkpointer: BaseCheckpointSaver | None, thread_id: str | None
+) -> None:
+    """thread_id의 체크포인트 삭제 - 재시도 한도를 넘긴 작업처럼 워크플로우 없이 정리할 때 사용"""
+    if checkpointer is None or not thread_id:
+        return
+    try:
+        await checkpointer.adelete_thread(thread_id)
+    except Exception:
+        logger.warning("체크포인트 삭제 실패", thread_id=thread_id, exc_info=True)
@@ -0,0 +1,191 @@
+"""LLM 구조화 응답 캐시
+
+같은 모델, 같은 호출 지점, 같은 프롬프트 내용, 같은 출력 타입이면 검증된 출력을 재사용한다
+SQLite 파일 하나를 여러 uvicorn 워커가 공유하고, TTL 만료와 최근 접근 순 LRU로 크기를 유지한다
+응답 생성에 사용한 토큰 수를 함께 저장하여 적중 시 절약한 토큰을 호출 지점별로 집계한다
+SQLite 접근은 비동기 메서드에서 스레드로 실행하고, 만료/초과분 정리는 저장 prune_interval회마다 한다
+"""
+
+import asyncio
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+
+from prometheus_client import Counter, Gauge
+
+from app.core.config import settings
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+LLM_CACHE_REQUESTS = Counter(
+    "llm_response_cache_requests_total",
+    "LLM 응답 캐시 조회 결과 (hit/miss), 적중률은 hit / (hit + miss)",
+    ["prompt", "result"],
+)
+LLM_CACHE_TOKENS_SAVED = Counter(
+    "llm_response_cache_tokens_saved_total",
+    "LLM 응답 캐시 적중으로 절약한 토큰 수",
+    ["prompt"],
+)
+LLM_CACHE_ENTRIES = Gauge(
+    "llm_response_cache_entries",
+    "LLM 응답 캐시 항목 수",
+)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS llm_response_cache (
+    key TEXT PRIMARY KEY,
+    prompt TEXT NOT NULL,
+    value TEXT NOT NULL,
+    tokens INTEGER NOT NULL,
+    expires_at REAL NOT NULL,
+    accessed_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_llm_response_cache_accessed_at
+    ON llm_response_cache (accessed_at);
+"""
+
+
+def llm_cache_key(
+    model: str,
+    prompt: str,
+    output_schema: str,
+    system_prompt: str,
+    human_content: str,
+) -> str:
+    """모델, 호출 지점(프롬프트 이름/버전), 출력 스키마, 렌더링된 프롬프트 내용으로 캐시 키 생성"""
+    material = json.dumps(
+        [model, prompt, output_schema, system_prompt, human_content], ensure_ascii=False
+    )
+    return hashlib.sha256(material.encode()).hexdigest()
+
+
+class LLMResponseCache:
+    """SQLite 기반 TTL + LRU LLM 응답 캐시"""
+
+    def __init__(
+        self,
+        path: str,
+        max_entries: int = 2000,
+        ttl: float = 86400.0,
+        prune_interval: int = 100,
+    ):
+        self._path = path
+        self._max_entries = max_entries
+        self._ttl = ttl
+        self._prune_interval = max(1, prune_interval)
+        self._sets_since_prune = 0
+        self._conn: sqlite3.Connection | None = None
+        self._lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        """SQLite 연결 지연 초기화"""
+        if self._conn is None:
+            directory = os.path.dirname(self._path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            self._conn = sqlite3.connect(self._path, check_same_thread=False)
+            if self._path != ":memory:":
+                self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.executescript(_SCHEMA)
+        return self._conn
+
+    def get(self, key: str, prompt: str) -> str | None:
+        """캐시된 출력 JSON 조회, 적중 시 접근 시각을 갱신하고 절약 토큰 집계"""
+        now = time.time()
+        with self._lock:
+            conn = self._connect()
+            row = conn.execute(
+                "SELECT value, tokens FROM llm_response_cache WHERE key = ? AND expires_at > ?",
+                (key, now),
+            ).fetchone()
+            if row is not None:
+                conn.execute(
+                    "UPDATE llm_response_cache SET accessed_at = ? WHERE key = ?", (now, key)
+                )
+                conn.commit()
+
+        if row is None:
+            LLM_CACHE_REQUESTS.labels(prompt=prompt, result="miss").inc()
+            return None
+        LLM_CACHE_REQUESTS.labels(prompt=prompt, result="hit").inc()
+        LLM_CACHE_TOKENS_SAVED.labels(prompt=prompt).inc(row[1])
+        return row[0]
+
+    def set(self, key: str, prompt: str, value: str, tokens: int, ttl: float | None = None) -> None:
+        """출력 JSON 저장, prune_interval회마다 만료 항목과 최대 개수 초과분 제거"""
+        now = time.time()
+        expires_at = now + (ttl if ttl is not None else self._ttl)
+        count = None
+        with self._lock:
+            conn = self._connect()
+            conn.execute(
+                "INSERT OR REPLACE INTO llm_response_cache "
+                "(key, prompt, value, tokens, expires_at, accessed_at) VALUES (?, ?, ?, ?, ?, ?)",
+                (key, prompt, value, tokens, expires_at, now),
+            )
+            self._sets_since_prune += 1
+            if self._sets_since_prune >= self._prune_interval:
+                self._sets_since_prune = 0
+                count = self._prune(conn, now)
+            conn.commit()
+        if count is not None:
+            LLM_CACHE_ENTRIES.set(count)
+
+    def _prune(self, conn: sqlite3.Connection, now: float) -> int:
+        """만료 항목과 최대 개수 초과분을 제거하고 남은 항목 수 반환"""
+        conn.execute("DELETE FROM llm_response_cache WHERE expires_at <= ?", (now,))
+        (count,) = conn.execute("SELECT COUNT(*) FROM llm_response_cache").fetchone()
+        overflow = count - self._max_entries
+        if overflow > 0:
+            conn.execute(
+                "DELETE FROM llm_response_cache WHERE rowid IN ("
+                "SELECT rowid FROM llm_response_cache ORDER BY accessed_at LIMIT ?)",
+                (overflow,),
+            )
+            count -= overflow
+        return count
+
+    async def aget(self, key: str, prompt: str) -> str | None:
+        """캐시된 출력 JSON 비동기 조회"""
+        return await asyncio.to_thread(self.get, key, prompt)
+
+    async def aset(
+        self, key: str, prompt: str, value: str, tokens: int, ttl: float | None = None
+    ) -> None:
+        """출력 JSON 비동기 저장"""
+        await asyncio.to_thread(self.set, key, prompt, value, tokens, ttl)
+
+    def close(self) -> None:
+        """SQLite 연결 종료"""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+_llm_response_cache: LLMResponseCache | None = None
+
+
+def get_llm_response_cache() -> LLMResponseCache:
+    """LLM 응답 캐시 지연 초기화 싱글턴"""
+    global _llm_response_cache
+    if _llm_response_cache is None:
+        _llm_response_cache = LLMResponseCache(
+            settings.llm_response_cache_path,
+            max_entries=settings.llm_response_cache_max_entries,
+            ttl=settings.llm_response_cache_ttl,
+        )
+    return _llm_response_cache
+
+
+def close_llm_response_cache() -> None:
+    """LLM 응답 캐시 종료"""
+    global _llm_response_cache
+    if _llm_response_cache is not None:
+        _llm_response_cache.close()
+        _llm_response_cache = None
@@ -0,0 +1,228 @@
+"""LangGraph 노드 캐시 백엔드
+
+LangGraph 기본 InMemoryCache는 크기 제한이 없고 프로세스 재시작이나 워커 간에 공유되지 않는다
+SQLite 파일 하나를 여러 uvicorn 워커가 공유하고, 최근 접근 순 LRU로 최대 개수를 유지한다
+저장 여부 판단 함수로 에러 상태처럼 재사용하면 안 되는 결과는 캐시하지 않는다
+그래프 실행이 사용하는 비동기 메서드는 SQLite 접근을 스레드로 실행하여 이벤트 루프를 막지 않고,
+만료 항목과 최대 개수 초과분 정리는 저장 prune_interval회마다 한 번만 한다
+"""
+
+import asyncio
+import os
+import sqlite3
+import threading
+import time
+from collections.abc import Callable, Mapping, Sequence
+from typing import Any
+
+from langgraph.cache.base import BaseCache, FullKey, Namespace, ValueT
+from langgraph.checkpoint.serde.base import SerializerProtocol
+from prometheus_client import Counter, Gauge
+
+from app.core.config import settings
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+NODE_CACHE_REQUESTS = Counter(
+    "langgraph_node_cache_requests_total",
+    "LangGraph 노드 캐시 조회 결과 (hit/miss), 적중률은 hit / (hit + miss)",
+    ["cache", "result"],
+)
+NODE_CACHE_SKIPPED = Counter(
+    "langgraph_node_cache_skipped_total",
+    "저장 조건을 만족하지 않아 캐시하지 않은 노드 결과 수",
+    ["cache"],
+)
+NODE_CACHE_ENTRIES = Gauge(
+    "langgraph_node_cache_entries",
+    "LangGraph 노드 캐시 항목 수",
+    ["cache"],
+)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS node_cache (
+    ns TEXT NOT NULL,
+    key TEXT NOT NULL,
+    expiry REAL,
+    encoding TEXT NOT NULL,
+    val BLOB NOT NULL,
+    accessed_at REAL NOT NULL,
+    PRIMARY KEY (ns, key)
+);
+CREATE INDEX IF NOT EXISTS idx_node_cache_accessed_at ON node_cache (accessed_at);
+"""
+
+
+class BoundedSqliteCache(BaseCache[ValueT]):
+    """SQLite 기반 크기 제한 LRU LangGraph 캐시"""
+
+    def __init__(
+        self,
+        path: str,
+        max_entries: int = 500,
+        name: str = "default",
+        should_cache: Callable[[Any], bool] | None = None,
+        *,
+        serde: SerializerProtocol | None = None,
+        prune_interval: int = 50,
+    ):
+        super().__init__(serde=serde)
+        self._path = path
+        self._max_entries = max_entries
+        self._prune_interval = max(1, prune_interval)
+        self._sets_since_prune = 0
+        self._name = name
+        self._should_cache = should_cache
+        self._conn: sqlite3.Connection | None = None
+        self._lock = threading.RLock()
+
+    def _connect(self) -> sqlite3.Connection:
+        """SQLite 연결 지연 초기화"""
+        if self._conn is None:
+            directory = os.path.dirname(self._path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            self._conn = sqlite3.connect(self._path, check_same_thread=False)
+            if self._path != ":memory:":
+                self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.executescript(_SCHEMA)
+        return self._conn
+
+    @staticmethod
+    def _ns(namespace: Namespace) -> str:
+        return ",".join(namespace)
+
+    def get(self, keys: Sequence[FullKey]) -> dict[FullKey, ValueT]:
+        """캐시 조회, 만료 항목은 제외하고 적중 항목의 접근 시각 갱신"""
+        if not keys:
+            return {}
+        now = time.time()
+        values: dict[FullKey, ValueT] = {}
+        with self._lock:
+            conn = self._connect()
+            for namespace, key in keys:
+                row = conn.execute(
+                    "SELECT expiry, encoding, val FROM node_cache WHERE ns = ? AND key = ?",
+                    (self._ns(namespace), key),
+                ).fetchone()
+                if row is None or (row[0] is not None and row[0] <= now):
+                    NODE_CACHE_REQUESTS.labels(cache=self._name, result="miss").inc()
+                    continue
+                conn.execute(
+                    "UPDATE node_cache SET accessed_at = ? WHERE ns = ? AND key = ?",
+                    (now, self._ns(namespace), key),
+                )
+                values[(namespace, key)] = self.serde.loads_typed((row[1], row[2]))
+                NODE_CACHE_REQUESTS.labels(cache=self._name, result="hit").inc()
+            conn.commit()
+        return values
+
+    async def aget(self, keys: Sequence[FullKey]) -> dict[FullKey, ValueT]:
+        """캐시 비동기 조회"""
+        if not keys:
+            return {}
+        return await asyncio.to_thread(self.get, keys)
+
+    def set(self, pairs: Mapping[FullKey, tuple[ValueT, int | None]]) -> None:
+        """캐시 저장, prune_interval회마다 만료 항목과 최대 개수 초과분 제거"""
+        now = time.time()
+        count = None
+        with self._lock:
+            conn = self._connect()
+            for (namespace, key), (value, ttl) in pairs.items():
+                if self._should_cache is not None and not self._should_cache(value):
+                    NODE_CACHE_SKIPPED.labels(cache=self._name).inc()
+                    continue
+                encoding, data = self.serde.dumps_typed(value)
+                conn.execute(
+                    "INSERT OR REPLACE INTO node_cache "
+                    "(ns, key, expiry, encoding, val, accessed_at) VALUES (?, ?, ?, ?, ?, ?)",
+                    (
+                        self._ns(namespace),
+                        key,
+                        now + ttl if ttl is not None else None,
+                        encoding,
+                        data,
+                        now,
+                    ),
+                )
+            self._sets_since_prune += 1
+            if self._sets_since_prune >= self._prune_interval:
+                self._sets_since_prune = 0
+                count = self._prune(conn, now)
+            conn.commit()
+        if count is not None:
+            NODE_CACHE_ENTRIES.labels(cache=self._name).set(count)
+
+    def _prune(self, conn: sqlite3.Connection, now: float) -> int:
+        """만료 항목과 최대 개수 초과분을 제거하고 남은 항목 수 반환"""
+        conn.execute("DELETE FROM node_cache WHERE expiry IS NOT NULL AND expiry <= ?", (now,))
+        (count,) = conn.execute("SELECT COUNT(*) FROM node_cache").fetchone()
+        overflow = count - self._max_entries
+        if overflow > 0:
+            conn.execute(
+                "DELETE FROM node_cache WHERE rowid IN ("
+                "SELECT rowid FROM node_cache ORDER BY accessed_at LIMIT ?)",
+                (overflow,),
+            )
+            count -= overflow
+        return count
+
+    async def aset(self, pairs: Mapping[FullKey, tuple[ValueT, int | None]]) -> None:
+        """캐시 비동기 저장"""
+        if pairs:
+            await asyncio.to_thread(self.set, pairs)
+
+    def clear(self, namespaces: Sequence[Namespace] | None = None) -> None:
+        """네임스페이스별 또는 전체 캐시 삭제"""
+        with self._lock:
+            conn = self._connect()
+            if namespaces is None:
+                conn.execute("DELETE FROM node_cache")
+            else:
+                conn.executemany(
+                    "DELETE FROM node_cache WHERE ns = ?",
+                    [(self._ns(namespace),) for namespace in namespaces],
+                )
+            conn.commit()
+
+    async def aclear(self, namespaces: Sequence[Namespace] | None = None) -> None:
+        """네임스페이스별 또는 전체 캐시 비동기 삭제"""
+        await asyncio.to_thread(self.clear, namespaces)
+
+    def close(self) -> None:
+        """SQLite 연결 종료"""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+def writes_without_error(writes: Any) -> bool:
+    """노드 출력 writes에 error_code가 없을 때만 캐시"""
+    return not any(channel == "error_code" and value for channel, value in writes)
+
+
+_node_cache: BoundedSqliteCache | None = None
+
+
+def get_node_cache() -> BoundedSqliteCache:
+    """워크플로우 노드 캐시 지연 초기화 싱글턴"""
+    global _node_cache
+    if _node_cache is None:
+        _node_cache = BoundedSqliteCache(
+            settings.workflow_cache_path,
+            max_entries=settings.workflow_cache_max_entries,
+            name="workflow",
+            should_cache=writes_without_error,
+        )
+    return _node_cache
+
+
+def close_node_cache() -> None:
+    """워크플로우 노드 캐시 종료"""
+    global _node_cache
+    if _node_cache is not None:
+        _node_cache.close()
+        _node_cache = None
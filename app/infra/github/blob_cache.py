@@ -0,0 +1,208 @@
+"""git blob SHA 기반 콘텐츠 주소 캐시
+
+blob SHA는 파일 내용의 해시이므로 같은 SHA는 레포, 포크, 토큰과 무관하게 같은 내용을 가리킨다
+원문 내용과 파일명별 의존성 파싱 결과를 메모리 LRU에 보관하고,
+경로가 설정되면 SQLite에도 기록하여 재시작 후에도 재사용한다
+비동기 메서드는 메모리에 없을 때만 SQLite 접근을 스레드로 실행하여 이벤트 루프를 막지 않고,
+SQLite 최대 개수 초과분 정리는 저장 prune_interval회마다 한 번만 한다
+"""
+
+import asyncio
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Any
+
+from app.core.config import settings
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS github_blobs (
+    cache_key TEXT PRIMARY KEY,
+    value TEXT NOT NULL,
+    accessed_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_github_blobs_accessed_at
+    ON github_blobs (accessed_at);
+"""
+
+
+class BlobCache:
+    """blob SHA를 키로 원문 내용과 파싱 결과를 저장하는 LRU 캐시"""
+
+    def __init__(self, max_entries: int = 2000, path: str | None = None, prune_interval: int = 100):
+        self._max_entries = max_entries
+        self._path = path
+        self._prune_interval = max(1, prune_interval)
+        self._puts_since_prune = 0
+        self._memory: OrderedDict[str, Any] = OrderedDict()
+        self._conn: sqlite3.Connection | None = None
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _content_key(sha: str) -> str:
+        return f"content:{sha}"
+
+    @staticmethod
+    def _parsed_key(sha: str, filename: str) -> str:
+        return f"parsed:{filename}:{sha}"
+
+    def _connect(self) -> sqlite3.Connection | None:
+        """SQLite 연결 지연 초기화, 경로가 없으면 None"""
+        if not self._path:
+            return None
+        if self._conn is None:
+            directory = os.path.dirname(self._path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            self._conn = sqlite3.connect(self._path, check_same_thread=False)
+            self._conn.executescript(_SCHEMA)
+        return self._conn
+
+    def _remember(self, key: str, value: Any) -> None:
+        """메모리 LRU에 저장 후 최대 개수 초과분 제거"""
+        self._memory[key] = value
+        self._memory.move_to_end(key)
+        while len(self._memory) > self._max_entries:
+            self._memory.popitem(last=False)
+
+    def _get_memory(self, key: str) -> Any | None:
+        with self._lock:
+            if key in self._memory:
+                self._memory.move_to_end(key)
+                return self._memory[key]
+            return None
+
+    def _get_stored(self, key: str) -> Any | None:
+        with self._lock:
+            conn = self._connect()
+            if conn is None:
+                return None
+            row = conn.execute(
+                "SELECT value FROM github_blobs WHERE cache_key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            conn.execute(
+                "UPDATE github_blobs SET accessed_at = ? WHERE cache_key = ?",
+                (time.time(), key),
+            )
+            conn.commit()
+            value = json.loads(row[0])
+            self._remember(key, value)
+            return value
+
+    def _get(self, key: str) -> Any | None:
+        value = self._get_memory(key)
+        if value is None:
+            value = self._get_stored(key)
+        return value
+
+    async def _aget(self, key: str) -> Any | None:
+        value = self._get_memory(key)
+        if value is None and self._path:
+            value = await asyncio.to_thread(self._get_stored, key)
+        return value
+
+    def _store(self, key: str, value: Any) -> None:
+        """SQLite 저장, prune_interval회마다 최대 개수 초과분을 오래된 순으로 제거"""
+        data = json.dumps(value, ensure_ascii=False)
+        with self._lock:
+            conn = self._connect()
+            if conn is None:
+                return
+            conn.execute(
+                "INSERT OR REPLACE INTO github_blobs (cache_key, value, accessed_at) "
+                "VALUES (?, ?, ?)",
+                (key, data, time.time()),
+            )
+            self._puts_since_prune += 1
+            if self._puts_since_prune >= self._prune_interval:
+                self._puts_since_prune = 0
+                (count,) = conn.execute("SELECT COUNT(*) FROM github_blobs").fetchone()
+                overflow = count - self._max_entries
+                if overflow > 0:
+                    conn.execute(
+                        "DELETE FROM github_blobs WHERE cache_key IN ("
+                        "SELECT cache_key FROM github_blobs ORDER BY accessed_at LIMIT ?)",
+                        (overflow,),
+                    )
+            conn.commit()
+
+    def _put(self, key: str, value: Any) -> None:
+        with self._lock:
+            self._remember(key, value)
+        self._store(key, value)
+
+    async def _aput(self, key: str, value: Any) -> None:
+        with self._lock:
+            self._remember(key, value)
+        if self._path:
+            await asyncio.to_thread(self._store, key, value)
+
+    def get_content(self, sha: str) -> str | None:
+        """blob 원문 조회, 없으면 None"""
+        return self._get(self._content_key(sha))
+
+    def put_content(self, sha: str, content: str) -> None:
+        """blob 원문 저장"""
+        self._put(self._content_key(sha), content)
+
+    def get_parsed(self, sha: str, filename: str) -> dict | None:
+        """파일명 기준 파싱 결과 조회, 없으면 None"""
+        return self._get(self._parsed_key(sha, filename))
+
+    def put_parsed(self, sha: str, filename: str, parsed: dict) -> None:
+        """파일명 기준 파싱 결과 저장"""
+        self._put(self._parsed_key(sha, filename), parsed)
+
+    async def aget_content(self, sha: str) -> str | None:
+        """blob 원문 비동기 조회"""
+        return await self._aget(self._content_key(sha))
+
+    async def aput_content(self, sha: str, content: str) -> None:
+        """blob 원문 비동기 저장"""
+        await self._aput(self._content_key(sha), content)
+
+    async def aget_parsed(self, sha: str, filename: str) -> dict | None:
+        """파일명 기준 파싱 결과 비동기 조회"""
+        return await self._aget(self._parsed_key(sha, filename))
+
+    async def aput_parsed(self, sha: str, filename: str, parsed: dict) -> None:
+        """파일명 기준 파싱 결과 비동기 저장"""
+        await self._aput(self._parsed_key(sha, filename), parsed)
+
+    def close(self) -> None:
+        """SQLite 연결 종료 및 메모리 캐시 비우기"""
+        with self._lock:
+            self._memory.clear()
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+_blob_cache: BlobCache | None = None
+
+
+def get_blob_cache() -> BlobCache:
+    """blob 캐시 지연 초기화 싱글턴"""
+    global _blob_cache
+    if _blob_cache is None:
+        _blob_cache = BlobCache(
+            max_entries=settings.github_blob_cache_max_entries,
+            path=settings.github_blob_cache_path or None,
+        )
+    return _blob_cache
+
+
+def close_blob_cache() -> None:
+    """blob 캐시 종료"""
+    global _blob_cache
+    if _blob_cache is not None:
+        _blob_cache.close()
+        _blob_cache = None
@@ -0,0 +1,149 @@
+"""GitHub REST 조건부 요청 응답 캐시
+
+URL, 쿼리 파라미터, 토큰 범위별로 ETag/Last-Modified와 응답 본문을 SQLite에 저장
+GitHub는 304 응답을 rate limit에 집계하지 않으므로 재생성 요청의 지연과 쿼터 소모를 줄인다
+SQLite 접근은 이벤트 루프를 막지 않도록 비동기 메서드에서 스레드로 실행하고,
+최대 개수 초과분 정리는 저장 prune_interval회마다 한 번만 한다
+"""
+
+import asyncio
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any
+
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS github_responses (
+    cache_key TEXT PRIMARY KEY,
+    etag TEXT,
+    last_modified TEXT,
+    body TEXT NOT NULL,
+    accessed_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_github_responses_accessed_at
+    ON github_responses (accessed_at);
+"""
+
+
+def token_fingerprint(token: str | None) -> str:
+    """토큰 원문 대신 캐시 키와 메트릭 라벨에 사용할 지문 반환"""
+    if not token:
+        return "anonymous"
+    return hashlib.sha256(token.encode()).hexdigest()[:16]
+
+
+@dataclass
+class CachedResponse:
+    """캐시된 GitHub 응답"""
+
+    etag: str | None
+    last_modified: str | None
+    body: Any
+
+
+class GitHubResponseCache:
+    """ETag/Last-Modified 기반 GitHub 응답 캐시 - 최근 접근 순으로 개수 제한"""
+
+    def __init__(self, path: str, max_entries: int = 5000, prune_interval: int = 100):
+        self._path = path
+        self._max_entries = max_entries
+        self._prune_interval = max(1, prune_interval)
+        self._puts_since_prune = 0
+        self._conn: sqlite3.Connection | None = None
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(url: str, params: dict | None, token: str | None) -> str:
+        """URL, 정렬된 쿼리 파라미터, 토큰 지문으로 캐시 키 생성"""
+        query = "&".join(f"{k}={v}" for k, v in sorted((params or {}).items()))
+        raw = f"{token_fingerprint(token)}|{url}?{query}"
+        return hashlib.sha256(raw.encode()).hexdigest()
+
+    def _connect(self) -> sqlite3.Connection:
+        """SQLite 연결 지연 초기화"""
+        if self._conn is None:
+            directory = os.path.dirname(self._path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            self._conn = sqlite3.connect(self._path, check_same_thread=False)
+            self._conn.executescript(_SCHEMA)
+        return self._conn
+
+    def get(self, key: str) -> CachedResponse | None:
+        """캐시 조회, 없으면 None"""
+        with self._lock:
+            row = (
+                self._connect()
+                .execute(
+                    "SELECT etag, last_modified, body FROM github_responses WHERE cache_key = ?",
+                    (key,),
+                )
+                .fetchone()
+            )
+        if row is None:
+            return None
+        etag, last_modified, body = row
+        return CachedResponse(etag=etag, last_modified=last_modified, body=json.loads(body))
+
+    def put(self, key: str, etag: str | None, last_modified: str | None, body: Any) -> None:
+        """응답 저장, prune_interval회마다 최대 개수 초과분을 오래된 순으로 제거"""
+        data = json.dumps(body, ensure_ascii=False)
+        with self._lock:
+            conn = self._connect()
+            conn.execute(
+                "INSERT OR REPLACE INTO github_responses "
+                "(cache_key, etag, last_modified, body, accessed_at) VALUES (?, ?, ?, ?, ?)",
+                (key, etag, last_modified, data, time.time()),
+            )
+            self._puts_since_prune += 1
+            if self._puts_since_prune >= self._prune_interval:
+                self._puts_since_prune = 0
+                self._prune(conn)
+            conn.commit()
+
+    def _prune(self, conn: sqlite3.Connection) -> None:
+        (count,) = conn.execute("SELECT COUNT(*) FROM github_responses").fetchone()
+        overflow = count - self._max_entries
+        if overflow > 0:
+            conn.execute(
+                "DELETE FROM github_responses WHERE cache_key IN ("
+                "SELECT cache_key FROM github_responses ORDER BY accessed_at LIMIT ?)",
+                (overflow,),
+            )
+
+    def touch(self, key: str) -> None:
+        """304 응답으로 재사용된 항목의 접근 시각 갱신"""
+        with self._lock:
+            conn = self._connect()
+            conn.execute(
+                "UPDATE github_responses SET accessed_at = ? WHERE cache_key = ?",
+                (time.time(), key),
+            )
+            conn.commit()
+
+    async def aget(self, key: str) -> CachedResponse | None:
+        """캐시 비동기 조회"""
+        return await asyncio.to_thread(self.get, key)
+
+    async def aput(self, key: str, etag: str | None, last_modified: str | None, body: Any) -> None:
+        """응답 비동기 저장"""
+        await asyncio.to_thread(self.put, key, etag, last_modified, body)
+
+    async def atouch(self, key: str) -> None:
+        """접근 시각 비동기 갱신"""
+        await asyncio.to_thread(self.touch, key)
+
+    def close(self) -> None:
+        """SQLite 연결 종료"""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
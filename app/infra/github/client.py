@@ -1,6 +1,13 @@
 import asyncio
 import base64
+import hashlib
+import json
 import re
+import time
+from collections import OrderedDict
+from collections.abc import AsyncIterator
+from pathlib import Path
+from typing import Any
 
 import httpx
 
@@ -11,6 +18,31 @@ from app.domain.resume.schemas import (
     PRInfoExtended,
     UserStats,
 )
+from app.infra.github.blob_cache import close_blob_cache
+from app.infra.github.cache import GitHubResponseCache, token_fingerprint
+from app.infra.github.local_clone import (
+    GitCommandError,
+    LocalClone,
+    close_clone_manager,
+    get_clone_manager,
+    read_commits,
+    read_files,
+    read_tree_entries,
+)
+from app.infra.github.rate_limit import (
+    PRIORITY_HIGH,
+    PRIORITY_LOW,
+    PRIORITY_NORMAL,
+    GitHubRateLimiter,
+)
+from app.infra.github.retry import (
+    FILES_BATCH_RETRY_POLICY,
+    GRAPHQL_RETRY_POLICY,
+    REST_RETRY_POLICY,
+    RetryPolicy,
+    send_with_retry,
+)
+from app.infra.github.single_flight import SingleFlight
 
 logger = get_logger(__name__)
 
@@ -34,7 +66,17 @@ DANGEROUS_PATH_PARTS = frozenset(
 )
 
 _client: httpx.AsyncClient | None = None
-_request_semaphore = asyncio.Semaphore(settings.github_max_concurrent_requests)
+_single_flight = SingleFlight()
+_user_node_ids: OrderedDict[str, tuple[str, float]] = OrderedDict()
+_pull_detail_cache: OrderedDict[tuple[str, str, int, str], dict] = OrderedDict()
+_response_cache: GitHubResponseCache | None = None
+_rate_limiter = GitHubRateLimiter(
+    max_concurrent=settings.github_max_concurrent_requests,
+    reserve=settings.github_rate_limit_reserve,
+    pace_threshold=settings.github_rate_limit_pace_threshold,
+    max_wait=settings.github_rate_limit_max_wait,
+    max_tokens=settings.github_rate_limit_max_tokens,
+)
 
 
 def _get_client() -> httpx.AsyncClient:
@@ -45,6 +87,19 @@ def _get_client() -> httpx.AsyncClient:
     return _client
 
 
+def _get_response_cache() -> GitHubResponseCache | None:
+    """조건부 요청 캐시 지연 초기화 싱글턴, 비활성화 시 None"""
+    global _response_cache
+    if not settings.github_cache_enabled:
+        return None
+    if _response_cache is None:
+        _response_cache = GitHubResponseCache(
+            settings.github_cache_path,
+            max_entries=settings.github_cache_max_entries,
+        )
+    return _response_cache
+
+
 def _matches_commit_author(
     commit_author: str,
     commit_user_login: str | None,
@@ -102,11 +157,116 @@ def _get_headers(token: str | None = None) -> dict[str, str]:
 
 
 async def close_client():
-    """httpx 클라이언트 종료"""
-    global _client
+    """httpx 클라이언트와 응답 캐시, blob 캐시, 부분 클론 종료"""
+    global _client, _response_cache
     if _client is not None:
         await _client.aclose()
         _client = None
+    if _response_cache is not None:
+        _response_cache.close()
+        _response_cache = None
+    close_blob_cache()
+    await close_clone_manager()
+
+
+async def _send(
+    method: str,
+    url: str,
+    token: str | None,
+    resource: str,
+    priority: int,
+    policy: RetryPolicy,
+    **kwargs,
+) -> httpx.Response:
+    """rate limit 스케줄러와 재시도 정책을 적용해 GitHub 요청 전송
+
+    재시도마다 스케줄러 슬롯을 다시 점유하므로 대기 중에는 다른 요청이 실행될 수 있음
+    """
+
+    async def attempt() -> httpx.Response:
+        async with _rate_limiter.acquire(token, resource, priority):
+            response = await _get_client().request(method, url, **kwargs)
+            _rate_limiter.observe(token, response, resource)
+            return response
+
+    return await send_with_retry(attempt, policy)
+
+
+async def _get_json(
+    url: str,
+    token: str | None = None,
+    params: dict | None = None,
+    priority: int = PRIORITY_NORMAL,
+) -> Any:
+    """GitHub REST GET 요청 후 JSON 반환
+
+    캐시된 ETag/Last-Modified로 조건부 요청을 보내고 304면 캐시된 본문을 반환
+    요청은 토큰별 rate limit 스케줄러를 거쳐 실행되며, 같은 URL/파라미터/토큰으로
+    진행 중인 요청이 있으면 새로 보내지 않고 그 결과를 공유
+
+    Args:
+        url: 요청 URL
+        token: GitHub OAuth 토큰, 캐시 키 범위에 포함
+        params: 쿼리 파라미터
+        priority: 스케줄러 우선순위, 작을수록 먼저 실행
+
+    Returns:
+        응답 JSON
+
+    Raises:
+        httpx.HTTPStatusError: GitHub API 호출 실패 시
+    """
+    key = ("rest", GitHubResponseCache.make_key(url, params, token))
+    return await _single_flight.do("rest", key, lambda: _fetch_json(url, token, params, priority))
+
+
+async def _fetch_json(
+    url: str,
+    token: str | None,
+    params: dict | None,
+    priority: int,
+) -> Any:
+    """조건부 요청 캐시를 거쳐 GitHub REST GET 실행"""
+    cache = _get_response_cache()
+    headers = _get_headers(token)
+    cache_key = None
+    cached = None
+
+    if cache is not None:
+        cache_key = GitHubResponseCache.make_key(url, params, token)
+        cached = await cache.aget(cache_key)
+        if cached is not None:
+            if cached.etag:
+                headers["If-None-Match"] = cached.etag
+            elif cached.last_modified:
+                headers["If-Modified-Since"] = cached.last_modified
+
+    response = await _send(
+        "GET",
+        url,
+        token,
+        "core",
+        priority,
+        REST_RETRY_POLICY,
+        headers=headers,
+        params=params,
+    )
+
+    if response.status_code == 304 and cached is not None:
+        await cache.atouch(cache_key)
+        logger.debug("GitHub 캐시 적중", url=url)
+        return cached.body
+
+    response.raise_for_status()
+    data = response.json()
+
+    if cache is not None:
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if etag or last_modified:
+            await cache.aput(cache_key, etag, last_modified, data)
+
+    return data
 
 
 async def get_authenticated_user(token: str) -> tuple[str | None, str | None]:
@@ -120,12 +280,21 @@ async def get_authenticated_user(token: str) -> tuple[str | None, str | None]:
     Returns:
         username, name 튜플, 실패 시 None, None
     """
+    return await _single_flight.do(
+        "identity",
+        ("identity", token_fingerprint(token)),
+        lambda: _fetch_authenticated_user(token),
+        ttl=settings.github_identity_ttl,
+        should_memoize=lambda result: result[0] is not None,
+    )
+
+
+async def _fetch_authenticated_user(token: str) -> tuple[str | None, str | None]:
+    """GET /user 호출로 인증된 사용자 조회"""
     url = f"{GITHUB_API_BASE}/user"
 
     try:
-        response = await _get_client().get(url, headers=_get_headers(token))
-        response.raise_for_status()
-        data = response.json()
+        data = await _get_json(url, token, priority=PRIORITY_HIGH)
         username = data.get("login")
         name = data.get("name")
         logger.info("인증된 사용자 조회 완료", username=username, name=name)
@@ -193,6 +362,7 @@ async def get_commits(
     author_name: str | None = None,
     author: str | None = None,
     per_page: int = 100,
+    since: str | None = None,
 ) -> list[CommitInfo]:
     """레포지토리 커밋 목록 조회
 
@@ -202,6 +372,7 @@ async def get_commits(
         author_name: Git author name, 커밋 필터링에 사용
         author: GitHub 유저네임, 커밋 필터링에 사용
         per_page: 가져올 커밋 개수
+        since: ISO 8601 시각, 지정하면 이후 커밋만 조회
 
     Returns:
         커밋 목록, merge 커밋 제외
@@ -210,10 +381,10 @@ async def get_commits(
     url = f"{GITHUB_API_BASE}/repos/{owner}/{repo}/commits"
 
     params = {"per_page": min(per_page, 100)}
+    if since:
+        params["since"] = since
 
-    response = await _get_client().get(url, headers=_get_headers(token), params=params)
-    response.raise_for_status()
-    data = response.json()
+    data = await _get_json(url, token, params)
 
     commits = []
     for commit in data:
@@ -234,6 +405,68 @@ async def get_commits(
     return commits
 
 
+async def get_head_commit(repo_url: str, token: str | None = None) -> dict | None:
+    """기본 브랜치 HEAD 커밋의 oid와 커밋 시각 조회
+
+    조건부 요청 캐시를 거치므로 변경이 없으면 304로 rate limit을 소모하지 않음
+
+    Args:
+        repo_url: GitHub 레포지토리 URL
+        token: GitHub OAuth 토큰
+
+    Returns:
+        oid, committed_date를 포함한 딕셔너리, 커밋이 없으면 None
+    """
+    owner, repo = parse_repo_url(repo_url)
+    url = f"{GITHUB_API_BASE}/repos/{owner}/{repo}/commits"
+
+    data = await _get_json(url, token, {"per_page": 1}, priority=PRIORITY_HIGH)
+    if not data:
+        return None
+    return {
+        "oid": data[0]["sha"],
+        "committed_date": data[0]["commit"]["committer"]["date"],
+    }
+
+
+def head_commit_from_node(repository: dict) -> dict | None:
+    """배치 쿼리 repository 노드에서 HEAD 커밋 oid와 커밋 시각 추출"""
+    target = (repository.get("defaultBranchRef") or {}).get("target") or {}
+    if not target.get("oid"):
+        return None
+    return {"oid": target["oid"], "committed_date": target.get("committedDate")}
+
+
+async def get_project_history_since(
+    repo_url: str,
+    since: str,
+    token: str | None = None,
+    author: str | None = None,
+    author_name: str | None = None,
+    commits_count: int = 50,
+    prs_count: int = 50,
+) -> dict:
+    """커서 시각 이후의 커밋과 Merged PR만 조회
+
+    Args:
+        repo_url: GitHub 레포지토리 URL
+        since: ISO 8601 시각, 스냅샷의 HEAD 커밋 시각
+        token: GitHub OAuth 토큰
+        author: GitHub 유저네임
+        author_name: Git author name
+        commits_count: 가져올 커밋 개수
+        prs_count: 확인할 PR 개수
+
+    Returns:
+        commits, pulls를 포함한 딕셔너리
+    """
+    commits, pulls = await asyncio.gather(
+        get_commits(repo_url, token, author_name, author, commits_count, since=since),
+        get_pulls_extended(repo_url, token, author, prs_count, merged_since=since),
+    )
+    return {"commits": commits, "pulls": pulls}
+
+
 async def get_repo_languages(repo_url: str, token: str | None = None) -> dict[str, int]:
     """레포지토리 언어 비율 조회
 
@@ -247,11 +480,10 @@ async def get_repo_languages(repo_url: str, token: str | None = None) -> dict[st
     owner, repo = parse_repo_url(repo_url)
     url = f"{GITHUB_API_BASE}/repos/{owner}/{repo}/languages"
 
-    response = await _get_client().get(url, headers=_get_headers(token))
-    response.raise_for_status()
+    data = await _get_json(url, token)
 
     logger.debug("언어 조회 완료", owner=owner, repo=repo)
-    return response.json()
+    return data
 
 
 async def get_repo_info(repo_url: str, token: str | None = None) -> dict:
@@ -262,19 +494,18 @@ async def get_repo_info(repo_url: str, token: str | None = None) -> dict:
         token: GitHub OAuth 토큰
 
     Returns:
-        description과 topics를 포함한 딕셔너리
+        description, topics, size(KB)를 포함한 딕셔너리
     """
     owner, repo = parse_repo_url(repo_url)
     url = f"{GITHUB_API_BASE}/repos/{owner}/{repo}"
 
-    response = await _get_client().get(url, headers=_get_headers(token))
-    response.raise_for_status()
-    data = response.json()
+    data = await _get_json(url, token)
 
     logger.debug("레포 정보 조회 완료", owner=owner, repo=repo)
     return {
         "description": data.get("description"),
         "topics": data.get("topics", []),
+        "size": data.get("size"),
     }
 
 
@@ -292,9 +523,7 @@ async def get_repo_readme(repo_url: str, token: str | None = None) -> str | None
     url = f"{GITHUB_API_BASE}/repos/{owner}/{repo}/readme"
 
     try:
-        response = await _get_client().get(url, headers=_get_headers(token))
-        response.raise_for_status()
-        data = response.json()
+        data = await _get_json(url, token)
 
         content = base64.b64decode(data["content"]).decode("utf-8")
         logger.debug("README 조회 완료", owner=owner, repo=repo)
@@ -306,31 +535,59 @@ async def get_repo_readme(repo_url: str, token: str | None = None) -> str | None
         raise
 
 
-async def get_repo_tree(repo_url: str, token: str | None = None) -> list[str]:
-    """레포지토리 전체 파일 목록 조회
+async def get_repo_tree_entries(repo_url: str, token: str | None = None) -> list[dict]:
+    """레포지토리 전체 파일 목록을 크기, blob SHA와 함께 조회
 
     Args:
         repo_url: GitHub 레포지토리 URL
         token: GitHub OAuth 토큰
 
     Returns:
-        파일 경로 리스트
+        path, size, sha를 포함한 파일 항목 리스트
 
     Raises:
         httpx.HTTPStatusError: GitHub API 호출 실패 시
     """
     owner, repo = parse_repo_url(repo_url)
+
+    async with get_clone_manager().lease(owner, repo, token) as clone_path:
+        if clone_path is not None:
+            try:
+                return await read_tree_entries(clone_path)
+            except GitCommandError as e:
+                logger.warning(
+                    "로컬 트리 조회 실패, API 폴백", owner=owner, repo=repo, error=str(e)
+                )
+
     url = f"{GITHUB_API_BASE}/repos/{owner}/{repo}/git/trees/HEAD"
 
     params = {"recursive": "1"}
 
-    response = await _get_client().get(url, headers=_get_headers(token), params=params)
-    response.raise_for_status()
-    data = response.json()
+    data = await _get_json(url, token, params)
+
+    entries = [
+        {"path": item["path"], "size": item.get("size"), "sha": item.get("sha")}
+        for item in data.get("tree", [])
+        if item["type"] == "blob"
+    ]
+    logger.debug("파일 트리 조회 완료", owner=owner, repo=repo, files=len(entries))
+    return entries
+
+
+async def get_repo_tree(repo_url: str, token: str | None = None) -> list[str]:
+    """레포지토리 전체 파일 목록 조회
+
+    Args:
+        repo_url: GitHub 레포지토리 URL
+        token: GitHub OAuth 토큰
+
+    Returns:
+        파일 경로 리스트
 
-    files = [item["path"] for item in data.get("tree", []) if item["type"] == "blob"]
-    logger.debug("파일 트리 조회 완료", owner=owner, repo=repo, files=len(files))
-    return files
+    Raises:
+        httpx.HTTPStatusError: GitHub API 호출 실패 시
+    """
+    return [entry["path"] for entry in await get_repo_tree_entries(repo_url, token)]
 
 
 async def get_file_content(repo_url: str, path: str, token: str | None = None) -> str | None:
@@ -348,9 +605,7 @@ async def get_file_content(repo_url: str, path: str, token: str | None = None) -
     url = f"{GITHUB_API_BASE}/repos/{owner}/{repo}/contents/{path}"
 
     try:
-        response = await _get_client().get(url, headers=_get_headers(token))
-        response.raise_for_status()
-        data = response.json()
+        data = await _get_json(url, token, priority=PRIORITY_LOW)
 
         if data.get("encoding") != "base64":
             return None
@@ -369,65 +624,106 @@ async def get_file_content(repo_url: str, path: str, token: str | None = None) -
         return None
 
 
-async def _graphql_query(query: str, variables: dict, token: str) -> dict:
-    """GraphQL 쿼리 실행
+async def _graphql_query_partial(
+    query: str,
+    variables: dict,
+    token: str,
+    priority: int = PRIORITY_HIGH,
+    policy: RetryPolicy = GRAPHQL_RETRY_POLICY,
+) -> tuple[dict, list[dict]]:
+    """GraphQL 쿼리 실행 후 부분 결과와 에러 목록 반환
+
+    별칭 배치 쿼리처럼 일부 필드만 실패해도 나머지 결과를 사용해야 할 때 사용
+    쿼리에 rateLimit 필드가 있으면 스케줄러 예산 갱신에 사용하고 결과에서 제거
+    같은 토큰으로 같은 쿼리와 변수가 진행 중이면 그 결과를 공유
 
     Args:
         query: GraphQL 쿼리 문자열
         variables: 쿼리 변수
         token: GitHub OAuth 토큰
+        priority: 스케줄러 우선순위, 작을수록 먼저 실행
+        policy: 재시도 정책
 
     Returns:
-        GraphQL 응답의 data 필드
-
-    Raises:
-        ValueError: GraphQL 에러 발생 시
+        GraphQL 응답의 data 필드와 errors 리스트 튜플
     """
+    query_key = hashlib.sha256(
+        json.dumps([query, variables], sort_keys=True, ensure_ascii=False).encode()
+    ).hexdigest()
+    key = ("graphql", token_fingerprint(token), query_key)
+    return await _single_flight.do(
+        "graphql", key, lambda: _execute_graphql(query, variables, token, priority, policy)
+    )
+
+
+async def _execute_graphql(
+    query: str,
+    variables: dict,
+    token: str,
+    priority: int,
+    policy: RetryPolicy,
+) -> tuple[dict, list[dict]]:
+    """GraphQL 요청 1건 실행 후 data와 errors 반환"""
     headers = _get_headers(token)
     headers["Content-Type"] = "application/json"
-    response = await _get_client().post(
+    response = await _send(
+        "POST",
         GITHUB_GRAPHQL_URL,
+        token,
+        "graphql",
+        priority,
+        policy,
         headers=headers,
         json={"query": query, "variables": variables},
     )
     response.raise_for_status()
     data = response.json()
+    if data.get("data"):
+        _rate_limiter.observe_graphql(token, data["data"].pop("rateLimit", None))
+
+    errors = data.get("errors") or []
+    for i, error in enumerate(errors, 1):
+        logger.warning(
+            "GraphQL 에러",
+            index=i,
+            total=len(errors),
+            type=error.get("type", "UNKNOWN"),
+            message=error.get("message", "알 수 없는 에러"),
+            path=error.get("path", []),
+        )
 
-    if "errors" in data:
-        error_count = len(data["errors"])
-        for i, error in enumerate(data["errors"], 1):
-            error_message = error.get("message", "알 수 없는 에러")
-            error_type = error.get("type", "UNKNOWN")
-            error_path = error.get("path", [])
-            logger.warning(
-                "GraphQL 에러",
-                index=i,
-                total=error_count,
-                type=error_type,
-                message=error_message,
-                path=error_path,
-            )
-        raise ValueError(f"GraphQL 요청 실패: {error_count}개의 에러 발생")
-
-    return data["data"]
+    return data.get("data") or {}, errors
 
 
-async def get_repo_context_graphql(repo_url: str, token: str) -> dict:
-    """GraphQL로 레포지토리 컨텍스트 정보 조회
+async def _graphql_query(
+    query: str,
+    variables: dict,
+    token: str,
+    policy: RetryPolicy = GRAPHQL_RETRY_POLICY,
+) -> dict:
+    """GraphQL 쿼리 실행
 
     Args:
-        repo_url: GitHub 레포지토리 URL
+        query: GraphQL 쿼리 문자열
+        variables: 쿼리 변수
         token: GitHub OAuth 토큰
+        policy: 재시도 정책
 
     Returns:
-        languages, description, topics, readme를 포함한 딕셔너리
+        GraphQL 응답의 data 필드
+
+    Raises:
+        ValueError: GraphQL 에러 발생 시
     """
-    owner, repo = parse_repo_url(repo_url)
+    data, errors = await _graphql_query_partial(query, variables, token, policy=policy)
+    if errors:
+        raise ValueError(f"GraphQL 요청 실패: {len(errors)}개의 에러 발생")
+    return data
 
-    query = """
-    query($owner: String!, $repo: String!) {
-      repository(owner: $owner, name: $repo) {
+
+_CONTEXT_FIELDS = """
         description
+        diskUsage
         repositoryTopics(first: 10) {
           nodes { topic { name } }
         }
@@ -437,67 +733,14 @@ async def get_repo_context_graphql(repo_url: str, token: str) -> dict:
         object(expression: "HEAD:README.md") {
           ... on Blob { text }
         }
-      }
-    }
-    """
-
-    data = await _graphql_query(query, {"owner": owner, "repo": repo}, token)
-    repository = data["repository"]
-
-    languages = {}
-    for edge in repository.get("languages", {}).get("edges", []):
-        languages[edge["node"]["name"]] = edge["size"]
-
-    topics = []
-    for node in repository.get("repositoryTopics", {}).get("nodes", []):
-        if node and node.get("topic"):
-            topics.append(node["topic"]["name"])
-
-    readme_obj = repository.get("object")
-    readme = (
-        readme_obj.get("text")[: settings.readme_max_length_github]
-        if readme_obj and readme_obj.get("text")
-        else None
-    )
-
-    logger.info("GraphQL 컨텍스트 조회 완료", owner=owner, repo=repo)
-    return {
-        "languages": languages,
-        "description": repository.get("description"),
-        "topics": topics,
-        "readme": readme,
-    }
-
-
-async def get_project_info_graphql(
-    repo_url: str,
-    token: str,
-    author: str | None = None,
-    author_name: str | None = None,
-    commits_count: int = 50,
-    prs_count: int = 50,
-) -> dict:
-    """GraphQL로 커밋과 PR 목록 조회
-
-    Args:
-        repo_url: GitHub 레포지토리 URL
-        token: GitHub OAuth 토큰
-        author: GitHub 유저네임, PR 필터링에 사용
-        author_name: Git author name, 커밋 필터링에 사용
-        commits_count: 가져올 커밋 개수
-        prs_count: 가져올 PR 개수
-
-    Returns:
-        commits, pulls를 포함한 딕셔너리
-    """
-    owner, repo = parse_repo_url(repo_url)
+"""
 
-    query = """
-    query($owner: String!, $repo: String!, $commitsCount: Int!, $prsCount: Int!) {
-      repository(owner: $owner, name: $repo) {
+_PROJECT_FIELDS = """
         defaultBranchRef {
           target {
             ... on Commit {
+              oid
+              committedDate
               history(first: $commitsCount) {
                 nodes {
                   oid
@@ -525,19 +768,43 @@ async def get_project_info_graphql(
             commits { totalCount }
           }
         }
-      }
-    }
-    """
+"""
 
-    variables = {
-        "owner": owner,
-        "repo": repo,
-        "commitsCount": commits_count,
-        "prsCount": prs_count,
+
+def _parse_repo_context(repository: dict) -> dict:
+    """GraphQL repository 노드에서 컨텍스트 정보 추출"""
+    languages = {}
+    for edge in (repository.get("languages") or {}).get("edges", []):
+        languages[edge["node"]["name"]] = edge["size"]
+
+    topics = []
+    for node in (repository.get("repositoryTopics") or {}).get("nodes", []):
+        if node and node.get("topic"):
+            topics.append(node["topic"]["name"])
+
+    readme_obj = repository.get("object")
+    readme = (
+        readme_obj.get("text")[: settings.readme_max_length_github]
+        if readme_obj and readme_obj.get("text")
+        else None
+    )
+
+    return {
+        "languages": languages,
+        "description": repository.get("description"),
+        "topics": topics,
+        "readme": readme,
     }
 
-    data = await _graphql_query(query, variables, token)
-    repository = data["repository"]
+
+def _parse_project_history(
+    repository: dict,
+    repo_url: str,
+    author: str | None,
+    author_name: str | None,
+) -> dict:
+    """GraphQL repository 노드에서 작성자 기준으로 커밋과 PR 추출"""
+    owner, repo = parse_repo_url(repo_url)
 
     commits = []
     total_commits_before_filter = 0
@@ -574,12 +841,12 @@ async def get_project_info_graphql(
     )
 
     pulls = []
-    all_pr_nodes = repository.get("pullRequests", {}).get("nodes", [])
+    all_pr_nodes = (repository.get("pullRequests") or {}).get("nodes", [])
     total_prs_before_filter = len(all_pr_nodes)
     for pr_node in all_pr_nodes:
         if not pr_node:
             continue
-        pr_author = pr_node.get("author", {}).get("login", "")
+        pr_author = (pr_node.get("author") or {}).get("login", "")
         if author and pr_author.lower() != author.lower():
             logger.debug(
                 "PR 작성자 매칭 실패",
@@ -611,55 +878,385 @@ async def get_project_info_graphql(
         filter_author=author,
     )
 
-    logger.info(
-        "GraphQL 프로젝트 정보 조회 완료",
-        owner=owner,
-        repo=repo,
-        commits=len(commits),
-        prs=len(pulls),
-    )
     return {
         "commits": commits,
         "pulls": pulls,
     }
 
 
-async def get_files_content_graphql(
-    repo_url: str,
-    paths: list[str],
-    token: str,
-) -> dict[str, str | None]:
-    """GraphQL로 여러 파일 내용을 한 번에 조회
+async def get_repo_context_graphql(repo_url: str, token: str) -> dict:
+    """GraphQL로 레포지토리 컨텍스트 정보 조회
 
     Args:
         repo_url: GitHub 레포지토리 URL
-        paths: 파일 경로 리스트
         token: GitHub OAuth 토큰
 
     Returns:
-        파일 경로를 키로, 내용을 값으로 하는 딕셔너리
+        languages, description, topics, readme를 포함한 딕셔너리
     """
-    if not paths:
-        return {}
-
     owner, repo = parse_repo_url(repo_url)
 
-    file_aliases = []
-    for i, path in enumerate(paths):
-        safe_path = _sanitize_file_path(path)
-        alias = f'file{i}: object(expression: "HEAD:{safe_path}") {{ ... on Blob {{ text }} }}'
-        file_aliases.append(alias)
-
     query = f"""
     query($owner: String!, $repo: String!) {{
-      repository(owner: $owner, name: $repo) {{
-        {chr(10).join(file_aliases)}
-      }}
+      repository(owner: $owner, name: $repo) {{{_CONTEXT_FIELDS}      }}
     }}
     """
 
     data = await _graphql_query(query, {"owner": owner, "repo": repo}, token)
-    repository = data["repository"]
+    context = _parse_repo_context(data["repository"])
+
+    logger.info("GraphQL 컨텍스트 조회 완료", owner=owner, repo=repo)
+    return context
+
+
+async def get_project_info_graphql(
+    repo_url: str,
+    token: str,
+    author: str | None = None,
+    author_name: str | None = None,
+    commits_count: int = 50,
+    prs_count: int = 50,
+) -> dict:
+    """GraphQL로 커밋과 PR 목록 조회
+
+    Args:
+        repo_url: GitHub 레포지토리 URL
+        token: GitHub OAuth 토큰
+        author: GitHub 유저네임, PR 필터링에 사용
+        author_name: Git author name, 커밋 필터링에 사용
+        commits_count: 가져올 커밋 개수
+        prs_count: 가져올 PR 개수
+
+    Returns:
+        commits, pulls를 포함한 딕셔너리
+    """
+    owner, repo = parse_repo_url(repo_url)
+
+    query = f"""
+    query($owner: String!, $repo: String!, $commitsCount: Int!, $prsCount: Int!) {{
+      repository(owner: $owner, name: $repo) {{{_PROJECT_FIELDS}      }}
+    }}
+    """
+
+    variables = {
+        "owner": owner,
+        "repo": repo,
+        "commitsCount": commits_count,
+        "prsCount": prs_count,
+    }
+
+    data = await _graphql_query(query, variables, token)
+    result = _parse_project_history(data["repository"], repo_url, author, author_name)
+
+    logger.info(
+        "GraphQL 프로젝트 정보 조회 완료",
+        owner=owner,
+        repo=repo,
+        commits=len(result["commits"]),
+        prs=len(result["pulls"]),
+    )
+    return result
+
+
+async def get_user_node_id(login: str, token: str) -> str | None:
+    """GitHub 유저네임의 GraphQL 노드 ID 조회, TTL 동안 프로세스 내 LRU 캐시에서 재사용
+
+    Args:
+        login: GitHub 유저네임
+        token: GitHub OAuth 토큰
+
+    Returns:
+        사용자 노드 ID, 존재하지 않는 사용자면 None
+    """
+    key = login.lower()
+    cached = _user_node_ids.get(key)
+    if cached is not None:
+        node_id, expires_at = cached
+        if time.monotonic() < expires_at:
+            _user_node_ids.move_to_end(key)
+            return node_id
+        del _user_node_ids[key]
+
+    query = """
+    query($login: String!) {
+      user(login: $login) { id }
+    }
+    """
+    data, _ = await _graphql_query_partial(query, {"login": login}, token)
+    node_id = (data.get("user") or {}).get("id")
+    if node_id:
+        _user_node_ids[key] = (node_id, time.monotonic() + settings.github_user_node_id_cache_ttl)
+        _user_node_ids.move_to_end(key)
+        while len(_user_node_ids) > settings.github_user_node_id_cache_size:
+            _user_node_ids.popitem(last=False)
+    return node_id
+
+
+async def iter_author_commits(
+    repo_url: str,
+    token: str,
+    author_id: str,
+    target_count: int | None = None,
+    max_pages: int | None = None,
+) -> AsyncIterator[CommitInfo]:
+    """기본 브랜치에서 특정 사용자의 커밋을 서버 측 필터링과 커서 페이지네이션으로 순회
+
+    history(author: {id}) 로 작성자 필터를 서버에 맡겨 다른 팀원의 커밋 노드를 받지 않고,
+    target_count개를 채우거나 max_pages 페이지를 소모하면 중단한다
+
+    Args:
+        repo_url: GitHub 레포지토리 URL
+        token: GitHub OAuth 토큰
+        author_id: get_user_node_id로 조회한 사용자 노드 ID
+        target_count: 수집할 커밋 개수, 기본값은 설정값
+        max_pages: 최대 요청 페이지 수 (쿼리 비용 상한), 기본값은 설정값
+
+    Yields:
+        머지 커밋을 제외한 사용자 커밋
+    """
+    owner, repo = parse_repo_url(repo_url)
+    target_count = target_count or settings.github_author_history_target
+    max_pages = max_pages or settings.github_author_history_max_pages
+
+    query = """
+    query($owner: String!, $repo: String!, $authorId: ID!, $first: Int!, $after: String) {
+      repository(owner: $owner, name: $repo) {
+        defaultBranchRef {
+          target {
+            ... on Commit {
+              history(first: $first, after: $after, author: {id: $authorId}) {
+                pageInfo { hasNextPage endCursor }
+                nodes {
+                  oid
+                  message
+                  author { name }
+                  parents { totalCount }
+                }
+              }
+            }
+          }
+        }
+      }
+    }
+    """
+
+    yielded = 0
+    pages = 0
+    cursor = None
+    while pages < max_pages:
+        pages += 1
+        variables = {
+            "owner": owner,
+            "repo": repo,
+            "authorId": author_id,
+            "first": min(100, target_count - yielded),
+            "after": cursor,
+        }
+        data = await _graphql_query(query, variables, token)
+        branch_ref = (data.get("repository") or {}).get("defaultBranchRef") or {}
+        history = (branch_ref.get("target") or {}).get("history")
+        if not history:
+            break
+
+        for node in history.get("nodes", []):
+            if node.get("parents", {}).get("totalCount", 0) >= 2:
+                continue
+            yield CommitInfo(
+                sha=node["oid"],
+                message=node["message"],
+                author=(node.get("author") or {}).get("name") or "Unknown",
+            )
+            yielded += 1
+            if yielded >= target_count:
+                break
+
+        page_info = history.get("pageInfo") or {}
+        if yielded >= target_count or not page_info.get("hasNextPage"):
+            break
+        cursor = page_info.get("endCursor")
+
+    logger.debug("작성자 커밋 조회 완료", owner=owner, repo=repo, commits=yielded, pages=pages)
+
+
+async def _get_author_commits(repo_url: str, token: str, author: str) -> list[CommitInfo] | None:
+    """서버 측 작성자 필터 모드로 커밋 수집, 사용할 수 없으면 None"""
+    try:
+        author_id = await get_user_node_id(author, token)
+        if not author_id:
+            return None
+        return [commit async for commit in iter_author_commits(repo_url, token, author_id)]
+    except Exception as e:
+        logger.warning("작성자 커밋 조회 실패, 기존 방식 폴백", error=type(e).__name__)
+        return None
+
+
+def _estimate_repo_query_cost(commits_count: int, prs_count: int) -> int:
+    """배치 쿼리에서 레포 1개가 차지하는 노드 수 추정
+
+    토픽/언어 20개와 README 1개에 커밋, PR 노드를 더한 값
+    """
+    return 21 + commits_count + prs_count
+
+
+def _split_repo_batches(
+    repo_urls: list[str], commits_count: int, prs_count: int
+) -> list[list[str]]:
+    """레포 수와 추정 노드 수 상한에 맞게 배치 분할"""
+    cost = _estimate_repo_query_cost(commits_count, prs_count)
+    max_repos = max(
+        1,
+        min(
+            settings.github_graphql_batch_max_repos,
+            settings.github_graphql_batch_max_nodes // cost,
+        ),
+    )
+    return [repo_urls[i : i + max_repos] for i in range(0, len(repo_urls), max_repos)]
+
+
+async def _fetch_repo_batch(
+    repo_urls: list[str],
+    token: str,
+    commits_count: int,
+    prs_count: int,
+) -> dict[str, dict | Exception]:
+    """별칭 쿼리 1회로 여러 레포의 repository 노드 조회"""
+    declarations = ["$commitsCount: Int!", "$prsCount: Int!"]
+    selections = []
+    variables: dict = {"commitsCount": commits_count, "prsCount": prs_count}
+
+    for i, repo_url in enumerate(repo_urls):
+        owner, repo = parse_repo_url(repo_url)
+        declarations.append(f"$owner{i}: String!, $repo{i}: String!")
+        selections.append(
+            f"repo{i}: repository(owner: $owner{i}, name: $repo{i}) {{"
+            f"{_CONTEXT_FIELDS}{_PROJECT_FIELDS}      }}"
+        )
+        variables[f"owner{i}"] = owner
+        variables[f"repo{i}"] = repo
+
+    query = f"""
+    query({", ".join(declarations)}) {{
+      rateLimit {{ cost remaining limit resetAt }}
+      {chr(10).join(selections)}
+    }}
+    """
+
+    data, errors = await _graphql_query_partial(query, variables, token)
+
+    failed_aliases: dict[str, str] = {}
+    for error in errors:
+        path = error.get("path") or []
+        if path:
+            failed_aliases.setdefault(str(path[0]), error.get("message", "알 수 없는 에러"))
+
+    results: dict[str, dict | Exception] = {}
+    for i, repo_url in enumerate(repo_urls):
+        alias = f"repo{i}"
+        repository = data.get(alias)
+        if repository is None:
+            message = failed_aliases.get(alias, "repository 노드 없음")
+            results[repo_url] = ValueError(f"GraphQL 배치 조회 실패: {message}")
+        else:
+            results[repo_url] = repository
+    return results
+
+
+async def get_repos_batch_graphql(
+    repo_urls: list[str],
+    token: str,
+    commits_count: int = 50,
+    prs_count: int = 50,
+) -> dict[str, dict | Exception]:
+    """별칭 배치 쿼리로 여러 레포의 컨텍스트와 프로젝트 이력을 한 번에 조회
+
+    추정 노드 수 기준으로 배치를 나눠 병렬 조회하며, 실패한 레포는 예외 객체로 반환되어
+    해당 레포만 개별 조회 경로로 폴백할 수 있다
+
+    Args:
+        repo_urls: GitHub 레포지토리 URL 리스트
+        token: GitHub OAuth 토큰
+        commits_count: 레포별 가져올 커밋 개수
+        prs_count: 레포별 가져올 PR 개수
+
+    Returns:
+        레포 URL을 키로, GraphQL repository 노드 또는 예외를 값으로 하는 딕셔너리
+    """
+    if not repo_urls:
+        return {}
+
+    batches = _split_repo_batches(repo_urls, commits_count, prs_count)
+    gathered = await asyncio.gather(
+        *(_fetch_repo_batch(batch, token, commits_count, prs_count) for batch in batches),
+        return_exceptions=True,
+    )
+
+    results: dict[str, dict | Exception] = {}
+    for batch, batch_result in zip(batches, gathered, strict=True):
+        if isinstance(batch_result, Exception):
+            logger.warning(
+                "GraphQL 배치 조회 실패", repos=len(batch), error=type(batch_result).__name__
+            )
+            results.update({repo_url: batch_result for repo_url in batch})
+        else:
+            results.update(batch_result)
+
+    failed = sum(1 for value in results.values() if isinstance(value, Exception))
+    logger.info(
+        "GraphQL 배치 조회 완료",
+        repos=len(repo_urls),
+        batches=len(batches),
+        failed=failed,
+    )
+    return results
+
+
+def _chunk_file_paths(paths: list[str], sizes: dict[str, int] | None = None) -> list[list[str]]:
+    """별칭 개수와 예상 blob 크기 합계 상한에 맞춰 파일 경로를 청크로 분할
+
+    크기를 모르는 파일은 github_files_batch_unknown_size로 추정하며,
+    상한보다 큰 단일 파일은 단독 청크로 둔다
+    """
+    max_aliases = settings.github_files_batch_max_aliases
+    max_bytes = settings.github_files_batch_max_bytes
+    sizes = sizes or {}
+
+    chunks: list[list[str]] = []
+    current: list[str] = []
+    current_bytes = 0
+    for path in paths:
+        size = sizes.get(path) or settings.github_files_batch_unknown_size
+        if current and (len(current) >= max_aliases or current_bytes + size > max_bytes):
+            chunks.append(current)
+            current, current_bytes = [], 0
+        current.append(path)
+        current_bytes += size
+    if current:
+        chunks.append(current)
+    return chunks
+
+
+async def _get_files_chunk_graphql(
+    owner: str, repo: str, paths: list[str], token: str
+) -> dict[str, str | None]:
+    """파일 경로 청크 하나를 별칭 GraphQL 쿼리로 조회"""
+    file_aliases = []
+    for i, path in enumerate(paths):
+        safe_path = _sanitize_file_path(path)
+        alias = f'file{i}: object(expression: "HEAD:{safe_path}") {{ ... on Blob {{ text }} }}'
+        file_aliases.append(alias)
+
+    query = f"""
+    query($owner: String!, $repo: String!) {{
+      repository(owner: $owner, name: $repo) {{
+        {chr(10).join(file_aliases)}
+      }}
+    }}
+    """
+
+    data = await _graphql_query(
+        query, {"owner": owner, "repo": repo}, token, policy=FILES_BATCH_RETRY_POLICY
+    )
+    repository = data["repository"]
 
     result = {}
     for i, path in enumerate(paths):
@@ -668,8 +1265,55 @@ async def get_files_content_graphql(
             result[path] = file_obj["text"]
         else:
             result[path] = None
+    return result
+
+
+async def get_files_content_graphql(
+    repo_url: str,
+    paths: list[str],
+    token: str,
+    sizes: dict[str, int] | None = None,
+) -> dict[str, str | None]:
+    """GraphQL로 여러 파일 내용을 청크 단위로 동시에 조회
+
+    별칭 개수와 예상 blob 크기로 청크를 나누고, 실패한 청크의 파일만 None으로 반환하여
+    호출 측에서 해당 파일만 REST로 재조회하도록 한다
+
+    Args:
+        repo_url: GitHub 레포지토리 URL
+        paths: 파일 경로 리스트
+        token: GitHub OAuth 토큰
+        sizes: 파일 경로별 blob 크기, get_repo_tree_entries 결과에서 추출
+
+    Returns:
+        파일 경로를 키로, 내용을 값으로 하는 딕셔너리
+    """
+    if not paths:
+        return {}
+
+    owner, repo = parse_repo_url(repo_url)
+    chunks = _chunk_file_paths(paths, sizes)
+
+    async def fetch_chunk(chunk: list[str]) -> dict[str, str | None]:
+        try:
+            return await _get_files_chunk_graphql(owner, repo, chunk, token)
+        except Exception as e:
+            logger.warning(
+                "GraphQL 파일 청크 조회 실패",
+                owner=owner,
+                repo=repo,
+                files=len(chunk),
+                error=type(e).__name__,
+            )
+            return dict.fromkeys(chunk)
+
+    result: dict[str, str | None] = {}
+    for chunk_result in await asyncio.gather(*(fetch_chunk(chunk) for chunk in chunks)):
+        result.update(chunk_result)
 
-    logger.debug("GraphQL 파일 조회 완료", owner=owner, repo=repo, files=len(paths))
+    logger.debug(
+        "GraphQL 파일 조회 완료", owner=owner, repo=repo, files=len(paths), chunks=len(chunks)
+    )
     return result
 
 
@@ -677,6 +1321,7 @@ async def get_files_content(
     repo_url: str,
     paths: list[str],
     token: str | None = None,
+    sizes: dict[str, int] | None = None,
 ) -> dict[str, str | None]:
     """여러 파일 내용 조회
 
@@ -684,6 +1329,7 @@ async def get_files_content(
         repo_url: GitHub 레포지토리 URL
         paths: 파일 경로 리스트
         token: GitHub OAuth 토큰
+        sizes: 파일 경로별 blob 크기, GraphQL 청크 분할에 사용
 
     Returns:
         파일 경로를 키로, 내용을 값으로 하는 딕셔너리
@@ -691,17 +1337,25 @@ async def get_files_content(
     if not paths:
         return {}
 
-    async def fetch_with_limit(path: str) -> tuple[str, str | None]:
-        async with _request_semaphore:
-            content = await get_file_content(repo_url, path, token)
-            return path, content
+    owner, repo = parse_repo_url(repo_url)
+    async with get_clone_manager().lease(owner, repo, token) as clone_path:
+        if clone_path is not None:
+            try:
+                return await read_files(clone_path, paths, token)
+            except GitCommandError as e:
+                logger.warning(
+                    "로컬 파일 조회 실패, API 폴백", owner=owner, repo=repo, error=str(e)
+                )
+
+    async def fetch_one(path: str) -> tuple[str, str | None]:
+        return path, await get_file_content(repo_url, path, token)
 
     result: dict[str, str | None] = {}
     paths_to_fetch: list[str] = paths
 
     if token:
         try:
-            graphql_result = await get_files_content_graphql(repo_url, paths, token)
+            graphql_result = await get_files_content_graphql(repo_url, paths, token, sizes)
             result.update(graphql_result)
             paths_to_fetch = [p for p, content in graphql_result.items() if content is None]
 
@@ -711,7 +1365,7 @@ async def get_files_content(
             logger.warning("GraphQL 파일 조회 실패, REST 폴백", error=type(e).__name__)
 
     if paths_to_fetch:
-        tasks = [fetch_with_limit(path) for path in paths_to_fetch]
+        tasks = [fetch_one(path) for path in paths_to_fetch]
         rest_results = await asyncio.gather(*tasks)
         for path, content in rest_results:
             result[path] = content
@@ -719,6 +1373,85 @@ async def get_files_content(
     return result
 
 
+async def _prepare_local_clone(
+    repo_url: str, token: str | None, prefetched: dict | None = None
+) -> LocalClone | None:
+    """설정과 레포 크기에 따라 부분 클론을 준비하여 점유한 채로 반환, 로컬 수집 대상이 아니면 None
+
+    반환된 클론은 사용 후 get_clone_manager().release로 반환해야 한다
+
+    - off: 항상 API 사용
+    - always: 항상 부분 클론
+    - auto: 레포 크기(KB)가 github_clone_min_size_kb 이상이면 부분 클론
+    """
+    mode = settings.github_clone_mode
+    if mode not in ("auto", "always"):
+        return None
+
+    owner, repo = parse_repo_url(repo_url)
+    if mode == "auto":
+        size_kb = prefetched.get("diskUsage") if prefetched is not None else None
+        if size_kb is None:
+            try:
+                size_kb = (await get_repo_info(repo_url, token)).get("size")
+            except httpx.HTTPError as e:
+                logger.warning(
+                    "레포 크기 조회 실패", owner=owner, repo=repo, error=type(e).__name__
+                )
+                return None
+        if not size_kb or size_kb < settings.github_clone_min_size_kb:
+            return None
+
+    try:
+        return await get_clone_manager().acquire(owner, repo, token, create=True)
+    except GitCommandError as e:
+        logger.warning("부분 클론 실패, API 사용", owner=owner, repo=repo, error=str(e))
+        return None
+
+
+async def _get_project_info_local(
+    clone_path: Path,
+    repo_url: str,
+    token: str | None,
+    author: str | None,
+    author_name: str | None,
+    commits_count: int,
+    prs_count: int,
+    prefetched: dict | None,
+) -> dict:
+    """부분 클론에서 파일 트리와 커밋을 읽고, PR만 API로 조회"""
+    file_entries = await read_tree_entries(clone_path)
+    commits = [
+        commit
+        for commit in await read_commits(clone_path, settings.github_clone_depth)
+        if _matches_commit_author(commit.author, None, author, author_name)
+    ][:commits_count]
+
+    if prefetched is not None:
+        pulls = _parse_project_history(prefetched, repo_url, author, author_name)["pulls"]
+    elif token:
+        graphql_data = await get_project_info_graphql(
+            repo_url, token, author, author_name, 0, prs_count
+        )
+        pulls = graphql_data["pulls"]
+    else:
+        pulls = await get_pulls_extended(repo_url, token, author, prs_count)
+
+    logger.info(
+        "로컬 프로젝트 정보 조회 완료",
+        repo_url=repo_url,
+        files=len(file_entries),
+        commits=len(commits),
+        prs=len(pulls),
+    )
+    return {
+        "file_tree": [entry["path"] for entry in file_entries],
+        "file_entries": file_entries,
+        "commits": commits,
+        "pulls": pulls,
+    }
+
+
 async def get_project_info(
     repo_url: str,
     token: str | None = None,
@@ -726,6 +1459,7 @@ async def get_project_info(
     author_name: str | None = None,
     commits_count: int = 50,
     prs_count: int = 50,
+    prefetched: dict | None = None,
 ) -> dict:
     """프로젝트 정보 조회
 
@@ -736,45 +1470,112 @@ async def get_project_info(
         author_name: Git author name, 커밋 필터링에 사용
         commits_count: 가져올 커밋 개수
         prs_count: 가져올 PR 개수
+        prefetched: get_repos_batch_graphql로 미리 조회한 repository 노드
 
     Returns:
-        file_tree, commits, pulls를 포함한 딕셔너리
+        file_tree, file_entries, commits, pulls를 포함한 딕셔너리
     """
-    file_tree = await get_repo_tree(repo_url, token)
+    clone = await _prepare_local_clone(repo_url, token, prefetched)
+    if clone is not None:
+        try:
+            return await _get_project_info_local(
+                clone.path,
+                repo_url,
+                token,
+                author,
+                author_name,
+                commits_count,
+                prs_count,
+                prefetched,
+            )
+        except Exception as e:
+            logger.warning("로컬 프로젝트 정보 조회 실패, API 폴백", error=type(e).__name__)
+        finally:
+            await get_clone_manager().release(clone)
+
+    file_entries, history = await asyncio.gather(
+        get_repo_tree_entries(repo_url, token),
+        _get_project_history(
+            repo_url, token, author, author_name, commits_count, prs_count, prefetched
+        ),
+    )
+    return {
+        "file_tree": [entry["path"] for entry in file_entries],
+        "file_entries": file_entries,
+        "commits": history["commits"],
+        "pulls": history["pulls"],
+    }
+
+
+async def _get_project_history(
+    repo_url: str,
+    token: str | None,
+    author: str | None,
+    author_name: str | None,
+    commits_count: int,
+    prs_count: int,
+    prefetched: dict | None,
+) -> dict:
+    """커밋과 PR 이력 조회 - 파일 트리 조회와 독립적으로 실행"""
+    author_commits = None
+    if token and author and settings.github_author_history_enabled:
+        author_commits = await _get_author_commits(repo_url, token, author)
+
+    if prefetched is not None:
+        history = _parse_project_history(prefetched, repo_url, author, author_name)
+        # 작성자 필터 모드에서는 배치 쿼리가 커밋을 받지 않으므로 REST로 보충
+        if author_commits is None and settings.github_author_history_enabled:
+            author_commits = await get_commits(repo_url, token, author_name, author, commits_count)
+        return {
+            "commits": author_commits if author_commits is not None else history["commits"],
+            "pulls": history["pulls"],
+        }
 
     if token:
         try:
             graphql_data = await get_project_info_graphql(
-                repo_url, token, author, author_name, commits_count, prs_count
+                repo_url,
+                token,
+                author,
+                author_name,
+                0 if author_commits is not None else commits_count,
+                prs_count,
             )
             return {
-                "file_tree": file_tree,
-                "commits": graphql_data["commits"],
+                "commits": (
+                    author_commits if author_commits is not None else graphql_data["commits"]
+                ),
                 "pulls": graphql_data["pulls"],
             }
         except Exception as e:
             logger.warning("GraphQL 프로젝트 정보 조회 실패, REST 폴백", error=type(e).__name__)
 
-    commits = await get_commits(repo_url, token, author_name, author, commits_count)
+    commits = author_commits
+    if commits is None:
+        commits = await get_commits(repo_url, token, author_name, author, commits_count)
     pulls = await get_pulls_extended(repo_url, token, author, prs_count)
 
-    return {
-        "file_tree": file_tree,
-        "commits": commits,
-        "pulls": pulls,
-    }
+    return {"commits": commits, "pulls": pulls}
 
 
-async def get_repo_context(repo_url: str, token: str | None = None) -> dict:
+async def get_repo_context(
+    repo_url: str,
+    token: str | None = None,
+    prefetched: dict | None = None,
+) -> dict:
     """레포지토리 컨텍스트 정보 조회
 
     Args:
         repo_url: GitHub 레포지토리 URL
         token: GitHub OAuth 토큰
+        prefetched: get_repos_batch_graphql로 미리 조회한 repository 노드
 
     Returns:
         languages, description, topics, readme를 포함한 딕셔너리
     """
+    if prefetched is not None:
+        return _parse_repo_context(prefetched)
+
     if token:
         try:
             return await get_repo_context_graphql(repo_url, token)
@@ -844,6 +1645,7 @@ async def get_pulls_extended(
     token: str | None = None,
     author: str | None = None,
     per_page: int = 30,
+    merged_since: str | None = None,
 ) -> list[PRInfoExtended]:
     """레포지토리 Merged PR 목록 조회
 
@@ -852,6 +1654,7 @@ async def get_pulls_extended(
         token: GitHub OAuth 토큰
         author: GitHub 유저네임
         per_page: 가져올 PR 개수
+        merged_since: ISO 8601 시각, 지정하면 최근 갱신 순으로 조회해 이후 머지된 PR만 반환
 
     Returns:
         확장된 PR 목록
@@ -860,24 +1663,20 @@ async def get_pulls_extended(
     url = f"{GITHUB_API_BASE}/repos/{owner}/{repo}/pulls"
 
     params = {"state": "closed", "per_page": min(per_page, 100)}
+    if merged_since:
+        params.update({"sort": "updated", "direction": "desc"})
 
-    response = await _get_client().get(url, headers=_get_headers(token), params=params)
-    response.raise_for_status()
-    data = response.json()
+    data = await _get_json(url, token, params)
 
     merged_prs = [
         pr
         for pr in data
         if pr.get("merged_at") is not None
         and (not author or pr["user"]["login"].lower() == author.lower())
+        and (not merged_since or pr["merged_at"] > merged_since)
     ]
 
-    async def fetch_detail_with_limit(pr_number: int) -> dict:
-        async with _request_semaphore:
-            return await _get_pull_detail(owner, repo, pr_number, token)
-
-    tasks = [fetch_detail_with_limit(pr["number"]) for pr in merged_prs]
-    details = await asyncio.gather(*tasks)
+    details = await _get_pull_details(owner, repo, merged_prs, token)
 
     prs = [
         PRInfoExtended(
@@ -887,11 +1686,11 @@ async def get_pulls_extended(
             author=pr["user"]["login"],
             merged_at=pr["merged_at"],
             repo_url=repo_url,
-            commits_count=detail["commits"],
-            additions=detail["additions"],
-            deletions=detail["deletions"],
+            commits_count=details[pr["number"]]["commits"],
+            additions=details[pr["number"]]["additions"],
+            deletions=details[pr["number"]]["deletions"],
         )
-        for pr, detail in zip(merged_prs, details, strict=True)
+        for pr in merged_prs
     ]
 
     logger.debug("PR 확장 조회 완료", owner=owner, repo=repo, count=len(prs))
@@ -913,12 +1712,169 @@ async def _get_pull_detail(
         commits, additions, deletions 포함 딕셔너리
     """
     url = f"{GITHUB_API_BASE}/repos/{owner}/{repo}/pulls/{pull_number}"
-    response = await _get_client().get(url, headers=_get_headers(token))
-    response.raise_for_status()
-    data = response.json()
+    data = await _get_json(url, token, priority=PRIORITY_LOW)
 
     return {
         "commits": data.get("commits", 0),
         "additions": data.get("additions", 0),
         "deletions": data.get("deletions", 0),
     }
+
+
+async def _fetch_pull_details_rest(
+    owner: str,
+    repo: str,
+    numbers: list[int],
+    keys: dict[int, tuple[str, str, int, str]],
+    token: str | None = None,
+) -> dict[int, dict]:
+    """캐시에 없는 PR 상세를 REST로 개별 조회하여 캐시에 저장
+
+    Raises:
+        httpx.HTTPError: 조회에 실패한 PR이 있는 경우, 성공한 상세는 캐시에 남김
+    """
+    fetched = await asyncio.gather(
+        *(_get_pull_detail(owner, repo, number, token) for number in numbers),
+        return_exceptions=True,
+    )
+    details: dict[int, dict] = {}
+    errors: list[BaseException] = []
+    for number, detail in zip(numbers, fetched, strict=True):
+        if isinstance(detail, BaseException):
+            logger.warning("PR 상세 조회 실패", pr_number=number, error=type(detail).__name__)
+            errors.append(detail)
+            continue
+        details[number] = detail
+        _store_pull_detail(keys[number], detail)
+    if errors:
+        raise errors[0]
+    return details
+
+
+def _cached_pull_detail(key: tuple[str, str, int, str]) -> dict | None:
+    """PR 상세 캐시 조회, 적중하면 최근 사용으로 갱신"""
+    detail = _pull_detail_cache.get(key)
+    if detail is not None:
+        _pull_detail_cache.move_to_end(key)
+    return detail
+
+
+def _store_pull_detail(key: tuple[str, str, int, str], detail: dict) -> None:
+    """PR 상세 캐시 저장, 최대 개수 초과 시 가장 오래된 항목 제거"""
+    _pull_detail_cache[key] = detail
+    _pull_detail_cache.move_to_end(key)
+    while len(_pull_detail_cache) > settings.github_pull_detail_cache_size:
+        _pull_detail_cache.popitem(last=False)
+
+
+async def _get_pull_details_graphql(
+    owner: str, repo: str, pull_numbers: list[int], token: str
+) -> dict[int, dict]:
+    """별칭 GraphQL 쿼리로 여러 PR의 commits/additions/deletions 일괄 조회
+
+    Args:
+        owner: 레포지토리 소유자
+        repo: 레포지토리 이름
+        pull_numbers: PR 번호 리스트
+        token: GitHub OAuth 토큰
+
+    Returns:
+        PR 번호를 키로 하는 상세 정보 딕셔너리
+    """
+    chunk_size = settings.github_pull_detail_batch_size
+    chunks = [pull_numbers[i : i + chunk_size] for i in range(0, len(pull_numbers), chunk_size)]
+
+    async def fetch_chunk(numbers: list[int]) -> dict[int, dict]:
+        aliases = "\n".join(
+            f"pr{n}: pullRequest(number: {n}) {{ additions deletions commits {{ totalCount }} }}"
+            for n in numbers
+        )
+        query = f"""
+        query($owner: String!, $repo: String!) {{
+          repository(owner: $owner, name: $repo) {{
+            {aliases}
+          }}
+        }}
+        """
+        data, _ = await _graphql_query_partial(query, {"owner": owner, "repo": repo}, token)
+        repository = data.get("repository") or {}
+
+        details = {}
+        for n in numbers:
+            node = repository.get(f"pr{n}")
+            if node:
+                details[n] = {
+                    "commits": (node.get("commits") or {}).get("totalCount", 0),
+                    "additions": node.get("additions", 0),
+                    "deletions": node.get("deletions", 0),
+                }
+        return details
+
+    results: dict[int, dict] = {}
+    for chunk_result in await asyncio.gather(*(fetch_chunk(chunk) for chunk in chunks)):
+        results.update(chunk_result)
+    return results
+
+
+async def _get_pull_details(
+    owner: str, repo: str, pulls: list[dict], token: str | None = None
+) -> dict[int, dict]:
+    """여러 PR의 상세 정보 조회
+
+    토큰이 있으면 별칭 GraphQL로 일괄 조회하고, 없거나 실패하면 PR 번호와 updated_at으로
+    키를 잡은 캐시를 확인한 뒤 누락된 PR만 REST로 개별 조회
+
+    Args:
+        owner: 레포지토리 소유자
+        repo: 레포지토리 이름
+        pulls: REST PR 목록 응답 항목 리스트
+        token: GitHub OAuth 토큰
+
+    Returns:
+        PR 번호를 키로 하는 상세 정보 딕셔너리
+
+    Raises:
+        httpx.HTTPError: REST 개별 조회가 실패한 경우, 성공한 상세는 캐시에 남김
+    """
+    if not pulls:
+        return {}
+
+    if token:
+        try:
+            details = await _get_pull_details_graphql(
+                owner, repo, [pr["number"] for pr in pulls], token
+            )
+            if len(details) == len(pulls):
+                return details
+            logger.info("GraphQL PR 상세 부분 누락, REST 보충", missing=len(pulls) - len(details))
+        except Exception as e:
+            logger.warning("GraphQL PR 상세 조회 실패, REST 폴백", error=type(e).__name__)
+            details = {}
+    else:
+        details = {}
+
+    keys = {
+        pr["number"]: (owner, repo, pr["number"], pr.get("updated_at") or "")
+        for pr in pulls
+        if pr["number"] not in details
+    }
+    missing = []
+    for number, key in keys.items():
+        cached = _cached_pull_detail(key)
+        if cached is not None:
+            details[number] = cached
+        else:
+            missing.append(number)
+
+    if missing:
+        details.update(await _fetch_pull_details_rest(owner, repo, missing, keys, token))
+
+    logger.debug(
+        "PR 상세 조회 완료",
+        owner=owner,
+        repo=repo,
+        total=len(pulls),
+        cached=len(keys) - len(missing),
+        fetched=len(missing),
+    )
+    return details
@@ -0,0 +1,330 @@
+"""부분 클론 기반 로컬 수집 백엔드
+
+대형 레포나 활동이 많은 레포는 API 대신 `--filter=blob:none --depth N` 부분 클론 1회로
+커밋, 파일 트리, 의존성 파일을 로컬에서 읽는다. blob은 실제로 읽는 파일만 지연 다운로드된다
+
+클론은 scratch 디렉토리 아래에 레포와 토큰별로 두고, 최대 개수와 TTL을 넘으면 오래된 순으로 삭제한다
+토큰은 URL이나 .git/config에 남기지 않도록 GIT_CONFIG_* 환경 변수로 인증 헤더만 전달한다
+"""
+
+import asyncio
+import base64
+import os
+import shutil
+import time
+from collections import OrderedDict
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from pathlib import Path
+
+from app.core.config import settings
+from app.core.logging import get_logger
+from app.domain.resume.schemas import CommitInfo
+from app.infra.github.cache import token_fingerprint
+
+logger = get_logger(__name__)
+
+GIT_TIMEOUT = 120.0
+
+_FIELD_SEP = "\x1f"
+_RECORD_SEP = "\x1e"
+
+
+class GitCommandError(RuntimeError):
+    """git 명령 실행 실패"""
+
+
+@dataclass
+class LocalClone:
+    """scratch 디렉토리에 있는 부분 클론"""
+
+    path: Path
+    created_at: float
+    leases: int = 0
+    retired: bool = False
+
+
+async def _run_git(
+    *args: str,
+    cwd: Path | None = None,
+    env: dict[str, str] | None = None,
+    stdin: bytes | None = None,
+) -> bytes:
+    """git 명령 실행 후 stdout 반환
+
+    Raises:
+        GitCommandError: 종료 코드가 0이 아니거나 시간 초과인 경우
+    """
+    process = await asyncio.create_subprocess_exec(
+        "git",
+        *args,
+        cwd=cwd,
+        env={**os.environ, "GIT_TERMINAL_PROMPT": "0", **(env or {})},
+        stdin=asyncio.subprocess.PIPE if stdin is not None else asyncio.subprocess.DEVNULL,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+    )
+    try:
+        stdout, stderr = await asyncio.wait_for(process.communicate(stdin), timeout=GIT_TIMEOUT)
+    except TimeoutError as e:
+        process.kill()
+        await process.wait()
+        raise GitCommandError(f"git {args[0]} 시간 초과") from e
+
+    if process.returncode != 0:
+        raise GitCommandError(f"git {args[0]} 실패: {stderr.decode(errors='replace').strip()}")
+    return stdout
+
+
+def _auth_env(token: str | None) -> dict[str, str]:
+    """토큰을 http.extraHeader로 전달하는 git 환경 변수"""
+    if not token:
+        return {}
+    credentials = base64.b64encode(f"x-access-token:{token}".encode()).decode()
+    return {
+        "GIT_CONFIG_COUNT": "1",
+        "GIT_CONFIG_KEY_0": "http.extraHeader",
+        "GIT_CONFIG_VALUE_0": f"Authorization: Basic {credentials}",
+    }
+
+
+class CloneManager:
+    """레포와 토큰별 부분 클론 생성과 scratch 디렉토리 용량 관리
+
+    클론은 (owner, repo, 토큰 지문)으로 구분하여 다른 토큰으로 만든 클론을 재사용하지 않는다
+    로컬 git 명령은 접근 권한을 확인하지 않으므로 비공개 레포 클론을 다른 사용자와 공유하지 않는다
+    사용 중인 클론은 점유 수를 세어, 만료되거나 밀려나도 마지막 점유가 끝난 뒤에 삭제한다
+    """
+
+    def __init__(self, root: str, max_repos: int = 10, ttl: float = 600.0, depth: int = 200):
+        self._root = Path(root)
+        self._max_repos = max_repos
+        self._ttl = ttl
+        self._depth = depth
+        self._clones: OrderedDict[tuple[str, str, str], LocalClone] = OrderedDict()
+        self._locks: dict[tuple[str, str, str], asyncio.Lock] = {}
+        self._trash: list[Path] = []
+
+    async def acquire(
+        self, owner: str, repo: str, token: str | None = None, create: bool = False
+    ) -> LocalClone | None:
+        """유효한 클론을 점유하여 반환, 없거나 만료되면 None
+
+        create가 True면 클론이 없을 때 부분 클론을 생성한다
+        반환된 클론은 사용이 끝나면 release로 반환해야 한다
+
+        Raises:
+            GitCommandError: 클론 생성 실패 시
+        """
+        key = (owner, repo, token_fingerprint(token))
+        try:
+            if create:
+                return await self._ensure(key, token)
+            clone = self._lookup(key)
+            if clone is not None:
+                clone.leases += 1
+            return clone
+        finally:
+            await self._purge()
+
+    async def release(self, clone: LocalClone) -> None:
+        """클론 점유 반환, 만료되거나 밀려난 클론이면 마지막 점유가 끝날 때 삭제"""
+        clone.leases -= 1
+        if clone.retired and clone.leases == 0:
+            self._trash.append(clone.path)
+        await self._purge()
+
+    @asynccontextmanager
+    async def lease(
+        self, owner: str, repo: str, token: str | None = None, create: bool = False
+    ) -> AsyncIterator[Path | None]:
+        """블록 안에서 클론이 삭제되지 않도록 점유하고 경로 반환, 없으면 None"""
+        clone = await self.acquire(owner, repo, token, create)
+        if clone is None:
+            yield None
+            return
+        try:
+            yield clone.path
+        finally:
+            await self.release(clone)
+
+    def _lookup(self, key: tuple[str, str, str]) -> LocalClone | None:
+        clone = self._clones.get(key)
+        if clone is None:
+            return None
+        if time.time() - clone.created_at > self._ttl or not clone.path.exists():
+            self._retire(key)
+            return None
+        self._clones.move_to_end(key)
+        return clone
+
+    async def _ensure(self, key: tuple[str, str, str], token: str | None) -> LocalClone:
+        owner, repo, _ = key
+        lock = self._locks.setdefault(key, asyncio.Lock())
+        async with lock:
+            clone = self._lookup(key)
+            if clone is not None:
+                clone.leases += 1
+                return clone
+
+            path = self._root / f"{owner}__{repo}__{time.time_ns()}"
+            path.parent.mkdir(parents=True, exist_ok=True)
+            source = f"{settings.github_clone_base_url.rstrip('/')}/{owner}/{repo}.git"
+
+            started = time.perf_counter()
+            try:
+                await _run_git(
+                    "clone",
+                    "--filter=blob:none",
+                    "--no-checkout",
+                    "--single-branch",
+                    f"--depth={self._depth}",
+                    source,
+                    str(path),
+                    env=_auth_env(token),
+                )
+            except GitCommandError:
+                self._trash.append(path)
+                raise
+
+            clone = LocalClone(path=path, created_at=time.time(), leases=1)
+            self._retire(key)
+            self._clones[key] = clone
+            self._evict_overflow()
+            logger.info(
+                "부분 클론 완료",
+                owner=owner,
+                repo=repo,
+                depth=self._depth,
+                elapsed_ms=round((time.perf_counter() - started) * 1000),
+            )
+            return clone
+
+    def _retire(self, key: tuple[str, str, str]) -> None:
+        """목록에서 클론을 빼고, 점유 중이 아니면 삭제 대상에 추가"""
+        clone = self._clones.pop(key, None)
+        if clone is None:
+            return
+        clone.retired = True
+        if clone.leases == 0:
+            self._trash.append(clone.path)
+        lock = self._locks.get(key)
+        if lock is not None and not lock.locked():
+            del self._locks[key]
+
+    def _evict_overflow(self) -> None:
+        while len(self._clones) > self._max_repos:
+            key = next(iter(self._clones))
+            logger.debug("부분 클론 제거", owner=key[0], repo=key[1])
+            self._retire(key)
+
+    async def _purge(self) -> None:
+        """삭제 대상 클론 디렉토리를 이벤트 루프 밖에서 삭제"""
+        while self._trash:
+            path = self._trash.pop()
+            await asyncio.to_thread(shutil.rmtree, path, ignore_errors=True)
+
+    async def close(self) -> None:
+        """모든 클론 삭제"""
+        for key in list(self._clones):
+            self._retire(key)
+        await self._purge()
+
+
+async def read_tree_entries(path: Path) -> list[dict]:
+    """HEAD 트리의 파일 목록을 blob SHA와 함께 조회
+
+    부분 클론에서 크기 조회는 blob 다운로드를 유발하므로 size는 None으로 둔다
+    """
+    output = await _run_git("ls-tree", "-r", "-z", "HEAD", cwd=path)
+    entries = []
+    for record in output.decode(errors="replace").split("\0"):
+        if not record:
+            continue
+        meta, file_path = record.split("\t", 1)
+        _, object_type, sha = meta.split()
+        if object_type == "blob":
+            entries.append({"path": file_path, "size": None, "sha": sha})
+    return entries
+
+
+async def read_commits(path: Path, count: int) -> list[CommitInfo]:
+    """HEAD에서 머지 커밋을 제외한 최근 커밋 조회"""
+    output = await _run_git(
+        "log",
+        "--no-merges",
+        f"-n{count}",
+        f"--format=%H{_FIELD_SEP}%an{_FIELD_SEP}%B{_RECORD_SEP}",
+        cwd=path,
+    )
+    commits = []
+    for record in output.decode(errors="replace").split(_RECORD_SEP):
+        record = record.strip("\n")
+        if not record:
+            continue
+        sha, author, message = record.split(_FIELD_SEP, 2)
+        commits.append(CommitInfo(sha=sha, message=message.strip(), author=author or "Unknown"))
+    return commits
+
+
+async def read_files(
+    path: Path, paths: list[str], token: str | None = None
+) -> dict[str, str | None]:
+    """HEAD 기준 파일 내용 조회, 없거나 바이너리면 None
+
+    cat-file --batch 프로세스 하나로 읽으며, 클론에 없는 blob은 git이 원격에서 지연 다운로드한다
+
+    Raises:
+        GitCommandError: blob 다운로드나 git 명령 실패 시
+    """
+    if not paths:
+        return {}
+
+    request = "".join(f"HEAD:{file_path}\n" for file_path in paths).encode()
+    output = await _run_git("cat-file", "--batch", cwd=path, env=_auth_env(token), stdin=request)
+
+    results: dict[str, str | None] = {}
+    offset = 0
+    for file_path in paths:
+        header_end = output.index(b"\n", offset)
+        header = output[offset:header_end].decode(errors="replace")
+        offset = header_end + 1
+        if header.endswith((" missing", " ambiguous")):
+            results[file_path] = None
+            continue
+        size = int(header.rsplit(" ", 1)[1])
+        content = output[offset : offset + size]
+        offset += size + 1
+        if b"\0" in content:
+            results[file_path] = None
+            continue
+        try:
+            results[file_path] = content.decode("utf-8")
+        except UnicodeDecodeError:
+            results[file_path] = None
+    return results
+
+
+_clone_manager: CloneManager | None = None
+
+
+def get_clone_manager() -> CloneManager:
+    """부분 클론 관리자 지연 초기화 싱글턴"""
+    global _clone_manager
+    if _clone_manager is None:
+        _clone_manager = CloneManager(
+            settings.github_clone_dir,
+            max_repos=settings.github_clone_max_repos,
+            ttl=settings.github_clone_ttl,
+            depth=settings.github_clone_depth,
+        )
+    return _clone_manager
+
+
+async def close_clone_manager() -> None:
+    """부분 클론 관리자 종료 및 scratch 디렉토리 정리"""
+    global _clone_manager
+    if _clone_manager is not None:
+        await _clone_manager.close()
+        _clone_manager = None
@@ -0,0 +1,285 @@
+"""GitHub rate limit 인지 요청 스케줄러
+
+OAuth 토큰(미인증은 서버 IP)별로 남은 예산을 추적하고, 예산이 부족하면 요청 간격을 늘리거나
+리셋 시각까지 대기한다. 예산 대기는 슬롯을 점유하기 전에 하므로 예산이 바닥난 토큰이 다른 토큰의
+요청을 막지 않는다. 동시 실행 슬롯은 프로세스 전체에서 max_concurrent개를 공유하고 우선순위 순으로
+배정하여 신원 조회나 배치 쿼리가 파일 단위 REST 요청보다 먼저 처리되도록 한다
+토큰별 예산은 최근 사용 순으로 max_tokens개까지만 보관한다
+
+- REST: X-RateLimit-Remaining/Limit/Reset/Resource 헤더
+- 2차 제한: 403/429 응답의 Retry-After, 없으면 60초 차단
+- GraphQL: 응답의 rateLimit { cost remaining resetAt } 필드
+"""
+
+import asyncio
+import heapq
+import itertools
+import time
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from datetime import datetime
+
+import httpx
+from prometheus_client import Gauge
+
+from app.core.logging import get_logger
+from app.infra.github.cache import token_fingerprint
+
+logger = get_logger(__name__)
+
+PRIORITY_HIGH = 0
+PRIORITY_NORMAL = 1
+PRIORITY_LOW = 2
+
+SECONDARY_LIMIT_DEFAULT_WAIT = 60.0
+
+RATE_LIMIT_REMAINING = Gauge(
+    "github_rate_limit_remaining",
+    "마지막으로 관측한 GitHub rate limit 남은 요청 수",
+    ["authenticated", "resource"],
+)
+RATE_LIMIT_LIMIT = Gauge(
+    "github_rate_limit_limit",
+    "마지막으로 관측한 GitHub rate limit 시간당 한도",
+    ["authenticated", "resource"],
+)
+RATE_LIMIT_RESET = Gauge(
+    "github_rate_limit_reset_timestamp_seconds",
+    "마지막으로 관측한 GitHub rate limit 리셋 시각 (epoch)",
+    ["authenticated", "resource"],
+)
+REQUESTS_IN_FLIGHT = Gauge(
+    "github_requests_in_flight",
+    "실행 중인 GitHub 요청 수",
+)
+REQUESTS_QUEUED = Gauge(
+    "github_requests_queued",
+    "실행 슬롯을 기다리는 GitHub 요청 수",
+)
+
+
+@dataclass
+class RateLimitBudget:
+    """토큰과 리소스 조합별 rate limit 상태"""
+
+    limit: int | None = None
+    remaining: int | None = None
+    reset_at: float | None = None
+    blocked_until: float = 0.0
+
+
+class _PrioritySlots:
+    """우선순위 큐 기반 동시 실행 슬롯 - 값이 작을수록 먼저 배정"""
+
+    def __init__(self, capacity: int):
+        self._capacity = capacity
+        self._in_use = 0
+        self._waiters: list[tuple[int, int, asyncio.Future]] = []
+        self._counter = itertools.count()
+
+    @property
+    def queued(self) -> int:
+        return sum(1 for _, _, fut in self._waiters if not fut.done())
+
+    @property
+    def in_use(self) -> int:
+        return self._in_use
+
+    async def acquire(self, priority: int) -> None:
+        if self._in_use < self._capacity and not self.queued:
+            self._in_use += 1
+            return
+
+        fut = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (priority, next(self._counter), fut))
+        try:
+            await fut
+        except asyncio.CancelledError:
+            if fut.done() and not fut.cancelled():
+                self.release()
+            raise
+
+    def release(self) -> None:
+        while self._waiters:
+            _, _, fut = heapq.heappop(self._waiters)
+            if not fut.done():
+                fut.set_result(None)
+                return
+        self._in_use -= 1
+
+
+class GitHubRateLimiter:
+    """토큰별 예산과 프로세스 전체 동시 실행 슬롯을 관리하는 GitHub 요청 스케줄러"""
+
+    def __init__(
+        self,
+        max_concurrent: int,
+        reserve: int = 50,
+        pace_threshold: int = 200,
+        max_wait: float = 30.0,
+        max_tokens: int = 1000,
+    ):
+        self._reserve = reserve
+        self._pace_threshold = pace_threshold
+        self._max_wait = max_wait
+        self._max_tokens = max_tokens
+        self._slots = _PrioritySlots(max_concurrent)
+        self._budgets: OrderedDict[str, dict[str, RateLimitBudget]] = OrderedDict()
+
+    def budget(self, token: str | None, resource: str = "core") -> RateLimitBudget:
+        """토큰과 리소스의 현재 예산 반환, 보관 토큰 수를 넘으면 가장 오래 쓰지 않은 토큰 제거"""
+        fingerprint = token_fingerprint(token)
+        budgets = self._budgets.get(fingerprint)
+        if budgets is None:
+            budgets = self._budgets[fingerprint] = {}
+            while len(self._budgets) > self._max_tokens:
+                self._budgets.popitem(last=False)
+        else:
+            self._budgets.move_to_end(fingerprint)
+        if resource not in budgets:
+            budgets[resource] = RateLimitBudget()
+        return budgets[resource]
+
+    def compute_delay(self, token: str | None, resource: str = "core") -> float:
+        """현재 예산 기준으로 요청 전 대기할 시간(초) 계산
+
+        - 2차 제한으로 차단 중이면 차단 해제까지
+        - 남은 예산이 예비분 이하면 리셋 시각까지
+        - 남은 예산이 적으면 리셋까지 남은 시간을 남은 요청 수로 나눠 간격 조절
+        """
+        budget = self.budget(token, resource)
+        now = time.time()
+
+        if budget.blocked_until > now:
+            return budget.blocked_until - now
+
+        if budget.remaining is None or budget.reset_at is None or budget.reset_at <= now:
+            return 0.0
+
+        time_to_reset = budget.reset_at - now
+        if budget.remaining <= self._reserve:
+            return time_to_reset
+        if budget.remaining < self._pace_threshold:
+            return time_to_reset / budget.remaining
+        return 0.0
+
+    @asynccontextmanager
+    async def acquire(
+        self,
+        token: str | None,
+        resource: str = "core",
+        priority: int = PRIORITY_NORMAL,
+    ):
+        """예산에 맞춰 대기한 뒤 실행 슬롯을 점유
+
+        대기는 슬롯을 점유하기 전에 하여 대기 중인 토큰이 동시 실행 슬롯을 차지하지 않는다
+        대기 시간이 max_wait를 넘으면 max_wait만 기다린 후 진행하며,
+        이 경우 GitHub의 403 응답이 기존 에러 처리 경로로 전달된다
+        """
+        delay = self.compute_delay(token, resource)
+        if delay > 0:
+            wait = min(delay, self._max_wait)
+            logger.info(
+                "GitHub rate limit 대기",
+                resource=resource,
+                delay_s=round(wait, 2),
+                remaining=self.budget(token, resource).remaining,
+            )
+            await asyncio.sleep(wait)
+
+        REQUESTS_QUEUED.inc()
+        try:
+            await self._slots.acquire(priority)
+        finally:
+            REQUESTS_QUEUED.dec()
+
+        REQUESTS_IN_FLIGHT.inc()
+        try:
+            yield
+        finally:
+            REQUESTS_IN_FLIGHT.dec()
+            self._slots.release()
+
+    def _set_budget(
+        self,
+        token: str | None,
+        resource: str,
+        remaining: int | None,
+        limit: int | None,
+        reset_at: float | None,
+    ) -> None:
+        budget = self.budget(token, resource)
+        authenticated = "true" if token else "false"
+        if remaining is not None:
+            budget.remaining = remaining
+            RATE_LIMIT_REMAINING.labels(authenticated=authenticated, resource=resource).set(
+                remaining
+            )
+        if limit is not None:
+            budget.limit = limit
+            RATE_LIMIT_LIMIT.labels(authenticated=authenticated, resource=resource).set(limit)
+        if reset_at is not None:
+            budget.reset_at = reset_at
+            RATE_LIMIT_RESET.labels(authenticated=authenticated, resource=resource).set(reset_at)
+
+    def observe(self, token: str | None, response: httpx.Response, resource: str = "core") -> None:
+        """응답 헤더로 예산을 갱신하고 2차 제한 응답이면 차단 시각 설정"""
+        headers = response.headers
+        resource = headers.get("X-RateLimit-Resource", resource)
+
+        remaining = _parse_int(headers.get("X-RateLimit-Remaining"))
+        limit = _parse_int(headers.get("X-RateLimit-Limit"))
+        reset = _parse_int(headers.get("X-RateLimit-Reset"))
+        self._set_budget(token, resource, remaining, limit, float(reset) if reset else None)
+
+        if response.status_code not in (403, 429):
+            return
+
+        budget = self.budget(token, resource)
+        retry_after = _parse_int(headers.get("Retry-After"))
+        if retry_after is not None:
+            budget.blocked_until = time.time() + retry_after
+        elif remaining == 0 and reset:
+            budget.blocked_until = float(reset)
+        elif "secondary rate limit" in response.text.lower():
+            budget.blocked_until = time.time() + SECONDARY_LIMIT_DEFAULT_WAIT
+        else:
+            return
+
+        logger.warning(
+            "GitHub rate limit 도달",
+            resource=resource,
+            status=response.status_code,
+            blocked_s=round(budget.blocked_until - time.time(), 1),
+        )
+
+    def observe_graphql(self, token: str | None, rate_limit: dict | None) -> None:
+        """GraphQL 응답의 rateLimit 필드로 graphql 예산 갱신"""
+        if not rate_limit:
+            return
+        reset_at = None
+        if rate_limit.get("resetAt"):
+            reset_at = datetime.fromisoformat(rate_limit["resetAt"]).timestamp()
+        self._set_budget(
+            token,
+            "graphql",
+            _parse_int(rate_limit.get("remaining")),
+            _parse_int(rate_limit.get("limit")),
+            reset_at,
+        )
+        logger.debug(
+            "GraphQL 쿼리 비용",
+            cost=rate_limit.get("cost"),
+            remaining=rate_limit.get("remaining"),
+        )
+
+
+def _parse_int(value) -> int | None:
+    """헤더 값을 정수로 변환, 실패 시 None"""
+    if value is None:
+        return None
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
@@ -0,0 +1,187 @@
+"""GitHub 요청 재시도 정책
+
+엔드포인트 종류별로 재시도 횟수와 대기 시간을 달리 적용
+- rest: 멱등 GET 요청
+- graphql: 읽기 전용 GraphQL 쿼리
+- files_batch: 파일 일괄 조회 GraphQL, 실패 시 REST 폴백이 있으므로 재시도를 적게 함
+
+일시적 오류(연결 실패, 타임아웃, 5xx)는 full jitter 지수 백오프로 재시도
+rate limit 응답은 Retry-After 또는 X-RateLimit-Reset까지 대기하되,
+대기 시간이 예산을 넘으면 재시도하지 않고 원래 응답을 그대로 돌려준다
+"""
+
+import asyncio
+import random
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+
+import httpx
+from prometheus_client import Counter, Histogram
+
+from app.core.config import settings
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+RETRYABLE_STATUS_CODES = frozenset({500, 502, 503, 504})
+
+RETRY_TOTAL = Counter(
+    "github_retries_total",
+    "GitHub 요청 재시도 횟수",
+    ["endpoint_class", "reason"],
+)
+RETRY_GIVE_UP_TOTAL = Counter(
+    "github_retry_give_up_total",
+    "재시도 예산 초과로 포기한 GitHub 요청 수",
+    ["endpoint_class", "reason"],
+)
+RETRY_WAIT_SECONDS = Histogram(
+    "github_retry_wait_seconds",
+    "GitHub 요청 1건이 재시도 대기에 사용한 총 시간",
+    ["endpoint_class"],
+    buckets=(0.1, 0.5, 1, 2, 5, 10, 30, 60),
+)
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """엔드포인트 종류별 재시도 정책"""
+
+    endpoint_class: str
+    max_attempts: int
+    base_delay: float
+    max_delay: float
+    max_total_wait: float
+
+
+REST_RETRY_POLICY = RetryPolicy(
+    endpoint_class="rest",
+    max_attempts=settings.github_retry_max_attempts,
+    base_delay=settings.github_retry_base_delay,
+    max_delay=settings.github_retry_max_delay,
+    max_total_wait=settings.github_retry_max_total_wait,
+)
+GRAPHQL_RETRY_POLICY = RetryPolicy(
+    endpoint_class="graphql",
+    max_attempts=settings.github_retry_max_attempts,
+    base_delay=settings.github_retry_base_delay,
+    max_delay=settings.github_retry_max_delay,
+    max_total_wait=settings.github_retry_max_total_wait,
+)
+FILES_BATCH_RETRY_POLICY = RetryPolicy(
+    endpoint_class="files_batch",
+    max_attempts=min(2, settings.github_retry_max_attempts),
+    base_delay=settings.github_retry_base_delay,
+    max_delay=settings.github_retry_max_delay,
+    max_total_wait=settings.github_retry_base_delay * 4,
+)
+
+
+def _retry_reason(response: httpx.Response) -> str | None:
+    """재시도 대상 응답이면 사유 반환, 아니면 None"""
+    if response.status_code in RETRYABLE_STATUS_CODES:
+        return "server_error"
+    if response.status_code in (403, 429):
+        headers = response.headers
+        if "Retry-After" in headers or headers.get("X-RateLimit-Remaining") == "0":
+            return "rate_limit"
+        if "secondary rate limit" in response.text.lower():
+            return "rate_limit"
+    return None
+
+
+def _backoff_delay(policy: RetryPolicy, attempt: int) -> float:
+    """full jitter 지수 백오프 대기 시간"""
+    return random.uniform(0, min(policy.max_delay, policy.base_delay * (2**attempt)))
+
+
+def _rate_limit_delay(response: httpx.Response, policy: RetryPolicy, attempt: int) -> float:
+    """Retry-After, X-RateLimit-Reset 순으로 대기 시간 결정, 둘 다 없으면 백오프"""
+    retry_after = response.headers.get("Retry-After")
+    if retry_after is not None:
+        try:
+            return float(retry_after)
+        except ValueError:
+            pass
+
+    reset = response.headers.get("X-RateLimit-Reset")
+    if reset is not None:
+        try:
+            return max(0.0, float(reset) - time.time())
+        except ValueError:
+            pass
+
+    return _backoff_delay(policy, attempt)
+
+
+async def send_with_retry(
+    send: Callable[[], Awaitable[httpx.Response]],
+    policy: RetryPolicy,
+) -> httpx.Response:
+    """정책에 따라 요청을 재시도하고 마지막 응답 반환
+
+    Args:
+        send: 요청 1회를 실행하는 코루틴 함수
+        policy: 재시도 정책
+
+    Returns:
+        성공 응답 또는 재시도를 포기한 시점의 응답
+
+    Raises:
+        httpx.TransportError: 연결 오류가 재시도 후에도 계속되는 경우
+    """
+    total_wait = 0.0
+    attempt = 0
+
+    try:
+        while True:
+            transport_error: httpx.TransportError | None = None
+            try:
+                response = await send()
+            except httpx.TransportError as e:
+                reason = "timeout" if isinstance(e, httpx.TimeoutException) else "connection"
+                if attempt + 1 >= policy.max_attempts:
+                    raise
+                transport_error = e
+                delay = _backoff_delay(policy, attempt)
+                error = type(e).__name__
+            else:
+                reason = _retry_reason(response)
+                if reason is None or attempt + 1 >= policy.max_attempts:
+                    return response
+                if reason == "rate_limit":
+                    delay = _rate_limit_delay(response, policy, attempt)
+                else:
+                    delay = _backoff_delay(policy, attempt)
+                error = f"HTTP {response.status_code}"
+
+            if total_wait + delay > policy.max_total_wait:
+                RETRY_GIVE_UP_TOTAL.labels(
+                    endpoint_class=policy.endpoint_class, reason=reason
+                ).inc()
+                logger.warning(
+                    "GitHub 재시도 예산 초과",
+                    endpoint_class=policy.endpoint_class,
+                    reason=reason,
+                    delay_s=round(delay, 2),
+                )
+                if transport_error is not None:
+                    raise transport_error
+                return response
+
+            RETRY_TOTAL.labels(endpoint_class=policy.endpoint_class, reason=reason).inc()
+            logger.info(
+                "GitHub 요청 재시도",
+                endpoint_class=policy.endpoint_class,
+                reason=reason,
+                error=error,
+                attempt=attempt + 1,
+                delay_s=round(delay, 2),
+            )
+            await asyncio.sleep(delay)
+            total_wait += delay
+            attempt += 1
+    finally:
+        if attempt:
+            RETRY_WAIT_SECONDS.labels(endpoint_class=policy.endpoint_class).observe(total_wait)
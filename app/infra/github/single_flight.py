@@ -0,0 +1,103 @@
+"""동일 GitHub 요청 병합 (single-flight)
+
+같은 키의 요청이 진행 중이면 새 요청을 보내지 않고 진행 중인 결과를 함께 기다린다
+프론트엔드 재시도나 같은 지원자의 작업이 동시에 실행될 때 중복 호출을 줄인다
+신원 조회처럼 자주 바뀌지 않는 결과는 짧은 TTL 동안 메모이제이션한다
+"""
+
+import asyncio
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Hashable
+from typing import Any
+
+from prometheus_client import Counter
+
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+SINGLE_FLIGHT_TOTAL = Counter(
+    "github_single_flight_total",
+    "GitHub 요청 병합 결과 (hit: 메모 적중, miss: 실제 요청, coalesced: 진행 중 요청에 합류)",
+    ["endpoint", "outcome"],
+)
+
+
+class SingleFlight:
+    """키별로 진행 중인 요청을 공유하고 선택적으로 결과를 TTL 동안 보관"""
+
+    def __init__(self, max_memo_entries: int = 1024):
+        self._inflight: dict[Hashable, asyncio.Task] = {}
+        self._memo: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        self._max_memo_entries = max_memo_entries
+
+    def _memo_get(self, key: Hashable) -> tuple[bool, Any]:
+        entry = self._memo.get(key)
+        if entry is None:
+            return False, None
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._memo[key]
+            return False, None
+        return True, value
+
+    def _memo_put(self, key: Hashable, value: Any, ttl: float) -> None:
+        self._memo[key] = (time.monotonic() + ttl, value)
+        self._memo.move_to_end(key)
+        while len(self._memo) > self._max_memo_entries:
+            self._memo.popitem(last=False)
+
+    async def do(
+        self,
+        endpoint: str,
+        key: Hashable,
+        fn: Callable[[], Awaitable[Any]],
+        ttl: float | None = None,
+        should_memoize: Callable[[Any], bool] | None = None,
+    ) -> Any:
+        """키에 해당하는 요청을 한 번만 실행하고 결과 공유
+
+        호출자 하나가 취소되어도 공유 요청은 계속 실행되어 다른 호출자에게 결과를 전달한다
+
+        Args:
+            endpoint: 메트릭 라벨용 엔드포인트 종류
+            key: 요청 식별 키 (엔드포인트, 레포, 토큰 지문 등)
+            fn: 실제 요청을 실행하는 코루틴 함수
+            ttl: 결과 메모이제이션 시간(초), None이면 진행 중인 요청만 병합
+            should_memoize: 결과를 메모이제이션할지 판단하는 함수, 실패 결과 제외용
+
+        Returns:
+            요청 결과
+        """
+        if ttl is not None:
+            found, value = self._memo_get(key)
+            if found:
+                SINGLE_FLIGHT_TOTAL.labels(endpoint=endpoint, outcome="hit").inc()
+                return value
+
+        task = self._inflight.get(key)
+        if task is not None and not task.done():
+            SINGLE_FLIGHT_TOTAL.labels(endpoint=endpoint, outcome="coalesced").inc()
+            logger.debug("진행 중인 GitHub 요청에 합류", endpoint=endpoint)
+            return await asyncio.shield(task)
+
+        SINGLE_FLIGHT_TOTAL.labels(endpoint=endpoint, outcome="miss").inc()
+        task = asyncio.ensure_future(fn())
+        self._inflight[key] = task
+
+        def _on_done(done: asyncio.Task) -> None:
+            if self._inflight.get(key) is done:
+                del self._inflight[key]
+            if ttl is None or done.cancelled() or done.exception() is not None:
+                return
+            result = done.result()
+            if should_memoize is None or should_memoize(result):
+                self._memo_put(key, result, ttl)
+
+        task.add_done_callback(_on_done)
+        return await asyncio.shield(task)
+
+    def clear(self) -> None:
+        """메모이제이션 결과 비우기"""
+        self._memo.clear()
@@ -1,23 +1,41 @@
+import contextlib
 import functools
+import hashlib
+import json
 import os
+import re
+import sqlite3
+from collections.abc import Callable
 from typing import Any
 
 import httpx
+from langchain_core.callbacks import UsageMetadataCallbackHandler
 from langchain_core.language_models import BaseChatModel
 from langchain_core.messages import HumanMessage, SystemMessage
+from langchain_core.runnables import Runnable
+from langchain_core.utils.json import parse_json_markdown
 from langchain_google_genai import ChatGoogleGenerativeAI
 from langchain_openai import ChatOpenAI
 from langfuse.langchain import CallbackHandler
 from langfuse.types import TraceContext
+from pydantic import BaseModel
+from pydantic import ValidationError as PydanticValidationError
 
 from app.core.config import settings
 from app.core.exceptions import LLMError
 from app.core.logging import get_logger
+from app.infra.cache.llm_response_cache import get_llm_response_cache, llm_cache_key
+from app.infra.llm.hedging import get_llm_hedger
+from app.infra.llm.limiter import BACKEND_EVALUATOR, BACKEND_GENERATOR, get_llm_limiter
 
 logger = get_logger(__name__)
 
 _VALID_INTERVIEW_TYPES = frozenset({"technical", "behavioral"})
 
+_StructuredKey = tuple[int, type, str | None]
+_structured_runnables: dict[_StructuredKey, tuple[BaseChatModel, Runnable]] = {}
+_warmup_targets: list[tuple[Callable[[], BaseChatModel], type, str | None]] = []
+
 
 def setup_langfuse_env() -> None:
     """Langfuse 환경 변수 설정"""
@@ -81,10 +99,58 @@ def get_evaluator_llm() -> ChatGoogleGenerativeAI:
     )
 
 
+def get_structured_runnable(
+    llm: BaseChatModel, output_type: type, method: str | None = None
+) -> Runnable:
+    """(LLM 인스턴스, 출력 타입, method)별 구조화 출력 runnable을 한 번만 만들어 재사용
+
+    with_structured_output은 호출마다 JSON 스키마 변환과 출력 파서 체인을 새로 만든다
+    LLM 클라이언트가 새로 만들어지면 이전 인스턴스의 runnable은 사용하지 않는다
+    """
+    key = (id(llm), output_type, method)
+    entry = _structured_runnables.get(key)
+    if entry is not None and entry[0] is llm:
+        return entry[1]
+
+    kwargs = {"method": method} if method else {}
+    runnable = llm.with_structured_output(output_type, **kwargs)
+    _structured_runnables[key] = (llm, runnable)
+    return runnable
+
+
+def register_structured_output(
+    llm_getter: Callable[[], BaseChatModel], output_type: type, method: str | None = None
+) -> None:
+    """앱 시작 시 미리 만들 구조화 출력 runnable 등록"""
+    _warmup_targets.append((llm_getter, output_type, method))
+
+
+def warm_structured_runnables() -> int:
+    """등록된 구조화 출력 runnable을 미리 생성하고 생성 개수 반환
+
+    설정 누락 등으로 클라이언트를 만들 수 없는 LLM은 건너뛰고 첫 호출 때 생성한다
+    """
+    warmed = 0
+    for llm_getter, output_type, method in _warmup_targets:
+        try:
+            get_structured_runnable(llm_getter(), output_type, method)
+        except Exception as e:
+            logger.warning(
+                "구조화 출력 runnable 사전 생성 실패",
+                output_type=output_type.__name__,
+                error=str(e),
+            )
+            continue
+        warmed += 1
+    logger.info("구조화 출력 runnable 사전 생성 완료", warmed=warmed, total=len(_warmup_targets))
+    return warmed
+
+
 def close_llm_clients() -> None:
     """캐시된 LLM 클라이언트 정리 — lifespan에서 호출"""
     get_generator_llm.cache_clear()
     get_evaluator_llm.cache_clear()
+    _structured_runnables.clear()
     logger.info("LLM 클라이언트 캐시 정리 완료")
 
 
@@ -118,6 +184,55 @@ def _build_langfuse_config(
     return config
 
 
+def _llm_slot(llm: BaseChatModel) -> contextlib.AbstractAsyncContextManager:
+    """LLM 백엔드(generator/evaluator)의 적응형 동시성 제한 슬롯"""
+    if not settings.llm_limiter_enabled:
+        return contextlib.nullcontext()
+    backend = BACKEND_EVALUATOR if isinstance(llm, ChatGoogleGenerativeAI) else BACKEND_GENERATOR
+    return get_llm_limiter(backend).slot()
+
+
+def _model_name(llm: BaseChatModel) -> str:
+    """캐시 키용 모델 이름"""
+    name = getattr(llm, "model_name", None) or getattr(llm, "model", None)
+    return name if isinstance(name, str) else type(llm).__name__
+
+
+@functools.cache
+def _output_schema_fingerprint(output_type: type[BaseModel]) -> str:
+    """출력 타입 이름과 JSON 스키마 해시, 스키마가 바뀌면 이전 캐시를 사용하지 않음"""
+    schema = json.dumps(output_type.model_json_schema(), sort_keys=True, ensure_ascii=False)
+    digest = hashlib.sha256(schema.encode()).hexdigest()[:16]
+    return f"{output_type.__module__}.{output_type.__qualname__}:{digest}"
+
+
+async def _load_cached_output[T](
+    cache_key: str, cache_prompt: str, output_type: type[T]
+) -> T | None:
+    """캐시된 출력 조회, 캐시 오류나 스키마 불일치는 미스로 처리"""
+    try:
+        cached = await get_llm_response_cache().aget(cache_key, cache_prompt)
+        if cached is None:
+            return None
+        return output_type.model_validate_json(cached)
+    except (sqlite3.Error, PydanticValidationError) as e:
+        logger.warning("LLM 응답 캐시 조회 실패", prompt=cache_prompt, error=str(e))
+        return None
+
+
+async def _store_output(
+    cache_key: str, cache_prompt: str, output: BaseModel, usage: UsageMetadataCallbackHandler
+) -> None:
+    """검증된 출력과 사용 토큰 수를 캐시에 저장, 캐시 오류는 호출 결과에 영향 없음"""
+    tokens = sum(u.get("total_tokens", 0) for u in usage.usage_metadata.values())
+    try:
+        await get_llm_response_cache().aset(
+            cache_key, cache_prompt, output.model_dump_json(), tokens
+        )
+    except sqlite3.Error as e:
+        logger.warning("LLM 응답 캐시 저장 실패", prompt=cache_prompt, error=str(e))
+
+
 async def _invoke_llm[T](
     llm: BaseChatModel,
     output_type: type[T],
@@ -125,18 +240,53 @@ async def _invoke_llm[T](
     human_content: str,
     config: dict,
     structured_output_method: str | None = None,
+    cache_prompt: str | None = None,
+    hedge_prompt: str | None = None,
 ) -> T:
-    """구조화된 출력으로 LLM 호출"""
-    kwargs = {}
-    if structured_output_method:
-        kwargs["method"] = structured_output_method
-    structured_llm = llm.with_structured_output(output_type, **kwargs)
+    """구조화된 출력으로 LLM 호출
+
+    cache_prompt(호출 지점의 프롬프트 이름/버전)를 지정하면 응답 캐시를 사용한다
+    모델, cache_prompt, 출력 스키마, 렌더링된 system/human 내용이 모두 같으면 저장된 출력을 반환한다
+    hedge_prompt(지연 통계를 모을 호출 지점 이름)를 지정하고 헤지 설정이 켜져 있으면
+    느린 응답에 같은 요청을 한 번 더 보내 먼저 검증을 통과한 출력을 사용한다
+    """
+    cache_key = None
+    if (
+        cache_prompt
+        and settings.llm_response_cache_enabled
+        and isinstance(output_type, type)
+        and issubclass(output_type, BaseModel)
+    ):
+        cache_key = llm_cache_key(
+            _model_name(llm),
+            cache_prompt,
+            _output_schema_fingerprint(output_type),
+            system_prompt,
+            human_content,
+        )
+        cached = await _load_cached_output(cache_key, cache_prompt, output_type)
+        if cached is not None:
+            logger.debug("LLM 응답 캐시 적중", prompt=cache_prompt)
+            return cached
+
+    structured_llm = get_structured_runnable(llm, output_type, structured_output_method)
     messages = [
         SystemMessage(content=system_prompt),
         HumanMessage(content=human_content),
     ]
-    try:
+    usage = UsageMetadataCallbackHandler() if cache_key else None
+    if usage is not None:
+        config = {**config, "callbacks": [*(config.get("callbacks") or []), usage]}
+
+    async def request() -> T:
         return await structured_llm.ainvoke(messages, config=config)
+
+    try:
+        if hedge_prompt and settings.llm_hedge_enabled:
+            result = await get_llm_hedger().call(hedge_prompt, request, slot=lambda: _llm_slot(llm))
+        else:
+            async with _llm_slot(llm):
+                result = await request()
     except (httpx.TimeoutException, httpx.ConnectError, httpx.HTTPStatusError):
         raise
     except Exception as e:
@@ -148,3 +298,111 @@ async def _invoke_llm[T](
             exc_info=True,
         )
         raise LLMError(detail=f"LLM 출력 파싱 실패 [{type(e).__name__}]: {e}") from e
+
+    if usage is not None and isinstance(result, output_type):
+        await _store_output(cache_key, cache_prompt, result, usage)
+    return result
+
+
+class _JsonStringFieldStream:
+    """JSON 출력 청크에서 문자열 필드 하나의 값을 디코딩된 증분으로 추출
+
+    이스케이프 시퀀스가 청크 경계에서 잘리면 다음 청크가 올 때까지 보류한다
+    """
+
+    _PARTIAL_ESCAPE = re.compile(r"(\\+)(u[0-9a-fA-F]{0,3})?$")
+
+    def __init__(self, field: str):
+        self._key = re.compile(rf'"{re.escape(field)}"\s*:\s*"')
+        self._buffer = ""
+        self._start: int | None = None
+        self._emitted = 0
+        self._closed = False
+
+    def feed(self, chunk: str) -> str:
+        """청크를 추가하고 새로 확정된 필드 값 반환"""
+        self._buffer += chunk
+        if self._closed:
+            return ""
+        if self._start is None:
+            match = self._key.search(self._buffer)
+            if match is None:
+                return ""
+            self._start = match.end()
+
+        raw = self._buffer[self._start :]
+        end = self._closing_quote(raw)
+        if end is not None:
+            raw = raw[:end]
+            self._closed = True
+        else:
+            partial = self._PARTIAL_ESCAPE.search(raw)
+            if partial and len(partial.group(1)) % 2 == 1:
+                raw = raw[: partial.end(1) - 1]
+        try:
+            decoded = json.loads(f'"{raw}"', strict=False)
+        except json.JSONDecodeError:
+            return ""
+        if not self._closed and decoded and "\ud800" <= decoded[-1] <= "\udbff":
+            decoded = decoded[:-1]
+        delta = decoded[self._emitted :]
+        self._emitted = len(decoded)
+        return delta
+
+    @staticmethod
+    def _closing_quote(raw: str) -> int | None:
+        """이스케이프되지 않은 닫는 따옴표 위치"""
+        escaped = False
+        for i, ch in enumerate(raw):
+            if escaped:
+                escaped = False
+            elif ch == "\\":
+                escaped = True
+            elif ch == '"':
+                return i
+        return None
+
+
+async def _stream_json_llm[T](
+    llm: BaseChatModel,
+    output_type: type[T],
+    system_prompt: str,
+    human_content: str,
+    config: dict,
+    stream_field: str,
+    on_delta: Callable[[str], None],
+) -> T:
+    """JSON 모드로 LLM을 스트리밍 호출하며 stream_field 문자열 값을 토큰 단위로 전달
+
+    생성이 끝나면 전체 출력을 output_type으로 검증하여 반환한다
+    응답 캐시는 사용하지 않는다
+    """
+    json_llm = llm.bind(response_format={"type": "json_object"})
+    messages = [
+        SystemMessage(content=system_prompt),
+        HumanMessage(content=human_content),
+    ]
+    field_stream = _JsonStringFieldStream(stream_field)
+    parts: list[str] = []
+    try:
+        async with _llm_slot(llm):
+            async for chunk in json_llm.astream(messages, config=config):
+                text = chunk.text
+                if not text:
+                    continue
+                parts.append(text)
+                delta = field_stream.feed(text)
+                if delta:
+                    on_delta(delta)
+        return output_type.model_validate(parse_json_markdown("".join(parts)))
+    except (httpx.TimeoutException, httpx.ConnectError, httpx.HTTPStatusError):
+        raise
+    except Exception as e:
+        logger.error(
+            "LLM 스트리밍 출력 파싱 실패",
+            output_type=output_type.__name__,
+            error_type=type(e).__name__,
+            error=str(e),
+            exc_info=True,
+        )
+        raise LLMError(detail=f"LLM 출력 파싱 실패 [{type(e).__name__}]: {e}") from e
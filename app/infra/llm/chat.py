@@ -1,3 +1,5 @@
+from collections.abc import Callable
+
 from app.core.logging import get_logger
 from app.domain.interview.chat_schemas import ChatOutput
 from app.infra.langfuse.prompt_manager import get_prompt
@@ -5,11 +7,42 @@ from app.infra.llm.base import (
     _VALID_INTERVIEW_TYPES,
     _build_langfuse_config,
     _invoke_llm,
+    _stream_json_llm,
     get_generator_llm,
+    register_structured_output,
 )
 
 logger = get_logger(__name__)
 
+register_structured_output(get_generator_llm, ChatOutput, "json_mode")
+
+
+async def _call_chat_llm(
+    system_prompt: str,
+    human_content: str,
+    config: dict,
+    on_message_delta: Callable[[str], None] | None,
+) -> ChatOutput:
+    """채팅 LLM 호출, on_message_delta가 있으면 message 토큰을 생성되는 대로 전달"""
+    if on_message_delta is not None:
+        return await _stream_json_llm(
+            llm=get_generator_llm(),
+            output_type=ChatOutput,
+            system_prompt=system_prompt,
+            human_content=human_content,
+            config=config,
+            stream_field="message",
+            on_delta=on_message_delta,
+        )
+    return await _invoke_llm(
+        llm=get_generator_llm(),
+        output_type=ChatOutput,
+        system_prompt=system_prompt,
+        human_content=human_content,
+        config=config,
+        structured_output_method="json_mode",
+    )
+
 
 async def generate_chat_response(
     resume_json: str,
@@ -21,8 +54,12 @@ async def generate_chat_response(
     answer: str,
     session_id: str | None = None,
     callbacks: list | None = None,
+    on_message_delta: Callable[[str], None] | None = None,
 ) -> ChatOutput:
-    """면접 채팅 응답 생성 - vLLM 사용"""
+    """면접 채팅 응답 생성 - vLLM 사용
+
+    on_message_delta를 지정하면 면접관 message 토큰을 생성되는 대로 전달한다
+    """
     if interview_type not in _VALID_INTERVIEW_TYPES:
         raise ValueError(f"지원하지 않는 면접 유형: {interview_type}")
     logger.debug(
@@ -52,14 +89,7 @@ async def generate_chat_response(
         callbacks=callbacks,
     )
 
-    result = await _invoke_llm(
-        llm=get_generator_llm(),
-        output_type=ChatOutput,
-        system_prompt=system_prompt,
-        human_content=human_content,
-        config=config,
-        structured_output_method="json_mode",
-    )
+    result = await _call_chat_llm(system_prompt, human_content, config, on_message_delta)
 
     logger.debug("채팅 응답 생성 완료")
     return result
@@ -76,8 +106,12 @@ async def generate_chat_response_with_history(
     conversation_history: str,
     session_id: str | None = None,
     callbacks: list | None = None,
+    on_message_delta: Callable[[str], None] | None = None,
 ) -> ChatOutput:
-    """멀티턴 면접 채팅 응답 생성 - 대화 이력 포함, vLLM 사용"""
+    """멀티턴 면접 채팅 응답 생성 - 대화 이력 포함, vLLM 사용
+
+    on_message_delta를 지정하면 면접관 message 토큰을 생성되는 대로 전달한다
+    """
     if interview_type not in _VALID_INTERVIEW_TYPES:
         raise ValueError(f"지원하지 않는 면접 유형: {interview_type}")
     logger.debug(
@@ -108,14 +142,7 @@ async def generate_chat_response_with_history(
         callbacks=callbacks,
     )
 
-    result = await _invoke_llm(
-        llm=get_generator_llm(),
-        output_type=ChatOutput,
-        system_prompt=system_prompt,
-        human_content=human_content,
-        config=config,
-        structured_output_method="json_mode",
-    )
+    result = await _call_chat_llm(system_prompt, human_content, config, on_message_delta)
 
     logger.debug("멀티턴 채팅 응답 생성 완료")
     return result
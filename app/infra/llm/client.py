@@ -17,6 +17,7 @@ from app.infra.llm.resume import (
     edit_resume,
     evaluate_edited_resume,
     evaluate_resume,
+    generate_project_resume,
     generate_resume,
     plan_edit,
     plan_resume,
@@ -39,6 +40,7 @@ __all__ = [
     "edit_resume",
     "evaluate_edited_resume",
     "evaluate_resume",
+    "generate_project_resume",
     "generate_resume",
     "plan_edit",
     "plan_resume",
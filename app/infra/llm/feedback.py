@@ -16,10 +16,15 @@ from app.infra.llm.base import (
     _invoke_llm,
     get_evaluator_llm,
     get_generator_llm,
+    register_structured_output,
 )
 
 logger = get_logger(__name__)
 
+register_structured_output(get_generator_llm, FeedbackOutput, "json_mode")
+register_structured_output(get_generator_llm, OverallFeedbackOutput, "json_mode")
+register_structured_output(get_evaluator_llm, RetrievalEvalOutput)
+
 
 async def generate_feedback(
     position: str,
@@ -164,6 +169,7 @@ async def evaluate_retrieval_quality(
         system_prompt=LOCAL_FEEDBACK_RETRIEVAL_EVALUATOR_SYSTEM,
         human_content=human_content,
         config=config,
+        cache_prompt="feedback-retrieval-eval:v1",
     )
 
     logger.debug("retrieval 품질 평가 완료", result=result.result, reason=result.reason)
@@ -0,0 +1,174 @@
+"""지연 민감 LLM 호출의 헤지 요청
+
+호출 지점(프롬프트 이름)별로 최근 지연을 기록하고, 요청이 지정한 백분위 지연을 넘기면 같은 요청을
+한 번 더 보낸다. 먼저 성공한(구조화 출력 검증을 통과한) 응답을 사용하고 나머지 요청은 취소한다
+추가 요청은 토큰 버킷 예산 안에서만 보내므로 전체 요청 대비 헤지 비율은 budget_ratio를 넘지 않는다
+동시성 제한 슬롯을 함께 넘기면 헤지 대기와 지연 측정은 원 요청이 슬롯을 얻은 뒤부터 시작하여
+대기열에서 기다린 시간 때문에 헤지하지 않는다
+"""
+
+import asyncio
+import contextlib
+import math
+import time
+from collections import deque
+from collections.abc import Awaitable, Callable
+from contextlib import AbstractAsyncContextManager
+
+from prometheus_client import Counter
+
+from app.core.config import settings
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+LLM_HEDGES = Counter(
+    "llm_hedge_requests_total",
+    "헤지 대상 LLM 호출의 헤지 결정 (fired/budget_exhausted)",
+    ["prompt", "result"],
+)
+LLM_HEDGE_WINS = Counter(
+    "llm_hedge_wins_total",
+    "헤지를 보낸 호출에서 먼저 성공한 요청 (primary/hedge), 헤지 승률은 hedge / (primary + hedge)",
+    ["prompt", "winner"],
+)
+
+
+class LLMHedger:
+    """프롬프트별 지연 백분위 기반 헤지 요청 실행기"""
+
+    def __init__(
+        self,
+        percentile: float = 0.95,
+        min_samples: int = 20,
+        window: int = 200,
+        budget_ratio: float = 0.05,
+        budget_burst: float = 5.0,
+    ):
+        self._percentile = percentile
+        self._min_samples = min_samples
+        self._window = window
+        self._budget_ratio = budget_ratio
+        self._budget_burst = budget_burst
+        self._budget = budget_burst
+        self._latencies: dict[str, deque[float]] = {}
+
+    def hedge_delay(self, prompt: str) -> float | None:
+        """헤지 요청을 보낼 대기 시간, 관측 표본이 부족하면 None"""
+        samples = self._latencies.get(prompt)
+        if samples is None or len(samples) < self._min_samples:
+            return None
+        ordered = sorted(samples)
+        index = min(len(ordered) - 1, max(0, math.ceil(self._percentile * len(ordered)) - 1))
+        return ordered[index]
+
+    def record_latency(self, prompt: str, latency: float) -> None:
+        """원 요청의 지연 기록"""
+        samples = self._latencies.get(prompt)
+        if samples is None:
+            samples = self._latencies[prompt] = deque(maxlen=self._window)
+        samples.append(latency)
+
+    def _try_spend_budget(self) -> bool:
+        if self._budget < 1.0:
+            return False
+        self._budget -= 1.0
+        return True
+
+    async def call[T](
+        self,
+        prompt: str,
+        request: Callable[[], Awaitable[T]],
+        slot: Callable[[], AbstractAsyncContextManager] | None = None,
+    ) -> T:
+        """request를 실행하고, 백분위 지연을 넘기면 헤지 요청을 보내 먼저 성공한 결과 반환
+
+        slot을 지정하면 각 요청은 슬롯을 얻은 뒤 실행하고, 헤지 대기와 지연 측정은 원 요청이
+        슬롯을 얻은 시점부터 시작한다. 원 요청이 슬롯을 기다리는 동안에는 헤지하지 않는다
+        두 요청이 모두 실패하면 원 요청의 예외를 전달한다
+        헤지에 진 원 요청은 취소 시점까지의 지연을 기록하여 꼬리 지연이 백분위에 계속 반영되게 한다
+        """
+        self._budget = min(self._budget_burst, self._budget + self._budget_ratio)
+        delay = self.hedge_delay(prompt)
+        acquired = asyncio.Event()
+        started = 0.0
+
+        async def primary_request() -> T:
+            nonlocal started
+            async with slot() if slot is not None else contextlib.nullcontext():
+                started = time.monotonic()
+                acquired.set()
+                return await request()
+
+        async def hedge_request() -> T:
+            async with slot() if slot is not None else contextlib.nullcontext():
+                return await request()
+
+        primary = asyncio.ensure_future(primary_request())
+        acquire_wait = asyncio.ensure_future(acquired.wait())
+        tasks: dict[asyncio.Future, str] = {primary: "primary"}
+        try:
+            await asyncio.wait({primary, acquire_wait}, return_when=asyncio.FIRST_COMPLETED)
+            if delay is not None and not primary.done():
+                await asyncio.wait({primary}, timeout=delay)
+            if delay is None or primary.done():
+                result = await primary
+                self.record_latency(prompt, time.monotonic() - started)
+                return result
+
+            if not self._try_spend_budget():
+                LLM_HEDGES.labels(prompt=prompt, result="budget_exhausted").inc()
+                result = await primary
+                self.record_latency(prompt, time.monotonic() - started)
+                return result
+
+            LLM_HEDGES.labels(prompt=prompt, result="fired").inc()
+            logger.info("LLM 헤지 요청 전송", prompt=prompt, delay_s=round(delay, 2))
+            tasks[asyncio.ensure_future(hedge_request())] = "hedge"
+            return await self._first_success(prompt, tasks, started)
+        finally:
+            acquire_wait.cancel()
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+                elif not task.cancelled():
+                    task.exception()
+            if acquired.is_set() and not primary.done():
+                self.record_latency(prompt, time.monotonic() - started)
+
+    async def _first_success[T](
+        self, prompt: str, tasks: dict[asyncio.Future, str], started: float
+    ) -> T:
+        """먼저 성공한 요청의 결과 반환, 모두 실패하면 원 요청의 예외 전달"""
+        pending = set(tasks)
+        errors: dict[str, BaseException] = {}
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                error = task.exception()
+                if error is not None:
+                    errors[tasks[task]] = error
+                    continue
+                winner = tasks[task]
+                LLM_HEDGE_WINS.labels(prompt=prompt, winner=winner).inc()
+                if winner == "primary":
+                    self.record_latency(prompt, time.monotonic() - started)
+                return task.result()
+        raise errors.get("primary") or errors["hedge"]
+
+
+_hedger: LLMHedger | None = None
+
+
+def get_llm_hedger() -> LLMHedger:
+    """LLM 헤지 실행기 지연 초기화 싱글턴"""
+    global _hedger
+    if _hedger is None:
+        _hedger = LLMHedger(
+            percentile=settings.llm_hedge_percentile,
+            min_samples=settings.llm_hedge_min_samples,
+            window=settings.llm_hedge_window,
+            budget_ratio=settings.llm_hedge_budget_ratio,
+            budget_burst=settings.llm_hedge_budget_burst,
+        )
+    return _hedger
@@ -8,10 +8,14 @@ from app.infra.llm.base import (
     _invoke_llm,
     get_evaluator_llm,
     get_generator_llm,
+    register_structured_output,
 )
 
 logger = get_logger(__name__)
 
+register_structured_output(get_generator_llm, InterviewQuestionsOutput, "json_mode")
+register_structured_output(get_evaluator_llm, InterviewEvaluationOutput, "json_mode")
+
 
 async def generate_interview(
     resume_json: str,
@@ -0,0 +1,286 @@
+"""LLM 백엔드별 적응형 동시성 제한
+
+프로세스 전체에서 generator(vLLM)와 evaluator(Gemini)마다 제한기 하나를 공유한다
+한도는 AIMD로 조절한다. 한도가 꽉 찬 상태에서 지연이 임계값 이내로 끝나면 한도를 1/한도씩
+늘리고(대략 한도만큼 완료될 때마다 +1), 429/5xx/타임아웃이나 임계값 초과 지연이 관측되면
+backoff 배로 줄인다. 지연 임계값은 기본으로 백엔드 타임아웃에 가깝게 두어, 정상적으로 오래 걸리는
+전체 이력서 생성은 과부하로 보지 않는다
+
+빈 슬롯은 (대기 시작 시각 + 우선순위 × priority_aging)이 작은 순으로 배정한다
+면접 채팅이 배치성 피드백보다 먼저 처리되지만, 오래 기다린 batch 요청은
+나중에 들어온 높은 우선순위 요청을 앞지를 수 있어 부하가 계속되어도 batch가 무한히 밀리지 않는다
+"""
+
+import asyncio
+import heapq
+import itertools
+import time
+from collections.abc import Iterator
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
+
+import httpx
+from prometheus_client import Counter, Gauge, Histogram
+
+from app.core.config import settings
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+BACKEND_GENERATOR = "generator"
+BACKEND_EVALUATOR = "evaluator"
+
+PRIORITY_INTERACTIVE = 0
+PRIORITY_NORMAL = 1
+PRIORITY_BATCH = 2
+
+_PRIORITY_LABELS = {
+    PRIORITY_INTERACTIVE: "interactive",
+    PRIORITY_NORMAL: "normal",
+    PRIORITY_BATCH: "batch",
+}
+_LATENCY_THRESHOLD_TIMEOUT_RATIO = 0.9
+_OVERLOAD_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+_OVERLOAD_ERROR_NAMES = frozenset(
+    {"APITimeoutError", "RateLimitError", "ResourceExhausted", "ServiceUnavailable"}
+)
+
+LLM_CONCURRENCY_LIMIT = Gauge(
+    "llm_concurrency_limit",
+    "LLM 백엔드별 현재 동시 요청 한도",
+    ["backend"],
+)
+LLM_REQUESTS_IN_FLIGHT = Gauge(
+    "llm_requests_in_flight",
+    "LLM 백엔드별 실행 중인 요청 수",
+    ["backend"],
+)
+LLM_REQUESTS_QUEUED = Gauge(
+    "llm_requests_queued",
+    "LLM 백엔드별 실행 슬롯을 기다리는 요청 수",
+    ["backend", "priority"],
+)
+LLM_QUEUE_WAIT_SECONDS = Histogram(
+    "llm_queue_wait_seconds",
+    "LLM 요청이 실행 슬롯을 얻기까지 기다린 시간",
+    ["backend", "priority"],
+    buckets=(0.01, 0.05, 0.1, 0.5, 1, 2, 5, 10, 30, 60),
+)
+LLM_LIMIT_DECREASES = Counter(
+    "llm_concurrency_limit_decreases_total",
+    "LLM 동시 요청 한도 감소 횟수",
+    ["backend", "reason"],
+)
+
+_llm_priority: ContextVar[int] = ContextVar("llm_priority", default=PRIORITY_NORMAL)
+
+
+@contextmanager
+def llm_priority(priority: int) -> Iterator[None]:
+    """블록 안에서 실행되는 LLM 호출(하위 태스크 포함)의 우선순위 지정"""
+    token = _llm_priority.set(priority)
+    try:
+        yield
+    finally:
+        _llm_priority.reset(token)
+
+
+def _status_code(error: BaseException) -> int | None:
+    """예외 또는 원인 예외에서 HTTP 상태 코드 추출"""
+    current: BaseException | None = error
+    while current is not None:
+        for candidate in (
+            getattr(current, "status_code", None),
+            getattr(getattr(current, "response", None), "status_code", None),
+            getattr(current, "code", None),
+        ):
+            if isinstance(candidate, int):
+                return candidate
+        current = current.__cause__
+    return None
+
+
+def is_overload_error(error: BaseException) -> bool:
+    """백엔드 과부하 신호(429/5xx/타임아웃)인지 판단, 출력 파싱 실패 등은 해당하지 않음"""
+    if isinstance(error, TimeoutError | httpx.TimeoutException):
+        return True
+    if type(error).__name__ in _OVERLOAD_ERROR_NAMES:
+        return True
+    return _status_code(error) in _OVERLOAD_STATUS_CODES
+
+
+class AdaptiveConcurrencyLimiter:
+    """우선순위 대기열과 AIMD 한도를 가진 동시성 제한기"""
+
+    def __init__(
+        self,
+        backend: str,
+        initial_limit: int,
+        min_limit: int,
+        max_limit: int,
+        latency_threshold: float,
+        backoff: float = 0.5,
+        cooldown: float = 5.0,
+        priority_aging: float = 10.0,
+    ):
+        self._backend = backend
+        self._min_limit = max(1, min_limit)
+        self._max_limit = max(self._min_limit, max_limit)
+        self._limit = float(min(max(initial_limit, self._min_limit), self._max_limit))
+        self._latency_threshold = latency_threshold
+        self._backoff = backoff
+        self._cooldown = cooldown
+        self._priority_aging = priority_aging
+        self._last_decrease = float("-inf")
+        self._in_flight = 0
+        self._waiters: list[tuple[float, int, asyncio.Future]] = []
+        self._counter = itertools.count()
+        LLM_CONCURRENCY_LIMIT.labels(backend=backend).set(self.limit)
+
+    @property
+    def limit(self) -> int:
+        return int(self._limit)
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    @property
+    def queued(self) -> int:
+        return sum(1 for _, _, fut in self._waiters if not fut.done())
+
+    async def acquire(self, priority: int = PRIORITY_NORMAL) -> None:
+        """실행 슬롯 점유, 한도가 차 있으면 대기 시각과 우선순위로 정한 순서대로 대기"""
+        if self._in_flight < self.limit and not self.queued:
+            self._in_flight += 1
+            LLM_REQUESTS_IN_FLIGHT.labels(backend=self._backend).set(self._in_flight)
+            return
+
+        fut = asyncio.get_running_loop().create_future()
+        rank = time.monotonic() + priority * self._priority_aging
+        heapq.heappush(self._waiters, (rank, next(self._counter), fut))
+        try:
+            await fut
+        except asyncio.CancelledError:
+            if fut.done() and not fut.cancelled():
+                self.release()
+            raise
+
+    def release(self) -> None:
+        """실행 슬롯 반환 후 한도 안에서 대기 요청 깨움"""
+        self._in_flight -= 1
+        self._wake_waiters()
+
+    def _wake_waiters(self) -> None:
+        while self._waiters and self._in_flight < self.limit:
+            _, _, fut = heapq.heappop(self._waiters)
+            if not fut.done():
+                fut.set_result(None)
+                self._in_flight += 1
+        LLM_REQUESTS_IN_FLIGHT.labels(backend=self._backend).set(self._in_flight)
+
+    def on_success(self, latency: float) -> None:
+        """정상 완료 반영 - 지연이 임계값 이내고 한도가 꽉 찬 상태였으면 가산 증가"""
+        if latency > self._latency_threshold:
+            self._decrease("latency")
+            return
+        if self._in_flight < self.limit and not self.queued:
+            return
+        self._set_limit(min(self._max_limit, self._limit + 1 / self._limit))
+
+    def on_overload(self) -> None:
+        """과부하 응답 반영 - 승법 감소"""
+        self._decrease("overload")
+
+    def _decrease(self, reason: str) -> None:
+        now = time.monotonic()
+        if now - self._last_decrease < self._cooldown:
+            return
+        self._last_decrease = now
+        previous = self.limit
+        self._set_limit(max(self._min_limit, self._limit * self._backoff))
+        LLM_LIMIT_DECREASES.labels(backend=self._backend, reason=reason).inc()
+        logger.warning(
+            "LLM 동시 요청 한도 감소",
+            backend=self._backend,
+            reason=reason,
+            previous=previous,
+            limit=self.limit,
+        )
+
+    def _set_limit(self, limit: float) -> None:
+        self._limit = limit
+        LLM_CONCURRENCY_LIMIT.labels(backend=self._backend).set(self.limit)
+        self._wake_waiters()
+
+    @asynccontextmanager
+    async def slot(self, priority: int | None = None):
+        """슬롯을 점유한 채로 블록을 실행하고 지연과 예외로 한도 조절
+
+        priority를 생략하면 llm_priority로 지정한 현재 컨텍스트의 우선순위를 사용한다
+        과부하가 아닌 예외(출력 파싱 실패 등)와 취소는 한도에 반영하지 않는다
+        """
+        if priority is None:
+            priority = _llm_priority.get()
+        label = _PRIORITY_LABELS.get(priority, str(priority))
+
+        queued_gauge = LLM_REQUESTS_QUEUED.labels(backend=self._backend, priority=label)
+        queued_gauge.inc()
+        wait_started = time.monotonic()
+        try:
+            await self.acquire(priority)
+        finally:
+            queued_gauge.dec()
+        LLM_QUEUE_WAIT_SECONDS.labels(backend=self._backend, priority=label).observe(
+            time.monotonic() - wait_started
+        )
+
+        started = time.monotonic()
+        try:
+            yield
+        except Exception as e:
+            if is_overload_error(e):
+                self.on_overload()
+            raise
+        else:
+            self.on_success(time.monotonic() - started)
+        finally:
+            self.release()
+
+
+_limiters: dict[str, AdaptiveConcurrencyLimiter] = {}
+
+
+def get_llm_limiter(backend: str) -> AdaptiveConcurrencyLimiter:
+    """백엔드별 동시성 제한기 지연 초기화 싱글턴"""
+    limiter = _limiters.get(backend)
+    if limiter is not None:
+        return limiter
+
+    common = {
+        "backoff": settings.llm_limiter_backoff,
+        "cooldown": settings.llm_limiter_cooldown,
+        "priority_aging": settings.llm_limiter_priority_aging,
+    }
+    if backend == BACKEND_EVALUATOR:
+        limiter = AdaptiveConcurrencyLimiter(
+            backend,
+            initial_limit=settings.llm_evaluator_initial_concurrency,
+            min_limit=settings.llm_evaluator_min_concurrency,
+            max_limit=settings.llm_evaluator_max_concurrency,
+            latency_threshold=settings.llm_evaluator_latency_threshold
+            or settings.gemini_timeout * _LATENCY_THRESHOLD_TIMEOUT_RATIO,
+            **common,
+        )
+    else:
+        limiter = AdaptiveConcurrencyLimiter(
+            backend,
+            initial_limit=settings.vllm_max_concurrent_requests,
+            min_limit=settings.llm_generator_min_concurrency,
+            max_limit=settings.llm_generator_max_concurrency,
+            latency_threshold=settings.llm_generator_latency_threshold
+            or settings.vllm_timeout * _LATENCY_THRESHOLD_TIMEOUT_RATIO,
+            **common,
+        )
+    _limiters[backend] = limiter
+    return limiter
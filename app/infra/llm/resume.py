@@ -1,10 +1,11 @@
 from app.core.logging import get_logger
 from app.domain.resume.schemas import (
     EvaluationOutput,
+    ProjectInfo,
     ProjectInfoDict,
     ResumeData,
 )
-from app.domain.resume.schemas.edit import ClassifyOutput, EditPlanOutput
+from app.domain.resume.schemas.edit import ClassifyOutput, EditPlanOutput, EditResumeOutput
 from app.domain.resume.schemas.plan import ProjectPlan
 from app.infra.langfuse.prompt_manager import get_prompt
 from app.infra.llm.base import (
@@ -12,10 +13,18 @@ from app.infra.llm.base import (
     _invoke_llm,
     get_evaluator_llm,
     get_generator_llm,
+    register_structured_output,
 )
 
 logger = get_logger(__name__)
 
+register_structured_output(get_generator_llm, ResumeData, "json_mode")
+register_structured_output(get_generator_llm, EditResumeOutput, "json_mode")
+register_structured_output(get_evaluator_llm, EvaluationOutput, "json_mode")
+register_structured_output(get_evaluator_llm, ClassifyOutput, "json_mode")
+register_structured_output(get_evaluator_llm, EditPlanOutput, "json_mode")
+register_structured_output(get_evaluator_llm, ProjectPlan, "json_mode")
+
 
 async def generate_resume(
     project_info: list[ProjectInfoDict],
@@ -72,6 +81,34 @@ async def generate_resume(
     return result
 
 
+async def generate_project_resume(
+    project: ProjectInfoDict,
+    position: str,
+    generation_plan: str,
+    session_id: str | None = None,
+    feedback: str = "",
+    previous_project_json: str = "",
+) -> ProjectInfo:
+    """프로젝트 하나만 생성 - 프로젝트별 병렬 생성 모드에서 사용
+
+    vLLM 동시 요청 수는 generator 백엔드의 적응형 동시성 제한기가 조절한다
+
+    Raises:
+        ValueError: 생성 결과에 프로젝트가 없는 경우
+    """
+    result = await generate_resume(
+        project_info=[project],
+        position=position,
+        session_id=session_id,
+        generation_plans=generation_plan,
+        feedback=feedback,
+        previous_resume_json=previous_project_json,
+    )
+    if not result.projects:
+        raise ValueError(f"프로젝트 생성 결과 없음: {project.get('repo_name', '')}")
+    return result.projects[0]
+
+
 def _format_project_evidence(
     project_info: list,
     repo_contexts: dict,
@@ -147,6 +184,8 @@ async def evaluate_resume(
         human_content=human_content,
         config=config,
         structured_output_method="json_mode",
+        cache_prompt="resume-evaluator:v1",
+        hedge_prompt="resume-evaluator",
     )
 
     logger.debug(
@@ -181,6 +220,8 @@ async def classify_edit(
         human_content=human_content,
         config=config,
         structured_output_method="json_mode",
+        cache_prompt="resume-edit-classify:v1",
+        hedge_prompt="resume-edit-classify",
     )
 
     logger.debug(
@@ -217,6 +258,8 @@ async def plan_edit(
         human_content=human_content,
         config=config,
         structured_output_method="json_mode",
+        cache_prompt="resume-edit-plan:v1",
+        hedge_prompt="resume-edit-plan",
     )
 
     logger.debug(
@@ -276,6 +319,8 @@ async def plan_resume(
         human_content=human_content,
         config=config,
         structured_output_method="json_mode",
+        cache_prompt="resume-plan:v1",
+        hedge_prompt="resume-plan",
     )
 
     logger.debug(
@@ -321,6 +366,7 @@ async def edit_resume[T](
         human_content=human_content,
         config=config,
         structured_output_method="json_mode",
+        cache_prompt="resume-edit:v1",
     )
 
     logger.debug("이력서 수정 완료")
@@ -351,6 +397,7 @@ async def evaluate_edited_resume(
         human_content=human_content,
         config=config,
         structured_output_method="json_mode",
+        cache_prompt="resume-edit-evaluator:v1",
     )
 
     logger.debug(
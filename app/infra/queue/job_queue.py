@@ -0,0 +1,517 @@
+"""SQLite 기반 영속 작업 큐
+
+이력서 생성/수정 작업을 요청 즉시 SQLite에 기록하고 워커 풀이 가져가 실행한다
+작업은 실행 중 주기적으로 임대(lease)를 연장하며, 프로세스가 죽어 임대가 만료되면 다른 워커나
+재시작된 프로세스가 다시 가져간다. 실행 결과(콜백 페이로드)를 먼저 저장한 뒤 콜백을 전송하므로
+콜백은 최소 한 번 전달되고, 전송 실패 시 지수 백오프로 재전송한다
+
+상태 전이: queued -> running -> delivering -> done (재전송 한도 초과 시 dead)
+작업별 진행 이벤트(job_events)도 같은 파일에 기록하여 단계별 지연을 나중에 분석할 수 있다
+
+요청 페이로드에는 GitHub 토큰이 들어 있으므로 Fernet으로 암호화해 저장하고, 완료/dead 시 비운다
+워커와 API가 사용하는 비동기 메서드는 SQLite 접근을 스레드로 실행하여 이벤트 루프를 막지 않는다
+"""
+
+import asyncio
+import base64
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any
+
+from cryptography.fernet import Fernet, InvalidToken
+
+from app.core.config import settings
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    job_id TEXT PRIMARY KEY,
+    kind TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    callback_url TEXT NOT NULL,
+    status TEXT NOT NULL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    deliveries INTEGER NOT NULL DEFAULT 0,
+    result TEXT,
+    available_at REAL NOT NULL,
+    lease_expires_at REAL,
+    enqueued_at REAL NOT NULL,
+    updated_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_jobs_status_available ON jobs (status, available_at);
+CREATE TABLE IF NOT EXISTS job_events (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    job_id TEXT NOT NULL,
+    event TEXT NOT NULL,
+    data TEXT NOT NULL,
+    created_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_job_events_job_id ON job_events (job_id, id);
+"""
+
+_EMPTY_PAYLOAD = "{}"
+
+_CLAIMABLE = """
+SELECT job_id, kind, payload, callback_url, status, attempts, deliveries, result, enqueued_at
+FROM jobs
+WHERE (status IN ('queued', 'delivering') AND lease_expires_at IS NULL AND available_at <= ?)
+   OR (status IN ('running', 'delivering') AND lease_expires_at IS NOT NULL
+       AND lease_expires_at < ?)
+ORDER BY available_at
+LIMIT 1
+"""
+
+
+@dataclass
+class Job:
+    """큐에서 가져온 작업"""
+
+    job_id: str
+    kind: str
+    payload: dict[str, Any]
+    callback_url: str
+    status: str
+    attempts: int
+    deliveries: int
+    result: dict | None
+    enqueued_at: float
+
+
+@dataclass
+class JobEvent:
+    """작업 진행 이벤트"""
+
+    id: int
+    job_id: str
+    event: str
+    data: dict[str, Any]
+    created_at: float
+
+
+class JobQueue:
+    """임대 만료 기반 재처리를 지원하는 SQLite 작업 큐"""
+
+    def __init__(
+        self,
+        path: str,
+        visibility_timeout: float = 300.0,
+        max_deliveries: int = 5,
+        retention_seconds: float = 86400.0,
+        payload_secret: str = "",
+    ):
+        self._path = path
+        self._visibility_timeout = visibility_timeout
+        self._max_deliveries = max_deliveries
+        self._retention = retention_seconds
+        self._conn: sqlite3.Connection | None = None
+        self._lock = threading.Lock()
+        self._wakeup = asyncio.Event()
+        key = hashlib.sha256(f"job-payload|{payload_secret}".encode()).digest()
+        self._fernet = Fernet(base64.urlsafe_b64encode(key))
+
+    @property
+    def visibility_timeout(self) -> float:
+        return self._visibility_timeout
+
+    def _connect(self) -> sqlite3.Connection:
+        """SQLite 연결 지연 초기화"""
+        if self._conn is None:
+            directory = os.path.dirname(self._path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            self._conn = sqlite3.connect(self._path, check_same_thread=False, isolation_level=None)
+            if self._path != ":memory:":
+                self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.executescript(_SCHEMA)
+        return self._conn
+
+    def _encrypt_payload(self, payload: dict[str, Any]) -> str:
+        data = json.dumps(payload, ensure_ascii=False).encode()
+        return self._fernet.encrypt(data).decode()
+
+    def _decrypt_payload(self, stored: str) -> dict[str, Any]:
+        """저장된 페이로드 복호화, 완료/dead로 비운 페이로드는 빈 딕셔너리
+
+        Raises:
+            InvalidToken: 다른 키로 암호화되었거나 손상된 경우
+        """
+        if stored == _EMPTY_PAYLOAD:
+            return {}
+        return json.loads(self._fernet.decrypt(stored.encode()))
+
+    def _execute(self, sql: str, params: tuple = ()) -> int:
+        """단일 쓰기 실행 후 변경 행 수 반환"""
+        with self._lock:
+            return self._connect().execute(sql, params).rowcount
+
+    def _insert_job(
+        self, job_id: str, kind: str, payload: dict[str, Any], callback_url: str
+    ) -> None:
+        now = time.time()
+        self._execute(
+            "INSERT INTO jobs (job_id, kind, payload, callback_url, status, available_at, "
+            "enqueued_at, updated_at) VALUES (?, ?, ?, ?, 'queued', ?, ?, ?)",
+            (job_id, kind, self._encrypt_payload(payload), callback_url, now, now, now),
+        )
+        self.record_event(job_id, "queued", {"kind": kind})
+
+    def enqueue(self, job_id: str, kind: str, payload: dict[str, Any], callback_url: str) -> None:
+        """작업 등록 후 대기 중인 워커 깨우기"""
+        self._insert_job(job_id, kind, payload, callback_url)
+        self._wakeup.set()
+
+    async def aenqueue(
+        self, job_id: str, kind: str, payload: dict[str, Any], callback_url: str
+    ) -> None:
+        """작업 비동기 등록 후 대기 중인 워커 깨우기"""
+        await asyncio.to_thread(self._insert_job, job_id, kind, payload, callback_url)
+        self._wakeup.set()
+
+    async def wait_for_job(self, timeout: float) -> None:
+        """새 작업 등록 또는 timeout까지 대기"""
+        try:
+            await asyncio.wait_for(self._wakeup.wait(), timeout=timeout)
+        except TimeoutError:
+            pass
+        self._wakeup.clear()
+
+    def claim(self) -> Job | None:
+        """실행하거나 콜백을 전송할 작업 하나를 임대
+
+        임대가 만료된 running 작업은 시도 횟수를 늘려 다시 실행하고,
+        delivering 작업은 저장된 결과로 콜백만 다시 전송한다
+        페이로드를 복호화할 수 없는 작업은 실행할 수 없으므로 dead로 전환한다
+        """
+        while True:
+            now = time.time()
+            with self._lock:
+                conn = self._connect()
+                conn.execute("BEGIN IMMEDIATE")
+                try:
+                    row = conn.execute(_CLAIMABLE, (now, now)).fetchone()
+                    if row is None:
+                        conn.execute("COMMIT")
+                        return None
+                    (
+                        job_id,
+                        kind,
+                        stored,
+                        callback_url,
+                        status,
+                        attempts,
+                        deliveries,
+                        result,
+                        enq,
+                    ) = row
+                    try:
+                        payload = self._decrypt_payload(stored)
+                    except InvalidToken:
+                        conn.execute(
+                            "UPDATE jobs SET status = 'dead', payload = ?, "
+                            "lease_expires_at = NULL, updated_at = ? WHERE job_id = ?",
+                            (_EMPTY_PAYLOAD, now, job_id),
+                        )
+                        conn.execute("COMMIT")
+                        logger.error("작업 페이로드 복호화 실패, dead 처리", job_id=job_id)
+                        continue
+                    if status != "delivering":
+                        status = "running"
+                        attempts += 1
+                    conn.execute(
+                        "UPDATE jobs SET status = ?, attempts = ?, lease_expires_at = ?, "
+                        "updated_at = ? WHERE job_id = ?",
+                        (status, attempts, now + self._visibility_timeout, now, job_id),
+                    )
+                    conn.execute("COMMIT")
+                except BaseException:
+                    conn.execute("ROLLBACK")
+                    raise
+            return Job(
+                job_id=job_id,
+                kind=kind,
+                payload=payload,
+                callback_url=callback_url,
+                status=status,
+                attempts=attempts,
+                deliveries=deliveries,
+                result=json.loads(result) if result else None,
+                enqueued_at=enq,
+            )
+
+    def heartbeat(self, job_id: str) -> None:
+        """실행 중인 작업의 임대 연장"""
+        now = time.time()
+        self._execute(
+            "UPDATE jobs SET lease_expires_at = ?, updated_at = ? "
+            "WHERE job_id = ? AND lease_expires_at IS NOT NULL",
+            (now + self._visibility_timeout, now, job_id),
+        )
+
+    def complete_run(self, job_id: str, result: dict) -> None:
+        """실행 결과(콜백 페이로드)를 저장하고 콜백 전송 단계로 전환"""
+        now = time.time()
+        self._execute(
+            "UPDATE jobs SET status = 'delivering', result = ?, lease_expires_at = ?, "
+            "updated_at = ? WHERE job_id = ?",
+            (
+                json.dumps(result, ensure_ascii=False),
+                now + self._visibility_timeout,
+                now,
+                job_id,
+            ),
+        )
+
+    def mark_delivered(self, job_id: str) -> None:
+        """콜백 전송 완료 처리, 토큰이 남지 않도록 요청 페이로드 삭제"""
+        self._execute(
+            "UPDATE jobs SET status = 'done', payload = ?, lease_expires_at = NULL, "
+            "updated_at = ? WHERE job_id = ?",
+            (_EMPTY_PAYLOAD, time.time(), job_id),
+        )
+
+    def mark_dead(self, job_id: str) -> None:
+        """처리할 수 없는 작업을 dead로 전환"""
+        self._execute(
+            "UPDATE jobs SET status = 'dead', payload = ?, lease_expires_at = NULL, "
+            "updated_at = ? WHERE job_id = ?",
+            (_EMPTY_PAYLOAD, time.time(), job_id),
+        )
+
+    def schedule_redelivery(self, job_id: str, base_delay: float) -> bool:
+        """콜백 재전송 예약, 재전송 한도를 넘으면 dead로 전환하고 False 반환"""
+        now = time.time()
+        with self._lock:
+            conn = self._connect()
+            row = conn.execute("SELECT deliveries FROM jobs WHERE job_id = ?", (job_id,)).fetchone()
+            if row is None:
+                return False
+            deliveries = row[0] + 1
+            if deliveries >= self._max_deliveries:
+                conn.execute(
+                    "UPDATE jobs SET status = 'dead', deliveries = ?, payload = ?, "
+                    "lease_expires_at = NULL, updated_at = ? WHERE job_id = ?",
+                    (deliveries, _EMPTY_PAYLOAD, now, job_id),
+                )
+                return False
+            conn.execute(
+                "UPDATE jobs SET deliveries = ?, available_at = ?, lease_expires_at = NULL, "
+                "updated_at = ? WHERE job_id = ?",
+                (deliveries, now + base_delay * (2 ** (deliveries - 1)), now, job_id),
+            )
+            return True
+
+    def schedule_retry(self, job_id: str, base_delay: float) -> bool:
+        """실행 중 예외가 난 작업을 시도 횟수를 유지한 채 지수 백오프 후 다시 실행하도록 예약
+
+        콜백 전송 단계였다면 콜백 재전송으로 예약하며, 재전송 한도를 넘으면 dead 전환 후 False 반환
+        """
+        with self._lock:
+            row = (
+                self._connect()
+                .execute("SELECT status, attempts FROM jobs WHERE job_id = ?", (job_id,))
+                .fetchone()
+            )
+        if row is None:
+            return False
+        status, attempts = row
+        if status == "delivering":
+            return self.schedule_redelivery(job_id, base_delay)
+        now = time.time()
+        return (
+            self._execute(
+                "UPDATE jobs SET status = 'queued', available_at = ?, lease_expires_at = NULL, "
+                "updated_at = ? WHERE job_id = ? AND status = 'running'",
+                (now + base_delay * (2 ** max(attempts - 1, 0)), now, job_id),
+            )
+            > 0
+        )
+
+    def release(self, job_id: str) -> None:
+        """종료 시 실행 중이던 작업을 즉시 다시 가져갈 수 있도록 반환
+
+        실행 단계였다면 이번 시도를 횟수에서 제외한다
+        """
+        now = time.time()
+        self._execute(
+            "UPDATE jobs SET "
+            "status = CASE status WHEN 'running' THEN 'queued' ELSE status END, "
+            "attempts = CASE status WHEN 'running' THEN MAX(attempts - 1, 0) ELSE attempts END, "
+            "lease_expires_at = NULL, available_at = ?, updated_at = ? "
+            "WHERE job_id = ? AND status IN ('running', 'delivering')",
+            (now, now, job_id),
+        )
+
+    def get(self, job_id: str) -> Job | None:
+        """작업 조회, 복호화할 수 없는 페이로드는 빈 딕셔너리"""
+        with self._lock:
+            row = (
+                self._connect()
+                .execute(
+                    "SELECT job_id, kind, payload, callback_url, status, attempts, deliveries, "
+                    "result, enqueued_at FROM jobs WHERE job_id = ?",
+                    (job_id,),
+                )
+                .fetchone()
+            )
+        if row is None:
+            return None
+        try:
+            payload = self._decrypt_payload(row[2])
+        except InvalidToken:
+            payload = {}
+        return Job(
+            job_id=row[0],
+            kind=row[1],
+            payload=payload,
+            callback_url=row[3],
+            status=row[4],
+            attempts=row[5],
+            deliveries=row[6],
+            result=json.loads(row[7]) if row[7] else None,
+            enqueued_at=row[8],
+        )
+
+    def depth(self) -> dict[tuple[str, str], int]:
+        """종류, 상태별 미완료 작업 수"""
+        with self._lock:
+            rows = (
+                self._connect()
+                .execute(
+                    "SELECT kind, status, COUNT(*) FROM jobs "
+                    "WHERE status IN ('queued', 'running', 'delivering') GROUP BY kind, status"
+                )
+                .fetchall()
+            )
+        return {(kind, status): count for kind, status, count in rows}
+
+    def record_event(self, job_id: str, event: str, data: dict[str, Any] | None = None) -> int:
+        """작업 진행 이벤트 기록 후 이벤트 id 반환"""
+        with self._lock:
+            cursor = self._connect().execute(
+                "INSERT INTO job_events (job_id, event, data, created_at) VALUES (?, ?, ?, ?)",
+                (job_id, event, json.dumps(data or {}, ensure_ascii=False), time.time()),
+            )
+            return cursor.lastrowid
+
+    def list_events(self, job_id: str, after_id: int = 0, limit: int = 100) -> list[JobEvent]:
+        """after_id 이후에 기록된 작업 진행 이벤트를 기록 순서대로 조회"""
+        with self._lock:
+            rows = (
+                self._connect()
+                .execute(
+                    "SELECT id, job_id, event, data, created_at FROM job_events "
+                    "WHERE job_id = ? AND id > ? ORDER BY id LIMIT ?",
+                    (job_id, after_id, limit),
+                )
+                .fetchall()
+            )
+        return [
+            JobEvent(
+                id=row[0], job_id=row[1], event=row[2], data=json.loads(row[3]), created_at=row[4]
+            )
+            for row in rows
+        ]
+
+    def prune(self) -> int:
+        """보관 기간이 지난 완료/실패 작업과 그 진행 이벤트 삭제"""
+        pruned = self._execute(
+            "DELETE FROM jobs WHERE status IN ('done', 'dead') AND updated_at < ?",
+            (time.time() - self._retention,),
+        )
+        self._execute(
+            "DELETE FROM job_events WHERE created_at < ? "
+            "AND job_id NOT IN (SELECT job_id FROM jobs)",
+            (time.time() - self._retention,),
+        )
+        return pruned
+
+    async def aclaim(self) -> Job | None:
+        """작업 하나를 비동기로 임대"""
+        return await asyncio.to_thread(self.claim)
+
+    async def aheartbeat(self, job_id: str) -> None:
+        """임대 비동기 연장"""
+        await asyncio.to_thread(self.heartbeat, job_id)
+
+    async def acomplete_run(self, job_id: str, result: dict) -> None:
+        """실행 결과 비동기 저장"""
+        await asyncio.to_thread(self.complete_run, job_id, result)
+
+    async def amark_delivered(self, job_id: str) -> None:
+        """콜백 전송 완료 비동기 처리"""
+        await asyncio.to_thread(self.mark_delivered, job_id)
+
+    async def amark_dead(self, job_id: str) -> None:
+        """dead 비동기 전환"""
+        await asyncio.to_thread(self.mark_dead, job_id)
+
+    async def aschedule_redelivery(self, job_id: str, base_delay: float) -> bool:
+        """콜백 재전송 비동기 예약"""
+        return await asyncio.to_thread(self.schedule_redelivery, job_id, base_delay)
+
+    async def aschedule_retry(self, job_id: str, base_delay: float) -> bool:
+        """실행 재시도 비동기 예약"""
+        return await asyncio.to_thread(self.schedule_retry, job_id, base_delay)
+
+    async def arelease(self, job_id: str) -> None:
+        """작업 비동기 반환"""
+        await asyncio.to_thread(self.release, job_id)
+
+    async def aget(self, job_id: str) -> Job | None:
+        """작업 비동기 조회"""
+        return await asyncio.to_thread(self.get, job_id)
+
+    async def adepth(self) -> dict[tuple[str, str], int]:
+        """미완료 작업 수 비동기 집계"""
+        return await asyncio.to_thread(self.depth)
+
+    async def arecord_event(
+        self, job_id: str, event: str, data: dict[str, Any] | None = None
+    ) -> int:
+        """작업 진행 이벤트 비동기 기록"""
+        return await asyncio.to_thread(self.record_event, job_id, event, data)
+
+    async def alist_events(
+        self, job_id: str, after_id: int = 0, limit: int = 100
+    ) -> list[JobEvent]:
+        """작업 진행 이벤트 비동기 조회"""
+        return await asyncio.to_thread(self.list_events, job_id, after_id, limit)
+
+    def close(self) -> None:
+        """SQLite 연결 종료"""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+_job_queue: JobQueue | None = None
+
+
+def get_job_queue() -> JobQueue:
+    """작업 큐 지연 초기화 싱글턴"""
+    global _job_queue
+    if _job_queue is None:
+        _job_queue = JobQueue(
+            settings.job_queue_path,
+            visibility_timeout=settings.job_visibility_timeout,
+            max_deliveries=settings.job_callback_max_deliveries,
+            retention_seconds=settings.job_queue_retention,
+            payload_secret=settings.job_queue_payload_secret or settings.ai_callback_secret,
+        )
+    return _job_queue
+
+
+def close_job_queue() -> None:
+    """작업 큐 종료"""
+    global _job_queue
+    if _job_queue is not None:
+        _job_queue.close()
+        _job_queue = None
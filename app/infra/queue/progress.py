@@ -0,0 +1,128 @@
+"""작업 진행 이벤트
+
+워커가 작업 실행 동안 컨텍스트에 기록기를 설정하면 워크플로우 노드가 emit_progress로
+단계별 이벤트를 남긴다. 이벤트는 작업 큐 SQLite에 저장되어 SSE로 중계되고,
+설정 시 중간 콜백으로도 전송된다. elapsed_s가 담긴 이벤트는 단계별 소요 시간 히스토그램에 기록한다
+저장은 스레드에서 하되 이벤트 순서를 지키도록 앞선 저장이 끝난 뒤 다음 저장을 시작한다
+"""
+
+import asyncio
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any
+
+import httpx
+from prometheus_client import Histogram
+
+from app.core.config import settings
+from app.core.logging import get_logger
+from app.infra.queue.job_queue import JobQueue
+
+logger = get_logger(__name__)
+
+JOB_STAGE_SECONDS = Histogram(
+    "job_stage_seconds",
+    "작업 진행 이벤트별 단계 소요 시간",
+    ["event"],
+    buckets=(0.1, 0.5, 1, 2, 5, 10, 30, 60, 120, 300),
+)
+
+ProgressSink = Callable[[str, dict[str, Any]], None]
+
+_progress_sink: ContextVar[ProgressSink | None] = ContextVar("progress_sink", default=None)
+_pending_callbacks: set[asyncio.Task] = set()
+
+
+def emit_progress(event: str, **data: Any) -> None:
+    """현재 작업의 진행 이벤트 기록, 작업 컨텍스트 밖이면 무시
+
+    진행 이벤트 기록 실패가 작업 자체를 실패시키지 않도록 예외는 로그만 남긴다
+    """
+    sink = _progress_sink.get()
+    if sink is None:
+        return
+    try:
+        sink(event, data)
+    except Exception as e:
+        logger.warning("진행 이벤트 기록 실패", progress_event=event, error=str(e))
+
+
+@contextmanager
+def progress_scope(sink: ProgressSink) -> Iterator[None]:
+    """블록 안에서 실행되는 코드(하위 태스크 포함)의 진행 이벤트를 sink로 전달"""
+    token = _progress_sink.set(sink)
+    try:
+        yield
+    finally:
+        _progress_sink.reset(token)
+
+
+class JobProgressRecorder:
+    """진행 이벤트를 작업 큐에 저장하고, callback_url이 있으면 중간 콜백으로 전송"""
+
+    def __init__(self, queue: JobQueue, job_id: str, callback_url: str = ""):
+        self._queue = queue
+        self._job_id = job_id
+        self._callback_url = callback_url
+        self._pending: asyncio.Task | None = None
+
+    def __call__(self, event: str, data: dict[str, Any]) -> None:
+        elapsed = data.get("elapsed_s")
+        if isinstance(elapsed, int | float):
+            JOB_STAGE_SECONDS.labels(event=event).observe(elapsed)
+        self._pending = asyncio.get_running_loop().create_task(
+            self._record(self._pending, event, data)
+        )
+
+    async def flush(self) -> None:
+        """지금까지 요청된 이벤트 저장 완료 대기"""
+        if self._pending is not None:
+            await self._pending
+
+    async def _record(
+        self, previous: asyncio.Task | None, event: str, data: dict[str, Any]
+    ) -> None:
+        """앞선 이벤트 저장 후 이벤트 저장과 중간 콜백 예약, 저장 실패는 로그만 남김"""
+        if previous is not None:
+            await previous
+        try:
+            event_id = await self._queue.arecord_event(self._job_id, event, data)
+        except Exception as e:
+            logger.warning("진행 이벤트 기록 실패", progress_event=event, error=str(e))
+            return
+        if self._callback_url:
+            payload = {
+                "jobId": self._job_id,
+                "eventId": event_id,
+                "event": event,
+                "data": data,
+                "timestamp": time.time(),
+            }
+            task = asyncio.get_running_loop().create_task(
+                _send_progress_callback(self._callback_url, payload)
+            )
+            _pending_callbacks.add(task)
+            task.add_done_callback(_pending_callbacks.discard)
+
+
+async def _send_progress_callback(url: str, payload: dict[str, Any]) -> None:
+    """중간 콜백 1회 전송, 진행 알림은 최종 콜백과 달리 재시도하지 않음"""
+    try:
+        async with httpx.AsyncClient(timeout=settings.callback_timeout) as client:
+            response = await client.post(
+                url,
+                json=payload,
+                headers={"X-AI-Callback-Secret": settings.ai_callback_secret},
+            )
+        if response.status_code >= 300:
+            logger.warning(
+                "진행 콜백 응답 오류",
+                progress_event=payload["event"],
+                status_code=response.status_code,
+            )
+    except httpx.RequestError as e:
+        logger.warning(
+            "진행 콜백 요청 실패", progress_event=payload["event"], error=type(e).__name__
+        )
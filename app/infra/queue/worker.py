@@ -0,0 +1,226 @@
+"""작업 큐 워커 풀
+
+설정된 동시성만큼 워커가 큐에서 작업을 임대해 실행하고 콜백을 전송한다
+실행 중에는 임대 만료 시간의 1/3 간격으로 임대를 연장한다
+처리 중 예외가 난 작업은 시도 횟수를 유지한 채 지수 백오프 후 다시 실행하고,
+시도 한도를 넘기면 실패 페이로드를 전송한다. 종료로 취소된 작업만 시도 횟수를 되돌린다
+큐 접근은 비동기 메서드로 하여 SQLite 쓰기 잠금 대기가 이벤트 루프를 막지 않는다
+작업 실행 구간에는 진행 이벤트 기록기를 설정하여 단계별 이벤트를 남긴다
+"""
+
+import asyncio
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from typing import Any
+
+from prometheus_client import Counter, Gauge, Histogram
+
+from app.core.context import set_job_id
+from app.core.logging import get_logger
+from app.infra.queue.job_queue import Job, JobQueue
+from app.infra.queue.progress import JobProgressRecorder, progress_scope
+
+logger = get_logger(__name__)
+
+JOB_QUEUE_DEPTH = Gauge(
+    "job_queue_depth",
+    "상태별 미완료 작업 수",
+    ["kind", "status"],
+)
+JOB_QUEUE_WAIT_SECONDS = Histogram(
+    "job_queue_wait_seconds",
+    "작업 등록부터 첫 실행까지 대기 시간",
+    ["kind"],
+    buckets=(0.1, 0.5, 1, 2, 5, 10, 30, 60, 120, 300, 600),
+)
+JOB_QUEUE_JOBS_TOTAL = Counter(
+    "job_queue_jobs_total",
+    "작업 처리 결과 (delivered, redelivery, retry, dead, exhausted, unknown_kind)",
+    ["kind", "outcome"],
+)
+
+DeliverFn = Callable[[str, dict, str], Awaitable[bool]]
+
+
+@dataclass
+class JobHandler:
+    """작업 종류별 실행 함수와 재시도 한도 초과 시 실패 페이로드 생성 함수"""
+
+    run: Callable[[str, dict[str, Any]], Awaitable[dict]]
+    on_exhausted: Callable[[str, dict[str, Any]], Awaitable[dict]]
+
+
+class JobWorkerPool:
+    """큐에서 작업을 가져와 실행하는 고정 크기 워커 풀"""
+
+    def __init__(
+        self,
+        queue: JobQueue,
+        handlers: dict[str, JobHandler],
+        deliver: DeliverFn,
+        concurrency: int = 10,
+        max_attempts: int = 3,
+        redelivery_delay: float = 30.0,
+        retry_delay: float = 10.0,
+        poll_interval: float = 1.0,
+        progress_callback_url: str = "",
+    ):
+        self._queue = queue
+        self._handlers = handlers
+        self._deliver = deliver
+        self._concurrency = concurrency
+        self._max_attempts = max_attempts
+        self._redelivery_delay = redelivery_delay
+        self._retry_delay = retry_delay
+        self._poll_interval = poll_interval
+        self._progress_callback_url = progress_callback_url
+        self._workers: list[asyncio.Task] = []
+        self._stopping = False
+
+    def start(self) -> None:
+        """워커 시작, 이전 프로세스가 남긴 미완료 작업도 임대 만료 후 이어서 처리"""
+        self._stopping = False
+        self._report_depth()
+        pruned = self._queue.prune()
+        logger.info(
+            "작업 워커 풀 시작",
+            concurrency=self._concurrency,
+            pending=sum(self._queue.depth().values()),
+            pruned=pruned,
+        )
+        self._workers = [
+            asyncio.create_task(self._worker_loop(), name=f"job-worker-{i}")
+            for i in range(self._concurrency)
+        ]
+        self._workers.append(asyncio.create_task(self._monitor_loop(), name="job-monitor"))
+
+    async def stop(self, timeout: float = 30.0) -> None:
+        """워커 중지, 실행 중이던 작업은 큐로 반환되어 재시작 후 다시 실행"""
+        self._stopping = True
+        for worker in self._workers:
+            worker.cancel()
+        if self._workers:
+            try:
+                await asyncio.wait_for(
+                    asyncio.gather(*self._workers, return_exceptions=True), timeout=timeout
+                )
+            except TimeoutError:
+                logger.warning("작업 워커 종료 타임아웃", timeout=timeout)
+        self._workers = []
+
+    async def _worker_loop(self) -> None:
+        while not self._stopping:
+            job = await self._queue.aclaim()
+            if job is None:
+                await self._queue.wait_for_job(self._poll_interval)
+                continue
+            try:
+                await self._process(job)
+            except asyncio.CancelledError:
+                await asyncio.shield(self._queue.arelease(job.job_id))
+                logger.info("실행 중인 작업 반환", job_id=job.job_id)
+                raise
+            except Exception:
+                logger.error("작업 처리 중 예외", job_id=job.job_id, exc_info=True)
+                try:
+                    await self._retry_failed(job)
+                except Exception:
+                    # 예약하지 못한 작업은 임대 만료 후 시도 횟수를 늘려 다시 실행된다
+                    logger.error("작업 재시도 예약 실패", job_id=job.job_id, exc_info=True)
+
+    async def _retry_failed(self, job: Job) -> None:
+        """예외가 난 작업을 백오프 후 재시도하도록 예약, 실패 페이로드 처리도 실패했으면 dead"""
+        if job.status == "running" and job.attempts > self._max_attempts:
+            await self._queue.amark_dead(job.job_id)
+            await self._queue.arecord_event(job.job_id, "dead", {"reason": "exhausted_failed"})
+            JOB_QUEUE_JOBS_TOTAL.labels(kind=job.kind, outcome="dead").inc()
+        elif await self._queue.aschedule_retry(job.job_id, self._retry_delay):
+            await self._queue.arecord_event(job.job_id, "retry_scheduled")
+            JOB_QUEUE_JOBS_TOTAL.labels(kind=job.kind, outcome="retry").inc()
+        else:
+            await self._queue.arecord_event(job.job_id, "dead")
+            JOB_QUEUE_JOBS_TOTAL.labels(kind=job.kind, outcome="dead").inc()
+
+    async def _monitor_loop(self) -> None:
+        """큐 깊이 게이지 주기적 갱신"""
+        while not self._stopping:
+            self._set_depth(await self._queue.adepth())
+            await asyncio.sleep(self._poll_interval * 5)
+
+    async def _heartbeat(self, job_id: str) -> None:
+        interval = self._queue.visibility_timeout / 3
+        while True:
+            await asyncio.sleep(interval)
+            await self._queue.aheartbeat(job_id)
+
+    async def _process(self, job: Job) -> None:
+        """작업 실행 결과를 저장한 뒤 콜백 전송"""
+        set_job_id(job.job_id)
+        handler = self._handlers.get(job.kind)
+        if handler is None:
+            logger.error("등록되지 않은 작업 종류", kind=job.kind)
+            JOB_QUEUE_JOBS_TOTAL.labels(kind=job.kind, outcome="unknown_kind").inc()
+            await self._queue.amark_dead(job.job_id)
+            await self._queue.arecord_event(job.job_id, "dead", {"reason": "unknown_kind"})
+            return
+
+        heartbeat = asyncio.create_task(self._heartbeat(job.job_id))
+        try:
+            result = job.result
+            if job.status == "running":
+                recorder = JobProgressRecorder(self._queue, job.job_id, self._progress_callback_url)
+                if job.attempts == 1:
+                    wait = time.time() - job.enqueued_at
+                    JOB_QUEUE_WAIT_SECONDS.labels(kind=job.kind).observe(wait)
+                if job.attempts > self._max_attempts:
+                    logger.warning("작업 재시도 한도 초과", attempts=job.attempts)
+                    JOB_QUEUE_JOBS_TOTAL.labels(kind=job.kind, outcome="exhausted").inc()
+                    recorder("exhausted", {"attempts": job.attempts})
+                    result = await handler.on_exhausted(job.job_id, job.payload)
+                    await recorder.flush()
+                else:
+                    logger.info("작업 시작", kind=job.kind, attempt=job.attempts)
+                    recorder(
+                        "started",
+                        {
+                            "attempt": job.attempts,
+                            "queued_s": round(time.time() - job.enqueued_at, 3),
+                        },
+                    )
+                    started = time.monotonic()
+                    with progress_scope(recorder):
+                        result = await handler.run(job.job_id, job.payload)
+                    recorder("finished", {"elapsed_s": round(time.monotonic() - started, 3)})
+                    await recorder.flush()
+                await self._queue.acomplete_run(job.job_id, result)
+
+            logger.info("콜백 전송 시작", delivery=job.deliveries + 1)
+            try:
+                delivered = await self._deliver(job.callback_url, result, job.job_id)
+            except Exception as e:
+                logger.error("콜백 전송 실패", error=str(e), exc_info=True)
+                delivered = False
+        finally:
+            heartbeat.cancel()
+
+        if delivered:
+            await self._queue.amark_delivered(job.job_id)
+            await self._queue.arecord_event(job.job_id, "delivered")
+            JOB_QUEUE_JOBS_TOTAL.labels(kind=job.kind, outcome="delivered").inc()
+        elif await self._queue.aschedule_redelivery(job.job_id, self._redelivery_delay):
+            await self._queue.arecord_event(job.job_id, "redelivery_scheduled")
+            JOB_QUEUE_JOBS_TOTAL.labels(kind=job.kind, outcome="redelivery").inc()
+        else:
+            logger.error("콜백 재전송 한도 초과", job_id=job.job_id)
+            await self._queue.arecord_event(job.job_id, "dead")
+            JOB_QUEUE_JOBS_TOTAL.labels(kind=job.kind, outcome="dead").inc()
+
+    def _report_depth(self) -> None:
+        """큐 깊이 게이지 동기 갱신, 워커 시작 시에만 사용"""
+        self._set_depth(self._queue.depth())
+
+    def _set_depth(self, depth: dict[tuple[str, str], int]) -> None:
+        for kind in self._handlers:
+            for status in ("queued", "running", "delivering"):
+                JOB_QUEUE_DEPTH.labels(kind=kind, status=status).set(depth.get((kind, status), 0))
@@ -1,4 +1,3 @@
-import asyncio
 from contextlib import asynccontextmanager
 
 from dotenv import load_dotenv
@@ -10,16 +9,22 @@ from langgraph.checkpoint.sqlite.aio import AsyncSqliteSaver
 from prometheus_fastapi_instrumentator import Instrumentator
 
 from app.api.routers import api_router, api_v2_router
-from app.api.v1.resume import get_background_tasks as get_v1_tasks
-from app.api.v2.resume_edit import get_background_tasks as get_v2_edit_tasks
+from app.api.utils import deliver_callback
+from app.api.v1.resume import GENERATE_JOB_KIND, create_generate_job_handler
+from app.api.v2.resume_edit import EDIT_JOB_KIND, create_edit_job_handler
 from app.core.config import settings
 from app.core.exceptions import register_exception_handlers
 from app.core.logging import get_logger, setup_logging
 from app.core.middleware import RequestLoggingMiddleware
+from app.domain.resume.snapshot_store import close_snapshot_store
+from app.infra.cache.llm_response_cache import close_llm_response_cache
+from app.infra.cache.node_cache import close_node_cache
 from app.infra.github.client import close_client as close_github_client
-from app.infra.llm.base import close_llm_clients
+from app.infra.llm.base import close_llm_clients, warm_structured_runnables
 from app.infra.llm.client import setup_langfuse_env
 from app.infra.qdrant.client import close_client as close_qdrant_client
+from app.infra.queue.job_queue import close_job_queue, get_job_queue
+from app.infra.queue.worker import JobWorkerPool
 from app.infra.s3.client import close_s3_client
 from app.infra.stt.client import close_client as close_stt_client
 
@@ -42,6 +47,10 @@ async def _cleanup_clients():
     for name, close_fn in [
         ("Qdrant", close_qdrant_client),
         ("LLM", close_llm_clients),
+        ("스냅샷 저장소", close_snapshot_store),
+        ("워크플로우 캐시", close_node_cache),
+        ("LLM 응답 캐시", close_llm_response_cache),
+        ("작업 큐", close_job_queue),
     ]:
         try:
             close_fn()
@@ -53,26 +62,32 @@ async def _cleanup_clients():
 async def lifespan(app: FastAPI):
     """앱 시작/종료 이벤트 관리"""
     async with AsyncSqliteSaver.from_conn_string("data/checkpoints.db") as checkpointer:
+        await checkpointer.setup()
+        # WAL 모드에서 노드마다 발생하는 체크포인트 커밋의 fsync 비용을 줄임
+        await checkpointer.conn.execute("PRAGMA synchronous=NORMAL")
         app.state.checkpointer = checkpointer
         logger.info("AsyncSqliteSaver 체크포인터 초기화 완료")
         if settings.is_production:
             missing = settings.validate_for_production()
             if missing:
                 logger.warning("프로덕션 필수 설정 누락", missing=missing)
+        warm_structured_runnables()
+        job_pool = JobWorkerPool(
+            get_job_queue(),
+            handlers={
+                GENERATE_JOB_KIND: create_generate_job_handler(checkpointer),
+                EDIT_JOB_KIND: create_edit_job_handler(checkpointer),
+            },
+            deliver=deliver_callback,
+            concurrency=settings.job_worker_concurrency,
+            max_attempts=settings.job_max_attempts,
+            redelivery_delay=settings.job_callback_redelivery_delay,
+            retry_delay=settings.job_retry_delay,
+            progress_callback_url=settings.job_progress_callback_url,
+        )
+        job_pool.start()
         yield
-        tasks = get_v1_tasks() | get_v2_edit_tasks()
-        if tasks:
-            logger.info("진행 중인 작업 종료 대기", count=len(tasks))
-            for task in tasks:
-                task.cancel()
-            try:
-                await asyncio.wait_for(
-                    asyncio.gather(*tasks, return_exceptions=True),
-                    timeout=30.0,
-                )
-                logger.info("모든 작업 종료 완료")
-            except TimeoutError:
-                logger.warning("작업 종료 타임아웃 - 30초 초과")
+        await job_pool.stop(timeout=30.0)
         await _cleanup_clients()
 
 
@@ -4,6 +4,12 @@ from unittest.mock import patch
 import pytest
 
 os.environ["LANGCHAIN_TRACING_V2"] = "false"
+os.environ["GITHUB_CACHE_ENABLED"] = "false"
+os.environ["RESUME_SNAPSHOT_ENABLED"] = "false"
+os.environ["WORKFLOW_CACHE_PATH"] = ":memory:"
+os.environ["JOB_QUEUE_PATH"] = ":memory:"
+os.environ["LLM_RESPONSE_CACHE_ENABLED"] = "false"
+os.environ["LLM_RESPONSE_CACHE_PATH"] = ":memory:"
 from httpx import ASGITransport, AsyncClient
 
 from app.domain.resume.schemas import (
@@ -1,12 +1,17 @@
 import asyncio
+import json
 from unittest.mock import AsyncMock, patch
 
+from langchain_core.language_models.fake_chat_models import GenericFakeChatModel
+from langchain_core.messages import AIMessage
+
 from app.domain.interview.chat_schemas import ChatOutput
 from app.domain.interview.store import (
     InterviewContextStore,
     QuestionContext,
     SessionMeta,
 )
+from app.infra.llm.base import _JsonStringFieldStream, _stream_json_llm
 
 SAMPLE_CHAT_OUTPUT = ChatOutput(
     message="좋은 답변입니다",
@@ -461,6 +466,169 @@ class TestMultiturnWorkflow:
         assert workflow is not None
 
 
+def _parse_sse(text: str) -> list[tuple[str, dict]]:
+    """SSE 응답 본문을 (event, data) 목록으로 변환"""
+    events = []
+    for message in text.strip().split("\n\n"):
+        fields = dict(line.split(": ", 1) for line in message.splitlines())
+        events.append((fields["event"], json.loads(fields["data"])))
+    return events
+
+
+class TestMessageTokenStream:
+    """JSON 출력에서 message 토큰 스트리밍 테스트."""
+
+    def test_decodes_field_across_chunk_boundaries(self):
+        """이스케이프가 청크 경계에서 잘려도 디코딩된 값만 순서대로 전달."""
+        raw = '{"message": "줄\\n바꿈 \\"인용\\" \\uac00\\\\끝", "follow_up_question": "다음"}'
+        stream = _JsonStringFieldStream("message")
+
+        deltas = [stream.feed(raw[i : i + 3]) for i in range(0, len(raw), 3)]
+
+        assert "".join(deltas) == '줄\n바꿈 "인용" 가\\끝'
+        assert all("\\u" not in d for d in deltas)
+
+    def test_ignores_other_fields(self):
+        """다른 필드 값은 전달하지 않음."""
+        stream = _JsonStringFieldStream("message")
+
+        out = stream.feed('{"follow_up_question": "질문", ') + stream.feed('"message": "답"}')
+
+        assert out == "답"
+
+    async def test_stream_json_llm_returns_validated_output(self):
+        """토큰을 전달하면서 최종 출력은 구조화 타입으로 검증하여 반환."""
+        payload = '{"message": "좋은 답변 입니다", "follow_up_question": "왜 그렇게 했나요?"}'
+        llm = GenericFakeChatModel(messages=iter([AIMessage(content=payload)]))
+        deltas: list[str] = []
+
+        result = await _stream_json_llm(
+            llm=llm,
+            output_type=ChatOutput,
+            system_prompt="system",
+            human_content="human",
+            config={},
+            stream_field="message",
+            on_delta=deltas.append,
+        )
+
+        assert len(deltas) > 1
+        assert "".join(deltas) == "좋은 답변 입니다"
+        assert result == ChatOutput(
+            message="좋은 답변 입니다", follow_up_question="왜 그렇게 했나요?"
+        )
+
+
+class TestChatStreaming:
+    """면접 채팅 토큰 스트리밍 테스트."""
+
+    async def test_agent_streams_tokens_and_commits_checkpoint(self):
+        """워크플로우 실행 중 메시지 토큰을 전달하고 턴을 체크포인트에 기록."""
+        from langgraph.checkpoint.memory import MemorySaver
+
+        from app.domain.interview.chat_agent import run_chat_agent
+
+        async def fake_generate(**kwargs):
+            for token in ["좋은 ", "답변", "입니다"]:
+                kwargs["on_message_delta"](token)
+            return ChatOutput(
+                message="좋은 답변입니다",
+                follow_up_question="구체적으로요?",
+                follow_up_intent="깊이 확인",
+            )
+
+        checkpointer = MemorySaver()
+        deltas: list[str] = []
+        with (
+            patch("app.domain.interview.chat_agent._chat_workflow", None),
+            patch(
+                "app.domain.interview.chat_workflow.generate_chat_response",
+                side_effect=fake_generate,
+            ),
+        ):
+            result, error, turn_count = await run_chat_agent(
+                resume_json='{"projects": []}',
+                position="백엔드 개발자",
+                interview_type="technical",
+                question_text="질문",
+                question_intent="의도",
+                related_project=None,
+                answer="답변",
+                thread_id="stream-thread",
+                checkpointer=checkpointer,
+                on_message_delta=deltas.append,
+            )
+
+            from app.domain.interview import chat_agent
+
+            snapshot = await chat_agent._chat_workflow.aget_state(
+                {"configurable": {"thread_id": "stream-thread"}}
+            )
+
+        assert deltas == ["좋은 ", "답변", "입니다"]
+        assert error is None
+        assert turn_count == 1
+        assert result.follow_up_intent == "깊이 확인"
+        assert snapshot.next == ("wait_for_user",)
+        assert snapshot.values["messages"][-1] == {"role": "ai", "content": "좋은 답변입니다"}
+
+    async def test_stream_endpoint_sends_tokens_then_done(self, async_client):
+        """message_delta 이벤트 뒤에 구조화 필드를 담은 done 이벤트 전송."""
+        mock_store = InterviewContextStore()
+        _setup_store(mock_store)
+
+        async def fake_agent(**kwargs):
+            kwargs["on_message_delta"]("좋은 ")
+            kwargs["on_message_delta"]("답변입니다")
+            return (
+                ChatOutput(
+                    message="좋은 답변입니다",
+                    follow_up_question="성능은 어떻게 측정했나요?",
+                    follow_up_intent="측정 방법 확인",
+                ),
+                None,
+                1,
+            )
+
+        with (
+            patch("app.api.v2.chat.interview_context_store", mock_store),
+            patch("app.api.v2.chat.run_chat_agent", side_effect=fake_agent),
+        ):
+            response = await async_client.post(
+                "/api/v2/interview/chat/stream",
+                json=SAMPLE_CHAT_REQUEST,
+            )
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/event-stream")
+        events = _parse_sse(response.text)
+        assert events[:2] == [
+            ("message_delta", {"delta": "좋은 "}),
+            ("message_delta", {"delta": "답변입니다"}),
+        ]
+        name, done = events[-1]
+        assert name == "done"
+        assert done["status"] == "success"
+        assert done["message"] == "좋은 답변입니다"
+        assert done["followUpQuestion"] == "성능은 어떻게 측정했나요?"
+        assert done["followUpIntent"] == "측정 방법 확인"
+        assert done["turnNumber"] == 1
+        assert mock_store.get("test-session-001").get("q-test-001-fu1") is not None
+
+    async def test_stream_endpoint_session_expired(self, async_client):
+        """세션이 없으면 실패 상태의 done 이벤트만 전송."""
+        with patch("app.api.v2.chat.interview_context_store", InterviewContextStore()):
+            response = await async_client.post(
+                "/api/v2/interview/chat/stream",
+                json=SAMPLE_CHAT_REQUEST,
+            )
+
+        events = _parse_sse(response.text)
+        assert [name for name, _ in events] == ["done"]
+        assert events[0][1]["status"] == "failed"
+        assert events[0][1]["error"]["message"] == "면접 세션이 만료되었습니다"
+
+
 class TestInterviewContextStore:
     """InterviewContextStore 유닛 테스트"""
 
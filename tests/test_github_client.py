@@ -1,5 +1,11 @@
+import json
+import threading
+
+import httpx
 import pytest
 
+from app.infra.github import client as client_module
+from app.infra.github.cache import GitHubResponseCache
 from app.infra.github.client import _sanitize_file_path, parse_repo_url
 
 
@@ -75,3 +81,416 @@ class TestSanitizeFilePath:
         """특수문자가 포함된 경로는 ValueError 발생."""
         with pytest.raises(ValueError, match="유효하지 않은 파일 경로"):
             _sanitize_file_path(invalid_path)
+
+
+class TestConditionalRequestCache:
+    """_get_json 조건부 요청 캐시 테스트."""
+
+    @pytest.fixture
+    def cached_client(self, tmp_path, monkeypatch):
+        """MockTransport와 임시 SQLite 캐시로 GitHub 클라이언트 구성."""
+        requests: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            if request.headers.get("If-None-Match") == '"v1"':
+                return httpx.Response(304)
+            return httpx.Response(200, json={"Python": 100}, headers={"ETag": '"v1"'})
+
+        monkeypatch.setattr(client_module.settings, "github_cache_enabled", True)
+        monkeypatch.setattr(
+            client_module,
+            "_response_cache",
+            GitHubResponseCache(str(tmp_path / "cache.db"), max_entries=10),
+        )
+        monkeypatch.setattr(
+            client_module, "_client", httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        )
+        yield requests
+        client_module._response_cache.close()
+
+    async def test_serves_304_from_cache(self, cached_client):
+        """두 번째 요청은 If-None-Match를 보내고 304면 캐시 본문 반환."""
+        url = "https://api.github.com/repos/user/repo/languages"
+
+        first = await client_module._get_json(url, "token-a")
+        second = await client_module._get_json(url, "token-a")
+
+        assert first == second == {"Python": 100}
+        assert "If-None-Match" not in cached_client[0].headers
+        assert cached_client[1].headers["If-None-Match"] == '"v1"'
+
+    async def test_cache_is_scoped_by_token(self, cached_client):
+        """토큰이 다르면 캐시를 공유하지 않음."""
+        url = "https://api.github.com/repos/user/repo/languages"
+
+        await client_module._get_json(url, "token-a")
+        await client_module._get_json(url, "token-b")
+
+        assert "If-None-Match" not in cached_client[1].headers
+
+
+class TestGitHubResponseCache:
+    """GitHubResponseCache 테스트."""
+
+    def test_evicts_least_recently_accessed(self, tmp_path):
+        """최대 개수 초과 시 가장 오래 접근하지 않은 항목 제거."""
+        cache = GitHubResponseCache(str(tmp_path / "cache.db"), max_entries=2, prune_interval=1)
+        cache.put("a", '"a"', None, {"v": 1})
+        cache.put("b", '"b"', None, {"v": 2})
+        cache.touch("a")
+        cache.put("c", '"c"', None, {"v": 3})
+
+        assert cache.get("a") is not None
+        assert cache.get("b") is None
+        assert cache.get("c").body == {"v": 3}
+        cache.close()
+
+    def test_prunes_once_per_interval(self, tmp_path):
+        """최대 개수 초과분은 저장할 때마다가 아니라 prune_interval회마다 정리."""
+        cache = GitHubResponseCache(str(tmp_path / "cache.db"), max_entries=1, prune_interval=3)
+        cache.put("a", '"a"', None, {"v": 1})
+        cache.put("b", '"b"', None, {"v": 2})
+
+        assert cache.get("a") is not None
+
+        cache.put("c", '"c"', None, {"v": 3})
+
+        assert cache.get("a") is None
+        assert cache.get("b") is None
+        assert cache.get("c") is not None
+        cache.close()
+
+    async def test_async_methods_run_off_event_loop(self, tmp_path, monkeypatch):
+        """비동기 메서드는 SQLite 접근을 스레드에서 실행."""
+        cache = GitHubResponseCache(str(tmp_path / "cache.db"))
+        threads: list[str] = []
+        get = cache.get
+
+        def tracking_get(key):
+            threads.append(threading.current_thread().name)
+            return get(key)
+
+        monkeypatch.setattr(cache, "get", tracking_get)
+        await cache.aput("a", '"a"', None, {"v": 1})
+        await cache.atouch("a")
+
+        assert (await cache.aget("a")).body == {"v": 1}
+        assert threads and threads[0] != threading.main_thread().name
+        cache.close()
+
+
+class TestReposBatchGraphql:
+    """get_repos_batch_graphql 배치 조회 테스트."""
+
+    @pytest.fixture
+    def graphql_requests(self, monkeypatch):
+        """repo1 별칭만 실패하는 GraphQL 응답을 반환하는 MockTransport."""
+        requests: list[dict] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            body = json.loads(request.content)
+            requests.append(body)
+            return httpx.Response(
+                200,
+                json={
+                    "data": {
+                        "repo0": {
+                            "description": "첫 번째 레포",
+                            "repositoryTopics": {"nodes": [{"topic": {"name": "python"}}]},
+                            "languages": {"edges": [{"size": 10, "node": {"name": "Python"}}]},
+                            "object": None,
+                            "defaultBranchRef": None,
+                            "pullRequests": {"nodes": []},
+                        },
+                        "repo1": None,
+                    },
+                    "errors": [{"type": "NOT_FOUND", "path": ["repo1"], "message": "없음"}],
+                },
+            )
+
+        monkeypatch.setattr(
+            client_module, "_client", httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        )
+        return requests
+
+    async def test_failed_repo_degrades_only_itself(self, graphql_requests):
+        """한 레포 실패는 해당 레포만 예외로 반환하고 나머지는 한 번의 요청으로 조회."""
+        urls = ["https://github.com/user/ok", "https://github.com/user/missing"]
+
+        results = await client_module.get_repos_batch_graphql(urls, "token")
+
+        assert len(graphql_requests) == 1
+        assert graphql_requests[0]["variables"]["repo1"] == "missing"
+        assert isinstance(results[urls[1]], ValueError)
+        context = await client_module.get_repo_context(urls[0], "token", results[urls[0]])
+        assert context["description"] == "첫 번째 레포"
+        assert context["languages"] == {"Python": 10}
+
+    def test_split_respects_node_budget(self, monkeypatch):
+        """추정 노드 수 상한을 넘지 않도록 배치 분할."""
+        monkeypatch.setattr(client_module.settings, "github_graphql_batch_max_repos", 5)
+        monkeypatch.setattr(client_module.settings, "github_graphql_batch_max_nodes", 250)
+        urls = [f"https://github.com/user/repo{i}" for i in range(5)]
+
+        batches = client_module._split_repo_batches(urls, commits_count=50, prs_count=50)
+
+        assert [len(batch) for batch in batches] == [2, 2, 1]
+
+
+class TestPullDetails:
+    """get_pulls_extended PR 상세 일괄 조회 테스트."""
+
+    PULLS = [
+        {
+            "number": n,
+            "title": f"PR {n}",
+            "body": None,
+            "user": {"login": "tester"},
+            "merged_at": "2024-01-01T00:00:00Z",
+            "updated_at": "2024-01-02T00:00:00Z",
+        }
+        for n in (1, 2, 3)
+    ]
+
+    @pytest.fixture
+    def requests(self, monkeypatch):
+        """PR 목록 REST, 상세 GraphQL/REST 응답을 반환하는 MockTransport."""
+        requests: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            if request.url.path.endswith("/graphql"):
+                return httpx.Response(
+                    200,
+                    json={
+                        "data": {
+                            "repository": {
+                                f"pr{n}": {
+                                    "additions": n * 10,
+                                    "deletions": n,
+                                    "commits": {"totalCount": n},
+                                }
+                                for n in (1, 2, 3)
+                            }
+                        }
+                    },
+                )
+            if request.url.path.endswith("/pulls"):
+                return httpx.Response(200, json=self.PULLS)
+            number = int(request.url.path.rsplit("/", 1)[-1])
+            return httpx.Response(200, json={"commits": number, "additions": 1, "deletions": 2})
+
+        monkeypatch.setattr(
+            client_module, "_client", httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        )
+        monkeypatch.setattr(client_module, "_pull_detail_cache", client_module.OrderedDict())
+        return requests
+
+    async def test_token_uses_single_graphql_query(self, requests):
+        """토큰이 있으면 PR 개수와 무관하게 GraphQL 한 번으로 상세 조회."""
+        prs = await client_module.get_pulls_extended("https://github.com/user/repo", "token")
+
+        paths = [r.url.path for r in requests]
+        assert paths.count("/graphql") == 1
+        assert not any("/pulls/" in path for path in paths)
+        assert [(pr.commits_count, pr.additions) for pr in prs] == [(1, 10), (2, 20), (3, 30)]
+
+    async def test_anonymous_reuses_cached_details(self, requests):
+        """토큰이 없으면 REST로 조회하고, 같은 updated_at의 PR은 캐시 재사용."""
+        url = "https://github.com/user/repo"
+
+        first = await client_module.get_pulls_extended(url)
+        detail_calls = sum("/pulls/" in r.url.path for r in requests)
+        second = await client_module.get_pulls_extended(url)
+
+        assert detail_calls == 3
+        assert sum("/pulls/" in r.url.path for r in requests) == 3
+        assert [pr.commits_count for pr in second] == [pr.commits_count for pr in first]
+
+    async def test_failed_rest_detail_propagates(self, monkeypatch):
+        """REST 상세 조회가 실패하면 PR을 빼지 않고 예외를 전달, 성공한 상세는 캐시."""
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.url.path.endswith("/pulls"):
+                return httpx.Response(200, json=self.PULLS)
+            number = int(request.url.path.rsplit("/", 1)[-1])
+            if number == 2:
+                return httpx.Response(404, json={"message": "Not Found"})
+            return httpx.Response(200, json={"commits": number, "additions": 1, "deletions": 2})
+
+        monkeypatch.setattr(
+            client_module, "_client", httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        )
+        monkeypatch.setattr(client_module, "_pull_detail_cache", client_module.OrderedDict())
+
+        with pytest.raises(httpx.HTTPStatusError):
+            await client_module.get_pulls_extended("https://github.com/user/repo")
+
+        assert len(client_module._pull_detail_cache) == 2
+
+    def test_cache_evicts_least_recently_used(self, monkeypatch):
+        """캐시 크기를 넘으면 가장 오래 사용하지 않은 항목부터 제거."""
+        monkeypatch.setattr(client_module, "_pull_detail_cache", client_module.OrderedDict())
+        monkeypatch.setattr(client_module.settings, "github_pull_detail_cache_size", 2)
+        keys = [("user", "repo", n, "t") for n in (1, 2, 3)]
+
+        client_module._store_pull_detail(keys[0], {"commits": 1})
+        client_module._store_pull_detail(keys[1], {"commits": 2})
+        client_module._cached_pull_detail(keys[0])
+        client_module._store_pull_detail(keys[2], {"commits": 3})
+
+        assert client_module._cached_pull_detail(keys[1]) is None
+        assert client_module._cached_pull_detail(keys[0]) == {"commits": 1}
+
+
+class TestAuthorHistory:
+    """작성자 커밋 서버 측 필터 페이지네이션 테스트."""
+
+    @pytest.fixture
+    def graphql_requests(self, monkeypatch):
+        """페이지마다 커밋 2개(머지 커밋 1개 포함)를 반환하는 MockTransport."""
+        requests: list[dict] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            body = json.loads(request.content)
+            requests.append(body)
+            if "user(login" in body["query"]:
+                return httpx.Response(200, json={"data": {"user": {"id": "U_1"}}})
+            page = len([r for r in requests if "history" in r["query"]])
+            return httpx.Response(
+                200,
+                json={
+                    "data": {
+                        "repository": {
+                            "defaultBranchRef": {
+                                "target": {
+                                    "history": {
+                                        "pageInfo": {
+                                            "hasNextPage": page < 3,
+                                            "endCursor": f"c{page}",
+                                        },
+                                        "nodes": [
+                                            {
+                                                "oid": f"sha{page}",
+                                                "message": f"feat: {page}",
+                                                "author": {"name": "tester"},
+                                                "parents": {"totalCount": 1},
+                                            },
+                                            {
+                                                "oid": f"merge{page}",
+                                                "message": "Merge",
+                                                "author": {"name": "tester"},
+                                                "parents": {"totalCount": 2},
+                                            },
+                                        ],
+                                    }
+                                }
+                            }
+                        }
+                    }
+                },
+            )
+
+        monkeypatch.setattr(
+            client_module, "_client", httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        )
+        monkeypatch.setattr(client_module, "_user_node_ids", client_module.OrderedDict())
+        return requests
+
+    async def test_paginates_with_author_filter(self, graphql_requests):
+        """author id를 서버에 전달하고 커서로 다음 페이지를 이어서 조회."""
+        commits = [
+            commit
+            async for commit in client_module.iter_author_commits(
+                "https://github.com/team/repo", "token", "U_1", target_count=2, max_pages=5
+            )
+        ]
+
+        assert [commit.sha for commit in commits] == ["sha1", "sha2"]
+        assert [r["variables"]["after"] for r in graphql_requests] == [None, "c1"]
+        assert all(r["variables"]["authorId"] == "U_1" for r in graphql_requests)
+
+    async def test_stops_at_page_cap(self, graphql_requests):
+        """목표 개수를 채우지 못해도 최대 페이지 수에서 중단."""
+        commits = [
+            commit
+            async for commit in client_module.iter_author_commits(
+                "https://github.com/team/repo", "token", "U_1", target_count=10, max_pages=2
+            )
+        ]
+
+        assert len(commits) == 2
+        assert len(graphql_requests) == 2
+
+    async def test_user_node_id_resolved_once(self, graphql_requests):
+        """같은 유저네임의 노드 ID는 한 번만 조회."""
+        first = await client_module.get_user_node_id("Tester", "token")
+        second = await client_module.get_user_node_id("tester", "token")
+
+        assert first == second == "U_1"
+        assert len(graphql_requests) == 1
+
+    async def test_user_node_id_cache_is_bounded(self, graphql_requests, monkeypatch):
+        """노드 ID 캐시는 최대 개수를 넘으면 가장 오래 쓰지 않은 유저네임부터 제거."""
+        monkeypatch.setattr(client_module.settings, "github_user_node_id_cache_size", 2)
+
+        for login in ("a", "b", "a", "c"):
+            await client_module.get_user_node_id(login, "token")
+
+        assert list(client_module._user_node_ids) == ["a", "c"]
+
+    async def test_user_node_id_expires_after_ttl(self, graphql_requests, monkeypatch):
+        """TTL이 지난 노드 ID는 다시 조회."""
+        monkeypatch.setattr(client_module.settings, "github_user_node_id_cache_ttl", 0.0)
+
+        await client_module.get_user_node_id("tester", "token")
+        await client_module.get_user_node_id("tester", "token")
+
+        assert len(graphql_requests) == 2
+
+
+class TestFilesContentChunking:
+    """get_files_content_graphql 청크 분할 테스트."""
+
+    def test_chunk_by_alias_count_and_size(self, monkeypatch):
+        """별칭 개수와 blob 크기 합계 상한을 모두 지키도록 분할."""
+        monkeypatch.setattr(client_module.settings, "github_files_batch_max_aliases", 3)
+        monkeypatch.setattr(client_module.settings, "github_files_batch_max_bytes", 1000)
+        paths = [f"pkg{i}/package.json" for i in range(5)] + ["big/build.gradle"]
+        sizes = {path: 100 for path in paths} | {"big/build.gradle": 5000}
+
+        chunks = client_module._chunk_file_paths(paths, sizes)
+
+        assert [len(chunk) for chunk in chunks] == [3, 2, 1]
+        assert chunks[-1] == ["big/build.gradle"]
+
+    async def test_failed_chunk_falls_back_alone(self, monkeypatch):
+        """실패한 청크의 파일만 REST로 재조회."""
+        monkeypatch.setattr(client_module.settings, "github_files_batch_max_aliases", 2)
+        rest_paths: list[str] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.url.path.endswith("/graphql"):
+                query = json.loads(request.content)["query"]
+                if "bad" in query:
+                    return httpx.Response(
+                        200, json={"data": None, "errors": [{"message": "parse error"}]}
+                    )
+                return httpx.Response(
+                    200,
+                    json={"data": {"repository": {"file0": {"text": "a"}, "file1": {"text": "b"}}}},
+                )
+            rest_paths.append(request.url.path.split("/contents/")[-1])
+            return httpx.Response(404)
+
+        monkeypatch.setattr(
+            client_module, "_client", httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        )
+        paths = ["a/package.json", "b/package.json", "bad/package.json"]
+
+        result = await client_module.get_files_content("https://github.com/u/r", paths, "token")
+
+        assert result["a/package.json"] == "a"
+        assert result["b/package.json"] == "b"
+        assert rest_paths == ["bad/package.json"]
@@ -0,0 +1,139 @@
+import subprocess
+
+import pytest
+
+from app.infra.github import client as client_module
+from app.infra.github import local_clone as local_clone_module
+from app.infra.github.local_clone import CloneManager, read_commits, read_files, read_tree_entries
+
+
+def _git(cwd, *args, author="tester"):
+    """fixture 레포에서 git 명령 실행."""
+    env = {
+        "GIT_AUTHOR_NAME": author,
+        "GIT_AUTHOR_EMAIL": f"{author}@example.com",
+        "GIT_COMMITTER_NAME": author,
+        "GIT_COMMITTER_EMAIL": f"{author}@example.com",
+        "HOME": str(cwd),
+        "PATH": "/usr/bin:/bin:/usr/local/bin",
+    }
+    subprocess.run(["git", *args], cwd=cwd, env=env, check=True, capture_output=True)
+
+
+@pytest.fixture
+async def fixture_repo(tmp_path, monkeypatch):
+    """file:// 로 클론할 수 있는 owner/repo fixture 레포."""
+    origin = tmp_path / "origin" / "owner" / "repo.git"
+    work = tmp_path / "work"
+    work.mkdir()
+    _git(work, "init", "-q", "-b", "main")
+    (work / "package.json").write_text('{"dependencies": {"react": "^18.0.0"}}')
+    _git(work, "add", ".")
+    _git(work, "commit", "-q", "-m", "feat: 초기 설정")
+    (work / "app").mkdir()
+    (work / "app" / "main.py").write_text("print('hi')\n")
+    _git(work, "add", ".")
+    _git(work, "commit", "-q", "-m", "feat: 팀원 기능", author="teammate")
+    _git(work, "clone", "-q", "--bare", str(work), str(origin))
+    _git(origin, "config", "uploadpack.allowFilter", "true")
+
+    monkeypatch.setattr(
+        client_module.settings, "github_clone_base_url", f"file://{tmp_path / 'origin'}"
+    )
+    manager = CloneManager(str(tmp_path / "clones"), max_repos=1)
+    monkeypatch.setattr(local_clone_module, "_clone_manager", manager)
+    yield manager
+    await manager.close()
+
+
+class TestLocalClone:
+    """부분 클론 수집 백엔드 테스트."""
+
+    async def test_reads_tree_commits_and_files(self, fixture_repo):
+        """부분 클론에서 트리, 커밋, 파일 내용을 로컬로 조회."""
+        async with fixture_repo.lease("owner", "repo", create=True) as path:
+            entries = await read_tree_entries(path)
+            commits = await read_commits(path, 10)
+            files = await read_files(path, ["package.json", "missing.txt"])
+
+        assert sorted(entry["path"] for entry in entries) == ["app/main.py", "package.json"]
+        assert all(len(entry["sha"]) == 40 for entry in entries)
+        assert [commit.author for commit in commits] == ["teammate", "tester"]
+        assert "react" in files["package.json"]
+        assert files["missing.txt"] is None
+
+    async def test_project_info_uses_clone_when_always(self, fixture_repo, monkeypatch):
+        """always 모드에서는 트리와 커밋을 API 호출 없이 클론에서 조회."""
+        monkeypatch.setattr(client_module.settings, "github_clone_mode", "always")
+        monkeypatch.setattr(client_module, "get_pulls_extended", _no_pulls)
+
+        info = await client_module.get_project_info(
+            "https://github.com/owner/repo", author="tester"
+        )
+        contents = await client_module.get_files_content(
+            "https://github.com/owner/repo", ["package.json"]
+        )
+
+        assert info["file_tree"] == ["app/main.py", "package.json"]
+        assert [commit.message for commit in info["commits"]] == ["feat: 초기 설정"]
+        assert "react" in contents["package.json"]
+
+    async def test_clone_is_blob_filtered(self, fixture_repo):
+        """blob 필터 부분 클론으로 생성."""
+        async with fixture_repo.lease("owner", "repo", create=True) as path:
+            result = subprocess.run(
+                ["git", "config", "remote.origin.partialclonefilter"],
+                cwd=path,
+                capture_output=True,
+                text=True,
+            )
+
+        assert result.stdout.strip() == "blob:none"
+
+    async def test_evicts_oldest_clone(self, fixture_repo, tmp_path):
+        """최대 클론 개수를 넘으면 오래된 클론 디렉토리 삭제."""
+        origin = tmp_path / "origin" / "owner"
+        _git(origin, "clone", "-q", "--bare", str(origin / "repo.git"), str(origin / "other.git"))
+        _git(origin / "other.git", "config", "uploadpack.allowFilter", "true")
+
+        async with fixture_repo.lease("owner", "repo", create=True) as first:
+            pass
+        async with fixture_repo.lease("owner", "other", create=True) as second:
+            pass
+
+        assert not first.exists()
+        assert second.exists()
+        assert await fixture_repo.acquire("owner", "repo") is None
+
+    async def test_clone_is_not_shared_across_tokens(self, fixture_repo):
+        """다른 토큰으로 만든 클론은 재사용하지 않음."""
+        async with fixture_repo.lease("owner", "repo", "token-a", create=True) as path:
+            async with fixture_repo.lease("owner", "repo", "token-a") as same_token:
+                assert same_token == path
+            async with fixture_repo.lease("owner", "repo", "token-b") as other_token:
+                assert other_token is None
+
+    async def test_expired_clone_kept_until_lease_released(self, fixture_repo):
+        """사용 중에 만료된 클론은 점유가 끝난 뒤에 삭제."""
+        async with fixture_repo.lease("owner", "repo", create=True) as path:
+            fixture_repo._ttl = 0.0
+            assert await fixture_repo.acquire("owner", "repo") is None
+            assert path.exists()
+
+        assert not path.exists()
+
+    async def test_auto_mode_skips_small_repo(self, monkeypatch):
+        """auto 모드에서 작은 레포는 클론하지 않음."""
+        monkeypatch.setattr(client_module.settings, "github_clone_mode", "auto")
+        monkeypatch.setattr(client_module.settings, "github_clone_min_size_kb", 1000)
+
+        clone = await client_module._prepare_local_clone(
+            "https://github.com/owner/repo", None, {"diskUsage": 10}
+        )
+
+        assert clone is None
+
+
+async def _no_pulls(*args, **kwargs):
+    """PR 조회 대체."""
+    return []
@@ -0,0 +1,166 @@
+import asyncio
+import time
+
+import httpx
+import pytest
+
+from app.infra.github.rate_limit import PRIORITY_HIGH, PRIORITY_LOW, GitHubRateLimiter
+
+
+def _response(status_code: int = 200, text: str = "", **headers: str) -> httpx.Response:
+    return httpx.Response(status_code, text=text, headers=headers)
+
+
+class TestComputeDelay:
+    """GitHubRateLimiter.compute_delay 테스트."""
+
+    def test_no_delay_without_budget_info(self):
+        """예산 정보가 없으면 대기하지 않음."""
+        limiter = GitHubRateLimiter(max_concurrent=2)
+        assert limiter.compute_delay("token") == 0.0
+
+    def test_waits_for_reset_when_below_reserve(self):
+        """남은 예산이 예비분 이하면 리셋 시각까지 대기."""
+        limiter = GitHubRateLimiter(max_concurrent=2, reserve=10)
+        reset = int(time.time()) + 100
+        limiter.observe(
+            "token",
+            _response(**{"X-RateLimit-Remaining": "5", "X-RateLimit-Reset": str(reset)}),
+        )
+
+        assert 95 < limiter.compute_delay("token") <= 100
+
+    def test_paces_when_budget_is_low(self):
+        """예산이 적으면 리셋까지 남은 시간을 남은 요청 수로 나눠 간격 조절."""
+        limiter = GitHubRateLimiter(max_concurrent=2, reserve=10, pace_threshold=200)
+        reset = int(time.time()) + 100
+        limiter.observe(
+            "token",
+            _response(**{"X-RateLimit-Remaining": "100", "X-RateLimit-Reset": str(reset)}),
+        )
+
+        assert 0.9 < limiter.compute_delay("token") <= 1.0
+
+    def test_budget_is_tracked_per_token(self):
+        """다른 토큰의 예산에는 영향을 주지 않음."""
+        limiter = GitHubRateLimiter(max_concurrent=2, reserve=10)
+        reset = int(time.time()) + 100
+        limiter.observe(
+            "token-a",
+            _response(**{"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": str(reset)}),
+        )
+
+        assert limiter.compute_delay("token-a") > 0
+        assert limiter.compute_delay("token-b") == 0.0
+        assert limiter.compute_delay(None) == 0.0
+
+    @pytest.mark.parametrize(
+        "response, expected_min",
+        [
+            (_response(403, **{"Retry-After": "30"}), 29),
+            (_response(429, **{"Retry-After": "5"}), 4),
+            (_response(403, text="You have exceeded a secondary rate limit"), 59),
+        ],
+    )
+    def test_secondary_limit_blocks(self, response, expected_min):
+        """2차 제한 응답이면 Retry-After 또는 기본 60초 동안 차단."""
+        limiter = GitHubRateLimiter(max_concurrent=2)
+        limiter.observe("token", response)
+
+        assert limiter.compute_delay("token") > expected_min
+
+    def test_graphql_rate_limit_field(self):
+        """GraphQL rateLimit 필드로 graphql 예산 갱신."""
+        limiter = GitHubRateLimiter(max_concurrent=2, reserve=10)
+        limiter.observe_graphql(
+            "token", {"cost": 3, "remaining": 4, "limit": 5000, "resetAt": "2099-01-01T00:00:00Z"}
+        )
+
+        budget = limiter.budget("token", "graphql")
+        assert budget.remaining == 4
+        assert budget.limit == 5000
+        assert limiter.budget("token", "core").remaining is None
+
+
+class TestPriorityScheduling:
+    """동시 실행 슬롯 우선순위 배정 테스트."""
+
+    async def test_high_priority_runs_before_queued_low_priority(self):
+        """슬롯이 비면 먼저 대기한 LOW보다 HIGH 요청을 먼저 실행."""
+        limiter = GitHubRateLimiter(max_concurrent=1)
+        order: list[str] = []
+        release = asyncio.Event()
+
+        async def run(name: str, priority: int, hold: bool = False):
+            async with limiter.acquire("token", priority=priority):
+                order.append(name)
+                if hold:
+                    await release.wait()
+
+        first = asyncio.create_task(run("first", PRIORITY_LOW, hold=True))
+        await asyncio.sleep(0)
+        low = asyncio.create_task(run("low", PRIORITY_LOW))
+        await asyncio.sleep(0)
+        high = asyncio.create_task(run("high", PRIORITY_HIGH))
+        await asyncio.sleep(0)
+
+        release.set()
+        await asyncio.gather(first, low, high)
+
+        assert order == ["first", "high", "low"]
+
+    async def test_concurrency_cap_is_shared_across_tokens(self):
+        """토큰이 달라도 프로세스 전체 동시 실행 수는 max_concurrent를 넘지 않음."""
+        limiter = GitHubRateLimiter(max_concurrent=2)
+        running = peak = 0
+
+        async def run(token: str):
+            nonlocal running, peak
+            async with limiter.acquire(token):
+                running += 1
+                peak = max(peak, running)
+                await asyncio.sleep(0.01)
+                running -= 1
+
+        await asyncio.gather(*(run(f"token-{i}") for i in range(6)))
+
+        assert peak == 2
+
+    async def test_pacing_wait_does_not_hold_slot(self):
+        """예산 대기 중인 토큰은 다른 토큰의 요청을 막지 않음."""
+        limiter = GitHubRateLimiter(max_concurrent=1, max_wait=10.0)
+        limiter.observe("slow", _response(403, **{"Retry-After": "10"}))
+        order: list[str] = []
+
+        async def run(token: str):
+            async with limiter.acquire(token):
+                order.append(token)
+
+        slow = asyncio.create_task(run("slow"))
+        await asyncio.sleep(0)
+        await asyncio.wait_for(run("fast"), timeout=1)
+        slow.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await slow
+
+        assert order == ["fast"]
+
+
+class TestBudgetEviction:
+    """토큰별 예산 보관 한도 테스트."""
+
+    def test_evicts_least_recently_used_token(self):
+        """보관 토큰 수를 넘으면 가장 오래 쓰지 않은 토큰의 예산부터 제거."""
+        limiter = GitHubRateLimiter(max_concurrent=2, reserve=10, max_tokens=2)
+        reset = int(time.time()) + 100
+        for token in ("token-a", "token-b"):
+            limiter.observe(
+                token,
+                _response(**{"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": str(reset)}),
+            )
+
+        limiter.compute_delay("token-a")
+        limiter.compute_delay("token-c")
+
+        assert limiter.compute_delay("token-a") > 0
+        assert limiter.compute_delay("token-b") == 0.0
@@ -0,0 +1,108 @@
+import time
+
+import httpx
+import pytest
+
+from app.infra.github import retry as retry_module
+from app.infra.github.retry import RetryPolicy, send_with_retry
+
+POLICY = RetryPolicy(
+    endpoint_class="rest",
+    max_attempts=3,
+    base_delay=0.5,
+    max_delay=8.0,
+    max_total_wait=30.0,
+)
+
+
+@pytest.fixture
+def sleeps(monkeypatch) -> list[float]:
+    """asyncio.sleep 호출을 기록만 하고 즉시 반환."""
+    recorded: list[float] = []
+
+    async def fake_sleep(delay: float) -> None:
+        recorded.append(delay)
+
+    monkeypatch.setattr(retry_module.asyncio, "sleep", fake_sleep)
+    return recorded
+
+
+def _sender(*outcomes):
+    """미리 정한 응답 또는 예외를 순서대로 반환하는 send 함수 생성."""
+    calls = {"count": 0}
+
+    async def send() -> httpx.Response:
+        outcome = outcomes[calls["count"]]
+        calls["count"] += 1
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+    return send, calls
+
+
+class TestSendWithRetry:
+    """send_with_retry 함수 테스트."""
+
+    async def test_retries_server_error_then_succeeds(self, sleeps):
+        """5xx 응답은 백오프 후 재시도."""
+        send, calls = _sender(httpx.Response(502), httpx.Response(200))
+
+        response = await send_with_retry(send, POLICY)
+
+        assert response.status_code == 200
+        assert calls["count"] == 2
+        assert len(sleeps) == 1
+        assert 0 <= sleeps[0] <= POLICY.base_delay
+
+    async def test_retries_connection_error(self, sleeps):
+        """연결 오류는 재시도."""
+        send, calls = _sender(httpx.ConnectError("reset"), httpx.Response(200))
+
+        response = await send_with_retry(send, POLICY)
+
+        assert response.status_code == 200
+        assert calls["count"] == 2
+
+    async def test_raises_after_max_attempts(self, sleeps):
+        """최대 시도 횟수 이후에도 연결 오류면 예외 전파."""
+        send, calls = _sender(*[httpx.ReadTimeout("timeout")] * 3)
+
+        with pytest.raises(httpx.ReadTimeout):
+            await send_with_retry(send, POLICY)
+
+        assert calls["count"] == 3
+
+    async def test_honors_retry_after(self, sleeps):
+        """2차 rate limit 응답은 Retry-After만큼 대기."""
+        send, _ = _sender(
+            httpx.Response(403, headers={"Retry-After": "7"}),
+            httpx.Response(200),
+        )
+
+        await send_with_retry(send, POLICY)
+
+        assert sleeps == [7.0]
+
+    async def test_gives_up_when_reset_exceeds_budget(self, sleeps):
+        """리셋까지 대기 시간이 예산을 넘으면 재시도 없이 응답 반환."""
+        reset = str(int(time.time()) + 3600)
+        send, calls = _sender(
+            httpx.Response(403, headers={"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": reset})
+        )
+
+        response = await send_with_retry(send, POLICY)
+
+        assert response.status_code == 403
+        assert calls["count"] == 1
+        assert sleeps == []
+
+    @pytest.mark.parametrize("status_code", [401, 404, 422])
+    async def test_does_not_retry_client_errors(self, sleeps, status_code):
+        """일시적이지 않은 4xx 응답은 재시도하지 않음."""
+        send, calls = _sender(httpx.Response(status_code))
+
+        response = await send_with_retry(send, POLICY)
+
+        assert response.status_code == status_code
+        assert calls["count"] == 1
@@ -0,0 +1,128 @@
+import asyncio
+
+import httpx
+import pytest
+
+from app.infra.github import client as client_module
+from app.infra.github.single_flight import SINGLE_FLIGHT_TOTAL, SingleFlight
+
+
+def _count(endpoint: str, outcome: str) -> float:
+    """single-flight 카운터 현재 값."""
+    return SINGLE_FLIGHT_TOTAL.labels(endpoint=endpoint, outcome=outcome)._value.get()
+
+
+class TestSingleFlight:
+    """SingleFlight 요청 병합 테스트."""
+
+    async def test_concurrent_calls_share_one_execution(self):
+        """같은 키의 동시 호출은 한 번만 실행하고 결과 공유."""
+        flight = SingleFlight()
+        calls = 0
+
+        async def fetch():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return {"value": calls}
+
+        before = _count("test", "coalesced")
+        results = await asyncio.gather(*(flight.do("test", "key", fetch) for _ in range(3)))
+
+        assert calls == 1
+        assert results == [{"value": 1}] * 3
+        assert _count("test", "coalesced") - before == 2
+
+    async def test_exception_is_shared_and_not_memoized(self):
+        """실패는 모든 대기자에게 전달되고 다음 호출은 다시 실행."""
+        flight = SingleFlight()
+        calls = 0
+
+        async def fail():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            raise ValueError("boom")
+
+        results = await asyncio.gather(
+            *(flight.do("test", "key", fail, ttl=60) for _ in range(2)), return_exceptions=True
+        )
+        with pytest.raises(ValueError):
+            await flight.do("test", "key", fail, ttl=60)
+
+        assert all(isinstance(result, ValueError) for result in results)
+        assert calls == 2
+
+    async def test_cancelled_caller_does_not_cancel_shared_request(self):
+        """한 호출자가 취소되어도 다른 호출자는 결과를 받음."""
+        flight = SingleFlight()
+
+        async def fetch():
+            await asyncio.sleep(0.02)
+            return "done"
+
+        first = asyncio.create_task(flight.do("test", "key", fetch))
+        second = asyncio.create_task(flight.do("test", "key", fetch))
+        await asyncio.sleep(0)
+        first.cancel()
+
+        assert await second == "done"
+
+    async def test_ttl_memoizes_successful_result(self, monkeypatch):
+        """TTL 안에서는 성공 결과를 재사용하고 만료 후 다시 실행."""
+        flight = SingleFlight()
+        now = [100.0]
+        monkeypatch.setattr("app.infra.github.single_flight.time.monotonic", lambda: now[0])
+        calls = 0
+
+        async def fetch():
+            nonlocal calls
+            calls += 1
+            return calls
+
+        assert await flight.do("test", "key", fetch, ttl=10) == 1
+        assert await flight.do("test", "key", fetch, ttl=10) == 1
+        now[0] += 11
+        assert await flight.do("test", "key", fetch, ttl=10) == 2
+
+
+class TestClientSingleFlight:
+    """GitHub 클라이언트 요청 병합 테스트."""
+
+    @pytest.fixture
+    def requests(self, monkeypatch):
+        """지연 응답을 반환하며 요청을 기록하는 MockTransport."""
+        requests: list[httpx.Request] = []
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            await asyncio.sleep(0.01)
+            if request.url.path == "/user":
+                return httpx.Response(200, json={"login": "tester", "name": "Tester"})
+            return httpx.Response(200, json={"description": "repo", "topics": []})
+
+        monkeypatch.setattr(
+            client_module, "_client", httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        )
+        monkeypatch.setattr(client_module, "_single_flight", SingleFlight())
+        return requests
+
+    async def test_identical_rest_calls_coalesced(self, requests):
+        """동시에 들어온 같은 REST 요청은 한 번만 전송."""
+        url = "https://github.com/user/repo"
+
+        results = await asyncio.gather(
+            *(client_module.get_repo_info(url, "token") for _ in range(3))
+        )
+
+        assert len(requests) == 1
+        assert all(result["description"] == "repo" for result in results)
+
+    async def test_identity_memoized_across_calls(self, requests):
+        """같은 작업 안에서 반복되는 신원 조회는 한 번만 전송."""
+        user = await client_module.get_authenticated_user("token")
+        username = await client_module.get_authenticated_username("token")
+
+        assert user == ("tester", "Tester")
+        assert username == "tester"
+        assert len(requests) == 1
@@ -0,0 +1,441 @@
+import asyncio
+import threading
+import time
+from unittest.mock import patch
+
+from app.infra.queue.job_queue import JobQueue
+from app.infra.queue.progress import emit_progress
+from app.infra.queue.worker import JobHandler, JobWorkerPool
+
+
+def _queue(tmp_path, **kwargs) -> JobQueue:
+    return JobQueue(str(tmp_path / "jobs.db"), **kwargs)
+
+
+async def _empty_result(job_id, payload):
+    return {}
+
+
+async def _failed_result(job_id, payload):
+    return {"status": "failed"}
+
+
+def _expire_lease(queue: JobQueue, job_id: str) -> None:
+    queue._execute(
+        "UPDATE jobs SET lease_expires_at = ? WHERE job_id = ?", (time.time() - 1, job_id)
+    )
+
+
+class TestJobQueue:
+    """JobQueue 테스트."""
+
+    def test_claim_leases_job_once(self, tmp_path):
+        """임대된 작업은 임대 만료 전까지 다시 가져가지 않음."""
+        queue = _queue(tmp_path)
+        queue.enqueue("job-1", "kind", {"a": 1}, "http://cb")
+
+        job = queue.claim()
+
+        assert job.job_id == "job-1"
+        assert job.status == "running"
+        assert job.attempts == 1
+        assert job.payload == {"a": 1}
+        assert queue.claim() is None
+
+    def test_expired_lease_is_reclaimed(self, tmp_path):
+        """임대가 만료된 running 작업은 시도 횟수를 늘려 다시 가져감."""
+        queue = _queue(tmp_path)
+        queue.enqueue("job-1", "kind", {}, "http://cb")
+        queue.claim()
+        _expire_lease(queue, "job-1")
+
+        job = queue.claim()
+
+        assert job.status == "running"
+        assert job.attempts == 2
+
+    def test_recovers_unfinished_jobs_after_restart(self, tmp_path):
+        """같은 파일을 연 새 인스턴스가 미완료 작업을 이어서 처리."""
+        first = _queue(tmp_path)
+        first.enqueue("job-1", "kind", {}, "http://cb")
+        first.enqueue("job-2", "kind", {}, "http://cb")
+        first.claim()
+        _expire_lease(first, "job-1")
+        first.close()
+
+        second = _queue(tmp_path)
+        claimed = {second.claim().job_id, second.claim().job_id}
+
+        assert claimed == {"job-1", "job-2"}
+
+    def test_delivering_job_keeps_result(self, tmp_path):
+        """실행 결과 저장 후 임대가 만료되면 다시 실행하지 않고 콜백만 재전송."""
+        queue = _queue(tmp_path)
+        queue.enqueue("job-1", "kind", {}, "http://cb")
+        queue.claim()
+        queue.complete_run("job-1", {"status": "success"})
+        _expire_lease(queue, "job-1")
+
+        job = queue.claim()
+
+        assert job.status == "delivering"
+        assert job.attempts == 1
+        assert job.result == {"status": "success"}
+
+    def test_redelivery_then_dead(self, tmp_path):
+        """재전송 한도를 넘으면 dead로 전환하고 페이로드 삭제."""
+        queue = _queue(tmp_path, max_deliveries=2)
+        queue.enqueue("job-1", "kind", {"token": "secret"}, "http://cb")
+        queue.claim()
+        queue.complete_run("job-1", {})
+
+        assert queue.schedule_redelivery("job-1", base_delay=0) is True
+        assert queue.claim().status == "delivering"
+        assert queue.schedule_redelivery("job-1", base_delay=0) is False
+
+        job = queue.get("job-1")
+        assert job.status == "dead"
+        assert job.payload == {}
+
+    def test_mark_delivered_scrubs_payload(self, tmp_path):
+        """콜백 전송 완료 시 요청 페이로드 삭제."""
+        queue = _queue(tmp_path)
+        queue.enqueue("job-1", "kind", {"token": "secret"}, "http://cb")
+        queue.claim()
+        queue.complete_run("job-1", {})
+        queue.mark_delivered("job-1")
+
+        job = queue.get("job-1")
+        assert job.status == "done"
+        assert job.payload == {}
+
+    def test_payload_is_encrypted_at_rest(self, tmp_path):
+        """대기 중인 작업의 페이로드는 암호화되어 DB에 토큰이 평문으로 남지 않음."""
+        queue = _queue(tmp_path, payload_secret="key")
+        queue.enqueue("job-1", "kind", {"github_token": "ghp_secret"}, "http://cb")
+
+        stored = queue._connect().execute("SELECT payload FROM jobs").fetchone()[0]
+
+        assert "ghp_secret" not in stored
+        assert queue.claim().payload == {"github_token": "ghp_secret"}
+
+    def test_undecryptable_payload_marks_job_dead(self, tmp_path):
+        """다른 키로 암호화된 작업은 실행하지 않고 dead 처리."""
+        _queue(tmp_path, payload_secret="old").enqueue("job-1", "kind", {"a": 1}, "http://cb")
+        queue = _queue(tmp_path, payload_secret="new")
+        queue.enqueue("job-2", "kind", {"b": 2}, "http://cb")
+
+        job = queue.claim()
+
+        assert job.job_id == "job-2"
+        assert queue.get("job-1").status == "dead"
+        assert queue.get("job-1").payload == {}
+
+    async def test_async_methods_run_off_event_loop(self, tmp_path):
+        """비동기 메서드는 SQLite 접근을 이벤트 루프 밖 스레드에서 실행."""
+        queue = _queue(tmp_path)
+        await queue.aenqueue("job-1", "kind", {"a": 1}, "http://cb")
+        threads = []
+        claim = queue.claim
+
+        def tracking_claim():
+            threads.append(threading.current_thread())
+            return claim()
+
+        with patch.object(queue, "claim", side_effect=tracking_claim):
+            job = await queue.aclaim()
+        await queue.acomplete_run("job-1", {"ok": True})
+        await queue.amark_delivered("job-1")
+
+        assert job.payload == {"a": 1}
+        assert threads and threads[0] is not threading.current_thread()
+        assert (await queue.aget("job-1")).status == "done"
+        assert [e.event for e in await queue.alist_events("job-1")] == ["queued"]
+
+    def test_release_requeues_running_job(self, tmp_path):
+        """반환된 running 작업은 시도 횟수를 되돌리고 즉시 다시 가져갈 수 있음."""
+        queue = _queue(tmp_path)
+        queue.enqueue("job-1", "kind", {}, "http://cb")
+        queue.claim()
+        queue.release("job-1")
+
+        job = queue.claim()
+
+        assert job.job_id == "job-1"
+        assert job.attempts == 1
+
+    def test_schedule_retry_keeps_attempts_with_backoff(self, tmp_path):
+        """실행 재시도는 시도 횟수를 유지하고 백오프 시간 전에는 다시 가져가지 않음."""
+        queue = _queue(tmp_path)
+        queue.enqueue("job-1", "kind", {}, "http://cb")
+        queue.claim()
+
+        assert queue.schedule_retry("job-1", base_delay=60) is True
+        assert queue.claim() is None
+
+        queue._execute("UPDATE jobs SET available_at = 0 WHERE job_id = 'job-1'")
+        job = queue.claim()
+        assert job.status == "running"
+        assert job.attempts == 2
+
+    def test_depth_counts_unfinished(self, tmp_path):
+        """종류, 상태별 미완료 작업 수 집계."""
+        queue = _queue(tmp_path)
+        queue.enqueue("job-1", "a", {}, "http://cb")
+        queue.enqueue("job-2", "a", {}, "http://cb")
+        queue.enqueue("job-3", "b", {}, "http://cb")
+        queue.claim()
+
+        assert queue.depth() == {("a", "running"): 1, ("a", "queued"): 1, ("b", "queued"): 1}
+
+    def test_enqueue_records_queued_event(self, tmp_path):
+        """작업 등록 시 queued 진행 이벤트 기록."""
+        queue = _queue(tmp_path)
+        queue.enqueue("job-1", "kind", {}, "http://cb")
+
+        events = queue.list_events("job-1")
+
+        assert [(e.event, e.data) for e in events] == [("queued", {"kind": "kind"})]
+
+    def test_list_events_after_id(self, tmp_path):
+        """after_id 이후 이벤트만 기록 순서대로 조회."""
+        queue = _queue(tmp_path)
+        queue.enqueue("job-1", "kind", {}, "http://cb")
+        first = queue.record_event("job-1", "step", {"n": 1})
+        queue.record_event("job-1", "step", {"n": 2})
+        queue.record_event("job-2", "step", {"n": 3})
+
+        events = queue.list_events("job-1", after_id=first)
+
+        assert [e.data for e in events] == [{"n": 2}]
+
+    def test_prune_removes_events_of_pruned_jobs(self, tmp_path):
+        """보관 기간이 지난 작업의 진행 이벤트도 함께 삭제."""
+        queue = _queue(tmp_path, retention_seconds=0)
+        queue.enqueue("job-1", "kind", {}, "http://cb")
+        queue.enqueue("job-2", "kind", {}, "http://cb")
+        queue.claim()
+        queue.complete_run("job-1", {})
+        queue.mark_delivered("job-1")
+
+        assert queue.prune() == 1
+        assert queue.list_events("job-1") == []
+        assert len(queue.list_events("job-2")) == 1
+
+
+class TestJobWorkerPool:
+    """JobWorkerPool 테스트."""
+
+    @staticmethod
+    async def _wait_for_status(queue: JobQueue, job_id: str, status: str) -> None:
+        for _ in range(200):
+            if queue.get(job_id).status == status:
+                return
+            await asyncio.sleep(0.01)
+        raise AssertionError(f"{job_id} 상태가 {status}가 되지 않음")
+
+    async def test_runs_job_and_delivers_callback(self, tmp_path):
+        """작업 실행 결과를 콜백 URL로 전송하고 done 처리."""
+        queue = _queue(tmp_path)
+        delivered = []
+
+        async def run(job_id, payload):
+            return {"job_id": job_id, "value": payload["value"] * 2}
+
+        async def deliver(url, payload, job_id):
+            delivered.append((url, payload))
+            return True
+
+        pool = JobWorkerPool(
+            queue,
+            {"double": JobHandler(run=run, on_exhausted=_empty_result)},
+            deliver,
+            concurrency=2,
+            poll_interval=0.05,
+        )
+        pool.start()
+        queue.enqueue("job-1", "double", {"value": 21}, "http://cb")
+        await self._wait_for_status(queue, "job-1", "done")
+        await pool.stop()
+
+        assert delivered == [("http://cb", {"job_id": "job-1", "value": 42})]
+
+    async def test_failed_delivery_is_retried_without_rerun(self, tmp_path):
+        """콜백 전송 실패 시 작업을 다시 실행하지 않고 콜백만 재전송."""
+        queue = _queue(tmp_path)
+        runs = []
+        attempts = []
+
+        async def run(job_id, payload):
+            runs.append(job_id)
+            return {"ok": True}
+
+        async def deliver(url, payload, job_id):
+            attempts.append(job_id)
+            return len(attempts) > 1
+
+        pool = JobWorkerPool(
+            queue,
+            {"kind": JobHandler(run=run, on_exhausted=_empty_result)},
+            deliver,
+            concurrency=1,
+            redelivery_delay=0,
+            poll_interval=0.05,
+        )
+        pool.start()
+        queue.enqueue("job-1", "kind", {}, "http://cb")
+        await self._wait_for_status(queue, "job-1", "done")
+        await pool.stop()
+
+        assert runs == ["job-1"]
+        assert attempts == ["job-1", "job-1"]
+
+    async def test_failing_handler_is_retried_then_exhausted(self, tmp_path):
+        """실행 함수가 계속 실패하면 시도 한도까지만 다시 실행하고 실패 페이로드를 전송."""
+        queue = _queue(tmp_path)
+        runs = []
+        delivered = []
+
+        async def run(job_id, payload):
+            runs.append(job_id)
+            raise RuntimeError("boom")
+
+        async def deliver(url, payload, job_id):
+            delivered.append(payload)
+            return True
+
+        pool = JobWorkerPool(
+            queue,
+            {"kind": JobHandler(run=run, on_exhausted=_failed_result)},
+            deliver,
+            concurrency=1,
+            max_attempts=2,
+            retry_delay=0,
+            poll_interval=0.05,
+        )
+        pool.start()
+        queue.enqueue("job-1", "kind", {}, "http://cb")
+        await self._wait_for_status(queue, "job-1", "done")
+        await pool.stop()
+
+        assert runs == ["job-1", "job-1"]
+        assert delivered == [{"status": "failed"}]
+        assert "retry_scheduled" in [e.event for e in queue.list_events("job-1")]
+
+    async def test_exhausted_job_sends_failure_payload(self, tmp_path):
+        """시도 한도를 넘긴 작업은 실행 없이 실패 페이로드를 전송."""
+        queue = _queue(tmp_path)
+        queue.enqueue("job-1", "kind", {}, "http://cb")
+        for _ in range(3):
+            queue.claim()
+            _expire_lease(queue, "job-1")
+        delivered = []
+
+        async def run(job_id, payload):
+            raise AssertionError("실행되면 안 됨")
+
+        async def deliver(url, payload, job_id):
+            delivered.append(payload)
+            return True
+
+        pool = JobWorkerPool(
+            queue,
+            {"kind": JobHandler(run=run, on_exhausted=_failed_result)},
+            deliver,
+            concurrency=1,
+            max_attempts=3,
+            poll_interval=0.05,
+        )
+        pool.start()
+        await self._wait_for_status(queue, "job-1", "done")
+        await pool.stop()
+
+        assert delivered == [{"status": "failed"}]
+
+    async def test_stop_returns_running_job_to_queue(self, tmp_path):
+        """종료 시 실행 중인 작업은 queued로 반환."""
+        queue = _queue(tmp_path)
+        started = asyncio.Event()
+
+        async def run(job_id, payload):
+            started.set()
+            await asyncio.sleep(60)
+            return {}
+
+        async def deliver(url, payload, job_id):
+            return True
+
+        pool = JobWorkerPool(
+            queue,
+            {"kind": JobHandler(run=run, on_exhausted=_empty_result)},
+            deliver,
+            concurrency=1,
+            poll_interval=0.05,
+        )
+        pool.start()
+        queue.enqueue("job-1", "kind", {}, "http://cb")
+        await asyncio.wait_for(started.wait(), timeout=2)
+        await pool.stop()
+
+        job = queue.get("job-1")
+        assert job.status == "queued"
+        assert job.attempts == 0
+
+    async def test_records_progress_events(self, tmp_path):
+        """작업 실행 구간의 진행 이벤트와 시작, 종료, 전달 이벤트를 순서대로 기록."""
+        queue = _queue(tmp_path)
+
+        async def run(job_id, payload):
+            emit_progress("step", n=1)
+            return {}
+
+        async def deliver(url, payload, job_id):
+            return True
+
+        pool = JobWorkerPool(
+            queue,
+            {"kind": JobHandler(run=run, on_exhausted=_empty_result)},
+            deliver,
+            concurrency=1,
+            poll_interval=0.05,
+        )
+        pool.start()
+        queue.enqueue("job-1", "kind", {}, "http://cb")
+        await self._wait_for_status(queue, "job-1", "done")
+        await pool.stop()
+
+        events = queue.list_events("job-1")
+        assert [e.event for e in events] == ["queued", "started", "step", "finished", "delivered"]
+        assert events[1].data["attempt"] == 1
+        assert events[2].data == {"n": 1}
+        assert "elapsed_s" in events[3].data
+
+    async def test_sends_progress_callbacks(self, tmp_path):
+        """중간 콜백 URL이 설정되면 진행 이벤트를 중간 콜백으로도 전송."""
+        queue = _queue(tmp_path)
+
+        async def run(job_id, payload):
+            emit_progress("step", n=1)
+            return {}
+
+        async def deliver(url, payload, job_id):
+            return True
+
+        pool = JobWorkerPool(
+            queue,
+            {"kind": JobHandler(run=run, on_exhausted=_empty_result)},
+            deliver,
+            concurrency=1,
+            poll_interval=0.05,
+            progress_callback_url="http://progress",
+        )
+        with patch("app.infra.queue.progress._send_progress_callback") as send:
+            pool.start()
+            queue.enqueue("job-1", "kind", {}, "http://cb")
+            await self._wait_for_status(queue, "job-1", "done")
+            await pool.stop()
+
+        sent = [call.args for call in send.call_args_list]
+        assert [payload["event"] for _, payload in sent] == ["started", "step", "finished"]
+        assert all(url == "http://progress" for url, _ in sent)
+        assert sent[1][1]["jobId"] == "job-1"
@@ -10,6 +10,7 @@ from app.domain.resume.schemas import (
 )
 from app.infra.llm.client import (
     evaluate_resume,
+    generate_project_resume,
     generate_resume,
 )
 
@@ -289,6 +290,44 @@ class TestGenerateResume:
         assert result == expected_result
 
 
+class TestGenerateProjectResume:
+    """generate_project_resume 함수 테스트"""
+
+    @staticmethod
+    def _project(name: str) -> dict:
+        return {
+            "repo_name": name,
+            "repo_url": f"https://github.com/user/{name}",
+            "dependencies": [],
+            "messages": ["feat: init"],
+        }
+
+    async def test_returns_single_project(self):
+        """프로젝트 하나만 생성해 ProjectInfo 반환"""
+        generated = ProjectInfo(
+            name="a", repo_url="https://github.com/user/a", description="- 구현", tech_stack=[]
+        )
+        with patch(
+            "app.infra.llm.resume.generate_resume",
+            new_callable=AsyncMock,
+            return_value=ResumeData(projects=[generated]),
+        ) as mock_generate:
+            result = await generate_project_resume(self._project("a"), "백엔드 개발자", "plan")
+
+        assert result == generated
+        assert mock_generate.call_args.kwargs["project_info"] == [self._project("a")]
+
+    async def test_empty_result_raises(self):
+        """생성 결과가 비어 있으면 ValueError"""
+        with patch(
+            "app.infra.llm.resume.generate_resume",
+            new_callable=AsyncMock,
+            return_value=ResumeData(projects=[]),
+        ):
+            with pytest.raises(ValueError):
+                await generate_project_resume(self._project("a"), "백엔드 개발자", "plan")
+
+
 class TestEvaluateResume:
     """evaluate_resume 함수 테스트"""
 
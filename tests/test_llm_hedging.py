@@ -0,0 +1,199 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from app.domain.resume.schemas import EvaluationOutput
+from app.infra.llm.base import _invoke_llm
+from app.infra.llm.hedging import LLM_HEDGE_WINS, LLM_HEDGES, LLMHedger
+
+
+def _warmed_hedger(prompt: str, latency: float = 0.01, **kwargs) -> LLMHedger:
+    hedger = LLMHedger(min_samples=5, **kwargs)
+    for _ in range(5):
+        hedger.record_latency(prompt, latency)
+    return hedger
+
+
+def _wins(prompt: str, winner: str) -> float:
+    return LLM_HEDGE_WINS.labels(prompt=prompt, winner=winner)._value.get()
+
+
+class TestLLMHedger:
+    """LLMHedger 테스트."""
+
+    def test_delay_is_percentile_of_recent_latencies(self):
+        """최근 지연의 지정 백분위를 헤지 대기 시간으로 사용."""
+        hedger = LLMHedger(percentile=0.9, min_samples=10)
+        for i in range(1, 11):
+            hedger.record_latency("p", float(i))
+
+        assert hedger.hedge_delay("p") == 9.0
+        assert hedger.hedge_delay("other") is None
+
+    def test_no_delay_before_min_samples(self):
+        """표본이 부족하면 헤지하지 않음."""
+        hedger = LLMHedger(min_samples=3)
+        hedger.record_latency("p", 1.0)
+
+        assert hedger.hedge_delay("p") is None
+
+    async def test_fast_primary_is_not_hedged(self):
+        """백분위 지연 안에 끝나면 헤지 요청을 보내지 않음."""
+        hedger = _warmed_hedger("fast", latency=1.0)
+        request = AsyncMock(return_value="ok")
+
+        assert await hedger.call("fast", request) == "ok"
+        assert request.await_count == 1
+
+    async def test_slow_primary_is_hedged_and_cancelled(self):
+        """원 요청이 느리면 헤지 요청 결과를 사용하고 원 요청은 취소."""
+        hedger = _warmed_hedger("slow")
+        cancelled = asyncio.Event()
+        calls = 0
+        wins = _wins("slow", "hedge")
+
+        async def request():
+            nonlocal calls
+            calls += 1
+            if calls == 1:
+                try:
+                    await asyncio.sleep(10)
+                except asyncio.CancelledError:
+                    cancelled.set()
+                    raise
+            return f"result-{calls}"
+
+        result = await hedger.call("slow", request)
+        await asyncio.wait_for(cancelled.wait(), timeout=1)
+
+        assert result == "result-2"
+        assert _wins("slow", "hedge") == wins + 1
+
+    async def test_failed_primary_waits_for_hedge(self):
+        """헤지 후 원 요청이 실패하면 헤지 요청 결과를 기다려 사용."""
+        hedger = _warmed_hedger("fail")
+        calls = 0
+
+        async def request():
+            nonlocal calls
+            calls += 1
+            if calls == 1:
+                await asyncio.sleep(0.05)
+                raise ValueError("invalid output")
+            await asyncio.sleep(0.1)
+            return "hedge"
+
+        assert await hedger.call("fail", request) == "hedge"
+
+    async def test_both_failed_raises_primary_error(self):
+        """두 요청이 모두 실패하면 원 요청의 예외 전달."""
+        hedger = _warmed_hedger("both")
+        calls = 0
+
+        async def request():
+            nonlocal calls
+            calls += 1
+            name = f"error-{calls}"
+            await asyncio.sleep(0.05)
+            raise ValueError(name)
+
+        with pytest.raises(ValueError, match="error-1"):
+            await hedger.call("both", request)
+
+    async def test_queue_wait_does_not_trigger_hedge(self):
+        """슬롯을 기다린 시간은 헤지 대기와 지연 기록에 포함하지 않음."""
+        hedger = _warmed_hedger("queued", latency=0.05)
+        fired = LLM_HEDGES.labels(prompt="queued", result="fired")._value.get()
+        lock = asyncio.Lock()
+        calls = 0
+
+        async def request():
+            nonlocal calls
+            calls += 1
+            return "ok"
+
+        await lock.acquire()
+        call = asyncio.create_task(hedger.call("queued", request, slot=lambda: lock))
+        await asyncio.sleep(0.2)
+        lock.release()
+
+        assert await call == "ok"
+        assert calls == 1
+        assert LLM_HEDGES.labels(prompt="queued", result="fired")._value.get() == fired
+        assert max(hedger._latencies["queued"]) < 0.1
+
+    async def test_budget_caps_extra_requests(self):
+        """예산을 다 쓰면 헤지 없이 원 요청을 기다림."""
+        hedger = _warmed_hedger("budget", percentile=0.5, budget_ratio=0.0, budget_burst=1.0)
+        exhausted = LLM_HEDGES.labels(prompt="budget", result="budget_exhausted")._value.get()
+        calls = 0
+
+        async def request():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.05)
+            return "ok"
+
+        await hedger.call("budget", request)
+        await hedger.call("budget", request)
+
+        assert calls == 3
+        assert (
+            LLM_HEDGES.labels(prompt="budget", result="budget_exhausted")._value.get()
+            == exhausted + 1
+        )
+
+
+class TestInvokeLLMHedging:
+    """_invoke_llm 헤지 요청 적용 테스트."""
+
+    @staticmethod
+    def _slow_then_fast_llm() -> MagicMock:
+        calls = 0
+
+        async def fake_ainvoke(messages, config):
+            nonlocal calls
+            calls += 1
+            if calls == 1:
+                await asyncio.sleep(10)
+            return EvaluationOutput(result="pass", feedback=f"call-{calls}")
+
+        llm = MagicMock()
+        llm.with_structured_output.return_value.ainvoke = AsyncMock(side_effect=fake_ainvoke)
+        return llm
+
+    async def _invoke(self, llm, hedge_prompt: str | None):
+        return await _invoke_llm(
+            llm=llm,
+            output_type=EvaluationOutput,
+            system_prompt="system",
+            human_content="resume",
+            config={"callbacks": []},
+            hedge_prompt=hedge_prompt,
+        )
+
+    async def test_hedged_call_returns_first_valid_output(self, monkeypatch):
+        """헤지 설정이 켜져 있으면 느린 평가 호출 대신 헤지 응답 사용."""
+        monkeypatch.setattr("app.infra.llm.base.settings.llm_hedge_enabled", True)
+        llm = self._slow_then_fast_llm()
+
+        with patch(
+            "app.infra.llm.base.get_llm_hedger", return_value=_warmed_hedger("resume-evaluator")
+        ):
+            result = await asyncio.wait_for(self._invoke(llm, "resume-evaluator"), timeout=2)
+
+        assert result.feedback == "call-2"
+
+    async def test_hedging_disabled_by_default(self):
+        """헤지 설정이 꺼져 있으면 hedge_prompt가 있어도 한 번만 호출."""
+        llm = MagicMock()
+        llm.with_structured_output.return_value.ainvoke = AsyncMock(
+            return_value=EvaluationOutput(result="pass", feedback="ok")
+        )
+
+        with patch("app.infra.llm.base.get_llm_hedger") as get_hedger:
+            await self._invoke(llm, "resume-evaluator")
+
+        get_hedger.assert_not_called()
+        assert llm.with_structured_output.return_value.ainvoke.await_count == 1
@@ -0,0 +1,214 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import httpx
+import pytest
+
+from app.domain.resume.schemas import EvaluationOutput
+from app.infra.llm import limiter as limiter_module
+from app.infra.llm.base import _invoke_llm
+from app.infra.llm.limiter import (
+    BACKEND_GENERATOR,
+    LLM_LIMIT_DECREASES,
+    PRIORITY_BATCH,
+    PRIORITY_INTERACTIVE,
+    AdaptiveConcurrencyLimiter,
+    get_llm_limiter,
+    is_overload_error,
+    llm_priority,
+)
+
+
+def _limiter(**kwargs) -> AdaptiveConcurrencyLimiter:
+    options = {
+        "initial_limit": 4,
+        "min_limit": 1,
+        "max_limit": 8,
+        "latency_threshold": 10.0,
+        "cooldown": 0.0,
+    }
+    options.update(kwargs)
+    return AdaptiveConcurrencyLimiter("test", **options)
+
+
+def _status_error(status: int) -> httpx.HTTPStatusError:
+    request = httpx.Request("POST", "http://llm")
+    return httpx.HTTPStatusError(
+        "error", request=request, response=httpx.Response(status, request=request)
+    )
+
+
+class TestAdaptiveConcurrencyLimiter:
+    """AdaptiveConcurrencyLimiter 테스트."""
+
+    async def test_bounds_concurrency_to_limit(self):
+        """동시에 실행되는 블록 수가 한도를 넘지 않음."""
+        limiter = _limiter(initial_limit=2)
+        running = peak = 0
+
+        async def call():
+            nonlocal running, peak
+            async with limiter.slot():
+                running += 1
+                peak = max(peak, running)
+                await asyncio.sleep(0.01)
+                running -= 1
+
+        await asyncio.gather(*(call() for _ in range(6)))
+
+        assert peak == 2
+        assert limiter.in_flight == 0
+
+    async def test_interactive_priority_served_before_batch(self):
+        """먼저 대기한 batch 요청보다 interactive 요청이 먼저 슬롯을 받음."""
+        limiter = _limiter(initial_limit=1)
+        order: list[str] = []
+        await limiter.acquire()
+
+        async def call(name: str, priority: int):
+            async with limiter.slot(priority):
+                order.append(name)
+
+        batch = asyncio.create_task(call("batch", PRIORITY_BATCH))
+        await asyncio.sleep(0)
+        with llm_priority(PRIORITY_INTERACTIVE):
+            interactive = asyncio.create_task(call("interactive", None))
+        await asyncio.sleep(0)
+        limiter.release()
+        await asyncio.gather(batch, interactive)
+
+        assert order == ["interactive", "batch"]
+
+    async def test_aged_batch_request_is_not_starved(self):
+        """오래 기다린 batch 요청은 나중에 들어온 interactive 요청보다 먼저 슬롯을 받음."""
+        limiter = _limiter(initial_limit=1, priority_aging=0.01)
+        order: list[str] = []
+        await limiter.acquire()
+
+        async def call(name: str, priority: int):
+            async with limiter.slot(priority):
+                order.append(name)
+
+        batch = asyncio.create_task(call("batch", PRIORITY_BATCH))
+        await asyncio.sleep(0.05)
+        interactive = asyncio.create_task(call("interactive", PRIORITY_INTERACTIVE))
+        await asyncio.sleep(0)
+        limiter.release()
+        await asyncio.gather(batch, interactive)
+
+        assert order == ["batch", "interactive"]
+
+    async def test_overload_multiplicative_decrease(self):
+        """429/5xx 응답이면 한도를 backoff 배로 줄이고 최소값 아래로 내리지 않음."""
+        limiter = _limiter(initial_limit=8, min_limit=3)
+        decreases = LLM_LIMIT_DECREASES.labels(backend="test", reason="overload")._value.get()
+
+        for _ in range(3):
+            with pytest.raises(httpx.HTTPStatusError):
+                async with limiter.slot():
+                    raise _status_error(429)
+
+        assert limiter.limit == 3
+        assert LLM_LIMIT_DECREASES.labels(backend="test", reason="overload")._value.get() == (
+            decreases + 3
+        )
+
+    async def test_cooldown_limits_consecutive_decreases(self):
+        """감소 직후 cooldown 동안 발생한 과부하는 한 번만 반영."""
+        limiter = _limiter(initial_limit=8, cooldown=60.0)
+
+        limiter.on_overload()
+        limiter.on_overload()
+
+        assert limiter.limit == 4
+
+    async def test_additive_increase_only_when_saturated(self):
+        """한도가 꽉 찬 상태의 정상 완료만 한도를 늘림."""
+        limiter = _limiter(initial_limit=2)
+
+        async with limiter.slot():
+            pass
+        assert limiter.limit == 2
+
+        async def call():
+            async with limiter.slot():
+                await asyncio.sleep(0.01)
+
+        await asyncio.gather(*(call() for _ in range(8)))
+
+        assert limiter.limit > 2
+
+    async def test_slow_response_decreases_limit(self):
+        """지연이 임계값을 넘으면 과부하로 보고 한도를 줄임."""
+        limiter = _limiter(initial_limit=4)
+
+        limiter.on_success(latency=30.0)
+
+        assert limiter.limit == 2
+
+    async def test_non_overload_error_keeps_limit(self):
+        """출력 파싱 실패 같은 예외는 한도에 반영하지 않음."""
+        limiter = _limiter(initial_limit=4)
+
+        with pytest.raises(ValueError):
+            async with limiter.slot():
+                raise ValueError("parse error")
+
+        assert limiter.limit == 4
+        assert limiter.in_flight == 0
+
+    def test_default_latency_threshold_follows_backend_timeout(self, monkeypatch):
+        """지연 임계값 미설정 시 타임아웃에 가까운 값을 사용해 긴 정상 생성은 감소 대상이 아님."""
+        monkeypatch.setattr(limiter_module, "_limiters", {})
+        monkeypatch.setattr(limiter_module.settings, "vllm_timeout", 600.0)
+        monkeypatch.setattr(limiter_module.settings, "llm_generator_latency_threshold", None)
+        limiter = get_llm_limiter(BACKEND_GENERATOR)
+        limit = limiter.limit
+
+        limiter.on_success(latency=300.0)
+
+        assert limiter.limit == limit
+
+    def test_is_overload_error(self):
+        """429/5xx/타임아웃만 과부하로 판단."""
+        assert is_overload_error(_status_error(429))
+        assert is_overload_error(_status_error(503))
+        assert is_overload_error(TimeoutError())
+        assert not is_overload_error(_status_error(400))
+        assert not is_overload_error(ValueError("bad json"))
+
+
+class TestInvokeLLMLimiter:
+    """_invoke_llm 동시성 제한 적용 테스트."""
+
+    async def test_llm_calls_share_backend_limiter(self):
+        """호출 지점과 관계없이 백엔드 제한기 한도만큼만 동시에 LLM 호출."""
+        limiter = _limiter(initial_limit=2, max_limit=2)
+        running = peak = 0
+
+        async def fake_ainvoke(messages, config):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return EvaluationOutput(result="pass", feedback="ok")
+
+        llm = MagicMock()
+        llm.with_structured_output.return_value.ainvoke = AsyncMock(side_effect=fake_ainvoke)
+
+        with patch("app.infra.llm.base.get_llm_limiter", return_value=limiter):
+            await asyncio.gather(
+                *(
+                    _invoke_llm(
+                        llm=llm,
+                        output_type=EvaluationOutput,
+                        system_prompt="system",
+                        human_content=f"resume-{i}",
+                        config={"callbacks": []},
+                    )
+                    for i in range(5)
+                )
+            )
+
+        assert peak == 2
@@ -0,0 +1,165 @@
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from app.domain.resume.schemas import EvaluationOutput
+from app.infra.cache.llm_response_cache import (
+    LLM_CACHE_REQUESTS,
+    LLM_CACHE_TOKENS_SAVED,
+    LLMResponseCache,
+    llm_cache_key,
+)
+from app.infra.llm.base import _invoke_llm
+
+
+def _hits(prompt: str) -> float:
+    return LLM_CACHE_REQUESTS.labels(prompt=prompt, result="hit")._value.get()
+
+
+class TestLLMResponseCache:
+    """LLMResponseCache 테스트."""
+
+    def test_roundtrip_and_tokens_saved(self, tmp_path):
+        """저장한 출력을 반환하고 적중 시 저장된 토큰 수만큼 절약 토큰 집계."""
+        cache = LLMResponseCache(str(tmp_path / "llm.db"))
+        saved = LLM_CACHE_TOKENS_SAVED.labels(prompt="p-roundtrip")._value.get()
+        cache.set("k", "p-roundtrip", '{"a": 1}', tokens=120)
+
+        assert cache.get("k", "p-roundtrip") == '{"a": 1}'
+        assert LLM_CACHE_TOKENS_SAVED.labels(prompt="p-roundtrip")._value.get() == saved + 120
+        cache.close()
+
+    def test_expired_entry_is_miss(self, tmp_path):
+        """TTL이 지난 항목은 조회되지 않음."""
+        cache = LLMResponseCache(str(tmp_path / "llm.db"))
+        cache.set("k", "p", "{}", tokens=0, ttl=-1)
+
+        assert cache.get("k", "p") is None
+
+    def test_evicts_least_recently_used(self, tmp_path):
+        """최대 개수를 넘으면 가장 오래 접근하지 않은 항목 제거."""
+        cache = LLMResponseCache(str(tmp_path / "llm.db"), max_entries=2, prune_interval=1)
+        cache.set("a", "p", "{}", tokens=0)
+        cache.set("b", "p", "{}", tokens=0)
+        cache.get("a", "p")
+        cache.set("c", "p", "{}", tokens=0)
+
+        assert [cache.get(k, "p") is not None for k in ("a", "b", "c")] == [True, False, True]
+
+    def test_prunes_once_per_interval(self, tmp_path):
+        """최대 개수 초과분은 저장할 때마다가 아니라 prune_interval회마다 정리."""
+        cache = LLMResponseCache(str(tmp_path / "llm.db"), max_entries=1, prune_interval=3)
+        cache.set("a", "p", "{}", tokens=0)
+        cache.set("b", "p", "{}", tokens=0)
+
+        assert cache.get("a", "p") is not None
+
+        cache.set("c", "p", "{}", tokens=0)
+
+        assert [cache.get(k, "p") is not None for k in ("a", "b", "c")] == [False, False, True]
+
+    async def test_async_roundtrip(self, tmp_path):
+        """비동기 메서드로 저장하고 조회."""
+        cache = LLMResponseCache(str(tmp_path / "llm.db"))
+        await cache.aset("k", "p", '{"a": 1}', tokens=0)
+
+        assert await cache.aget("k", "p") == '{"a": 1}'
+        cache.close()
+
+    def test_shared_between_instances(self, tmp_path):
+        """같은 파일을 여는 다른 인스턴스(워커)와 캐시 공유."""
+        path = str(tmp_path / "llm.db")
+        LLMResponseCache(path).set("k", "p", "{}", tokens=0)
+
+        assert LLMResponseCache(path).get("k", "p") == "{}"
+
+    def test_key_depends_on_every_component(self):
+        """모델, 호출 지점, 출력 스키마, 프롬프트 내용 중 하나라도 다르면 다른 키."""
+        base = ("model", "prompt:v1", "Output:abc", "system", "human")
+        keys = {llm_cache_key(*base)}
+        for i in range(len(base)):
+            changed = list(base)
+            changed[i] += "-changed"
+            keys.add(llm_cache_key(*changed))
+
+        assert len(keys) == len(base) + 1
+
+
+class TestInvokeLLMCache:
+    """_invoke_llm 응답 캐시 테스트."""
+
+    @pytest.fixture
+    def cache(self, tmp_path, monkeypatch):
+        monkeypatch.setattr("app.infra.llm.base.settings.llm_response_cache_enabled", True)
+        cache = LLMResponseCache(str(tmp_path / "llm.db"))
+        with patch("app.infra.llm.base.get_llm_response_cache", return_value=cache):
+            yield cache
+
+    @staticmethod
+    def _llm(output: EvaluationOutput) -> MagicMock:
+        llm = MagicMock()
+        llm.model_name = "test-model"
+        llm.with_structured_output.return_value.ainvoke = AsyncMock(return_value=output)
+        return llm
+
+    async def _invoke(self, llm, human: str, cache_prompt: str | None = "eval:v1"):
+        return await _invoke_llm(
+            llm=llm,
+            output_type=EvaluationOutput,
+            system_prompt="system",
+            human_content=human,
+            config={"callbacks": []},
+            cache_prompt=cache_prompt,
+        )
+
+    async def test_identical_call_uses_cache(self, cache):
+        """같은 입력으로 다시 호출하면 LLM을 호출하지 않고 저장된 출력 반환."""
+        llm = self._llm(EvaluationOutput(result="pass", feedback="ok"))
+        hits = _hits("eval:v1")
+
+        first = await self._invoke(llm, "resume")
+        second = await self._invoke(llm, "resume")
+
+        assert second == first
+        assert isinstance(second, EvaluationOutput)
+        assert llm.with_structured_output.return_value.ainvoke.await_count == 1
+        assert _hits("eval:v1") == hits + 1
+
+    async def test_different_content_is_miss(self, cache):
+        """프롬프트 내용이 다르면 LLM을 다시 호출."""
+        llm = self._llm(EvaluationOutput(result="pass", feedback="ok"))
+
+        await self._invoke(llm, "resume-a")
+        await self._invoke(llm, "resume-b")
+
+        assert llm.with_structured_output.return_value.ainvoke.await_count == 2
+
+    async def test_call_site_without_cache_prompt_is_not_cached(self, cache):
+        """cache_prompt를 지정하지 않은 호출 지점은 캐시하지 않음."""
+        llm = self._llm(EvaluationOutput(result="pass", feedback="ok"))
+
+        await self._invoke(llm, "resume", cache_prompt=None)
+        await self._invoke(llm, "resume", cache_prompt=None)
+
+        assert llm.with_structured_output.return_value.ainvoke.await_count == 2
+
+    async def test_disabled_cache_is_not_used(self, cache, monkeypatch):
+        """캐시 설정이 꺼져 있으면 항상 LLM 호출."""
+        monkeypatch.setattr("app.infra.llm.base.settings.llm_response_cache_enabled", False)
+        llm = self._llm(EvaluationOutput(result="pass", feedback="ok"))
+
+        await self._invoke(llm, "resume")
+        await self._invoke(llm, "resume")
+
+        assert llm.with_structured_output.return_value.ainvoke.await_count == 2
+
+    async def test_corrupt_entry_falls_back_to_llm(self, cache):
+        """스키마에 맞지 않는 캐시 항목은 미스로 처리하고 LLM 호출."""
+        llm = self._llm(EvaluationOutput(result="pass", feedback="ok"))
+        await self._invoke(llm, "resume")
+        cache._connect().execute("UPDATE llm_response_cache SET value = '{\"bad\": 1}'")
+
+        result = await self._invoke(llm, "resume")
+
+        assert result.result == "pass"
+        assert llm.with_structured_output.return_value.ainvoke.await_count == 2
@@ -0,0 +1,157 @@
+import threading
+from typing import TypedDict
+
+from langgraph.graph import END, StateGraph
+from langgraph.types import CachePolicy
+
+from app.domain.resume.schemas import RepoContext, ResumeRequest, ResumeState
+from app.domain.resume.workflow import collect_data_cache_key
+from app.infra.cache.node_cache import BoundedSqliteCache, writes_without_error
+
+NS = ("collect_data",)
+
+
+def _state(**overrides) -> ResumeState:
+    request = {
+        "repo_urls": ["https://github.com/testuser/testrepo"],
+        "position": "백엔드 개발자",
+        "company": "테스트회사",
+        "github_token": "token-a",
+    }
+    request.update(overrides.pop("request", {}))
+    return ResumeState(request=ResumeRequest(**request), job_id="job-1", **overrides)
+
+
+class TestBoundedSqliteCache:
+    """BoundedSqliteCache 테스트."""
+
+    def test_roundtrip_pydantic_writes(self, tmp_path):
+        """pydantic 모델이 포함된 writes를 저장 후 그대로 복원."""
+        cache = BoundedSqliteCache(str(tmp_path / "cache.db"))
+        context = RepoContext(
+            name="repo", languages={"Python": 10}, description="", topics=[], readme_summary=""
+        )
+        writes = [("repo_contexts", {"repo": context})]
+
+        cache.set({(NS, "k"): (writes, None)})
+        restored = cache.get([(NS, "k")])
+
+        assert [tuple(write) for write in restored[(NS, "k")]] == writes
+        cache.close()
+
+    def test_evicts_least_recently_used(self, tmp_path):
+        """최대 개수를 넘으면 가장 오래 접근하지 않은 항목 제거."""
+        cache = BoundedSqliteCache(str(tmp_path / "cache.db"), max_entries=2, prune_interval=1)
+        cache.set({(NS, "a"): ([("x", 1)], None)})
+        cache.set({(NS, "b"): ([("x", 2)], None)})
+        cache.get([(NS, "a")])
+        cache.set({(NS, "c"): ([("x", 3)], None)})
+
+        result = cache.get([(NS, "a"), (NS, "b"), (NS, "c")])
+
+        assert set(result) == {(NS, "a"), (NS, "c")}
+
+    async def test_async_methods_run_off_event_loop(self, tmp_path, monkeypatch):
+        """aget/aset은 SQLite 접근을 스레드에서 실행."""
+        cache = BoundedSqliteCache(str(tmp_path / "cache.db"))
+        threads: list[str] = []
+        set_ = cache.set
+
+        def tracking_set(pairs):
+            threads.append(threading.current_thread().name)
+            set_(pairs)
+
+        monkeypatch.setattr(cache, "set", tracking_set)
+        await cache.aset({(NS, "k"): ([("x", 1)], None)})
+
+        assert await cache.aget([(NS, "k")]) == {(NS, "k"): [["x", 1]]}
+        assert threads and threads[0] != threading.main_thread().name
+        cache.close()
+
+    def test_expired_entry_is_miss(self, tmp_path):
+        """TTL이 지난 항목은 조회되지 않음."""
+        cache = BoundedSqliteCache(str(tmp_path / "cache.db"))
+        cache.set({(NS, "k"): ([("x", 1)], -1)})
+
+        assert cache.get([(NS, "k")]) == {}
+
+    def test_shared_between_instances(self, tmp_path):
+        """같은 파일을 여는 다른 인스턴스(워커)와 캐시 공유."""
+        path = str(tmp_path / "cache.db")
+        BoundedSqliteCache(path).set({(NS, "k"): ([("x", 1)], None)})
+
+        assert (NS, "k") in BoundedSqliteCache(path).get([(NS, "k")])
+
+    def test_skips_error_writes(self, tmp_path):
+        """에러 상태 writes는 저장하지 않음."""
+        cache = BoundedSqliteCache(str(tmp_path / "cache.db"), should_cache=writes_without_error)
+        cache.set({(NS, "err"): ([("error_code", "GITHUB_API_ERROR")], None)})
+        cache.set({(NS, "ok"): ([("project_info", [])], None)})
+
+        assert set(cache.get([(NS, "err"), (NS, "ok")])) == {(NS, "ok")}
+
+    def test_clear_namespace(self, tmp_path):
+        """네임스페이스 단위 삭제."""
+        cache = BoundedSqliteCache(str(tmp_path / "cache.db"))
+        cache.set({(NS, "a"): ([("x", 1)], None), (("other",), "b"): ([("x", 2)], None)})
+
+        cache.clear([NS])
+
+        assert set(cache.get([(NS, "a"), (("other",), "b")])) == {(("other",), "b")}
+
+    async def test_graph_reuses_cached_node(self, tmp_path):
+        """컴파일된 그래프에서 같은 키로 재실행 시 노드를 다시 실행하지 않음."""
+
+        class State(TypedDict, total=False):
+            value: int
+            session: str
+            result: int
+
+        calls = []
+
+        async def node(state: State) -> dict:
+            calls.append(state["session"])
+            return {"result": state["value"] * 2}
+
+        graph = StateGraph(State)
+        graph.add_node("double", node, cache_policy=CachePolicy(key_func=lambda s: str(s["value"])))
+        graph.set_entry_point("double")
+        graph.add_edge("double", END)
+        app = graph.compile(cache=BoundedSqliteCache(str(tmp_path / "cache.db")))
+
+        first = await app.ainvoke({"value": 2, "session": "s1"})
+        second = await app.ainvoke({"value": 2, "session": "s2"})
+
+        assert first["result"] == second["result"] == 4
+        assert second["session"] == "s2"
+        assert calls == ["s1"]
+
+
+class TestCollectDataCacheKey:
+    """collect_data_cache_key 테스트."""
+
+    def test_ignores_unrelated_fields(self):
+        """작업 ID, 회사명, 재시도 횟수는 키에 영향을 주지 않음."""
+        base = collect_data_cache_key(_state())
+        other = collect_data_cache_key(_state(request={"company": "다른회사"}, retry_count=2))
+
+        assert base == other
+
+    def test_distinguishes_token_identity(self):
+        """토큰이 다르면 다른 키."""
+        assert collect_data_cache_key(_state()) != collect_data_cache_key(
+            _state(request={"github_token": "token-b"})
+        )
+
+    def test_distinguishes_position_and_repos(self):
+        """포지션이나 레포 목록이 다르면 다른 키."""
+        base = collect_data_cache_key(_state())
+
+        assert base != collect_data_cache_key(_state(request={"position": "프론트엔드 개발자"}))
+        assert base != collect_data_cache_key(
+            _state(request={"repo_urls": ["https://github.com/testuser/other"]})
+        )
+
+    def test_key_does_not_contain_token(self):
+        """키에 토큰 원문이 포함되지 않음."""
+        assert "token-a" not in collect_data_cache_key(_state())
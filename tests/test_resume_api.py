@@ -1,7 +1,7 @@
-from unittest.mock import AsyncMock, patch
-
 from httpx import ASGITransport, AsyncClient
 
+from app.api.v1.resume import GENERATE_JOB_KIND
+from app.infra.queue.job_queue import get_job_queue
 from app.main import app
 
 
@@ -12,15 +12,14 @@ class TestGenerateResumeEndpoint:
         """정상 요청 시 jobId 반환"""
         transport = ASGITransport(app=app)
         async with AsyncClient(transport=transport, base_url="http://test") as client:
-            with patch("app.api.v1.resume._run_agent_and_callback", new_callable=AsyncMock):
-                response = await client.post(
-                    "/api/v1/resume/generate",
-                    json={
-                        "repoUrls": ["https://github.com/testuser/testrepo"],
-                        "position": "백엔드 개발자",
-                        "githubToken": "test-token-123",
-                    },
-                )
+            response = await client.post(
+                "/api/v1/resume/generate",
+                json={
+                    "repoUrls": ["https://github.com/testuser/testrepo"],
+                    "position": "백엔드 개발자",
+                    "githubToken": "test-token-123",
+                },
+            )
 
         assert response.status_code == 200
         data = response.json()
@@ -28,20 +27,38 @@ class TestGenerateResumeEndpoint:
         assert isinstance(data["jobId"], str)
         assert len(data["jobId"]) == 36
 
+    async def test_generate_enqueues_job(self):
+        """요청이 작업 큐에 queued 상태로 등록됨"""
+        transport = ASGITransport(app=app)
+        async with AsyncClient(transport=transport, base_url="http://test") as client:
+            response = await client.post(
+                "/api/v1/resume/generate",
+                json={
+                    "repoUrls": ["https://github.com/testuser/testrepo"],
+                    "position": "백엔드 개발자",
+                    "githubToken": "test-token-123",
+                },
+            )
+
+        job = get_job_queue().get(response.json()["jobId"])
+        assert job.kind == GENERATE_JOB_KIND
+        assert job.status == "queued"
+        assert job.payload["request"]["repo_urls"] == ["https://github.com/testuser/testrepo"]
+        assert job.payload["mock"] is False
+
     async def test_generate_with_company(self):
         """회사명 포함 요청 시 정상 동작"""
         transport = ASGITransport(app=app)
         async with AsyncClient(transport=transport, base_url="http://test") as client:
-            with patch("app.api.v1.resume._run_agent_and_callback", new_callable=AsyncMock):
-                response = await client.post(
-                    "/api/v1/resume/generate",
-                    json={
-                        "repoUrls": ["https://github.com/testuser/testrepo"],
-                        "position": "백엔드 개발자",
-                        "company": "테스트회사",
-                        "githubToken": "test-token-123",
-                    },
-                )
+            response = await client.post(
+                "/api/v1/resume/generate",
+                json={
+                    "repoUrls": ["https://github.com/testuser/testrepo"],
+                    "position": "백엔드 개발자",
+                    "company": "테스트회사",
+                    "githubToken": "test-token-123",
+                },
+            )
 
         assert response.status_code == 200
         assert "jobId" in response.json()
@@ -143,6 +160,55 @@ class TestGenerateResumeEndpoint:
         assert response.status_code == 422
 
 
+class TestResumeEventsEndpoint:
+    """GET /api/v1/resume/{job_id}/events 엔드포인트 테스트"""
+
+    async def test_streams_events_until_delivered(self):
+        """기록된 진행 이벤트를 SSE로 전송하고 delivered 이벤트 후 종료"""
+        queue = get_job_queue()
+        queue.enqueue("events-job-1", GENERATE_JOB_KIND, {}, "http://cb")
+        queue.record_event("events-job-1", "collect_data_finished", {"projects": 2})
+        queue.record_event("events-job-1", "delivered")
+
+        transport = ASGITransport(app=app)
+        async with AsyncClient(transport=transport, base_url="http://test") as client:
+            response = await client.get("/api/v1/resume/events-job-1/events")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/event-stream")
+        assert [
+            line.removeprefix("event: ")
+            for line in response.text.splitlines()
+            if line.startswith("event: ")
+        ] == ["queued", "collect_data_finished", "delivered"]
+        assert '"projects": 2' in response.text
+
+    async def test_resumes_after_last_event_id(self):
+        """Last-Event-ID 이후 이벤트부터 전송"""
+        queue = get_job_queue()
+        queue.enqueue("events-job-2", GENERATE_JOB_KIND, {}, "http://cb")
+        last_id = queue.record_event("events-job-2", "plan_finished", {"project": "a"})
+        queue.record_event("events-job-2", "delivered")
+
+        transport = ASGITransport(app=app)
+        async with AsyncClient(transport=transport, base_url="http://test") as client:
+            response = await client.get(
+                "/api/v1/resume/events-job-2/events", headers={"Last-Event-ID": str(last_id)}
+            )
+
+        assert "event: plan_finished" not in response.text
+        assert "event: delivered" in response.text
+
+    async def test_unknown_job_returns_404(self):
+        """존재하지 않는 작업이면 404"""
+        transport = ASGITransport(app=app)
+        async with AsyncClient(transport=transport, base_url="http://test") as client:
+            response = await client.get("/api/v1/resume/unknown-job/events")
+
+        assert response.status_code == 404
+        assert response.json()["error_code"] == "JOB_NOT_FOUND"
+
+
 class TestHealthEndpoint:
     """GET /health 엔드포인트 테스트"""
 
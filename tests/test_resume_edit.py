@@ -1,12 +1,16 @@
 import asyncio
 from unittest.mock import AsyncMock, MagicMock, patch
 
+import pytest
+
+from app.api.v2.resume_edit import EDIT_JOB_KIND
 from app.api.v2.schemas.resume_edit import (
     EditProjectOutput,
     EditResumeOutput,
 )
 from app.core.exceptions import ErrorCode
 from app.domain.resume.schemas.base import EvaluationOutput
+from app.infra.queue.job_queue import get_job_queue
 
 SAMPLE_EDIT_REQUEST = {
     "resumeId": 1,
@@ -52,19 +56,20 @@ class TestEditEndpointSuccess:
 
     async def test_edit_success(self, async_client):
         """정상 수정 요청 시 jobId 즉시 반환"""
-        with patch(
-            "app.api.v2.resume_edit._run_edit_and_callback",
-            new_callable=AsyncMock,
-        ):
-            response = await async_client.post(
-                "/api/v2/resume/edit",
-                json=SAMPLE_EDIT_REQUEST,
-            )
+        response = await async_client.post(
+            "/api/v2/resume/edit",
+            json=SAMPLE_EDIT_REQUEST,
+        )
 
         assert response.status_code == 200
         data = response.json()
         assert "jobId" in data
 
+        job = get_job_queue().get(data["jobId"])
+        assert job.kind == EDIT_JOB_KIND
+        assert job.payload["message"] == SAMPLE_EDIT_REQUEST["requestMessage"]
+        assert job.callback_url.endswith(f"/{data['jobId']}/callback")
+
 
 class TestEditEndpointFailure:
     """이력서 수정 엔드포인트 실패 테스트"""
@@ -73,14 +78,10 @@ class TestEditEndpointFailure:
         """LLM 실패 시에도 jobId 반환 후 실패 콜백 페이로드 생성"""
         from app.api.v2.resume_edit import _build_callback_payload
 
-        with patch(
-            "app.api.v2.resume_edit._run_edit_and_callback",
-            new_callable=AsyncMock,
-        ):
-            response = await async_client.post(
-                "/api/v2/resume/edit",
-                json=SAMPLE_EDIT_REQUEST,
-            )
+        response = await async_client.post(
+            "/api/v2/resume/edit",
+            json=SAMPLE_EDIT_REQUEST,
+        )
 
         assert response.status_code == 200
         assert "jobId" in response.json()
@@ -107,14 +108,10 @@ class TestEditEndpointFailure:
         """타임아웃 시에도 jobId 반환 후 실패 콜백 페이로드 생성"""
         from app.api.v2.resume_edit import _build_callback_payload
 
-        with patch(
-            "app.api.v2.resume_edit._run_edit_and_callback",
-            new_callable=AsyncMock,
-        ):
-            response = await async_client.post(
-                "/api/v2/resume/edit",
-                json=SAMPLE_EDIT_REQUEST,
-            )
+        response = await async_client.post(
+            "/api/v2/resume/edit",
+            json=SAMPLE_EDIT_REQUEST,
+        )
 
         assert response.status_code == 200
         assert "jobId" in response.json()
@@ -423,7 +420,7 @@ class TestEditAgent:
         assert error_code == ErrorCode.EDIT_OUT_OF_SCOPE
 
     async def test_run_edit_agent_timeout(self):
-        """에이전트 타임아웃"""
+        """에이전트 타임아웃은 작업 큐가 재시도하도록 전파"""
         from app.domain.resume.edit_agent import run_edit_agent
 
         mock_workflow = MagicMock()
@@ -438,16 +435,13 @@ class TestEditAgent:
                 "app.domain.resume.edit_agent.get_langfuse_handler",
                 return_value=None,
             ),
+            pytest.raises(asyncio.TimeoutError),
         ):
-            result, error, error_code = await run_edit_agent(
+            await run_edit_agent(
                 resume_json='{"projects": []}',
                 message="수정 요청",
             )
 
-        assert result is None
-        assert "타임아웃" in error
-        assert error_code == ErrorCode.EDIT_FAILED
-
 
 class TestClassifyNode:
     """분류 노드 테스트"""
@@ -1,14 +1,19 @@
+from unittest.mock import AsyncMock, patch
+
 import pytest
 
+from app.domain.resume import service as service_module
 from app.domain.resume.schemas import CommitInfo, PRInfoExtended
 from app.domain.resume.service import (
     _filter_and_sort_dependencies,
     _format_messages,
     _is_empty_repository,
+    _parse_dependencies,
     _summarize_file_tree,
     filter_tech_stack_by_position,
     validate_position_match,
 )
+from app.infra.github.blob_cache import BlobCache
 
 
 class TestFilterAndSortDependencies:
@@ -328,3 +333,101 @@ class TestFilterTechStackByPosition:
         result = filter_tech_stack_by_position(tech_stack, "백엔드 개발자")
 
         assert "lombok" not in result
+
+
+class TestParseDependenciesBlobCache:
+    """_parse_dependencies blob SHA 캐시 테스트."""
+
+    @pytest.fixture
+    def blob_cache(self, monkeypatch):
+        """테스트마다 비어 있는 메모리 blob 캐시."""
+        cache = BlobCache(max_entries=10)
+        monkeypatch.setattr(service_module, "get_blob_cache", lambda: cache)
+        return cache
+
+    async def test_same_blob_fetched_once(self, blob_cache):
+        """같은 blob SHA의 매니페스트는 다른 레포에서도 재조회하지 않음."""
+        content = '{"dependencies": {"react": "^18.0.0"}}'
+        entries = [{"path": "package.json", "size": len(content), "sha": "abc123"}]
+        fetch = AsyncMock(return_value={"package.json": content})
+
+        with patch.object(service_module, "get_files_content", fetch):
+            first = await _parse_dependencies(
+                "https://github.com/a/repo", ["package.json"], "token", entries
+            )
+            second = await _parse_dependencies(
+                "https://github.com/b/fork", ["package.json"], "token", entries
+            )
+
+        assert first == second == ["react"]
+        assert fetch.await_count == 1
+
+    async def test_cached_content_is_parsed_without_fetch(self, blob_cache):
+        """원문만 캐시된 blob은 네트워크 없이 파싱 후 결과 저장."""
+        blob_cache.put_content("def456", "fastapi==0.100.0\n")
+        entries = [{"path": "requirements.txt", "size": 17, "sha": "def456"}]
+        fetch = AsyncMock(return_value={})
+
+        with patch.object(service_module, "get_files_content", fetch):
+            deps = await _parse_dependencies(
+                "https://github.com/a/repo", ["requirements.txt"], "token", entries
+            )
+
+        assert deps == ["fastapi"]
+        fetch.assert_not_awaited()
+        assert blob_cache.get_parsed("def456", "requirements.txt") is not None
+
+
+class TestBlobCache:
+    """BlobCache LRU 및 SQLite 저장 테스트."""
+
+    def test_lru_eviction(self):
+        """최대 개수를 넘으면 가장 오래 사용하지 않은 항목 제거."""
+        cache = BlobCache(max_entries=2)
+        cache.put_content("a", "A")
+        cache.put_content("b", "B")
+        cache.get_content("a")
+        cache.put_content("c", "C")
+
+        assert cache.get_content("b") is None
+        assert cache.get_content("a") == "A"
+
+    def test_sqlite_survives_restart(self, tmp_path):
+        """SQLite 경로가 있으면 새 인스턴스에서도 조회 가능."""
+        path = str(tmp_path / "blobs.db")
+        cache = BlobCache(path=path)
+        cache.put_parsed("sha1", "package.json", {"dependencies": ["react"]})
+        cache.close()
+
+        reopened = BlobCache(path=path)
+
+        assert reopened.get_parsed("sha1", "package.json") == {"dependencies": ["react"]}
+        assert reopened.get_parsed("sha1", "pom.xml") is None
+        reopened.close()
+
+    def test_sqlite_prunes_once_per_interval(self, tmp_path):
+        """SQLite 최대 개수 초과분은 prune_interval회마다 정리."""
+        path = str(tmp_path / "blobs.db")
+        cache = BlobCache(max_entries=1, path=path, prune_interval=2)
+        cache.put_content("a", "A")
+        cache.put_content("b", "B")
+        cache.close()
+
+        reopened = BlobCache(path=path)
+
+        assert reopened.get_content("a") is None
+        assert reopened.get_content("b") == "B"
+        reopened.close()
+
+    async def test_async_methods_read_sqlite(self, tmp_path):
+        """비동기 메서드로 저장한 항목을 새 인스턴스에서 비동기로 조회."""
+        path = str(tmp_path / "blobs.db")
+        cache = BlobCache(path=path)
+        await cache.aput_parsed("sha1", "package.json", {"dependencies": ["react"]})
+        cache.close()
+
+        reopened = BlobCache(path=path)
+
+        assert await reopened.aget_parsed("sha1", "package.json") == {"dependencies": ["react"]}
+        assert await reopened.aget_content("sha1") is None
+        reopened.close()
@@ -0,0 +1,242 @@
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from app.domain.resume import service as service_module
+from app.domain.resume.schemas import CommitInfo, PRInfoExtended, RepoContext, ResumeRequest
+from app.domain.resume.snapshot_store import ProjectSnapshot, RepoSnapshotStore
+
+REPO_URL = "https://github.com/user/repo"
+
+PROJECT_INFO = {
+    "repo_name": "repo",
+    "repo_url": REPO_URL,
+    "file_tree": ["app/"],
+    "dependencies": ["fastapi"],
+    "messages": ["feat: 로그인 API 구현"],
+}
+
+
+def _commit(sha: str, message: str) -> CommitInfo:
+    """테스트용 커밋."""
+    return CommitInfo(sha=sha, message=message, author="tester")
+
+
+@pytest.fixture
+def store(tmp_path, monkeypatch) -> RepoSnapshotStore:
+    """임시 SQLite 스냅샷 저장소를 서비스에 주입."""
+    snapshot_store = RepoSnapshotStore(str(tmp_path / "snapshots.db"))
+    monkeypatch.setattr(service_module, "get_snapshot_store", lambda: snapshot_store)
+    yield snapshot_store
+    snapshot_store.close()
+
+
+class TestRepoSnapshotStore:
+    """RepoSnapshotStore 저장/만료 테스트."""
+
+    def test_project_roundtrip(self, store):
+        """사용자별로 저장한 스냅샷을 그대로 복원."""
+        snapshot = ProjectSnapshot(
+            head_oid="abc",
+            cursor="2024-01-01T00:00:00Z",
+            project_info=PROJECT_INFO,
+            commits=[_commit("s1", "feat: 로그인 API 구현")],
+            pulls=[],
+        )
+        store.put_project(REPO_URL, "Tester", snapshot)
+
+        restored = store.get_project(REPO_URL, "tester")
+
+        assert restored == snapshot
+        assert store.get_project(REPO_URL, "other") is None
+
+    def test_context_requires_same_head(self, store):
+        """HEAD oid가 다르면 컨텍스트 스냅샷 미사용."""
+        context = RepoContext(
+            name="repo", languages={}, description=None, topics=[], readme_summary=None
+        )
+        store.put_context(REPO_URL, "abc", context)
+
+        assert store.get_context(REPO_URL, "abc") == context
+        assert store.get_context(REPO_URL, "def") is None
+
+    def test_evicts_by_age_and_size(self, tmp_path):
+        """보관 기간이 지나거나 최대 개수를 넘으면 삭제."""
+        store = RepoSnapshotStore(
+            str(tmp_path / "s.db"), max_entries=2, max_age_seconds=60, prune_interval=1
+        )
+        context = RepoContext(
+            name="repo", languages={}, description=None, topics=[], readme_summary=None
+        )
+        for i in range(3):
+            store.put_context(f"https://github.com/user/repo{i}", "oid", context)
+
+        assert store.get_context("https://github.com/user/repo0", "oid") is None
+        with patch("app.domain.resume.snapshot_store.time.time", return_value=10**12):
+            assert store.get_context("https://github.com/user/repo2", "oid") is None
+        store.close()
+
+    def test_prunes_once_per_interval(self, tmp_path):
+        """최대 개수 초과분은 저장 prune_interval회마다 정리."""
+        store = RepoSnapshotStore(str(tmp_path / "s.db"), max_entries=1, prune_interval=3)
+        context = RepoContext(
+            name="repo", languages={}, description=None, topics=[], readme_summary=None
+        )
+        for i in range(2):
+            store.put_context(f"https://github.com/user/repo{i}", "oid", context)
+
+        assert store.get_context("https://github.com/user/repo0", "oid") is not None
+
+        store.put_context("https://github.com/user/repo2", "oid", context)
+
+        assert store.get_context("https://github.com/user/repo0", "oid") is None
+        assert store.get_context("https://github.com/user/repo2", "oid") is not None
+        store.close()
+
+
+class TestSnapshotCollection:
+    """_collect_single_project 스냅샷 연동 테스트."""
+
+    async def test_same_head_returns_snapshot(self, store):
+        """HEAD oid가 같으면 GitHub 수집 없이 스냅샷 반환."""
+        store.put_project(
+            REPO_URL,
+            "tester",
+            ProjectSnapshot("abc", "2024-01-01T00:00:00Z", PROJECT_INFO, [], []),
+        )
+
+        with (
+            patch.object(
+                service_module,
+                "get_head_commit",
+                AsyncMock(return_value={"oid": "abc", "committed_date": "2024-01-01T00:00:00Z"}),
+            ),
+            patch.object(service_module, "get_project_info", AsyncMock()) as project_info,
+        ):
+            result = await service_module._collect_single_project(REPO_URL, "token", "tester", None)
+
+        assert result == PROJECT_INFO
+        project_info.assert_not_awaited()
+
+    async def test_new_head_merges_commits_after_cursor(self, store):
+        """HEAD가 바뀌면 커서 이후 이력만 조회해 기존 이력과 병합."""
+        store.put_project(
+            REPO_URL,
+            "tester",
+            ProjectSnapshot(
+                "abc",
+                "2024-01-01T00:00:00Z",
+                PROJECT_INFO,
+                [_commit("s1", "feat: 로그인 API 구현")],
+                [],
+            ),
+        )
+        new_pr = PRInfoExtended(
+            number=7,
+            title="회원가입 추가",
+            body=None,
+            author="tester",
+            merged_at="2024-02-01T00:00:00Z",
+            repo_url=REPO_URL,
+            commits_count=2,
+            additions=10,
+            deletions=1,
+        )
+        history_since = AsyncMock(
+            return_value={"commits": [_commit("s2", "feat: 회원가입 API 구현")], "pulls": [new_pr]}
+        )
+
+        with (
+            patch.object(
+                service_module,
+                "get_head_commit",
+                AsyncMock(return_value={"oid": "def", "committed_date": "2024-02-01T00:00:00Z"}),
+            ),
+            patch.object(service_module, "get_project_history_since", history_since),
+            patch.object(
+                service_module,
+                "get_repo_tree_entries",
+                AsyncMock(return_value=[{"path": "app/main.py", "size": 10, "sha": "b1"}]),
+            ),
+            patch.object(service_module, "get_project_info", AsyncMock()) as project_info,
+        ):
+            result = await service_module._collect_single_project(REPO_URL, "token", "tester", None)
+
+        project_info.assert_not_awaited()
+        assert history_since.await_args.args[1] == "2024-01-01T00:00:00Z"
+        assert any("회원가입 API" in message for message in result["messages"])
+        assert any("로그인 API" in message for message in result["messages"])
+        assert store.get_project(REPO_URL, "tester").head_oid == "def"
+
+
+class TestSnapshotPrefetch:
+    """prefetch_repositories 스냅샷 레포 배치 제외 테스트."""
+
+    @staticmethod
+    def _request(*repo_urls: str) -> ResumeRequest:
+        return ResumeRequest(repo_urls=list(repo_urls), position="backend", github_token="token")
+
+    async def test_fresh_snapshot_excluded_from_batch(self, store):
+        """HEAD가 같은 스냅샷 레포는 배치 조회에서 제외."""
+        other = "https://github.com/user/other"
+        store.put_project(REPO_URL, "tester", ProjectSnapshot("abc", None, PROJECT_INFO, [], []))
+        batch = AsyncMock(return_value={other: {}})
+
+        with (
+            patch.object(
+                service_module, "get_authenticated_user", AsyncMock(return_value=("tester", None))
+            ),
+            patch.object(
+                service_module,
+                "get_head_commit",
+                AsyncMock(return_value={"oid": "abc", "committed_date": None}),
+            ),
+            patch.object(service_module, "get_repos_batch_graphql", batch),
+        ):
+            result = await service_module.prefetch_repositories(self._request(REPO_URL, other))
+
+        assert result == {other: {}}
+        assert batch.await_args.args[0] == [other]
+
+    async def test_all_snapshotted_skips_batch(self, store):
+        """커서가 있는 스냅샷만 있으면 HEAD 확인은 수집 단계로 미루고 배치를 보내지 않음."""
+        store.put_project(
+            REPO_URL,
+            "tester",
+            ProjectSnapshot("abc", "2024-01-01T00:00:00Z", PROJECT_INFO, [], []),
+        )
+        head = AsyncMock()
+        batch = AsyncMock()
+
+        with (
+            patch.object(
+                service_module, "get_authenticated_user", AsyncMock(return_value=("tester", None))
+            ),
+            patch.object(service_module, "get_head_commit", head),
+            patch.object(service_module, "get_repos_batch_graphql", batch),
+        ):
+            result = await service_module.prefetch_repositories(self._request(REPO_URL))
+
+        assert result == {}
+        head.assert_not_awaited()
+        batch.assert_not_awaited()
+
+    async def test_stale_snapshot_without_cursor_stays_in_batch(self, store):
+        """커서가 없고 HEAD가 바뀐 스냅샷 레포는 배치로 조회."""
+        store.put_project(REPO_URL, "tester", ProjectSnapshot("abc", None, PROJECT_INFO, [], []))
+        batch = AsyncMock(return_value={REPO_URL: {}})
+
+        with (
+            patch.object(
+                service_module, "get_authenticated_user", AsyncMock(return_value=("tester", None))
+            ),
+            patch.object(
+                service_module,
+                "get_head_commit",
+                AsyncMock(return_value={"oid": "def", "committed_date": None}),
+            ),
+            patch.object(service_module, "get_repos_batch_graphql", batch),
+        ):
+            await service_module.prefetch_repositories(self._request(REPO_URL))
+
+        assert batch.await_args.args[0] == [REPO_URL]
@@ -0,0 +1,118 @@
+import timeit
+from unittest.mock import MagicMock, patch
+
+import pytest
+from langchain_google_genai import ChatGoogleGenerativeAI
+
+from app.domain.resume.schemas import EvaluationOutput, ResumeData
+from app.domain.resume.schemas.plan import ProjectPlan
+from app.infra.llm import base
+from app.infra.llm.base import (
+    close_llm_clients,
+    get_structured_runnable,
+    warm_structured_runnables,
+)
+
+
+class TestStructuredRunnableRegistry:
+    """구조화 출력 runnable 레지스트리 테스트."""
+
+    def test_reuses_runnable_for_same_key(self):
+        """같은 LLM, 출력 타입, method면 with_structured_output을 한 번만 호출."""
+        llm = MagicMock()
+
+        first = get_structured_runnable(llm, ResumeData, "json_mode")
+        second = get_structured_runnable(llm, ResumeData, "json_mode")
+
+        assert first is second
+        llm.with_structured_output.assert_called_once_with(ResumeData, method="json_mode")
+
+    def test_separate_runnable_per_type_and_method(self):
+        """출력 타입이나 method가 다르면 별도 runnable 생성."""
+        llm = MagicMock()
+
+        get_structured_runnable(llm, ResumeData, "json_mode")
+        get_structured_runnable(llm, ProjectPlan, "json_mode")
+        get_structured_runnable(llm, ResumeData)
+
+        assert llm.with_structured_output.call_count == 3
+
+    def test_new_client_instance_rebuilds(self):
+        """LLM 클라이언트가 새로 만들어지면 이전 runnable을 사용하지 않음."""
+        old, new = MagicMock(), MagicMock()
+        get_structured_runnable(old, ResumeData, "json_mode")
+
+        get_structured_runnable(new, ResumeData, "json_mode")
+
+        new.with_structured_output.assert_called_once()
+
+    def test_close_llm_clients_clears_registry(self):
+        """LLM 클라이언트 정리 시 레지스트리도 비움."""
+        llm = MagicMock()
+        get_structured_runnable(llm, ResumeData, "json_mode")
+
+        close_llm_clients()
+        get_structured_runnable(llm, ResumeData, "json_mode")
+
+        assert llm.with_structured_output.call_count == 2
+
+    def test_warm_builds_registered_targets_and_skips_failures(self):
+        """등록된 대상을 미리 생성하고 클라이언트 생성에 실패한 대상은 건너뜀."""
+        llm = MagicMock()
+
+        def broken():
+            raise ValueError("API key required")
+
+        targets = [(lambda: llm, ResumeData, "json_mode"), (broken, EvaluationOutput, None)]
+        with patch.object(base, "_warmup_targets", targets):
+            warmed = warm_structured_runnables()
+
+        assert warmed == 1
+        assert get_structured_runnable(llm, ResumeData, "json_mode") is (
+            llm.with_structured_output.return_value
+        )
+        llm.with_structured_output.assert_called_once()
+
+    def test_repeated_lookups_build_once(self):
+        """실제 Gemini 클라이언트에서도 반복 조회 시 runnable을 한 번만 생성."""
+        llm = ChatGoogleGenerativeAI(model="gemini-2.5-pro", google_api_key="test-key")
+
+        with patch.object(
+            ChatGoogleGenerativeAI,
+            "with_structured_output",
+            autospec=True,
+            side_effect=ChatGoogleGenerativeAI.with_structured_output,
+        ) as build:
+            runnables = {
+                id(get_structured_runnable(llm, ResumeData, "json_mode")) for _ in range(20)
+            }
+
+        assert len(runnables) == 1
+        assert build.call_count == 1
+
+    @pytest.mark.benchmark
+    def test_registry_removes_per_call_build_overhead(self):
+        """마이크로 벤치마크: 레지스트리 조회가 매 호출 runnable 생성보다 10배 이상 빠름.
+
+        Gemini json_mode는 호출마다 출력 스키마를 변환하므로 생성 비용이 가장 크다
+        wall-clock 측정이라 기본 실행에서는 제외되며 `pytest -m benchmark`로 실행한다
+        """
+        llm = ChatGoogleGenerativeAI(model="gemini-2.5-pro", google_api_key="test-key")
+        get_structured_runnable(llm, ResumeData, "json_mode")
+
+        rebuild = min(
+            timeit.repeat(
+                lambda: llm.with_structured_output(ResumeData, method="json_mode"),
+                number=20,
+                repeat=3,
+            )
+        )
+        cached = min(
+            timeit.repeat(
+                lambda: get_structured_runnable(llm, ResumeData, "json_mode"),
+                number=20,
+                repeat=3,
+            )
+        )
+
+        assert cached * 10 < rebuild
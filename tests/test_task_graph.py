@@ -0,0 +1,69 @@
+import asyncio
+
+import pytest
+
+from app.domain.resume.task_graph import TaskGraph
+
+
+class TestTaskGraph:
+    """TaskGraph 의존성 실행 테스트."""
+
+    async def test_dependents_start_when_inputs_ready(self):
+        """느린 작업과 무관한 작업은 그 완료를 기다리지 않음."""
+        order: list[str] = []
+
+        async def slow() -> str:
+            await asyncio.sleep(0.05)
+            order.append("slow")
+            return "repos"
+
+        async def identity() -> str:
+            order.append("identity")
+            return "tester"
+
+        async def stats(identity: str) -> str:
+            order.append("stats")
+            return f"stats:{identity}"
+
+        graph = TaskGraph("test")
+        graph.add("slow", slow)
+        graph.add("identity", identity)
+        graph.add("stats", stats, deps=("identity",))
+
+        results = await graph.run()
+
+        assert order == ["identity", "stats", "slow"]
+        assert results == {"slow": "repos", "identity": "tester", "stats": "stats:tester"}
+        assert graph.timings["stats"].finished_ms < graph.timings["slow"].finished_ms
+
+    async def test_failure_cancels_remaining_tasks(self):
+        """작업 실패 시 나머지 작업을 취소하고 예외 전파."""
+        cancelled = asyncio.Event()
+
+        async def fail() -> None:
+            raise ValueError("boom")
+
+        async def long_running() -> None:
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        graph = TaskGraph("test")
+        graph.add("fail", fail)
+        graph.add("long", long_running)
+
+        with pytest.raises(ValueError, match="boom"):
+            await graph.run()
+        assert cancelled.is_set()
+
+    def test_rejects_unknown_dependency(self):
+        """등록되지 않은 작업에 의존하면 ValueError."""
+        graph = TaskGraph("test")
+
+        async def noop() -> None:
+            return None
+
+        with pytest.raises(ValueError):
+            graph.add("stats", noop, deps=("identity",))
@@ -1,3 +1,4 @@
+import asyncio
 from unittest.mock import AsyncMock, patch
 
 import httpx
@@ -5,6 +6,7 @@ import pytest
 
 from app.core.exceptions import ErrorCode
 from app.domain.resume.schemas import (
+    EvaluationOutput,
     ProjectInfo,
     RepoContext,
     ResumeData,
@@ -12,12 +14,21 @@ from app.domain.resume.schemas import (
     ResumeState,
     UserStats,
 )
+from app.domain.resume.schemas.plan import ProjectPlan
 from app.domain.resume.workflow import (
+    EVALUATOR_CALLS_SAVED,
+    FORMAT_VALIDATION_TOTAL,
+    MAX_GENERATE_RETRIES,
+    _route_after_validate,
+    assemble_node,
     collect_data_node,
+    create_resume_workflow,
     evaluate_node,
     generate_node,
     should_continue,
+    validate_node,
 )
+from app.infra.queue.progress import progress_scope
 
 
 class TestCollectDataNode:
@@ -216,6 +227,126 @@ class TestGenerateNode:
         assert "검증 오류" in result["error_message"]
 
 
+class TestGenerateNodePerProject:
+    """프로젝트별 병렬 생성 모드 테스트"""
+
+    @pytest.fixture(autouse=True)
+    def per_project_mode(self, monkeypatch):
+        monkeypatch.setattr(
+            "app.domain.resume.workflow.settings.resume_generation_mode", "per_project"
+        )
+
+    @staticmethod
+    def _project(name: str) -> dict:
+        return {
+            "repo_name": name,
+            "repo_url": f"https://github.com/testuser/{name}",
+            "dependencies": ["fastapi"],
+            "messages": [f"feat: {name}"],
+        }
+
+    @staticmethod
+    def _generated(project: dict) -> ProjectInfo:
+        return ProjectInfo(
+            name=project["repo_name"],
+            repo_url=project["repo_url"],
+            description="- 구현",
+            tech_stack=["FastAPI"],
+        )
+
+    @staticmethod
+    def _plan(name: str) -> ProjectPlan:
+        return ProjectPlan(
+            project_name=name,
+            repo_url=f"https://github.com/testuser/{name}",
+            recommended_tech_stack=["FastAPI"],
+            bullet_plans=[],
+            skipped_commits=[],
+        )
+
+    def _state(self, names: list[str], **extra) -> ResumeState:
+        return ResumeState(
+            request=ResumeRequest(
+                repo_urls=[f"https://github.com/testuser/{n}" for n in names],
+                position="백엔드 개발자",
+                github_token="test-token",
+            ),
+            project_info=[self._project(n) for n in names],
+            project_plans=[self._plan(n) for n in names],
+            **extra,
+        )
+
+    async def test_generates_projects_concurrently_in_order(self):
+        """프로젝트별 호출이 동시에 실행되고 결과는 입력 순서대로 조립."""
+        running = 0
+        peak = 0
+
+        async def fake_generate(project, position, generation_plan, **kwargs):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.05 if project["repo_name"] == "a" else 0.01)
+            running -= 1
+            assert project["repo_name"] in generation_plan
+            return self._generated(project)
+
+        with patch("app.domain.resume.workflow.generate_project_resume", side_effect=fake_generate):
+            result = await generate_node(self._state(["a", "b", "c"]))
+
+        assert [p.name for p in result["resume_data"].projects] == ["a", "b", "c"]
+        assert peak == 3
+
+    async def test_failed_project_is_isolated(self):
+        """한 프로젝트가 실패해도 나머지 프로젝트로 이력서 생성."""
+
+        async def fake_generate(project, **kwargs):
+            if project["repo_name"] == "b":
+                raise ValueError("malformed")
+            return self._generated(project)
+
+        with patch("app.domain.resume.workflow.generate_project_resume", side_effect=fake_generate):
+            result = await generate_node(self._state(["a", "b", "c"]))
+
+        assert [p.name for p in result["resume_data"].projects] == ["a", "c"]
+        assert result.get("error_code") is None
+
+    async def test_retry_keeps_previous_project_on_failure(self):
+        """재시도 중 실패한 프로젝트는 이전 결과를 유지하고 피드백은 프로젝트별로 전달."""
+        previous = ResumeData(
+            projects=[self._generated(self._project("a")), self._generated(self._project("b"))]
+        )
+        calls = []
+
+        async def fake_generate(project, feedback, previous_project_json, **kwargs):
+            calls.append(
+                (project["repo_name"], feedback, project["repo_url"] in previous_project_json)
+            )
+            if project["repo_name"] == "b":
+                raise ValueError("malformed")
+            return self._generated(project)
+
+        state = self._state(
+            ["a", "b"], resume_data=previous, evaluation_feedback="불릿 보강", retry_count=0
+        )
+        with patch("app.domain.resume.workflow.generate_project_resume", side_effect=fake_generate):
+            result = await generate_node(state)
+
+        assert [p.name for p in result["resume_data"].projects] == ["a", "b"]
+        assert sorted(calls) == [("a", "불릿 보강", True), ("b", "불릿 보강", True)]
+        assert result["retry_count"] == 1
+
+    async def test_all_projects_failed_sets_error(self):
+        """모든 프로젝트가 실패하면 기존 에러 처리 경로를 따름."""
+        with patch(
+            "app.domain.resume.workflow.generate_project_resume",
+            new_callable=AsyncMock,
+            side_effect=ValueError("Invalid format"),
+        ):
+            result = await generate_node(self._state(["a", "b"]))
+
+        assert result["error_code"] == ErrorCode.GENERATE_VALIDATION_ERROR
+
+
 class TestEvaluateNode:
     """evaluate_node 함수 테스트"""
 
@@ -314,6 +445,383 @@ class TestEvaluateNode:
         assert result["evaluation"] == "pass"
 
 
+class TestProjectGranularRetry:
+    """프로젝트별 평가 및 실패 프로젝트만 재생성 테스트"""
+
+    @pytest.fixture(autouse=True)
+    def per_project_evaluation(self, monkeypatch):
+        monkeypatch.setattr(
+            "app.domain.resume.workflow.settings.resume_evaluation_mode", "per_project"
+        )
+
+    @staticmethod
+    def _generated(name: str, description: str = "- 구현") -> ProjectInfo:
+        return ProjectInfo(
+            name=name,
+            repo_url=f"https://github.com/testuser/{name}",
+            description=description,
+            tech_stack=["FastAPI"],
+        )
+
+    def _state(self, names: list[str], **extra) -> ResumeState:
+        return ResumeState(
+            request=ResumeRequest(
+                repo_urls=[f"https://github.com/testuser/{n}" for n in names],
+                position="백엔드 개발자",
+                github_token="test-token",
+            ),
+            project_info=[
+                {
+                    "repo_name": n,
+                    "repo_url": f"https://github.com/testuser/{n}",
+                    "dependencies": [],
+                    "messages": [f"feat: {n}"],
+                }
+                for n in names
+            ],
+            repo_contexts={},
+            resume_data=ResumeData(projects=[self._generated(n) for n in names]),
+            **extra,
+        )
+
+    async def test_evaluates_each_project(self):
+        """프로젝트마다 판정과 피드백을 저장하고 하나라도 실패하면 fail."""
+
+        async def fake_evaluate(resume_data, project_info, **kwargs):
+            project = resume_data.projects[0]
+            assert [p["repo_url"] for p in project_info] == [project.repo_url]
+            if project.name == "b":
+                return EvaluationOutput(result="fail", violated_rule=1, feedback="근거 없음")
+            return EvaluationOutput(result="pass", feedback="")
+
+        with patch("app.domain.resume.workflow.evaluate_resume", side_effect=fake_evaluate):
+            result = await evaluate_node(self._state(["a", "b"]))
+
+        assert result["evaluation"] == "fail"
+        assert result["project_verdicts"] == {
+            "https://github.com/testuser/a": "pass",
+            "https://github.com/testuser/b": "fail",
+        }
+        assert result["project_feedback"] == {"https://github.com/testuser/b": "근거 없음"}
+        assert "[b] 근거 없음" in result["evaluation_feedback"]
+
+    async def test_passed_projects_are_not_reevaluated(self):
+        """이미 통과한 프로젝트는 다시 평가하지 않음."""
+        evaluated = []
+
+        async def fake_evaluate(resume_data, **kwargs):
+            evaluated.append(resume_data.projects[0].name)
+            return EvaluationOutput(result="pass", feedback="")
+
+        state = self._state(
+            ["a", "b"],
+            project_verdicts={
+                "https://github.com/testuser/a": "pass",
+                "https://github.com/testuser/b": "fail",
+            },
+        )
+        with patch("app.domain.resume.workflow.evaluate_resume", side_effect=fake_evaluate):
+            result = await evaluate_node(state)
+
+        assert evaluated == ["b"]
+        assert result["evaluation"] == "pass"
+
+    async def test_retry_regenerates_only_failed_projects(self):
+        """재시도 시 실패한 프로젝트만 다시 생성하고 통과한 프로젝트는 그대로 유지."""
+        regenerated = []
+
+        async def fake_generate(project, feedback, previous_project_json, **kwargs):
+            regenerated.append((project["repo_name"], feedback))
+            return self._generated(project["repo_name"], "- 수정됨")
+
+        state = self._state(
+            ["a", "b", "c"],
+            evaluation="fail",
+            evaluation_feedback="[b] 근거 없음",
+            project_feedback={"https://github.com/testuser/b": "근거 없음"},
+            retry_count=0,
+        )
+        with (
+            patch("app.domain.resume.workflow.generate_project_resume", side_effect=fake_generate),
+            patch("app.domain.resume.workflow.generate_resume", new_callable=AsyncMock) as batch,
+        ):
+            result = await generate_node(state)
+
+        batch.assert_not_called()
+        assert regenerated == [("b", "근거 없음")]
+        assert [p.description for p in result["resume_data"].projects] == [
+            "- 구현",
+            "- 수정됨",
+            "- 구현",
+        ]
+        assert result["retry_count"] == 1
+
+
+class TestValidateNode:
+    """LLM 평가 전 형식 검증 노드 테스트."""
+
+    VALID_DESCRIPTION = "\n".join(f"- API {i} 구현" for i in range(5))
+
+    @staticmethod
+    def _project(name: str, description: str, tech_stack: list[str] | None = None) -> ProjectInfo:
+        return ProjectInfo(
+            name=name,
+            repo_url=f"https://github.com/testuser/{name}",
+            description=description,
+            tech_stack=tech_stack or ["Python", "FastAPI", "PostgreSQL"],
+        )
+
+    def _state(self, projects: list[ProjectInfo], **extra) -> ResumeState:
+        return ResumeState(
+            request=ResumeRequest(
+                repo_urls=[p.repo_url for p in projects],
+                position="백엔드 개발자",
+                github_token="test-token",
+            ),
+            resume_data=ResumeData(projects=projects),
+            **extra,
+        )
+
+    async def test_clean_resume_goes_to_evaluate(self):
+        """형식 위반이 없으면 평가 단계로 진행."""
+        passed = FORMAT_VALIDATION_TOTAL.labels(outcome="passed")._value.get()
+        state = self._state([self._project("a", self.VALID_DESCRIPTION)])
+
+        result = await validate_node(state)
+
+        assert result == {"format_violations": []}
+        assert _route_after_validate({**state, **result}) == "evaluate"
+        assert FORMAT_VALIDATION_TOTAL.labels(outcome="passed")._value.get() == passed + 1
+
+    async def test_violations_skip_evaluator(self):
+        """형식 위반이 있으면 평가 없이 위반 사항을 피드백으로 재생성."""
+        saved = EVALUATOR_CALLS_SAVED._value.get()
+        state = self._state([self._project("a", "- 기능 구현했습니다")], retry_count=0)
+
+        with patch("app.domain.resume.workflow.evaluate_resume", new_callable=AsyncMock) as ev:
+            result = await validate_node(state)
+
+        ev.assert_not_called()
+        assert result["evaluation"] == "fail"
+        assert "[a] bullet_count" in result["evaluation_feedback"]
+        assert "forbidden_ending" in result["evaluation_feedback"]
+        assert "project_feedback" not in result
+        assert _route_after_validate({**state, **result}) == "generate"
+        assert EVALUATOR_CALLS_SAVED._value.get() == saved + 1
+
+    async def test_violations_end_when_retries_exhausted(self):
+        """재시도 한도에 도달하면 평가 없이 종료."""
+        state = self._state(
+            [self._project("a", "- 기능 구현했습니다")], retry_count=MAX_GENERATE_RETRIES
+        )
+
+        result = await validate_node(state)
+
+        assert _route_after_validate({**state, **result}) == "end"
+
+    async def test_disabled_validation_goes_to_evaluate(self, monkeypatch):
+        """형식 검증을 끄면 위반이 있어도 평가로 진행."""
+        monkeypatch.setattr(
+            "app.domain.resume.workflow.settings.resume_format_validation_enabled", False
+        )
+        state = self._state([self._project("a", "- 기능 구현했습니다")])
+
+        result = await validate_node(state)
+
+        assert _route_after_validate({**state, **result}) == "evaluate"
+
+    async def test_per_project_feedback_targets_violating_projects(self, monkeypatch):
+        """프로젝트별 평가 모드에서는 위반한 프로젝트만 재생성 대상으로 지정."""
+        monkeypatch.setattr(
+            "app.domain.resume.workflow.settings.resume_evaluation_mode", "per_project"
+        )
+        saved = EVALUATOR_CALLS_SAVED._value.get()
+        state = self._state(
+            [
+                self._project("a", self.VALID_DESCRIPTION),
+                self._project("b", self.VALID_DESCRIPTION, ["Python", "Pydantic"]),
+                self._project("c", self.VALID_DESCRIPTION),
+            ],
+            project_verdicts={"https://github.com/testuser/a": "pass"},
+        )
+
+        result = await validate_node(state)
+
+        assert list(result["project_feedback"]) == ["https://github.com/testuser/b"]
+        assert "tech_stack_count" in result["project_feedback"]["https://github.com/testuser/b"]
+        assert "forbidden_tech" in result["project_feedback"]["https://github.com/testuser/b"]
+        assert result["project_verdicts"] == {
+            "https://github.com/testuser/a": "pass",
+            "https://github.com/testuser/b": "fail",
+        }
+        # 위반하지 않은 c는 다음 라운드에 평가되므로 절감 호출에 포함하지 않음
+        assert EVALUATOR_CALLS_SAVED._value.get() == saved + 1
+
+
+class TestPipelinedWorkflow:
+    """프로젝트별 plan→generate→evaluate 파이프라인 테스트."""
+
+    DESCRIPTION = "\n".join(f"- API {i} 구현" for i in range(5))
+
+    @pytest.fixture(autouse=True)
+    def pipelined(self, monkeypatch):
+        monkeypatch.setattr("app.domain.resume.workflow.settings.resume_pipeline_mode", "pipelined")
+
+    @staticmethod
+    def _project_info(name: str) -> dict:
+        return {
+            "repo_name": name,
+            "repo_url": f"https://github.com/pipeline/{name}",
+            "dependencies": ["fastapi"],
+            "messages": [f"feat: {name}"],
+        }
+
+    def _generated(self, name: str) -> ProjectInfo:
+        return ProjectInfo(
+            name=name,
+            repo_url=f"https://github.com/pipeline/{name}",
+            description=self.DESCRIPTION,
+            tech_stack=["Python", "FastAPI", "PostgreSQL"],
+        )
+
+    @staticmethod
+    def _plan(project_info: dict) -> ProjectPlan:
+        return ProjectPlan(
+            project_name=project_info["repo_name"],
+            repo_url=project_info["repo_url"],
+            recommended_tech_stack=[],
+            bullet_plans=[],
+            skipped_commits=[],
+        )
+
+    def _workflow(self, names: list[str]):
+        async def fake_collect(state):
+            return {"project_info": [self._project_info(n) for n in names], "repo_contexts": {}}
+
+        with patch("app.domain.resume.workflow.collect_data_node", side_effect=fake_collect):
+            workflow = create_resume_workflow()
+        request = ResumeRequest(
+            repo_urls=[f"https://github.com/pipeline/{n}" for n in names],
+            position="백엔드 개발자",
+            github_token="test-token",
+        )
+        return workflow, {"request": request, "retry_count": 0}
+
+    async def test_generation_starts_before_all_plans_finish(self):
+        """느린 프로젝트의 plan을 기다리지 않고 먼저 끝난 plan부터 생성."""
+        fast_generated = asyncio.Event()
+        events = []
+
+        async def fake_plan(project_info, **kwargs):
+            if project_info["repo_name"] == "slow":
+                await fast_generated.wait()
+            events.append(f"plan:{project_info['repo_name']}")
+            return self._plan(project_info)
+
+        async def fake_generate(project, **kwargs):
+            events.append(f"generate:{project['repo_name']}")
+            if project["repo_name"] == "fast":
+                fast_generated.set()
+            return self._generated(project["repo_name"])
+
+        workflow, initial = self._workflow(["slow", "fast"])
+        with (
+            patch("app.domain.resume.workflow.plan_resume", side_effect=fake_plan),
+            patch("app.domain.resume.workflow.generate_project_resume", side_effect=fake_generate),
+            patch(
+                "app.domain.resume.workflow.evaluate_resume",
+                return_value=EvaluationOutput(result="pass", feedback=""),
+            ) as evaluate,
+        ):
+            result = await asyncio.wait_for(workflow.ainvoke(initial), timeout=5)
+
+        assert events.index("generate:fast") < events.index("plan:slow")
+        assert [p.name for p in result["resume_data"].projects] == ["slow", "fast"]
+        assert [p.project_name for p in result["project_plans"]] == ["slow", "fast"]
+        evaluate.assert_called_once()
+
+    async def test_per_project_evaluation_retries_only_failed_project(self, monkeypatch):
+        """파이프라인에서 평가까지 마치고 실패한 프로젝트만 재생성."""
+        monkeypatch.setattr(
+            "app.domain.resume.workflow.settings.resume_evaluation_mode", "per_project"
+        )
+        generated = []
+        evaluated = []
+
+        async def fake_generate(project, feedback, **kwargs):
+            generated.append((project["repo_name"], feedback))
+            return self._generated(project["repo_name"])
+
+        async def fake_evaluate(resume_data, **kwargs):
+            name = resume_data.projects[0].name
+            evaluated.append(name)
+            if name == "b" and evaluated.count("b") == 1:
+                return EvaluationOutput(result="fail", violated_rule=1, feedback="근거 없음")
+            return EvaluationOutput(result="pass", feedback="")
+
+        workflow, initial = self._workflow(["a", "b"])
+        with (
+            patch(
+                "app.domain.resume.workflow.plan_resume",
+                side_effect=lambda project_info, **kw: self._plan(project_info),
+            ),
+            patch("app.domain.resume.workflow.generate_project_resume", side_effect=fake_generate),
+            patch("app.domain.resume.workflow.evaluate_resume", side_effect=fake_evaluate),
+        ):
+            result = await asyncio.wait_for(workflow.ainvoke(initial), timeout=5)
+
+        assert sorted(generated) == [("a", ""), ("b", ""), ("b", "근거 없음")]
+        assert sorted(evaluated) == ["a", "b", "b"]
+        assert result["evaluation"] == "pass"
+        assert result["retry_count"] == 1
+
+    async def test_emits_progress_events_per_project(self):
+        """프로젝트별 plan, 생성 완료와 평가 결과를 진행 이벤트로 기록."""
+        events = []
+        workflow, initial = self._workflow(["a", "b"])
+        with (
+            patch(
+                "app.domain.resume.workflow.plan_resume",
+                side_effect=lambda project_info, **kw: self._plan(project_info),
+            ),
+            patch(
+                "app.domain.resume.workflow.generate_project_resume",
+                side_effect=lambda project, **kw: self._generated(project["repo_name"]),
+            ),
+            patch(
+                "app.domain.resume.workflow.evaluate_resume",
+                return_value=EvaluationOutput(result="pass", feedback=""),
+            ),
+            progress_scope(lambda event, data: events.append((event, data))),
+        ):
+            await asyncio.wait_for(workflow.ainvoke(initial), timeout=5)
+
+        names = [event for event, _ in events]
+        assert sorted(d["project"] for e, d in events if e == "plan_finished") == ["a", "b"]
+        assert names.count("project_finished") == 2
+        assert names[-1] == "evaluate_finished"
+        assert events[-1][1]["verdict"] == "pass"
+
+    async def test_assemble_returns_error_when_all_projects_fail(self):
+        """모든 프로젝트 생성이 실패하면 첫 번째 실패의 에러 상태 반환."""
+        state = ResumeState(
+            project_results={
+                "b": {"index": 1, "project": None, "error_code": ErrorCode.LLM_API_ERROR},
+                "a": {
+                    "index": 0,
+                    "project": None,
+                    "error_code": ErrorCode.GENERATE_PARSE_ERROR,
+                    "error_message": "파싱 실패",
+                },
+            }
+        )
+
+        result = await assemble_node(state)
+
+        assert result["error_code"] == ErrorCode.GENERATE_PARSE_ERROR
+        assert result["error_message"] == "파싱 실패"
+
+
 class TestShouldContinue:
     """should_continue 조건 함수 테스트"""
 
@@ -0,0 +1,202 @@
+import asyncio
+import time
+from typing import TypedDict
+
+import pytest
+from langgraph.checkpoint.sqlite.aio import AsyncSqliteSaver
+from langgraph.graph import END, StateGraph
+
+from app.domain.resume.schemas import ProjectInfo, ResumeData
+from app.domain.resume.schemas.plan import BulletPlan, ProjectPlan
+from app.domain.resume.workflow_utils import (
+    ainvoke_resumable,
+    clear_checkpoint,
+    discard_checkpoint,
+)
+
+
+class _State(TypedDict, total=False):
+    plans: list[ProjectPlan]
+    resume_data: ResumeData
+
+
+def _plan() -> ProjectPlan:
+    return ProjectPlan(
+        project_name="repo",
+        repo_url="https://github.com/user/repo",
+        recommended_tech_stack=["FastAPI"],
+        bullet_plans=[
+            BulletPlan(source_commits=["feat: init"], suggested_content="c", technical_detail="d")
+        ],
+        skipped_commits=[],
+    )
+
+
+def _build(checkpointer, generate):
+    calls = {"plan": 0, "generate": 0}
+
+    async def plan_node(state: _State) -> dict:
+        calls["plan"] += 1
+        return {"plans": [_plan()]}
+
+    async def generate_node(state: _State) -> dict:
+        calls["generate"] += 1
+        return await generate(state, calls["generate"])
+
+    graph = StateGraph(_State)
+    graph.add_node("plan", plan_node)
+    graph.add_node("generate", generate_node)
+    graph.set_entry_point("plan")
+    graph.add_edge("plan", "generate")
+    graph.add_edge("generate", END)
+    return graph.compile(checkpointer=checkpointer), calls
+
+
+def _resume(state: _State) -> dict:
+    plan = state["plans"][0]
+    project = ProjectInfo(
+        name=plan.project_name, repo_url=plan.repo_url, description="- 구현", tech_stack=["A"]
+    )
+    return {"resume_data": ResumeData(projects=[project])}
+
+
+@pytest.fixture
+async def checkpointer(tmp_path):
+    async with AsyncSqliteSaver.from_conn_string(str(tmp_path / "checkpoints.db")) as saver:
+        yield saver
+
+
+class TestAinvokeResumable:
+    """ainvoke_resumable 테스트."""
+
+    async def test_resumes_after_crash_without_repeating_nodes(self, checkpointer):
+        """중간 노드 실패 후 같은 thread_id로 재실행하면 완료된 노드는 건너뜀."""
+
+        async def generate(state, call):
+            if call == 1:
+                raise RuntimeError("process crashed")
+            return _resume(state)
+
+        workflow, calls = _build(checkpointer, generate)
+        config = {"configurable": {"thread_id": "job-1"}}
+
+        with pytest.raises(RuntimeError):
+            await ainvoke_resumable(workflow, {}, config, timeout=5)
+        final_state = await ainvoke_resumable(workflow, {}, config, timeout=5)
+
+        assert calls == {"plan": 1, "generate": 2}
+        assert isinstance(final_state["plans"][0], ProjectPlan)
+        assert final_state["resume_data"].projects[0].name == "repo"
+
+    async def test_timeout_keeps_checkpoint_for_retry(self, checkpointer):
+        """타임아웃 후 같은 thread_id로 재시도하면 완료된 노드를 다시 실행하지 않음."""
+
+        async def generate(state, call):
+            if call == 1:
+                await asyncio.sleep(5)
+            return _resume(state)
+
+        workflow, calls = _build(checkpointer, generate)
+        config = {"configurable": {"thread_id": "job-1"}}
+
+        with pytest.raises(TimeoutError):
+            await ainvoke_resumable(workflow, {}, config, timeout=0.3)
+        final_state = await ainvoke_resumable(workflow, {}, config, timeout=5)
+
+        assert calls == {"plan": 1, "generate": 2}
+        assert final_state["resume_data"].projects[0].repo_url == "https://github.com/user/repo"
+
+    async def test_slow_node_is_not_restarted_within_timeout(self, checkpointer):
+        """마감 시간 안이면 오래 걸리는 노드를 중간에 취소하고 다시 시작하지 않음."""
+
+        async def generate(state, call):
+            await asyncio.sleep(0.3)
+            return _resume(state)
+
+        workflow, calls = _build(checkpointer, generate)
+        started = time.monotonic()
+
+        final_state = await ainvoke_resumable(
+            workflow, {}, {"configurable": {"thread_id": "job-1"}}, timeout=0.5
+        )
+
+        assert calls == {"plan": 1, "generate": 1}
+        assert "resume_data" in final_state
+        assert time.monotonic() - started < 0.5
+
+    async def test_timeout_raises(self, checkpointer):
+        """마감 시간 안에 끝나지 않으면 TimeoutError."""
+
+        async def generate(state, call):
+            await asyncio.sleep(5)
+            return _resume(state)
+
+        workflow, calls = _build(checkpointer, generate)
+
+        with pytest.raises(TimeoutError):
+            await ainvoke_resumable(
+                workflow, {}, {"configurable": {"thread_id": "job-1"}}, timeout=0.2
+            )
+        assert calls["plan"] == 1
+
+    async def test_finished_thread_returns_final_state(self, checkpointer):
+        """이미 끝난 thread_id는 다시 실행하지 않고 최종 상태 반환."""
+
+        async def generate(state, call):
+            return _resume(state)
+
+        workflow, calls = _build(checkpointer, generate)
+        config = {"configurable": {"thread_id": "job-1"}}
+
+        await ainvoke_resumable(workflow, {}, config, timeout=5)
+        final_state = await ainvoke_resumable(workflow, {}, config, timeout=5)
+
+        assert calls == {"plan": 1, "generate": 1}
+        assert "resume_data" in final_state
+
+    async def test_clear_checkpoint_removes_thread(self, checkpointer):
+        """체크포인트 삭제 후에는 처음부터 실행."""
+
+        async def generate(state, call):
+            return _resume(state)
+
+        workflow, calls = _build(checkpointer, generate)
+        config = {"configurable": {"thread_id": "job-1"}}
+
+        await ainvoke_resumable(workflow, {}, config, timeout=5)
+        await clear_checkpoint(workflow, config)
+        await ainvoke_resumable(workflow, {}, config, timeout=5)
+
+        assert calls == {"plan": 2, "generate": 2}
+
+    async def test_discard_checkpoint_removes_thread(self, checkpointer):
+        """워크플로우 없이 thread_id로 체크포인트를 지우면 처음부터 실행."""
+
+        async def generate(state, call):
+            if call == 1:
+                raise RuntimeError("boom")
+            return _resume(state)
+
+        workflow, calls = _build(checkpointer, generate)
+        config = {"configurable": {"thread_id": "job-1"}}
+
+        with pytest.raises(RuntimeError):
+            await ainvoke_resumable(workflow, {}, config, timeout=5)
+        await discard_checkpoint(checkpointer, "job-1")
+        await ainvoke_resumable(workflow, {}, config, timeout=5)
+
+        assert calls == {"plan": 2, "generate": 2}
+
+    async def test_without_checkpointer_runs_from_start(self):
+        """체크포인터가 없으면 매번 처음부터 실행."""
+
+        async def generate(state, call):
+            return _resume(state)
+
+        workflow, calls = _build(None, generate)
+        config = {"configurable": {"thread_id": "job-1"}}
+
+        await ainvoke_resumable(workflow, {}, config, timeout=5)
+        await ainvoke_resumable(workflow, {}, config, timeout=5)
+
+        assert calls == {"plan": 2, "generate": 2}